@@ -147,16 +147,44 @@ def process():
 
 
 @cli.command()
-def sync():
+@click.option('--delta', is_flag=True, help='동기화 이후 변경된 레스토랑만 재전송')
+def sync(delta):
     """한식당 동기화"""
-    click.echo("Syncing to 한식당...")
+    click.echo(f"Syncing to 한식당{' (delta)' if delta else ''}...")
     
     async def run():
         workflow = SyncWorkflow()
-        await workflow.sync_to_hansikdang()
+        return await workflow.sync_to_hansikdang(delta=delta)
     
-    asyncio.run(run())
-    click.echo("✅ Sync completed!")
+    result = asyncio.run(run())
+    click.echo(
+        f"✅ Sync completed! {result['synced']}/{result['total_sent']} synced, {result['failed']} failed"
+    )
+    if result.get('bytes_sent'):
+        click.echo(
+            f"  📦 {result['bytes_sent']:,} bytes on wire ({result['bytes_per_restaurant']} bytes/restaurant, "
+            f"{result['compression_ratio']}x {result['encoding']}, {result['transport']})"
+        )
+
+
+@cli.command()
+def sync_baseline():
+    """변경 추적 이전에 동기화된 레스토랑의 해시 기준선 기록 (delta sync 도입 시 1회)"""
+    init_db()
+    updated = SyncWorkflow().baseline_synced_hashes()
+    click.echo(f"✅ Baseline recorded for {updated} synced restaurants")
+
+
+@cli.command()
+def dedupe_raw_sources():
+    """중복 (source, source_id) 원본 행 정리 후 unique 인덱스 생성 (uq_raw_source_id 도입 시 1회)"""
+    from src.utils.known_ids import dedupe_raw_sources as dedupe
+
+    with db_session() as db:
+        removed = dedupe(db)
+    click.echo(f"🧹 Removed {removed} duplicate raw rows")
+    init_db()
+    click.echo("✅ Unique index uq_raw_source_id ensured")
 
 
 @cli.command()
@@ -239,7 +267,7 @@ def full_pipeline():
 def import_json(json_file, source):
     """JSON 파일에서 레스토랑 데이터 임포트"""
     import json
-    from src.database.models import RawRestaurantData
+    from src.utils.known_ids import known_ids
     
     click.echo(f"Importing from {json_file}...")
     
@@ -249,51 +277,56 @@ def import_json(json_file, source):
     click.echo(f"Found {len(data)} restaurants")
     
     with db_session() as db:
-        count = 0
-        for item in data:
-            try:
-                # 위치 정보 추출
-                location = item.get('location', {})
-                lat = location.get('lat')
-                lng = location.get('lng')
-                
-                # raw_data에 lat/lng 추가
-                raw_data = {**item, 'lat': lat, 'lng': lng}
-                
-                raw = RawRestaurantData(
-                    id=str(uuid.uuid4()),
-                    source=source,
-                    source_id=item.get('placeId', item.get('id', str(uuid.uuid4()))),
-                    raw_data=raw_data,
-                    status='pending'
-                )
-                db.add(raw)
-                count += 1
-            except Exception as e:
-                logger.error(f"Failed to import: {e}")
+        source_ids = [item.get('placeId', item.get('id', str(uuid.uuid4()))) for item in data]
+        existing = known_ids.existing_ids(db, source, source_ids)
+        rows = []
+        
+        for item, source_id in zip(data, source_ids):
+            if source_id in existing:
+                continue
+            # 위치 정보 추출
+            location = item.get('location', {})
+            lat = location.get('lat')
+            lng = location.get('lng')
+            
+            # raw_data에 lat/lng 추가
+            rows.append({
+                'id': str(uuid.uuid4()),
+                'source': source,
+                'source_id': source_id,
+                'raw_data': {**item, 'lat': lat, 'lng': lng},
+                'status': 'pending',
+            })
+            existing.add(source_id)
         
+        count = len(known_ids.insert_new(db, rows))
         db.commit()
-        click.echo(f"✅ Imported {count}/{len(data)} restaurants")
+        known_ids.flush()
+        click.echo(f"✅ Imported {count}/{len(data)} restaurants ({len(data) - count} already collected)")
 
 
 @cli.command()
 @click.option('--query', default='홍대 한식', help='검색 쿼리')
 @click.option('--limit', default=100, help='수집할 최대 개수')
-def scrape_naver(query, limit):
+@click.option('--crawl', is_flag=True, help='페이지네이션 + 하위 지역 fan-out으로 신규 장소 수집')
+def scrape_naver(query, limit, crawl):
     """네이버 Maps API로 레스토랑 데이터 수집"""
-    click.echo(f"🔍 Naver Maps API: {query} (limit={limit})")
+    click.echo(f"🔍 Naver Maps API: {query} (limit={limit}, crawl={crawl})")
     
     async def run():
         from src.scrapers.naver_maps_api import NaverMapsScraper
         
         scraper = NaverMapsScraper()
-        result = await scraper.scrape(query=query, limit=limit)
+        result = await scraper.scrape(query=query, limit=limit, crawl=crawl)
         
         click.echo(f"\n✅ 네이버 Maps API 수집 완료!")
         click.echo(f"  - 검색 쿼리: {result['query']}")
         click.echo(f"  - 발견: {result['total_found']}개")
         click.echo(f"  - 저장: {result['saved_count']}개")
         click.echo(f"  - 중복: {result['duplicate_count']}개")
+        if crawl:
+            click.echo(f"  - 하위 쿼리: {result['sub_queries']}개, API 호출: {result['api_calls']}회")
+            click.echo(f"  - 호출당 신규: {result['new_per_call']}개 (조기 종료 {result['stopped_early']}회)")
     
     asyncio.run(run())
 
@@ -334,5 +367,394 @@ def stats():
         click.echo("=" * 50)
 
 
+
+@cli.command()
+@click.option('--limit', default=None, type=int, help='조회할 최대 레스토랑 수 (0 = 제한 없음)')
+@click.option('--concurrency', default=None, type=int, help='동시 조회 수')
+@click.option('--restart', is_flag=True, help='체크포인트를 무시하고 처음부터 실행')
+def enrich_google(limit, concurrency, restart):
+    """Google Places 평점/이미지 보강 (중단 시 체크포인트부터 이어서 실행)"""
+    from src.workflows.google_places import GooglePlacesWorkflow
+    
+    workflow = GooglePlacesWorkflow(concurrency=concurrency)
+    result = asyncio.run(workflow.enrich_restaurants(limit=limit, resume=not restart))
+    
+    for key, value in result.items():
+        click.echo(f"  - {key}: {value}")
+
+
+@cli.command()
+@click.option('--keywords', default=3, help='비교에 사용할 키워드 수 (일일 쿼리 앞에서부터)')
+@click.option('--max-results', default=5, help='키워드당 최대 결과 수')
+def benchmark_apify_batching(keywords, max_results):
+    """Apify 키워드별 실행 vs 일괄 실행 비용/시간 비교 (결과는 저장하지 않음)"""
+    from src.scrapers.apify_naver_scraper import ApifyNaverScraper
+    from src.workflows.stages import load_daily_queries
+    import time
+    
+    queries = load_daily_queries()[:keywords]
+    apify = ApifyNaverScraper()
+    
+    async def measure(batches):
+        started = time.monotonic()
+        usage, items = 0.0, 0
+        for batch in batches:
+            run = await apify.start_search(batch, max_results)
+            usage += run.get('usageTotalUsd') or 0.0
+            items += len([item async for item in apify.iter_results(run)])
+        return {'runs': len(batches), 'items': items, 'usd': usage, 'seconds': time.monotonic() - started}
+    
+    async def run():
+        per_keyword = await measure([[query] for query in queries])
+        batched = await measure([queries])
+        return per_keyword, batched
+    
+    click.echo(f"⏱️  Apify batching benchmark: {len(queries)} keywords × {max_results} results")
+    per_keyword, batched = asyncio.run(run())
+    
+    for label, result in (("per-keyword", per_keyword), ("batched", batched)):
+        click.echo(
+            f"  - {label:<12} runs={result['runs']} items={result['items']} "
+            f"${result['usd']:.4f} {result['seconds']:.1f}s"
+        )
+    click.echo(
+        f"  💰 savings: ${per_keyword['usd'] - batched['usd']:.4f}, "
+        f"{per_keyword['seconds'] - batched['seconds']:.1f}s per {len(queries)} keywords"
+    )
+
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', help='바인드 주소')
+@click.option('--port', default=8099, help='포트')
+@click.option('--latency-ms', default=0.0, help='응답마다 추가할 지연 (ms)')
+@click.option('--run-seconds', default=2.0, help='Apify actor 실행 소요 시간 (초)')
+@click.option('--max-body-bytes', default=0, help='한식당 API 요청 본문 한도 (초과 시 413, 0 = 제한 없음)')
+@click.option('--reject-ratio', default=0.0, help='한식당 API가 레스토랑을 거부하는 비율')
+@click.option('--accept-encodings', default=None, help='한식당 API가 받는 요청 압축 방식 (쉼표 구분, 빈 값 = 압축 미지원, 기본: 설치된 전부)')
+@click.option('--no-ndjson', is_flag=True, help='한식당 API의 NDJSON 스트리밍 업로드 미지원')
+def fake_providers(host, port, latency_ms, run_seconds, max_body_bytes, reject_ratio, accept_encodings, no_ndjson):
+    """오프라인 테스트용 외부 API 서버 (네이버/Google Places/Apify/한식당)"""
+    import uvicorn
+    from src.testing.fake_providers import create_app
+    
+    click.echo(f"🧪 Fake providers on http://{host}:{port}")
+    click.echo(f"  NAVER_API_BASE_URL=http://{host}:{port}")
+    click.echo(f"  GOOGLE_PLACES_BASE_URL=http://{host}:{port}/maps/api/place")
+    click.echo(f"  APIFY_BASE_URL=http://{host}:{port}/v2")
+    click.echo(f"  HANSIKDANG_API_URL=http://{host}:{port}")
+    options = {}
+    if accept_encodings is not None:
+        options['accept_encodings'] = [e.strip() for e in accept_encodings.split(',') if e.strip()]
+    
+    app = create_app(
+        latency_ms=latency_ms,
+        run_seconds=run_seconds,
+        max_body_bytes=max_body_bytes,
+        reject_ratio=reject_ratio,
+        ndjson=not no_ndjson,
+        **options
+    )
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+@cli.command()
+@click.option('--waiters', default=1000, help='동시 대기 코루틴 수')
+@click.option('--rate', default=200, help='초당 허용 요청 수')
+@click.option('--burst', default=20, help='burst 허용량')
+@click.option('--backend', type=click.Choice(['local', 'file', 'postgres']), default='local', help='버킷 백엔드')
+def stress_rate_limiter(waiters, rate, burst, backend):
+    """RateLimiter 부하 테스트 (동시 대기자 N개에서 제한/FIFO 준수 확인)"""
+    from src.utils.rate_limiter import stress_test, FileLockBackend, PostgresBackend
+    
+    backends = {
+        'local': lambda: None,
+        'file': lambda: FileLockBackend(),
+        'postgres': lambda: PostgresBackend(),
+    }
+    
+    click.echo(f"🔥 RateLimiter stress test: {waiters} waiters, {rate}/s, burst={burst}, backend={backend}")
+    result = asyncio.run(stress_test(
+        waiters=waiters, max_requests=rate, per_seconds=1.0, burst=burst, backend=backends[backend]()
+    ))
+    
+    for key, value in result.items():
+        click.echo(f"  - {key}: {value}")
+    
+    if not result['passed']:
+        raise click.ClickException("Rate limit violated")
+    click.echo("✅ Rate limit held")
+
+
+@cli.command()
+@click.option('--requests', 'count', default=50, help='엔드포인트별 요청 수')
+@click.option('--limit', default=100, help='리스트 엔드포인트 페이지 크기')
+def benchmark_serialization(count, limit):
+    """주요 API 엔드포인트 응답 시간 + JSON 직렬화 비교 (jsonable_encoder + json vs dumps)"""
+    import json
+    import statistics
+    import time
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+    from src.database.models import ProcessedRestaurant
+    from src.utils.serialization import ORJSON_AVAILABLE, dumps, loads
+
+    with db_session() as db:
+        first = db.query(ProcessedRestaurant.id).first()
+
+    paths = [
+        f"/api/restaurants?limit={min(limit, 100)}",
+        f"/api/restaurants/raw?limit={limit}",
+        f"/api/data-management/collection-results?limit={limit}",
+    ]
+    if first:
+        paths.append(f"/api/restaurants/{first.id}")
+
+    def per_call_ms(func) -> float:
+        started = time.perf_counter()
+        for _ in range(count):
+            func()
+        return (time.perf_counter() - started) / count * 1000
+
+    click.echo(f"⏱️  Serialization benchmark: {count} requests/endpoint, serializer={'orjson' if ORJSON_AVAILABLE else 'json'}")
+    client = TestClient(app)  # startup 이벤트(스케줄러/인덱스 로드) 없이 라우트만 호출
+    for path in paths:
+        response = client.get(path)
+        if response.status_code != 200:
+            click.echo(f"  - {path}: HTTP {response.status_code}, skipped")
+            continue
+
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        payload = loads(response.content)
+        stdlib_ms = per_call_ms(lambda: json.dumps(
+            jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"))
+        fast_ms = per_call_ms(lambda: dumps(payload))
+
+        click.echo(
+            f"  - {path}: {len(response.content)} bytes, "
+            f"mean {statistics.mean(latencies):.2f}ms, p95 {statistics.quantiles(latencies, n=20)[-1]:.2f}ms | "
+            f"encode: default {stdlib_ms:.3f}ms → dumps {fast_ms:.3f}ms "
+            f"({stdlib_ms / fast_ms if fast_ms else 0:.1f}x)"
+        )
+
+
+
+@cli.command()
+@click.option('--limit', default=0, help='검증할 레스토랑 수 (0 = 전체)')
+def validate_quality(limit):
+    """7가지 품질 지표 일괄 검증 (QualityMetrics에 저장)"""
+    from src.governance.quality_validator import QualityValidator
+    
+    with db_session() as db:
+        stats = QualityValidator(db).validate_batch(batch_size=limit or None)
+    
+    click.echo(
+        f"✅ Validated {stats['total_validated']} restaurants in {stats['elapsed_seconds']}s "
+        f"(avg {stats['average_score']}, A {stats['a_grade_percentage']}%)"
+    )
+    for grade, count in stats['grade_distribution'].items():
+        click.echo(f"  - {grade}: {count}")
+
+
+@cli.command()
+@click.option('--all', 'rescore_all', is_flag=True, help='전체를 재계산 대상으로 표시')
+@click.option('--limit', default=0, help='최대 처리 수 (0 = 표시된 행 전체)')
+def quality_rescore(rescore_all, limit):
+    """입력 필드가 바뀐 레스토랑만 품질 점수 재계산"""
+    from src.governance.quality_rescoring import QualityRescorer
+    
+    with db_session() as db:
+        rescorer = QualityRescorer(db)
+        if rescore_all:
+            rescorer.mark_dirty()
+        rescorer.mark_stale()
+        click.echo(f"🔎 Pending: {rescorer.pending()} restaurants")
+        stats = rescorer.rescore(limit=limit or None)
+    
+    click.echo(
+        f"✅ Rescored {stats['rescored']} restaurants in {stats['chunks']} chunks "
+        f"({stats['elapsed_seconds']}s, avg {stats['average_score']})"
+    )
+
+
+@cli.command()
+@click.option('--table', 'tables', multiple=True, help='대상 테이블 (여러 번 지정 가능, 기본: 전체)')
+@click.option('--full', is_flag=True, help='변경 여부와 관계없이 모든 파티션 다시 기록')
+@click.option('--csv', 'derive_csv', is_flag=True, help='processed_restaurants CSV도 함께 저장')
+def snapshot(tables, full, derive_csv):
+    """Parquet 스냅샷 내보내기 (직전 스냅샷 이후 바뀐 날짜 파티션만)"""
+    from src.governance.snapshot import SnapshotExporter
+    
+    with db_session() as db:
+        history = SnapshotExporter(db).export(tables=tables or None, full=full, derive_csv=derive_csv)
+        click.echo(
+            f"✅ Snapshot {history.id}: {history.new_records} rows written "
+            f"({(history.file_size_bytes or 0) / 1024 / 1024:.2f} MB), {history.total_records} rows total"
+        )
+
+
+@cli.command()
+@click.option('--snapshot-id', default=None, help='검증할 스냅샷 ID (기본: 최신)')
+@click.option('--check-db', is_flag=True, help='현재 DB와 달라진 파티션도 표시')
+def snapshot_verify(snapshot_id, check_db):
+    """스냅샷 파일 검증 (체크섬, 행 수)"""
+    from src.governance.snapshot import SnapshotExporter
+    
+    with db_session() as db:
+        report = SnapshotExporter(db).verify(snapshot_id=snapshot_id, check_db=check_db)
+    
+    click.echo(f"🔎 {report['verified']}/{report['partitions']} partitions verified ({report['rows']} rows)")
+    if check_db:
+        click.echo(f"  - changed since snapshot: {len(report['stale'])} partitions")
+        for partition in report['stale'][:20]:
+            click.echo(f"    · {partition}")
+    for error in report['errors']:
+        click.echo(f"  ❌ {error}")
+    if report['errors']:
+        raise click.ClickException(f"{len(report['errors'])} partitions failed verification")
+
+
+@cli.command()
+@click.option('--snapshot-id', default=None, help='복원할 스냅샷 ID (기본: 최신)')
+@click.option('--table', 'tables', multiple=True, help='대상 테이블 (여러 번 지정 가능, 기본: 전체)')
+@click.option('--overwrite', is_flag=True, help='이미 있는 행도 스냅샷 값으로 덮어쓰기')
+def snapshot_restore(snapshot_id, tables, overwrite):
+    """스냅샷을 DB에 복원 (기본: 없는 행만 삽입)"""
+    from src.governance.snapshot import SnapshotExporter
+    
+    with db_session() as db:
+        restored = SnapshotExporter(db).restore(snapshot_id=snapshot_id, tables=tables or None, overwrite=overwrite)
+    
+    for name, rows in restored.items():
+        click.echo(f"  - {name}: {rows} rows")
+    click.echo("✅ Restore completed")
+
+
+@cli.command()
+@click.option('--date', 'backup_date', default=None, help='비교할 날짜 파티션 (YYYY-MM-DD, 기본: 행이 가장 많은 날짜)')
+def benchmark_snapshot(backup_date):
+    """일일 CSV 백업 vs Parquet 파티션 내보내기 시간/크기 비교 (업로드 제외)"""
+    import tempfile
+    import time
+    from src.governance.drive_backup import DriveBackupManager
+    from src.governance.snapshot import SnapshotExporter
+    
+    with db_session() as db:
+        exporter = SnapshotExporter(db)
+        partitions = exporter.fingerprints('processed_restaurants')
+        if not backup_date:
+            dated = {day: p for day, p in partitions.items() if day != 'undated'}
+            if not dated:
+                raise click.ClickException("No dated processed_restaurants partitions")
+            backup_date = max(dated, key=lambda day: dated[day]['rows'])
+        
+        click.echo(f"⏱️  Snapshot benchmark: processed_restaurants {backup_date} ({partitions.get(backup_date, {}).get('rows', 0)} rows)")
+        
+        results = {}
+        for label, write in (
+            ('csv', lambda f: DriveBackupManager(db)._write_csv(f, backup_date)),
+            ('parquet', lambda f: exporter.write_parquet('processed_restaurants', backup_date, f)),
+        ):
+            with tempfile.TemporaryFile() as f:
+                started = time.perf_counter()
+                write(f)
+                results[label] = (time.perf_counter() - started, f.tell())
+        
+        for label, (seconds, size) in results.items():
+            click.echo(f"  - {label:<8} {seconds:.2f}s {size / 1024:.1f} KB")
+        csv_size, parquet_size = results['csv'][1], results['parquet'][1]
+        click.echo(f"  📉 parquet/csv size: {parquet_size / csv_size:.2f}x" if csv_size else "")
+
+
+@cli.command()
+@click.option('--workers', type=int, default=None, help='동시에 내보낼 chunk 수 (기본: FULL_BACKUP_WORKERS)')
+@click.option('--chunk-rows', type=int, default=None, help='chunk당 행 수 (기본: FULL_BACKUP_CHUNK_ROWS)')
+@click.option('--no-resume', is_flag=True, help='중단된 백업을 이어가지 않고 새로 시작')
+def full_backup(workers, chunk_rows, no_resume):
+    """전체 DB 백업 (테이블별 chunk 병렬 내보내기, 중단 시 이어서 진행)"""
+    from src.governance.full_backup import FullBackupManager
+    
+    result = FullBackupManager(workers=workers, chunk_rows=chunk_rows).backup(resume=not no_resume)
+    click.echo(
+        f"{'✅' if result['status'] == 'success' else '⚠️'} Full backup {result['backup_id']} {result['status']}: "
+        f"{result['chunks']} chunks, {result['rows']} rows, {result['bytes'] / 1024 / 1024:.2f} MB "
+        f"in {result['elapsed_seconds']}s"
+    )
+    if result['manifest_file_id']:
+        click.echo(f"  - manifest: {result['manifest_file_id']}")
+    else:
+        raise click.ClickException("Some chunks failed; run full-backup again to resume")
+
+
+@cli.command()
+@click.option('--manifest', 'manifest_file_id', default=None, help='manifest.json 파일 ID (기본: 마지막 성공 백업)')
+@click.option('--table', 'tables', multiple=True, help='대상 테이블 (여러 번 지정 가능, 기본: 전체)')
+@click.option('--truncate', is_flag=True, help='데이터가 있는 테이블을 비우고 복원')
+@click.option('--workers', type=int, default=None, help='동시에 적재할 chunk 수 (PostgreSQL)')
+def full_restore(manifest_file_id, tables, truncate, workers):
+    """전체 백업 복원 (체크섬 확인 후 PostgreSQL COPY 또는 bulk insert)"""
+    from src.governance.full_backup import FullBackupManager
+    
+    init_db()
+    restored = FullBackupManager(workers=workers).restore(
+        manifest_file_id=manifest_file_id, tables=tables or None, truncate=truncate
+    )
+    for name, rows in restored.items():
+        click.echo(f"  - {name}: {rows} rows")
+    click.echo("✅ Restore completed")
+
+
+
+@cli.command()
+@click.option('--table', 'tables', multiple=True, help='대상 로그 테이블 (여러 번 지정 가능, 기본: 전체)')
+def partition_logs(tables):
+    """로그 테이블을 월 파티션 테이블로 전환 (PostgreSQL, 전환 중 테이블 잠금)"""
+    from src.governance.retention import RetentionManager
+    
+    init_db()
+    manager = RetentionManager(tables=tables or None)
+    for name in manager.policies:
+        converted = manager.partition_table(name)
+        click.echo(f"  - {name}: {'partitioned' if converted else 'already partitioned'}")
+    manager.ensure_partitions()
+    
+    for name, status in manager.status().items():
+        click.echo(f"  📦 {name}: {status['partitions']} partitions, {status['rows']} rows")
+
+
+@cli.command()
+@click.option('--table', 'tables', multiple=True, help='대상 로그 테이블 (여러 번 지정 가능, 기본: 전체)')
+@click.option('--dry-run', is_flag=True, help='정리할 월만 표시')
+@click.option('--vacuum', is_flag=True, help='정리 후 공간 회수 (VACUUM)')
+def compact_logs(tables, dry_run, vacuum):
+    """보존 기간이 지난 로그를 월별 요약(log_rollups) 후 삭제"""
+    from src.governance.retention import RetentionManager
+    
+    manager = RetentionManager(tables=tables or None)
+    if not dry_run:
+        manager.ensure_partitions()
+    results = manager.apply_retention(dry_run=dry_run)
+    
+    for name, result in results.items():
+        months = ', '.join(result['months']) or '-'
+        if dry_run:
+            click.echo(f"  - {name} ({result['mode']}): before {result['boundary'][:10]} → {months}")
+        else:
+            click.echo(
+                f"  - {name} ({result['mode']}): {result['rows']} rows removed, "
+                f"{result['dropped_partitions']} partitions dropped ({months})"
+            )
+    
+    if vacuum and not dry_run:
+        manager.vacuum()
+    click.echo("✅ Dry run completed" if dry_run else "✅ Log compaction completed")
+
+
 if __name__ == '__main__':
     cli()
@@ -30,19 +30,88 @@ class Settings(BaseSettings):
     )
     data_collection_api_key: Optional[str] = os.getenv("DATA_COLLECTION_API_KEY")
     
+    # 외부 API 주소 (오프라인 테스트 시 fake provider 서버로 변경)
+    google_places_base_url: str = "https://maps.googleapis.com/maps/api/place"
+    naver_api_base_url: str = "https://openapi.naver.com"
+    apify_base_url: str = "https://api.apify.com/v2"
+    outscraper_base_url: str = "https://api.outscraper.com"
+    
+    # HTTP 응답 기록/재생 (record: 실제 응답을 fixture로 저장, replay: fixture로 응답)
+    http_replay_mode: Optional[str] = None
+    # Gemini 대신 결정적인 fake 모델 사용 (Gemini는 공유 HTTP 클라이언트를 거치지 않아 기록/재생 대상이 아님)
+    gemini_fake: bool = False
+    http_replay_dir: str = "fixtures/http"
+    
+    # 수집된 source ID 인덱스 (중복 체크 시 DB 조회 대신 사용, 없으면 DB에서 생성)
+    known_ids_path: str = "data/known_ids.idx"
+    
     # Scraping Settings
     daily_target: int = 33  # 하루 목표 수집 수 (네이버만 운영)
     quality_threshold: int = 20  # 품질 점수 임계값 (조정: 75 → 20, 모든 레스토랑 동기화 가능)
-    batch_size: int = 10  # 한식당 동기화 배치 사이즈 (413 에러 방지)
+    batch_size: int = 10  # 파이프라인 sync 단계에서 모아 보내는 레스토랑 수
+    pipeline_backlog_limit: int = 100  # 파이프라인 1회 실행에서 함께 정제할 기존 pending raw 데이터 최대 수
+    
+    # 한식당 동기화 (배치는 payload 바이트 기준으로 구성해 413 방지)
+    sync_max_in_flight: int = 4  # 동시에 전송 중인 배치 수
+    sync_max_batch_bytes: int = 256_000  # 배치 payload 최대 크기
+    sync_max_batch_rows: int = 100  # 배치 최대 레스토랑 수
+    hansikdang_patch_supported: bool = False  # delta sync 시 바뀐 필드만 PATCH로 전송
+    sync_compression: str = "auto"  # auto(zstandard 설치 시 zstd, 아니면 gzip) | zstd | gzip | none
+    sync_transport: str = "batch"  # batch(JSON 배치) | ndjson(스트리밍 업로드, 미지원 서버면 batch로 전환)
+    sync_stream_rows: int = 5000  # NDJSON 요청 1개에 담는 최대 레스토랑 수
+    sync_retry_attempts: int = 5  # failed 레스토랑을 다음 실행에서 재전송하는 최대 횟수
+    sync_retry_delay_minutes: float = 30.0  # failed 재전송 대기 시간 (실패할 때마다 2배)
     
     # Quality Standards
     min_images: int = 5  # 최소 이미지 수
     min_reviews: int = 10  # 최소 리뷰 수
+    quality_history_enabled: bool = False  # 품질 재계산마다 quality_metrics_history에 이력 추가
+    
+    # 데이터 계보 (파이프라인 이벤트를 버퍼에 모아 백그라운드에서 bulk insert)
+    lineage_enabled: bool = True
+    lineage_buffer_size: int = 10_000  # 버퍼 최대 이벤트 수
+    lineage_flush_rows: int = 500  # 이만큼 쌓이면 바로 기록
+    lineage_flush_interval: float = 2.0  # 최대 기록 간격 (초)
+    lineage_backpressure: str = "block"  # block(최대 lineage_block_timeout 초 대기, 이벤트 루프에서는 바로 버림) | sample(75% 이상이면 성공 이벤트 표본만 유지, 버린 수는 datahub_lineage_dropped)
+    lineage_sample_rate: int = 10  # sample 정책에서 N개 중 1개 유지
+    lineage_block_timeout: float = 1.0
+    
+    # 로그 테이블 보존 기간 (일, 0 = 무기한). 지난 달은 log_rollups에 요약 후 월 단위로 삭제
+    lineage_retention_days: int = 180
+    health_retention_days: int = 30
+    quality_history_retention_days: int = 365
+    scraping_log_retention_days: int = 365
+    sync_log_retention_days: int = 365
+    log_partition_months_ahead: int = 3  # PostgreSQL 월 파티션을 미리 만들어 둘 개월 수
+    
+    # 시스템 리소스 샘플링 (백그라운드 스레드, SystemMonitor는 마지막 샘플을 읽음)
+    metrics_sample_interval: float = 5.0  # 샘플링 간격 (초)
+    metrics_buffer_size: int = 720  # 링 버퍼 크기 (기본 1시간)
+    metrics_persist_interval: int = 300  # system_health에 평균/최대 기록 간격 (초, 0 = 기록 안 함)
+    metrics_textfile_path: str = "data/metrics/scheduler.prom"  # 스케줄러 프로세스 메트릭 파일 (빈 값 = 기록 안 함)
+    metrics_textfile_interval: float = 15.0  # 메트릭 파일 갱신 간격 (초)
+    
+    # Google Places 보강
+    google_enrichment_concurrency: int = 8  # 동시 조회 수 (실제 속도는 GooglePlacesAPI rate limiter가 제한)
+    google_enrichment_limit: int = 33  # 1회 실행당 최대 조회 수 (0 = 제한 없음, 백필 시 조정)
+    
+    # 백업 (CSV를 스트리밍으로 임시 파일에 쓰고 청크 단위 업로드)
+    backup_storage: str = "drive"  # drive(Google Drive) | local(backup_local_dir)
+    backup_local_dir: str = "data/backups"
+    backup_upload_chunk_mb: int = 8  # resumable upload 청크 크기
+    backup_spool_mb: int = 16  # 이 크기까지는 메모리, 넘으면 디스크 임시 파일
+    snapshot_derive_csv: bool = False  # Parquet 스냅샷 시 processed_restaurants CSV도 저장 (pyarrow 필요)
+    full_backup_workers: int = 4  # 전체 백업/복원 시 동시에 처리할 chunk 수
+    full_backup_chunk_rows: int = 100_000  # 전체 백업 chunk당 행 수 (기본 키 구간)
     
     # Retry Settings
     max_retries: int = 3
     retry_delay: int = 5  # seconds
     
+    # Job Locking (여러 스케줄러/API 레플리카 동시 실행 방지)
+    job_lock_ttl_seconds: int = 300  # heartbeat가 끊기면 이 시간 후 잠금 만료
+    job_lock_heartbeat_seconds: int = 60
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -6,29 +6,36 @@ Restaurant Data Hub Automated Scheduler
 """
 
 import asyncio
-import schedule
-import time
+import signal
 from datetime import datetime
 from loguru import logger
 import sys
 
 sys.path.insert(0, '/home/runner/workspace/data-hub')
 
-from src.scrapers.naver_maps_api import NaverMapsScraper
-from src.scrapers.google_places_api import GooglePlacesAPI
+from config import settings
 from src.scrapers.apify_naver_scraper import ApifyNaverScraper
-from src.scrapers.place_id_loader import PlaceIDLoader
 from src.workflows.sync import SyncWorkflow
-from src.processors.gemini import GeminiProcessor
-from src.processors.quality_validator import QualityValidator
+from src.workflows.pipeline import run_daily_pipeline
+from src.workflows.google_places import GooglePlacesWorkflow
+from src.workflows.stages import load_daily_queries
 from src.targeting.trends_analyzer import TrendsAnalyzer
 from src.targeting.query_generator import QueryGenerator
 from src.targeting.popularity_scorer import PopularityScorer
-from src.deduplication.service import DeduplicationService
 from src.governance.drive_backup import DriveBackupManager
+from src.governance.full_backup import FullBackupManager
+from src.governance.quality_rescoring import QualityRescorer
+from src.governance.lineage_sink import lineage_sink
+from src.monitoring.metrics_sampler import metrics_sampler
+from src.monitoring.metrics import registry
+from src.governance.retention import RetentionManager
+from src.governance.snapshot import PYARROW_AVAILABLE, SnapshotExporter
+from src.scheduling.async_scheduler import AsyncScheduler
+from src.scheduling.locks import job_locks
+from src.utils.http_client import http_clients
+from src.utils.known_ids import known_ids
 from src.database.connection import db_session, init_db
 from src.database.models import RawRestaurantData, ProcessedRestaurant, ScrapingTarget
-import uuid
 
 
 logger.add("logs/scheduler.log", rotation="1 day", retention="30 days", level="INFO")
@@ -103,343 +110,49 @@ async def generate_smart_queries_daily():
         return 0
 
 
-async def scrape_naver_daily():
-    """Apify Naver Map Scraper로 매일 33개 수집 (메뉴/전화번호 포함)"""
-    logger.info("=" * 60)
-    logger.info("🔍 Starting Naver Maps scraping with Apify (Daily target: 33)")
-    logger.info("=" * 60)
-    
-    try:
-        apify = ApifyNaverScraper()
-        
-        # DB에서 자동 생성된 쿼리 가져오기 (스마트 타겟팅)
-        with db_session() as db:
-            auto_targets = db.query(ScrapingTarget).filter_by(
-                created_by='auto',
-                status='active'
-            ).limit(33).all()
-            
-            if auto_targets:
-                search_queries = [t.keyword for t in auto_targets]
-                logger.info(f"  ✓ Using {len(search_queries)} smart-generated queries")
-            else:
-                # Fallback: 기본 쿼리 사용
-                search_queries = [
-                    "홍대 한식",
-                    "강남 한식당",
-                    "명동 한식",
-                    "여의도 맛집",
-                    "이태원 한식",
-                    "서울 삼계탕",
-                    "서울 불고기",
-                    "서울 비빔밥",
-                    "서울 갈비",
-                    "서울 냉면",
-                    "서울 찌개",
-                ]
-                logger.warning(f"  ⚠️  No smart queries found, using {len(search_queries)} default queries")
-        
-        total_saved = 0
-        for query in search_queries:
-            try:
-                # Apify로 레스토랑 검색 (메뉴/전화번호 포함)
-                results = await apify.search_restaurants([query], max_results=11)
-                
-                if not results:
-                    logger.warning(f"  ⚠️  {query}: No results")
-                    continue
-                
-                # DB에 저장
-                with db_session() as db:
-                    saved_count = 0
-                    for restaurant_data in results:
-                        try:
-                            # 중복 체크
-                            existing = db.query(RawRestaurantData).filter_by(
-                                name=restaurant_data.get('name'),
-                                address=restaurant_data.get('address')
-                            ).first()
-                            
-                            if existing:
-                                continue
-                            
-                            # Raw 데이터 저장
-                            raw = RawRestaurantData(
-                                id=str(uuid.uuid4()),
-                                source='apify_naver',
-                                raw_data=restaurant_data,
-                                status='pending'
-                            )
-                            db.add(raw)
-                            saved_count += 1
-                            
-                        except Exception as e:
-                            logger.error(f"    ❌ Error saving {restaurant_data.get('name')}: {e}")
-                    
-                    db.commit()
-                    total_saved += saved_count
-                    logger.info(f"  ✓ {query}: {saved_count} saved (with menu/phone)")
-                    
-                if total_saved >= 33:
-                    break
-                
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"  ❌ Error with query '{query}': {e}")
-        
-        logger.info(f"✅ Naver scraping completed: {total_saved} restaurants saved (with full data)")
-        return total_saved
-        
-    except Exception as e:
-        logger.error(f"❌ Naver scraping failed: {e}")
-        return 0
-
-
-async def process_pending_daily():
-    """Gemini AI로 pending 데이터 정제 (배치 처리)"""
-    logger.info("=" * 60)
-    logger.info("🤖 Starting Gemini AI processing")
-    logger.info("=" * 60)
+async def pipeline_daily():
+    """스트리밍 파이프라인: 수집 → 정제 → 보강 → 중복제거 → 동기화"""
+    logger.info("=" * 70)
+    logger.info("🚰 Starting streaming pipeline (scrape → refine → score → dedup → sync)")
+    logger.info("=" * 70)
     
     try:
-        gemini = GeminiProcessor()
-        total_processed = 0
-        batch_size = 10
+        # 쿼리 목록 DB 조회가 다른 스케줄 작업의 이벤트 루프를 막지 않도록 스레드에서 실행
+        queries = await asyncio.to_thread(load_daily_queries)
+        result = await run_daily_pipeline(queries)
         
-        while True:
-            with db_session() as db:
-                raw_batch = db.query(RawRestaurantData).filter(
-                    RawRestaurantData.status == 'pending'
-                ).limit(batch_size).all()
-                
-                if not raw_batch:
-                    break
-                
-                logger.info(f"Processing batch of {len(raw_batch)} records...")
-                batch_processed = 0
-                
-                for idx, raw in enumerate(raw_batch):
-                    try:
-                        if idx > 0 and idx % 5 == 0:
-                            await asyncio.sleep(10)
-                        
-                        max_retries = 3
-                        retry_count = 0
-                        refined = None
-                        
-                        while retry_count < max_retries and refined is None:
-                            try:
-                                refined = await gemini.refine_restaurant_data(raw.raw_data)
-                            except Exception as retry_error:
-                                error_msg = str(retry_error)
-                                if "429" in error_msg or "quota" in error_msg.lower():
-                                    retry_count += 1
-                                    if retry_count < max_retries:
-                                        wait_time = 60 * retry_count
-                                        logger.warning(f"  ⚠️ Rate limit! Retry in {wait_time}s (attempt {retry_count}/{max_retries})")
-                                        await asyncio.sleep(wait_time)
-                                    else:
-                                        raise
-                                else:
-                                    raise
-                        
-                        if refined is None:
-                            raise Exception("Failed to refine data after retries")
-                        
-                        quality = await gemini.calculate_quality_score(raw.raw_data)
-                        
-                        new_restaurant = ProcessedRestaurant(
-                            id=str(uuid.uuid4()),
-                            mapping_id=raw.id,
-                            name=refined.get('name', ''),
-                            name_en=refined.get('nameEn', ''),
-                            category=refined.get('category', '한식'),
-                            cuisine=refined.get('cuisine', ''),
-                            district=refined.get('district', ''),
-                            address=refined.get('address', ''),
-                            address_en=refined.get('addressEn', ''),
-                            latitude=raw.raw_data.get('lat') or raw.raw_data.get('geometry', {}).get('location', {}).get('lat'),
-                            longitude=raw.raw_data.get('lng') or raw.raw_data.get('geometry', {}).get('location', {}).get('lng'),
-                            description=refined.get('description', ''),
-                            description_en=refined.get('descriptionEn', ''),
-                            price_range=str(refined.get('priceRange', 2)),
-                            phone=refined.get('phone', ''),
-                            rating=raw.raw_data.get('rating'),
-                            review_count=raw.raw_data.get('reviewCount') or raw.raw_data.get('user_ratings_total', 0),
-                            image_url=refined.get('imageUrl', 'https://via.placeholder.com/400x300?text=Restaurant'),
-                            open_hours=refined.get('openHours'),
-                            quality_score=quality.get('quality_score', 0),
-                            quality_details=quality.get('quality_details', {}),
-                            sync_status='pending'
-                        )
-                        db.add(new_restaurant)
-                        
-                        raw.status = 'processed'
-                        batch_processed += 1
-                        
-                    except Exception as e:
-                        raw.status = 'failed'
-                        raw.error_message = str(e)
-                        logger.error(f"Failed to process {raw.id}: {e}")
-                
-                db.commit()
-                total_processed += batch_processed
-                logger.info(f"  ✓ Batch completed: {batch_processed}/{len(raw_batch)} processed (Total: {total_processed})")
-                
-                if len(raw_batch) < batch_size:
-                    break
-                
-                await asyncio.sleep(60)
+        for stage in result['stages']:
+            logger.info(
+                f"   {stage['stage']:<7} in={stage['received']:<4} out={stage['emitted']:<4} "
+                f"failed={stage['failed']:<3} avg={stage['avg_latency_ms']}ms "
+                f"rate={stage['throughput_per_min']}/min"
+            )
+        logger.info(f"✅ Pipeline completed in {result['elapsed_seconds']}s")
+        return result
         
-        logger.info(f"✅ Processing completed: {total_processed} records")
-        return total_processed
-            
     except Exception as e:
-        logger.error(f"❌ Processing failed: {e}")
-        return 0
+        logger.error(f"❌ Pipeline failed: {e}")
+        logger.exception(e)
+        return None
 
 
 async def enrich_with_google_ratings():
-    """구글 평점으로 기존 레스토랑 보강"""
+    """구글 평점으로 기존 레스토랑 보강 (병렬 조회 + 체크포인트)"""
     logger.info("=" * 60)
     logger.info("⭐ Starting Google ratings enrichment")
     logger.info("=" * 60)
     
     try:
-        with db_session() as db:
-            restaurants_without_google = db.query(ProcessedRestaurant).filter(
-                ProcessedRestaurant.google_place_id == None
-            ).limit(33).all()
-            
-            if not restaurants_without_google:
-                logger.info("No restaurants need Google enrichment")
-                return 0
-            
-            logger.info(f"Found {len(restaurants_without_google)} restaurants to enrich")
-            
-            google_api = GooglePlacesAPI()
-            enriched_count = 0
-            
-            for restaurant in restaurants_without_google:
-                try:
-                    place_data = await google_api.search_place(
-                        name=restaurant.name,
-                        address=restaurant.address or ""
-                    )
-                    
-                    if place_data:
-                        restaurant.google_place_id = place_data.get('place_id')
-                        restaurant.google_rating = place_data.get('rating')
-                        restaurant.google_review_count = place_data.get('user_ratings_total', 0)
-                        
-                        if place_data.get('image_urls'):
-                            restaurant.image_urls = place_data.get('image_urls')
-                            restaurant.image_url = place_data.get('image_url')
-                        
-                        from src.processors.popularity_calculator import PopularityCalculator
-                        popularity_score, popularity_tier = PopularityCalculator.calculate_with_tier(
-                            naver_rating=restaurant.naver_rating or 0,
-                            naver_review_count=restaurant.naver_review_count or 0,
-                            google_rating=restaurant.google_rating or 0,
-                            google_review_count=restaurant.google_review_count or 0
-                        )
-                        restaurant.popularity_score = popularity_score
-                        restaurant.popularity_tier = popularity_tier
-                        
-                        enriched_count += 1
-                        images_count = len(place_data.get('image_urls', []))
-                        logger.info(f"  ✓ Enriched: {restaurant.name} (Rating: {place_data.get('rating')}/5.0, Images: {images_count})")
-                    
-                    await asyncio.sleep(0.2)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to enrich {restaurant.name}: {e}")
-            
-            db.commit()
-            logger.info(f"✅ Google enrichment completed: {enriched_count} restaurants")
-            return enriched_count
-            
-    except Exception as e:
-        logger.error(f"❌ Google enrichment failed: {e}")
-        return 0
-
-
-async def update_menus_with_apify():
-    """Apify로 메뉴 데이터 업데이트 (배치 커밋)"""
-    logger.info("=" * 60)
-    logger.info("🍽️  Starting menu update with Apify")
-    logger.info("=" * 60)
-    
-    try:
-        apify = ApifyNaverScraper()
-        total_updated = 0
-        batch_size = 10
+        workflow = GooglePlacesWorkflow()
+        result = await workflow.enrich_restaurants()
         
-        while True:
-            with db_session() as db:
-                # 메뉴가 없는 레스토랑 조회 (배치 단위)
-                restaurants_without_menu = db.query(ProcessedRestaurant).filter(
-                    ProcessedRestaurant.menu_summary == None
-                ).limit(batch_size).all()
-                
-                if not restaurants_without_menu:
-                    logger.info("All restaurants have menu data")
-                    break
-                
-                logger.info(f"Processing batch of {len(restaurants_without_menu)} restaurants...")
-                batch_updated = 0
-                
-                for restaurant in restaurants_without_menu:
-                    try:
-                        # Apify로 상세 정보 조회 (메뉴 포함)
-                        details = await apify.get_restaurant_details(
-                            restaurant_name=restaurant.name,
-                            address=restaurant.address
-                        )
-                        
-                        if details and (details.get('menus') or details.get('menu_items')):
-                            # 메뉴 데이터 저장
-                            menus = details.get('menus', []) or details.get('menu_items', [])
-                            
-                            # JSON 배열 형태로 저장
-                            menu_list = []
-                            for menu in menus[:10]:  # 최대 10개
-                                if isinstance(menu, dict):
-                                    menu_list.append({
-                                        "name": menu.get('name', ''),
-                                        "price": menu.get('price', '')
-                                    })
-                                elif isinstance(menu, str):
-                                    menu_list.append({
-                                        "name": menu,
-                                        "price": ""
-                                    })
-                            
-                            restaurant.menu_summary = menu_list
-                            batch_updated += 1
-                            logger.info(f"  ✓ Updated menu: {restaurant.name} ({len(menu_list)} items)")
-                        else:
-                            logger.debug(f"  ⚠️  No menu found: {restaurant.name}")
-                        
-                        await asyncio.sleep(2)  # Rate limiting
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to update menu for {restaurant.name}: {e}")
-                
-                # 배치 커밋
-                db.commit()
-                total_updated += batch_updated
-                logger.info(f"  ✓ Batch committed: {batch_updated}/{len(restaurants_without_menu)} updated (Total: {total_updated})")
-                
-                if len(restaurants_without_menu) < batch_size:
-                    break
+        if not result['processed']:
+            logger.info("No restaurants need Google enrichment")
         
-        logger.info(f"✅ Menu update completed: {total_updated} restaurants")
-        return total_updated
+        return result['enriched']
             
     except Exception as e:
-        logger.error(f"❌ Menu update failed: {e}")
+        logger.error(f"❌ Google enrichment failed: {e}")
         return 0
 
 
@@ -453,6 +166,10 @@ async def sync_daily():
         workflow = SyncWorkflow()
         result = await workflow.sync_to_hansikdang()
         logger.info(f"✅ Sync completed: {result}")
+        
+        # 이미 동기화된 레스토랑 중 이후 수정된 것만 재전송
+        changes = await workflow.sync_to_hansikdang(delta=True)
+        logger.info(f"✅ Delta sync completed: {changes}")
         return result
         
     except Exception as e:
@@ -460,42 +177,6 @@ async def sync_daily():
         return 0
 
 
-async def deduplicate_daily():
-    """중복 탐지 및 자동 병합"""
-    logger.info("=" * 70)
-    logger.info("🔍 Starting daily duplicate detection and merging")
-    logger.info("=" * 70)
-    
-    try:
-        with db_session() as db:
-            service = DeduplicationService(
-                db=db,
-                name_threshold=90.0,
-                address_threshold=85.0,
-                distance_threshold_meters=100.0
-            )
-            
-            result = service.detect_and_merge_duplicates(
-                auto_merge=True,
-                merge_type='auto'
-            )
-            
-            logger.info("=" * 70)
-            logger.info("✅ Duplicate detection and merging completed")
-            logger.info(f"   Total restaurants: {result['total_restaurants']}")
-            logger.info(f"   Duplicate groups found: {result['duplicate_groups_found']}")
-            logger.info(f"   Merged groups: {result['merged_groups']}")
-            logger.info(f"   Total merged restaurants: {result['total_merged_restaurants']}")
-            logger.info("=" * 70)
-            
-            return result['merged_groups']
-        
-    except Exception as e:
-        logger.error(f"❌ Duplicate detection failed: {e}")
-        logger.exception(e)
-        return 0
-
-
 def log_statistics():
     """통계 로깅 및 시스템 모니터링"""
     try:
@@ -540,44 +221,17 @@ def log_statistics():
         logger.error(f"Failed to log statistics: {e}")
 
 
-def smart_targeting_job():
-    """스마트 타겟팅 작업 (동기 래퍼)"""
-    asyncio.run(generate_smart_queries_daily())
-
-
-def scrape_naver_job():
-    """네이버 수집 작업 (동기 래퍼)"""
-    asyncio.run(scrape_naver_daily())
-
-
-def process_job():
-    """정제 작업 (동기 래퍼)"""
-    asyncio.run(process_pending_daily())
-
-
-def sync_job():
-    """동기화 작업 (동기 래퍼)"""
-    asyncio.run(sync_daily())
-
-
-def google_enrichment_job():
-    """구글 평점 보강 작업 (동기 래퍼)"""
-    asyncio.run(enrich_with_google_ratings())
-
-
-def deduplication_job():
-    """중복 탐지 및 병합 작업 (동기 래퍼)"""
-    asyncio.run(deduplicate_daily())
-
-
-def weekly_update_job():
-    """주간 전체 데이터 업데이트 (동기 래퍼)"""
-    asyncio.run(update_all_restaurants_weekly())
-
-
-def backup_job():
-    """Google Drive 백업 작업 (동기 래퍼)"""
-    backup_daily_data()
+def rescore_quality():
+    """품질 입력 필드가 바뀐 레스토랑만 품질 점수 재계산"""
+    try:
+        with db_session() as db:
+            rescorer = QualityRescorer(db)
+            rescorer.mark_stale()
+            stats = rescorer.rescore()
+            return stats['rescored']
+    except Exception as e:
+        logger.error(f"❌ Quality rescoring failed: {e}")
+        return 0
 
 
 def backup_daily_data():
@@ -605,6 +259,13 @@ def backup_daily_data():
             else:
                 logger.error(f"❌ Backup failed: {backup_history.error_message}")
             
+            # 바뀐 파티션만 Parquet 스냅샷으로 저장 (CSV 백업 성공 여부와 별개)
+            if PYARROW_AVAILABLE:
+                try:
+                    SnapshotExporter(db).export(derive_csv=settings.snapshot_derive_csv)
+                except Exception as e:
+                    logger.error(f"❌ Snapshot failed: {e}")
+            
             return backup_history.status == 'success'
             
     except Exception as e:
@@ -612,6 +273,32 @@ def backup_daily_data():
         return False
 
 
+def full_backup_weekly():
+    """전체 DB 백업 (이전 실행이 중단됐으면 남은 chunk부터 이어서 진행)"""
+    logger.info("=" * 70)
+    logger.info("🗄️  Starting full database backup")
+    logger.info("=" * 70)
+    
+    try:
+        result = FullBackupManager().backup()
+        return result['status'] == 'success'
+    except Exception as e:
+        logger.error(f"❌ Full backup job failed: {e}")
+        return False
+
+
+def compact_logs_daily():
+    """로그 테이블 다음 달 파티션 생성 + 보존 기간이 지난 달 요약 후 삭제"""
+    try:
+        manager = RetentionManager()
+        manager.ensure_partitions()
+        results = manager.apply_retention()
+        return sum(result['rows'] for result in results.values())
+    except Exception as e:
+        logger.error(f"❌ Log compaction failed: {e}")
+        return 0
+
+
 async def update_all_restaurants_weekly():
     """매주 모든 레스토랑의 누락된 정보를 Apify로 업데이트"""
     logger.info("=" * 70)
@@ -704,64 +391,114 @@ async def update_all_restaurants_weekly():
         return 0
 
 
-def setup_schedule():
-    """스케줄 설정 (UTC 기준, KST = UTC + 9시간)"""
+def build_scheduler() -> AsyncScheduler:
+    """스케줄 설정 (cron, UTC 기준, KST = UTC + 9시간)"""
     logger.info("🚀 Setting up 24/7 automated schedule...")
     
+    # 작업 이름 단위 분산 잠금 (API /api/jobs/*/run과 같은 이름 사용)
+    scheduler = AsyncScheduler(lock_service=job_locks)
+    
     # UTC 16:30 = KST 01:30 (다음날) - 스마트 타겟팅
-    schedule.every().day.at("16:30").do(smart_targeting_job)
+    scheduler.add_job("smart_targeting", generate_smart_queries_daily, "30 16 * * *", timeout=30 * 60)
     logger.info("  ✓ Smart targeting: Daily at 16:30 UTC (KST 01:30, dynamic queries)")
     
-    # UTC 18:00 = KST 03:00 (다음날)
-    schedule.every().day.at("18:00").do(scrape_naver_job)
-    logger.info("  ✓ Naver scraping: Daily at 18:00 UTC (KST 03:00, 33 restaurants)")
-    
-    # UTC 18:05 = KST 03:05 (다음날) - 중복 탐지 및 병합 (Gemini/Google 전에 실행)
-    schedule.every().day.at("18:05").do(deduplication_job)
-    logger.info("  ✓ Duplicate detection: Daily at 18:05 UTC (KST 03:05, auto-merge)")
+    # UTC 18:00 = KST 03:00 (다음날) - 수집 → 정제 → 보강 → 중복제거 → 동기화 (스트리밍)
+    scheduler.add_job("pipeline", pipeline_daily, "0 18 * * *", timeout=4 * 3600, jitter=60)
+    logger.info("  ✓ Streaming pipeline: Daily at 18:00 UTC (KST 03:00, scrape → refine → score → dedup → sync)")
     
-    # UTC 21:00 = KST 06:00 (다음날)
-    schedule.every().day.at("21:00").do(process_job)
-    logger.info("  ✓ Gemini processing: Daily at 21:00 UTC (KST 06:00)")
+    # UTC 22:00 = KST 07:00 (다음날) - 기존 레스토랑 보강 (파이프라인 외 backlog)
+    scheduler.add_job("google_enrichment", enrich_with_google_ratings, "0 22 * * *", timeout=2 * 3600, jitter=60)
+    logger.info("  ✓ Google enrichment: Daily at 22:00 UTC (KST 07:00, backlog 33 restaurants)")
     
-    # UTC 22:00 = KST 07:00 (다음날)
-    schedule.every().day.at("22:00").do(google_enrichment_job)
-    logger.info("  ✓ Google enrichment: Daily at 22:00 UTC (KST 07:00, 33 restaurants)")
-    
-    # UTC 23:00 = KST 08:00 (다음날)
-    schedule.every().day.at("23:00").do(sync_job)
-    logger.info("  ✓ Hansikdang sync: Daily at 23:00 UTC (KST 08:00)")
+    # UTC 23:00 = KST 08:00 (다음날) - 파이프라인에서 실패한 동기화 재시도
+    scheduler.add_job("sync", sync_daily, "0 23 * * *", overlap='queue', timeout=3600)
+    logger.info("  ✓ Hansikdang sync: Daily at 23:00 UTC (KST 08:00, retry sweep)")
     
     # UTC 13:00 = KST 22:00 (같은 날) - Google Drive 백업
-    schedule.every().day.at("13:00").do(backup_job)
+    scheduler.add_job("backup", backup_daily_data, "0 13 * * *", timeout=2 * 3600)
     logger.info("  ✓ Google Drive backup: Daily at 13:00 UTC (KST 22:00)")
     
     # 매주 일요일 UTC 03:00 = KST 12:00 (정오)
-    schedule.every().sunday.at("03:00").do(weekly_update_job)
+    scheduler.add_job("weekly_update", update_all_restaurants_weekly, "0 3 * * sun", timeout=6 * 3600)
     logger.info("  ✓ Weekly data update: Sunday at 03:00 UTC (KST 12:00)")
     
-    schedule.every().hour.do(log_statistics)
+    # 매주 일요일 UTC 14:00 = KST 23:00 - 전체 DB 백업 (일일 백업 이후)
+    scheduler.add_job("full_backup", full_backup_weekly, "0 14 * * sun", timeout=3 * 3600)
+    logger.info("  ✓ Full database backup: Sunday at 14:00 UTC (KST 23:00)")
+    
+    # UTC 15:00 = KST 00:00 - 로그 파티션 생성 + 보존 기간 정리 (백업 이후)
+    scheduler.add_job("log_retention", compact_logs_daily, "0 15 * * *", timeout=3600)
+    logger.info("  ✓ Log retention: Daily at 15:00 UTC (KST 00:00, rollup + drop expired months)")
+    
+    # 15분마다 변경된 레스토랑만 품질 재계산 (놓친 실행은 다음 실행이 모두 처리)
+    scheduler.add_job("quality_rescore", rescore_quality, "*/15 * * * *", timeout=15 * 60, catch_up=False)
+    logger.info("  ✓ Quality rescoring: Every 15 minutes (changed restaurants only)")
+    
+    # 통계는 놓친 실행을 다시 돌릴 필요 없음
+    scheduler.add_job("statistics", log_statistics, "0 * * * *", timeout=5 * 60, catch_up=False)
     logger.info("  ✓ Statistics logging: Every hour")
     
     logger.info("\n✅ Schedule setup completed!")
     logger.info("=" * 60)
     logger.info("📅 Daily Schedule (KST):")
     logger.info("  01:30 KST - Smart Targeting (외국인 인기도 분석 + 동적 쿼리 생성)")
-    logger.info("  03:00 KST - Naver Maps scraping (33 smart queries)")
-    logger.info("  03:05 KST - Duplicate detection & merging (중복 제거)")
-    logger.info("  06:00 KST - Gemini AI processing")
-    logger.info("  07:00 KST - Google rating enrichment (33 restaurants)")
-    logger.info("  08:00 KST - Sync to 한식당 platform")
+    logger.info("  03:00 KST - Streaming pipeline (수집 → 정제 → 보강 → 중복제거 → 동기화)")
+    logger.info("  07:00 KST - Google rating enrichment (backlog 33 restaurants)")
+    logger.info("  08:00 KST - Sync to 한식당 platform (retry sweep)")
     logger.info("  22:00 KST - Google Drive daily backup")
+    logger.info("  00:00 KST - Log partitions + retention (rollup → drop)")
+    logger.info("  Every 15 min - Quality rescoring (changed restaurants only)")
     logger.info("  Every hour - Statistics logging")
     logger.info("")
     logger.info("📅 Weekly Schedule (KST):")
     logger.info("  Sunday 12:00 KST - Full data update (phone, menu, hours)")
+    logger.info("  Sunday 23:00 KST - Full database backup (parallel, resumable)")
     logger.info("=" * 60)
     logger.info(f"🎯 Daily target: 33 restaurants (스마트 타겟팅)")
     logger.info(f"🎯 Monthly target: 990 restaurants")
     logger.info(f"💾 Backup: Daily 22:00 KST to Google Drive")
     logger.info("=" * 60)
+    
+    return scheduler
+
+
+async def run_scheduler():
+    """스케줄러 실행 (API 재시작 요청 시 작업을 다시 구성)"""
+    loop = asyncio.get_running_loop()
+    
+    # 모든 작업이 같은 루프에서 실행되므로 HTTP 커넥션을 작업 간에 재사용
+    await http_clients.startup()
+    await asyncio.to_thread(known_ids.load)
+    lineage_sink.start()
+    metrics_sampler.start(loop=asyncio.get_running_loop())
+    if settings.metrics_textfile_path:
+        registry.start_textfile(settings.metrics_textfile_path, settings.metrics_textfile_interval)
+    
+    while True:
+        scheduler = build_scheduler()
+        
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, scheduler.stop)
+        
+        await asyncio.to_thread(log_statistics)
+        
+        logger.info("\n🔄 Scheduler running... (Press Ctrl+C to stop)")
+        logger.info("⏸️  Control: POST /api/jobs/scheduler/pause|resume|restart")
+        logger.info("=" * 60)
+        
+        result = await scheduler.run()
+        if result != 'restart':
+            break
+        
+        logger.info("🔁 Restarting scheduler...")
+    
+    await http_clients.aclose()
+    await asyncio.to_thread(known_ids.close)
+    await asyncio.to_thread(lineage_sink.close)
+    await asyncio.to_thread(metrics_sampler.close)
+    if settings.metrics_textfile_path:
+        await asyncio.to_thread(registry.stop_textfile, settings.metrics_textfile_path)
+    logger.info("\n🛑 Scheduler stopped")
 
 
 def main():
@@ -774,27 +511,8 @@ def main():
     
     init_db()
     
-    setup_schedule()
-    
-    log_statistics()
-    
-    logger.info("\n🔄 Scheduler running... (Press Ctrl+C to stop)")
-    logger.info("⏰ Schedule check interval: 10 seconds")
-    logger.info("=" * 60)
-    
     try:
-        loop_count = 0
-        while True:
-            schedule.run_pending()
-            loop_count += 1
-            
-            if loop_count % 360 == 0:
-                logger.debug(f"Scheduler loop: {loop_count} iterations ({loop_count // 360} hours)")
-            
-            time.sleep(10)
-            
-    except KeyboardInterrupt:
-        logger.info("\n🛑 Scheduler stopped by user")
+        asyncio.run(run_scheduler())
     except Exception as e:
         logger.error(f"❌ Scheduler error: {e}")
         raise
@@ -78,7 +78,7 @@ async def sync_batch(
         }
         
         # 한식당 플랫폼으로 동기화
-        await workflow.sync_to_hansikdang()
+        await workflow.sync_to_hansikdang(restaurant_ids=[r.id for r in pending_restaurants])
         
         # 최신 동기화 로그 조회
         latest_log = db.query(SyncLog).order_by(
@@ -9,9 +9,9 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
-import json
 
 from src.database.connection import get_db
+from src.utils.serialization import FastJSONResponse, dumps_str
 
 router = APIRouter(prefix="/api/data-management/collection-results", tags=["Collection Results"])
 
@@ -214,8 +214,8 @@ async def create_collection_result(
             "region": result.region,
             "rating": result.rating,
             "review_count": result.review_count,
-            "business_hours": json.dumps(result.business_hours) if result.business_hours else None,
-            "menu_items": json.dumps(result.menu_items) if result.menu_items else None,
+            "business_hours": dumps_str(result.business_hours) if result.business_hours else None,
+            "menu_items": dumps_str(result.menu_items) if result.menu_items else None,
             "price_range": result.price_range,
             "popularity_score": scores["popularity_score"],
             "popularity_tier": scores["popularity_tier"],
@@ -226,11 +226,11 @@ async def create_collection_result(
             "quality_score": scores["quality_score"],
             "youtube_mention_count": result.youtube_mention_count,
             "blog_mention_count": result.blog_mention_count,
-            "images": json.dumps(result.images) if result.images else None,
+            "images": dumps_str(result.images) if result.images else None,
             "thumbnail_url": result.thumbnail_url,
             "source": result.source,
             "source_url": result.source_url,
-            "source_data": json.dumps(result.source_data) if result.source_data else None
+            "source_data": dumps_str(result.source_data) if result.source_data else None
         })
         
         row = result_data.fetchone()
@@ -328,13 +328,13 @@ async def get_collection_results(
                 "updated_at": row[12].isoformat() if row[12] else None
             })
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "total": total,
             "limit": limit,
             "offset": offset,
             "data": items
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"조회 실패: {str(e)}")
@@ -366,7 +366,7 @@ async def get_collection_result_detail(
         if not row:
             raise HTTPException(status_code=404, detail="수집 결과를 찾을 수 없습니다")
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "data": {
                 "id": row[0],
@@ -387,7 +387,7 @@ async def get_collection_result_detail(
                 "updated_at": row[15].isoformat() if row[15] else None,
                 "request_name": row[16]
             }
-        }
+        })
         
     except HTTPException:
         raise
@@ -439,13 +439,13 @@ async def update_collection_result(
             params["review_count"] = update_data.review_count
         if update_data.business_hours is not None:
             update_fields.append("business_hours = CAST(:business_hours AS jsonb)")
-            params["business_hours"] = json.dumps(update_data.business_hours)
+            params["business_hours"] = dumps_str(update_data.business_hours)
         if update_data.menu_items is not None:
             update_fields.append("menu_items = CAST(:menu_items AS jsonb)")
-            params["menu_items"] = json.dumps(update_data.menu_items)
+            params["menu_items"] = dumps_str(update_data.menu_items)
         if update_data.links is not None:
             update_fields.append("links = CAST(:links AS jsonb)")
-            params["links"] = json.dumps(update_data.links)
+            params["links"] = dumps_str(update_data.links)
         
         if not update_fields:
             raise HTTPException(status_code=400, detail="수정할 필드가 없습니다")
@@ -17,6 +17,7 @@ from src.database.models import (
     DuplicateGroup, 
     QualityScore
 )
+from src.governance.quality_rescoring import QualityRescorer
 
 
 router = APIRouter(prefix="/api/data-management/duplicates", tags=["duplicate-management"])
@@ -164,64 +165,6 @@ def calculate_fuzzy_match_score(r1: Dict[str, Any], r2: Dict[str, Any]) -> float
     return round(total_similarity, 2)
 
 
-def calculate_quality_score(restaurant: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    데이터 품질 점수 계산
-    
-    Returns:
-        {
-            'completeness_score': float,  # 0-100
-            'phone_valid': bool,
-            'address_complete': bool,
-            'coordinates_valid': bool,
-            'total_score': float  # 0-100
-        }
-    """
-    score = {
-        'completeness_score': 0.0,
-        'phone_valid': False,
-        'address_complete': False,
-        'coordinates_valid': False,
-        'total_score': 0.0
-    }
-    
-    # 필수 필드 체크
-    required_fields = ['name', 'address', 'phone']
-    filled_required = sum(1 for field in required_fields if restaurant.get(field))
-    score['completeness_score'] = (filled_required / len(required_fields)) * 100
-    
-    # 전화번호 유효성 (10자리 이상 숫자)
-    phone = ''.join(filter(str.isdigit, str(restaurant.get('phone', ''))))
-    score['phone_valid'] = len(phone) >= 10
-    
-    # 주소 완성도 (10자 이상)
-    address = str(restaurant.get('address', '')).strip()
-    score['address_complete'] = len(address) >= 10
-    
-    # 좌표 유효성
-    lat = restaurant.get('latitude')
-    lng = restaurant.get('longitude')
-    if lat and lng:
-        try:
-            lat_f = float(lat)
-            lng_f = float(lng)
-            # 한국 좌표 범위: 위도 33-39, 경도 124-132
-            score['coordinates_valid'] = (33 <= lat_f <= 39 and 124 <= lng_f <= 132)
-        except:
-            score['coordinates_valid'] = False
-    
-    # 종합 점수 계산
-    total = 0
-    total += score['completeness_score'] * 0.4  # 40%
-    total += 20 if score['phone_valid'] else 0  # 20%
-    total += 20 if score['address_complete'] else 0  # 20%
-    total += 20 if score['coordinates_valid'] else 0  # 20%
-    
-    score['total_score'] = min(100, total)
-    
-    return score
-
-
 @router.post("/check")
 async def check_duplicates(
     request: DuplicateCheckRequest = DuplicateCheckRequest(),
@@ -615,71 +558,39 @@ async def ignore_duplicate(
 class QualityCalculateRequest(BaseModel):
     """품질 점수 계산 요청"""
     restaurant_ids: Optional[List[str]] = None
+    full: bool = False  # True면 전체 다시 계산 (기본: 변경된 레스토랑만)
 
 
 @router.post("/quality/calculate")
-async def calculate_quality_scores(
+def calculate_quality_scores(
     request: QualityCalculateRequest = QualityCalculateRequest(),
     db: Session = Depends(get_db)
 ):
-    """품질 점수 계산 및 저장"""
+    """
+    품질 점수 계산 및 저장 (레스토랑당 1행으로 교체)
+    
+    - restaurant_ids가 있으면 해당 레스토랑을 재계산 대상으로 표시
+    - full이면 전체를 표시
+    - 표시된(입력 필드가 바뀐) 레스토랑만 다시 계산
+    """
     try:
-        # 대상 레스토랑 조회
-        query = db.query(ProcessedRestaurant)
+        rescorer = QualityRescorer(db)
         if request.restaurant_ids:
-            query = query.filter(ProcessedRestaurant.id.in_(request.restaurant_ids))
+            rescorer.mark_dirty(request.restaurant_ids)
+        elif request.full:
+            rescorer.mark_dirty()
         
-        restaurants = query.all()
+        stats = rescorer.rescore()
         
-        if not restaurants:
+        if not stats['rescored']:
             return {
                 "message": "계산 대상이 없습니다",
                 "total_calculated": 0
             }
         
-        calculated = 0
-        for restaurant in restaurants:
-            r_data = {
-                'name': restaurant.name,
-                'address': restaurant.address,
-                'phone': restaurant.phone,
-                'latitude': restaurant.latitude,
-                'longitude': restaurant.longitude
-            }
-            
-            score_data = calculate_quality_score(r_data)
-            
-            # 기존 점수 확인
-            existing = db.query(QualityScore).filter(
-                QualityScore.restaurant_id == restaurant.id
-            ).first()
-            
-            if existing:
-                # 업데이트
-                existing.completeness_score = score_data['completeness_score']
-                existing.phone_valid = score_data['phone_valid']
-                existing.address_complete = score_data['address_complete']
-                existing.coordinates_valid = score_data['coordinates_valid']
-                existing.total_score = score_data['total_score']
-            else:
-                # 신규 생성
-                new_score = QualityScore(
-                    restaurant_id=restaurant.id,
-                    completeness_score=score_data['completeness_score'],
-                    phone_valid=score_data['phone_valid'],
-                    address_complete=score_data['address_complete'],
-                    coordinates_valid=score_data['coordinates_valid'],
-                    total_score=score_data['total_score']
-                )
-                db.add(new_score)
-            
-            calculated += 1
-        
-        db.commit()
-        
         return {
             "message": "품질 점수 계산 완료",
-            "total_calculated": calculated
+            "total_calculated": stats['rescored']
         }
     
     except Exception as e:
@@ -3,14 +3,18 @@ Governance API Routes - 데이터 거버넌스 엔드포인트
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from ..database.connection import get_db
 from ..database.models import QualityMetrics, DataLineage, ProcessedRestaurant
 from ..governance.quality_validator import QualityValidator
+from ..governance.quality_rescoring import QualityRescorer
 from ..governance.lineage_tracker import DataLineageTracker
+from ..governance.lineage_sink import lineage_sink
 from ..governance.drive_backup import DriveBackupManager
+from ..governance.retention import RetentionManager
 
 
 router = APIRouter(prefix="/api/governance", tags=["governance"])
@@ -19,6 +23,7 @@ router = APIRouter(prefix="/api/governance", tags=["governance"])
 class QualityValidationRequest(BaseModel):
     restaurant_id: Optional[str] = None
     batch_size: Optional[int] = 100
+    incremental: bool = False  # True면 입력 필드가 바뀐 레스토랑만 재계산
 
 
 @router.post("/quality/validate")
@@ -30,10 +35,20 @@ def validate_quality(
     데이터 품질을 검증합니다.
     
     - restaurant_id가 있으면 해당 레스토랑만 검증
-    - 없으면 일괄 검증 (batch_size 개수만큼)
+    - 없으면 일괄 검증 (batch_size 개수만큼, 0이면 전체)
+    - incremental이면 변경된 레스토랑만 재계산 (batch_size = 최대 처리 수)
     """
     validator = QualityValidator(db)
     
+    if request.incremental and not request.restaurant_id:
+        stats = QualityRescorer(db).rescore(limit=request.batch_size or None)
+        
+        return {
+            "status": "success",
+            "type": "incremental",
+            "statistics": stats
+        }
+    
     if request.restaurant_id:
         restaurant = db.query(ProcessedRestaurant).filter(
             ProcessedRestaurant.id == request.restaurant_id
@@ -103,10 +118,13 @@ def get_quality_metrics(
 
 @router.get("/quality/stats")
 def get_quality_stats(db: Session = Depends(get_db)):
-    """품질 통계를 조회합니다."""
-    metrics = db.query(QualityMetrics).all()
+    """품질 통계를 조회합니다. (DB에서 집계)"""
+    total, avg_score = db.query(
+        func.count(QualityMetrics.id),
+        func.avg(QualityMetrics.overall_quality_score)
+    ).one()
     
-    if not metrics:
+    if not total:
         return {
             "status": "success",
             "total_validated": 0,
@@ -114,18 +132,17 @@ def get_quality_stats(db: Session = Depends(get_db)):
             "grade_distribution": {}
         }
     
-    total = len(metrics)
-    avg_score = sum(m.overall_quality_score for m in metrics) / total
-    
-    grade_dist = {}
-    for grade in ['A', 'B', 'C', 'D', 'F']:
-        count = sum(1 for m in metrics if m.quality_grade == grade)
-        grade_dist[grade] = count
+    counts = dict(
+        db.query(QualityMetrics.quality_grade, func.count(QualityMetrics.id))
+        .group_by(QualityMetrics.quality_grade)
+        .all()
+    )
+    grade_dist = {grade: counts.get(grade, 0) for grade in ['A', 'B', 'C', 'D', 'F']}
     
     return {
         "status": "success",
         "total_validated": total,
-        "average_score": round(avg_score, 2),
+        "average_score": round(float(avg_score or 0), 2),
         "grade_distribution": grade_dist,
         "a_grade_percentage": round((grade_dist.get('A', 0) / total * 100) if total > 0 else 0, 2)
     }
@@ -135,15 +152,17 @@ def get_quality_stats(db: Session = Depends(get_db)):
 def get_lineage_stats(
     operation: Optional[str] = None,
     hours: int = 24,
+    percentiles: bool = False,
     db: Session = Depends(get_db)
 ):
-    """계보 통계를 조회합니다."""
+    """계보 통계를 조회합니다. (percentiles: 실행 시간 p50/p95/p99 포함, sink: 버퍼 기록/버림 횟수)"""
     tracker = DataLineageTracker(db)
-    stats = tracker.get_operation_stats(operation=operation, hours=hours)
+    stats = tracker.get_operation_stats(operation=operation, hours=hours, with_percentiles=percentiles)
     
     return {
         "status": "success",
-        "statistics": stats
+        "statistics": stats,
+        "sink": lineage_sink.stats()
     }
 
 
@@ -165,6 +184,15 @@ def get_lineage(
     }
 
 
+@router.get("/retention/status")
+def get_retention_status():
+    """로그 테이블 저장 방식(월 파티션/일반), 행 수, 보존 기간을 조회합니다."""
+    return {
+        "status": "success",
+        "tables": RetentionManager().status()
+    }
+
+
 @router.get("/backup/status")
 def get_backup_status(db: Session = Depends(get_db)):
     """최근 백업 상태를 조회합니다."""
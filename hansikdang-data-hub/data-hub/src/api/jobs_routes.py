@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 import asyncio
 
@@ -8,24 +8,37 @@ from src.database.connection import get_db
 from src.workflows.scraping import ScrapingWorkflow
 from src.workflows.sync import SyncWorkflow
 from src.api.governance_routes import BackupRequest
+from src.scheduling.locks import job_locks
 import logging
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 logger = logging.getLogger(__name__)
 
+# 수집/Gemini 정제/중복제거는 스케줄러의 파이프라인 단계와 같은 작업이므로 파이프라인 잠금을 함께 사용
+PIPELINE_LOCK = "pipeline"
+
+
+async def _ensure_not_running(job_name: str) -> None:
+    """다른 프로세스(스케줄러/API 레플리카)에서 실행 중이면 409"""
+    holder = await asyncio.to_thread(job_locks.get_holder, job_name)
+    if holder:
+        raise HTTPException(status_code=409, detail=f"이미 실행 중입니다: {job_name} ({holder})")
+
 
 @router.post("/targeting/run")
 async def run_targeting(background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
     Smart Targeting 실행 (Google Trends 분석 + 동적 쿼리 생성)
     """
+    await _ensure_not_running("smart_targeting")
+    
     try:
         from src.workflows.smart_targeting import SmartTargetingWorkflow
         
         workflow = SmartTargetingWorkflow()
         
         # 백그라운드에서 실행
-        background_tasks.add_task(workflow.run_smart_targeting)
+        background_tasks.add_task(job_locks.run_exclusive, "smart_targeting", workflow.run_smart_targeting)
         
         return {
             "status": "success",
@@ -42,11 +55,13 @@ async def run_scraping(background_tasks: BackgroundTasks, db: Session = Depends(
     """
     Naver Maps 스크래핑 실행 (33개 스마트 쿼리)
     """
+    await _ensure_not_running(PIPELINE_LOCK)
+    
     try:
         workflow = ScrapingWorkflow()
         
         # 백그라운드에서 실행
-        background_tasks.add_task(workflow.run_daily_scraping)
+        background_tasks.add_task(job_locks.run_exclusive, PIPELINE_LOCK, workflow.run_daily_scraping)
         
         return {
             "status": "success",
@@ -58,18 +73,47 @@ async def run_scraping(background_tasks: BackgroundTasks, db: Session = Depends(
         raise HTTPException(status_code=500, detail=f"실행 실패: {str(e)}")
 
 
+@router.post("/pipeline/run")
+async def run_pipeline(background_tasks: BackgroundTasks) -> Dict[str, Any]:
+    """
+    스트리밍 파이프라인 실행 (수집 → 정제 → 보강 → 중복제거 → 동기화)
+    """
+    await _ensure_not_running(PIPELINE_LOCK)
+    
+    try:
+        from src.workflows.pipeline import run_daily_pipeline
+        from src.workflows.stages import load_daily_queries
+        
+        # 쿼리 목록은 DB에서 읽으므로 이벤트 루프를 막지 않도록 스레드에서 조회
+        queries = await asyncio.to_thread(load_daily_queries)
+        
+        # 백그라운드에서 실행
+        background_tasks.add_task(job_locks.run_exclusive, PIPELINE_LOCK, run_daily_pipeline, queries)
+        
+        return {
+            "status": "success",
+            "message": "스트리밍 파이프라인이 백그라운드에서 실행 중입니다",
+            "started_at": datetime.now(timezone.utc).isoformat()
+        }
+    except Exception as e:
+        logger.error(f"파이프라인 실행 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"실행 실패: {str(e)}")
+
+
 @router.post("/deduplication/run")
 async def run_deduplication(background_tasks: BackgroundTasks, db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
     중복 탐지 & 병합 실행
     """
+    await _ensure_not_running(PIPELINE_LOCK)
+    
     try:
         from src.workflows.deduplication import DeduplicationWorkflow
         
         workflow = DeduplicationWorkflow()
         
         # 백그라운드에서 실행
-        background_tasks.add_task(workflow.detect_and_merge_duplicates)
+        background_tasks.add_task(job_locks.run_exclusive, PIPELINE_LOCK, workflow.detect_and_merge_duplicates)
         
         return {
             "status": "success",
@@ -86,6 +130,8 @@ async def run_gemini_processing(background_tasks: BackgroundTasks, db: Session =
     """
     Gemini AI 데이터 정제 실행
     """
+    await _ensure_not_running(PIPELINE_LOCK)
+    
     try:
         from src.processors.gemini import GeminiProcessor
         from src.database.models import RawRestaurantData, ProcessedRestaurant
@@ -129,7 +175,7 @@ async def run_gemini_processing(background_tasks: BackgroundTasks, db: Session =
                 logger.info(f"Gemini processing completed: {processed_count} restaurants")
         
         # 백그라운드에서 실행
-        background_tasks.add_task(process_with_gemini)
+        background_tasks.add_task(job_locks.run_exclusive, PIPELINE_LOCK, process_with_gemini)
         
         return {
             "status": "success",
@@ -146,13 +192,15 @@ async def run_places_enrichment(background_tasks: BackgroundTasks, db: Session =
     """
     Google Places API 데이터 보강 실행 (평점, 리뷰, 이미지)
     """
+    await _ensure_not_running("google_enrichment")
+    
     try:
         from src.workflows.google_places import GooglePlacesWorkflow
         
         workflow = GooglePlacesWorkflow()
         
         # 백그라운드에서 실행
-        background_tasks.add_task(workflow.enrich_restaurants)
+        background_tasks.add_task(job_locks.run_exclusive, "google_enrichment", workflow.enrich_restaurants)
         
         return {
             "status": "success",
@@ -169,11 +217,13 @@ async def run_sync(background_tasks: BackgroundTasks, db: Session = Depends(get_
     """
     메인 플랫폼 동기화 실행 (한식당 앱)
     """
+    await _ensure_not_running("sync")
+    
     try:
         workflow = SyncWorkflow()
         
         # 백그라운드에서 실행
-        background_tasks.add_task(workflow.sync_to_hansikdang)
+        background_tasks.add_task(job_locks.run_exclusive, "sync", workflow.sync_to_hansikdang)
         
         return {
             "status": "success",
@@ -190,13 +240,15 @@ async def run_backup(background_tasks: BackgroundTasks, db: Session = Depends(ge
     """
     Google Drive 백업 실행
     """
+    await _ensure_not_running("backup")
+    
     try:
         from src.governance.drive_backup import DriveBackupManager
         
         backup_manager = DriveBackupManager(db)
         
         # 백그라운드에서 실행 (manual backup)
-        background_tasks.add_task(backup_manager.backup_daily, None, 'manual')
+        background_tasks.add_task(job_locks.run_exclusive, "backup", backup_manager.backup_daily, None, 'manual')
         
         return {
             "status": "success",
@@ -246,8 +298,13 @@ async def get_jobs_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
             BackupHistory.started_at.desc()
         ).first()
         
+        # 분산 잠금 보유 현황 (어느 프로세스가 어떤 작업을 실행 중인지)
+        locks = await asyncio.to_thread(job_locks.list_locks)
+        
         return {
             "status": "success",
+            "locks": locks,
+            "running": {lock["job_name"]: lock["holder"] for lock in locks if lock["held"]},
             "jobs": {
                 "targeting": {
                     "last_run": latest_targeting.created_at.isoformat() if latest_targeting else None,
@@ -291,37 +348,84 @@ async def get_jobs_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"조회 실패: {str(e)}")
 
 
+@router.get("/scheduler")
+async def get_scheduler_status() -> Dict[str, Any]:
+    """
+    스케줄러 상태 조회 (heartbeat, 일시정지 여부, 작업별 다음 실행/마지막 결과)
+    """
+    try:
+        from src.scheduling import state
+        
+        return {"status": "success", "scheduler": await asyncio.to_thread(state.get_scheduler_status)}
+    except Exception as e:
+        logger.error(f"스케줄러 상태 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"조회 실패: {str(e)}")
+
+
 @router.post("/scheduler/pause")
-async def pause_scheduler() -> Dict[str, Any]:
+async def pause_scheduler(job_name: Optional[str] = None) -> Dict[str, Any]:
     """
-    스케줄러 일시정지 (주의: 실제 구현 필요)
+    스케줄러 일시정지 (job_name 지정 시 해당 작업만)
+    
+    실행 중인 작업은 계속 진행되고, 이후 예약 실행만 건너뜁니다.
     """
-    return {
-        "status": "info",
-        "message": "스케줄러 일시정지 기능은 scheduler.py에서 구현 필요",
-        "note": "현재는 scheduler 프로세스를 수동으로 중지해야 합니다"
-    }
+    try:
+        from src.scheduling import state
+        
+        scheduler_status = await asyncio.to_thread(state.set_paused, True, job_name)
+        
+        return {
+            "status": "success",
+            "message": f"{job_name or '스케줄러'} 일시정지됨",
+            "scheduler": scheduler_status
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"스케줄러 일시정지 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"일시정지 실패: {str(e)}")
 
 
 @router.post("/scheduler/resume")
-async def resume_scheduler() -> Dict[str, Any]:
+async def resume_scheduler(job_name: Optional[str] = None) -> Dict[str, Any]:
     """
-    스케줄러 재개 (주의: 실제 구현 필요)
+    스케줄러 재개 (job_name 지정 시 해당 작업만)
     """
-    return {
-        "status": "info",
-        "message": "스케줄러 재개 기능은 scheduler.py에서 구현 필요",
-        "note": "현재는 scheduler 프로세스를 수동으로 시작해야 합니다"
-    }
+    try:
+        from src.scheduling import state
+        
+        scheduler_status = await asyncio.to_thread(state.set_paused, False, job_name)
+        
+        return {
+            "status": "success",
+            "message": f"{job_name or '스케줄러'} 재개됨",
+            "scheduler": scheduler_status
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"스케줄러 재개 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"재개 실패: {str(e)}")
 
 
 @router.post("/scheduler/restart")
 async def restart_scheduler() -> Dict[str, Any]:
     """
-    스케줄러 재시작 (주의: 실제 구현 필요)
+    스케줄러 재시작 요청
+    
+    실행 중인 스케줄러가 다음 heartbeat(최대 수 초)에서 요청을 확인하고,
+    진행 중인 작업을 정리한 뒤 작업 구성을 다시 로드합니다.
     """
-    return {
-        "status": "info",
-        "message": "스케줄러 재시작 기능은 scheduler.py에서 구현 필요",
-        "note": "현재는 Replit workflow를 수동으로 재시작해야 합니다"
-    }
+    try:
+        from src.scheduling import state
+        
+        scheduler_status = await asyncio.to_thread(state.request_restart)
+        
+        return {
+            "status": "success",
+            "message": "스케줄러 재시작이 요청되었습니다",
+            "scheduler": scheduler_status
+        }
+    except Exception as e:
+        logger.error(f"스케줄러 재시작 요청 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"재시작 요청 실패: {str(e)}")
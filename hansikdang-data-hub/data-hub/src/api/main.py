@@ -4,12 +4,15 @@ FastAPI Server for Restaurant Data Hub
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.datastructures import Default
 from fastapi.responses import FileResponse, RedirectResponse, Response
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
+import asyncio
 import uuid
 from datetime import datetime
 import os
+import time
 
 from src.database.connection import get_db, init_db
 from src.database.models import (
@@ -17,6 +20,14 @@ from src.database.models import (
     ScrapingLog, SyncLog, CollectionConfig, DuplicateGroup, QualityScore
 )
 from src.workflows.scraping import ScrapingWorkflow
+from src.utils.http_client import http_clients
+from src.utils.known_ids import known_ids
+from src.governance.lineage_sink import lineage_sink
+from src.monitoring.metrics_sampler import metrics_sampler
+from src.monitoring.metrics import (
+    HTTP_REQUEST_SECONDS, OPENMETRICS_CONTENT_TYPE, PROMETHEUS_CONTENT_TYPE, registry
+)
+from src.utils.serialization import FastJSONResponse
 from src.api.targeting_routes import router as targeting_router
 from src.api.deduplication_routes import router as deduplication_router
 from src.api.governance_routes import router as governance_router
@@ -35,10 +46,12 @@ from src.api.unified_editor_routes import router as unified_editor_router
 from src.api.deployment_routes import router as deployment_router
 from config import settings
 
+# Default()로 감싸야 response_model이 있는 라우트는 pydantic 직렬화 fast path를 유지
 app = FastAPI(
     title="Restaurant Data Hub API",
     description="데이터 수집 및 관리 시스템",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=Default(FastJSONResponse)
 )
 
 app.include_router(targeting_router)
@@ -76,6 +89,24 @@ async def add_cache_control_header(request: Request, call_next):
     response.headers["Expires"] = "0"
     return response
 
+# 요청 지연 메트릭 (route: 경로 템플릿, 매칭 안 된 경로는 하나로 묶음)
+@app.middleware("http")
+async def observe_request_time(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status)
+        )
+
 # Static files
 static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static")
 if os.path.exists(static_dir):
@@ -84,8 +115,21 @@ if os.path.exists(static_dir):
 
 @app.on_event("startup")
 async def startup_event():
-    """서버 시작 시 DB 초기화"""
+    """서버 시작 시 DB 초기화 + 공유 HTTP 클라이언트 생성 + 수집 ID 인덱스 로드 + 계보 기록/리소스 샘플링 스레드 시작"""
     init_db()
+    await http_clients.startup()
+    await asyncio.to_thread(known_ids.load)
+    lineage_sink.start()
+    metrics_sampler.start(loop=asyncio.get_running_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 HTTP 커넥션 정리 + 수집 ID 인덱스 저장 + 남은 계보 이벤트/리소스 샘플 기록"""
+    await http_clients.aclose()
+    await asyncio.to_thread(known_ids.close)
+    await asyncio.to_thread(lineage_sink.close)
+    await asyncio.to_thread(metrics_sampler.close)
 
 
 @app.get("/")
@@ -114,6 +158,16 @@ async def health_check(db: Session = Depends(get_db)):
         }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus / OpenMetrics 노출"""
+    openmetrics = "application/openmetrics-text" in request.headers.get("accept", "")
+    return Response(
+        registry.render(openmetrics=openmetrics),
+        media_type=OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE
+    )
+
+
 @app.get("/api/stats")
 async def get_stats(db: Session = Depends(get_db)):
     """전체 통계"""
@@ -227,7 +281,7 @@ async def get_raw_restaurants(
         RawRestaurantData.scraped_at.desc()
     ).limit(limit).all()
     
-    return [
+    return FastJSONResponse([
         {
             "id": item.id,
             "source": item.source,
@@ -236,7 +290,7 @@ async def get_raw_restaurants(
             "scraped_at": item.scraped_at.isoformat(),
         }
         for item in items
-    ]
+    ])
 
 
 @app.get("/dashboard")
@@ -42,6 +42,31 @@ def get_component_health(
     }
 
 
+@router.get("/system-metrics")
+def get_system_metrics(seconds: Optional[int] = 300):
+    """백그라운드 샘플러의 최근 리소스 샘플을 조회합니다. (DB 조회 없음)"""
+    from ..monitoring.metrics_sampler import metrics_sampler
+    
+    return {
+        "status": "success",
+        "interval_seconds": metrics_sampler.interval,
+        "latest": metrics_sampler.latest(),
+        "samples": metrics_sampler.series(seconds=seconds)
+    }
+
+
+@router.get("/http-clients")
+def get_http_client_metrics():
+    """외부 연동 HTTP 클라이언트의 요청/커넥션 재사용 메트릭을 조회합니다."""
+    from ..utils.http_client import http_clients, HTTP2_AVAILABLE
+    
+    return {
+        "status": "success",
+        "http2_available": HTTP2_AVAILABLE,
+        "clients": http_clients.metrics()
+    }
+
+
 @router.get("/alerts")
 def get_alerts(db: Session = Depends(get_db)):
     """현재 활성 알림을 조회합니다."""
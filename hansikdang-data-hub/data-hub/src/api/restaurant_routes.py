@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 
 from src.database.connection import get_db
 from src.database.models import ProcessedRestaurant, RawRestaurantData
+from src.utils.serialization import FastJSONResponse
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/restaurants", tags=["restaurants"])
@@ -42,7 +43,7 @@ def get_restaurants(
     sort_by: str = Query("created_at", description="정렬 기준 (created_at, name, rating, quality_score)"),
     sort_order: str = Query("desc", description="정렬 순서 (asc, desc)"),
     db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     레스토랑 리스트 조회 (검색, 필터, 정렬, 페이지네이션)
     """
@@ -113,21 +114,21 @@ def get_restaurants(
             "image_url": r.image_urls[0] if r.image_urls and len(r.image_urls) > 0 else None
         })
     
-    return {
+    return FastJSONResponse({
         "status": "success",
         "total": total_count,
         "page": page,
         "limit": limit,
         "total_pages": (total_count + limit - 1) // limit,
         "items": items
-    }
+    })
 
 
 @router.get("/{restaurant_id}")
 def get_restaurant(
     restaurant_id: str,
     db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+) -> FastJSONResponse:
     """
     레스토랑 상세 조회
     """
@@ -138,7 +139,7 @@ def get_restaurant(
     if not restaurant:
         raise HTTPException(status_code=404, detail="레스토랑을 찾을 수 없습니다")
     
-    return {
+    return FastJSONResponse({
         "status": "success",
         "data": {
             "id": restaurant.id,
@@ -169,7 +170,7 @@ def get_restaurant(
             "created_at": restaurant.created_at.isoformat() if restaurant.created_at else None,
             "updated_at": restaurant.updated_at.isoformat() if restaurant.updated_at else None
         }
-    }
+    })
 
 
 @router.put("/{restaurant_id}")
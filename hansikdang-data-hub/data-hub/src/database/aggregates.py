@@ -0,0 +1,101 @@
+"""
+SQL aggregate helpers - 통계 엔드포인트가 행을 Python으로 가져오지 않고 DB에서 집계
+
+- count_where(): 조건별 행 수 (SUM(CASE ...), 쿼리 하나에 여러 개 가능)
+- json_array_length(): JSON 배열 길이 (PostgreSQL json_array_length / MySQL JSON_LENGTH / SQLite JSON1)
+- percentiles(): 백분위수 (PostgreSQL percentile_cont, 그 외 DB는 정렬 후 OFFSET으로 nearest-rank)
+
+Usage:
+    total, merged = db.query(func.count(), func.sum(json_array_length(MergeHistory.merged_ids))).one()
+    latency = percentiles(db, DataLineage.execution_time_ms, DataLineage.executed_at >= cutoff)
+"""
+import math
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Integer, and_, case, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import FunctionElement
+
+
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def count_where(*criteria) -> Any:
+    """조건을 만족하는 행 수 (NULL 없이 0부터)"""
+    return func.coalesce(func.sum(case((and_(*criteria), 1), else_=0)), 0)
+
+
+class json_array_length(FunctionElement):
+    """JSON 배열 길이 (배열이 아니거나 NULL이면 NULL → SUM/AVG에서 제외)"""
+    type = Integer()
+    inherit_cache = True
+    name = "json_array_length"
+
+
+@compiles(json_array_length)
+def _json_array_length_default(element, compiler, **kw):
+    return f"json_array_length({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_length, "postgresql")
+def _json_array_length_postgresql(element, compiler, **kw):
+    # JSON 컬럼이 jsonb여도 동작하도록 json으로 변환, 배열이 아닌 값은 NULL
+    value = compiler.process(element.clauses, **kw)
+    return (
+        f"CASE WHEN json_typeof(CAST({value} AS json)) = 'array' "
+        f"THEN json_array_length(CAST({value} AS json)) END"
+    )
+
+
+@compiles(json_array_length, "mysql")
+def _json_array_length_mysql(element, compiler, **kw):
+    return f"JSON_LENGTH({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_length, "sqlite")
+def _json_array_length_sqlite(element, compiler, **kw):
+    value = compiler.process(element.clauses, **kw)
+    return f"CASE WHEN json_type({value}) = 'array' THEN json_array_length({value}) END"
+
+
+def _key(fraction: float) -> str:
+    return f"p{fraction * 100:g}".replace(".", "_")
+
+
+def percentiles(
+    db: Session,
+    column,
+    *criteria,
+    fractions: Sequence[float] = DEFAULT_PERCENTILES
+) -> Dict[str, Optional[float]]:
+    """
+    column 값의 백분위수 (NULL 제외)
+
+    PostgreSQL은 percentile_cont(보간) 쿼리 1번, 그 외 DB는 nearest-rank로
+    백분위수마다 ORDER BY ... LIMIT 1 OFFSET k (인덱스가 있으면 인덱스 스캔)
+
+    Returns:
+        {"p50": 12.0, "p95": 80.0, "p99": 120.0} (행이 없으면 값은 None)
+    """
+    where = (column.isnot(None), *criteria)
+
+    if db.get_bind().dialect.name == "postgresql":
+        row = db.execute(
+            select(*[func.percentile_cont(fraction).within_group(column) for fraction in fractions]).where(*where)
+        ).one()
+        return {
+            _key(fraction): round(float(value), 2) if value is not None else None
+            for fraction, value in zip(fractions, row)
+        }
+
+    count = db.execute(select(func.count()).where(*where)).scalar() or 0
+    result = {}
+    for fraction in fractions:
+        if not count:
+            result[_key(fraction)] = None
+            continue
+        offset = min(max(math.ceil(fraction * count) - 1, 0), count - 1)
+        value = db.execute(select(column).where(*where).order_by(column).offset(offset).limit(1)).scalar()
+        result[_key(fraction)] = round(float(value), 2) if value is not None else None
+    return result
@@ -0,0 +1,135 @@
+"""
+ProcessedRestaurant change tracking
+한식당 전송 형식(payload)의 해시를 content_hash에 유지해 동기화 이후 변경된 행을 찾음
+
+- ORM insert/update 시 content_hash 자동 갱신 (전송 필드가 바뀌지 않으면 해시도 그대로)
+- 전송 성공 시 SyncWorkflow가 last_synced_hash / synced_field_hashes 기록
+- content_hash != last_synced_hash 인 synced 행 = delta sync 대상 (부분 인덱스 idx_processed_sync_dirty)
+- 품질 지표 입력 필드(QUALITY_METRIC_FIELDS)가 바뀌면 quality_dirty = True → QualityRescorer가 해당 행만 재계산
+  (이름이 바뀌거나 삭제되면 같은 이름의 다른 행도 고유성 점수가 바뀌므로 함께 표시, 삭제된 행의 점수는 제거)
+
+bulk_update_mappings 등 ORM 이벤트를 거치지 않는 쓰기는 refresh_content_hash()를 직접 호출하고
+품질 입력 필드를 바꿨다면 quality_dirty도 함께 설정해야 합니다.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Set
+
+from sqlalchemy import delete, event, inspect, update
+
+from src.database.models import ProcessedRestaurant, QualityMetrics, QualityScore
+
+
+# priceRange 숫자 변환 (문자열 → 숫자)
+PRICE_RANGE_MAP = {
+    "저렴": 1,
+    "보통": 2,
+    "비쌈": 3,
+    "매우비쌈": 4,
+    "1": 1, "2": 2, "3": 3, "4": 4
+}
+
+# 한식당이 레스토랑을 식별하는 필드 (PATCH 시 항상 포함)
+KEY_FIELDS = ("name", "address")
+
+
+def hansikdang_payload(restaurant: ProcessedRestaurant) -> Dict[str, Any]:
+    """한식당 External API 형식으로 변환"""
+    return {
+        "name": restaurant.name,
+        "nameEn": restaurant.name_en,
+        "category": restaurant.category,
+        "cuisine": restaurant.cuisine,
+        "district": restaurant.district,
+        "address": restaurant.address,
+        "description": restaurant.description,
+        "descriptionEn": restaurant.description_en,
+        "priceRange": PRICE_RANGE_MAP.get(str(restaurant.price_range), 2),
+        "imageUrl": restaurant.image_url or "https://via.placeholder.com/400x300?text=Restaurant",
+        "openHours": restaurant.open_hours or "정보 없음",
+        "phone": restaurant.phone,
+        "latitude": restaurant.latitude,
+        "longitude": restaurant.longitude,
+    }
+
+
+# 품질 지표별 입력 필드 (governance QualityValidator._measure_*, duplicate_routes QualityScore)
+QUALITY_METRIC_FIELDS = {
+    'completeness': ('name', 'address', 'category', 'description', 'phone', 'google_rating'),
+    'accuracy': ('description', 'google_rating', 'phone'),
+    'consistency': ('naver_rating', 'google_rating', 'address', 'latitude', 'longitude'),
+    'timeliness': ('created_at',),  # 경과 일수 구간은 시간이 지나도 바뀜 (QualityRescorer.mark_stale)
+    'validity': ('latitude', 'longitude', 'category'),
+    'uniqueness': ('name',),  # 같은 이름의 다른 행에도 영향
+    'relevance': ('category', 'description', 'google_rating'),
+    'quality_score': ('name', 'address', 'phone', 'latitude', 'longitude'),
+}
+QUALITY_FIELDS = frozenset(field for fields in QUALITY_METRIC_FIELDS.values() for field in fields)
+
+
+def _digest(value: Any, size: int) -> str:
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=size).hexdigest()
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """payload 전체 해시 (32자)"""
+    return _digest(payload, 16)
+
+
+def field_hashes(payload: Dict[str, Any]) -> Dict[str, str]:
+    """필드별 해시 (8자, 변경 필드 판별용)"""
+    return {field: _digest(value, 4) for field, value in payload.items()}
+
+
+def refresh_content_hash(restaurant: ProcessedRestaurant) -> str:
+    """현재 값 기준으로 content_hash 갱신"""
+    restaurant.content_hash = payload_hash(hansikdang_payload(restaurant))
+    return restaurant.content_hash
+
+
+@event.listens_for(ProcessedRestaurant, "before_insert")
+def _track_content_hash_on_insert(mapper, connection, target: ProcessedRestaurant) -> None:
+    # 컬럼 기본값(category='한식' 등)은 이 이벤트 이후 적용되므로 먼저 채운 뒤 해시 계산
+    for column in mapper.columns:
+        if column.default is not None and column.default.is_scalar and getattr(target, column.key) is None:
+            setattr(target, column.key, column.default.arg)
+    refresh_content_hash(target)
+
+
+@event.listens_for(ProcessedRestaurant, "before_update")
+def _track_content_hash(mapper, connection, target: ProcessedRestaurant) -> None:
+    refresh_content_hash(target)
+
+
+def changed_quality_metrics(target: ProcessedRestaurant) -> Set[str]:
+    """flush 전 변경된 필드 기준으로 다시 계산해야 하는 품질 지표"""
+    state = inspect(target)
+    changed = {field for field in QUALITY_FIELDS if state.attrs[field].history.has_changes()}
+    return {metric for metric, fields in QUALITY_METRIC_FIELDS.items() if changed.intersection(fields)}
+
+
+def _mark_same_name_dirty(connection, names) -> None:
+    names = [name for name in names if name]
+    if names:
+        table = ProcessedRestaurant.__table__
+        connection.execute(update(table).where(table.c.name.in_(names)).values(quality_dirty=True))
+
+
+@event.listens_for(ProcessedRestaurant, "before_update")
+def _track_quality_dirty(mapper, connection, target: ProcessedRestaurant) -> None:
+    if not changed_quality_metrics(target):
+        return
+    target.quality_dirty = True
+    # 이전 이름을 쓰는 행은 중복이 줄어듦 (새 이름 쪽은 재계산 시 함께 처리)
+    _mark_same_name_dirty(connection, inspect(target).attrs.name.history.deleted)
+
+
+@event.listens_for(ProcessedRestaurant, "after_delete")
+def _track_quality_dirty_on_delete(mapper, connection, target: ProcessedRestaurant) -> None:
+    _mark_same_name_dirty(connection, [target.name])
+    connection.execute(delete(QualityMetrics.__table__).where(
+        QualityMetrics.__table__.c.restaurant_id == target.id,
+        QualityMetrics.__table__.c.data_type == 'restaurant'
+    ))
+    connection.execute(delete(QualityScore.__table__).where(QualityScore.__table__.c.restaurant_id == target.id))
@@ -1,14 +1,18 @@
 """
 Database connection management
 """
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 from contextlib import contextmanager
 from typing import Generator
+from loguru import logger
 
 from config import settings
 from src.database.models import Base
+from src.database import change_tracking  # noqa: F401 (content_hash ORM 이벤트 등록)
+from src.monitoring.metrics import DB_QUERY_SECONDS
 
 
 # Create engine
@@ -18,13 +22,65 @@ engine = create_engine(
     echo=False,
 )
 
+
+@event.listens_for(engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    # 실행 컨텍스트에 저장 (실패한 문장은 컨텍스트와 함께 버려져 다음 쿼리 시간에 섞이지 않음)
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _observe_query_time(conn, cursor, statement, parameters, context, executemany):
+    """쿼리 실행 시간 메트릭 (operation: SQL 첫 키워드)"""
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "unknown"
+    DB_QUERY_SECONDS.observe(time.perf_counter() - started, operation=operation)
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 def init_db():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 + 기존 테이블에 새로 추가된 컬럼/인덱스 반영"""
     Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+
+
+def add_missing_columns():
+    """
+    모델에 추가된 컬럼/인덱스를 기존 테이블에 생성 (create_all은 기존 테이블을 변경하지 않음)
+
+    새 컬럼은 nullable로 추가합니다 (기존 행 값은 NULL).
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        with engine.begin() as conn:
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                logger.info(f"🧱 Added column {table.name}.{column.name} ({column_type})")
+
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in indexes:
+                continue
+            try:
+                index.create(bind=engine)
+                logger.info(f"🧱 Created index {index.name} on {table.name}")
+            except Exception as e:
+                logger.warning(f"Failed to create index {index.name}: {e}")
 
 
 def get_db() -> Generator[Session, None, None]:
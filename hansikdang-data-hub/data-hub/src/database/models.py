@@ -3,7 +3,7 @@ SQLAlchemy Database Models for Restaurant Data Hub
 """
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, Integer, Float, DateTime, Text, Boolean, JSON, Index
+    Column, String, Integer, Float, DateTime, Text, Boolean, JSON, Index, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -31,7 +31,7 @@ class RawRestaurantData(Base):
     
     # 인덱스
     __table_args__ = (
-        Index('idx_raw_source_id', 'source', 'source_id'),
+        Index('uq_raw_source_id', 'source', 'source_id', unique=True),  # 중복 수집 방지 (INSERT ... ON CONFLICT DO NOTHING)
         Index('idx_raw_status', 'status'),
         Index('idx_raw_scraped_at', 'scraped_at'),
         Index('idx_raw_place_id', 'place_id'),  # ✅ Phase 1: PlaceID 인덱스
@@ -129,6 +129,14 @@ class ProcessedRestaurant(Base):
     sync_status = Column(String, default='pending')  # pending, synced, failed
     synced_to_hansikdang = Column(Boolean, default=False)
     synced_at = Column(DateTime(timezone=True))
+    sync_attempts = Column(Integer, default=0)  # 연속 전송 실패 수 (성공 시 0)
+    sync_retry_at = Column(DateTime(timezone=True))  # failed 행을 다시 전송할 수 있는 시각
+    
+    # 변경 추적 (한식당 전송 형식 기준 해시, src/database/change_tracking.py)
+    content_hash = Column(String(32))  # 현재 값
+    last_synced_hash = Column(String(32))  # 마지막으로 전송 성공한 값
+    synced_field_hashes = Column(JSON)  # 필드별 해시 (PATCH 시 변경 필드 판별)
+    quality_dirty = Column(Boolean, default=True)  # 품질 점수 입력 필드가 바뀌어 재계산 필요 (NULL = 아직 계산 안 됨)
     
     # 메타데이터
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -144,6 +152,18 @@ class ProcessedRestaurant(Base):
         Index('idx_processed_google_place_id', 'google_place_id'),  # ✅ Phase 1
         Index('idx_processed_popularity', 'popularity_score'),  # ✅ Phase 2: 인기지수
         Index('idx_processed_popularity_tier', 'popularity_tier'),  # ✅ Phase 2: 인기등급
+        # 동기화 이후 변경된 행만 담는 부분 인덱스 (delta sync 조회)
+        Index(
+            'idx_processed_sync_dirty', 'sync_status',
+            postgresql_where=text('content_hash IS DISTINCT FROM last_synced_hash'),
+            sqlite_where=text('content_hash IS NOT last_synced_hash'),
+        ),
+        # 품질 재계산 대상만 담는 부분 인덱스 (QualityRescorer 조회)
+        Index(
+            'idx_processed_quality_dirty', 'id',
+            postgresql_where=text('quality_dirty IS NOT FALSE'),
+            sqlite_where=text('quality_dirty IS NOT 0'),
+        ),
     )
 
 
@@ -313,6 +333,31 @@ class QualityMetrics(Base):
     )
 
 
+class QualityMetricsHistory(Base):
+    """품질 메트릭 이력 (quality_history_enabled일 때 재계산마다 추가, quality_metrics는 레스토랑당 현재 값 1행)"""
+    __tablename__ = "quality_metrics_history"
+    
+    id = Column(String, primary_key=True)  # UUID
+    restaurant_id = Column(String, nullable=False)
+    
+    completeness_score = Column(Float)
+    accuracy_score = Column(Float)
+    consistency_score = Column(Float)
+    timeliness_score = Column(Float)
+    validity_score = Column(Float)
+    uniqueness_score = Column(Float)
+    relevance_score = Column(Float)
+    overall_quality_score = Column(Float)
+    quality_grade = Column(String)
+    
+    measured_at = Column(DateTime(timezone=True), server_default=func.now())
+    measured_by = Column(String, default='system')
+    
+    __table_args__ = (
+        Index('idx_quality_history_restaurant', 'restaurant_id', 'measured_at'),
+    )
+
+
 class DataLineage(Base):
     """데이터 계보 추적"""
     __tablename__ = "data_lineage"
@@ -399,6 +444,27 @@ class SystemHealth(Base):
     )
 
 
+class LogRollup(Base):
+    """보존 기간이 지난 로그 테이블의 월별 요약 (원본 삭제 전에 기록)"""
+    __tablename__ = "log_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    table_name = Column(String, nullable=False)  # 'data_lineage', 'system_health', ...
+    period_start = Column(DateTime(timezone=True), nullable=False)  # 월 시작 (UTC)
+    dimensions = Column(JSON)  # {"operation": "processed", "source_system": "gemini", ...}
+    row_count = Column(Integer, default=0)
+    metrics = Column(JSON)  # {"avg_execution_time_ms": 120.5, "sum_success_count": 30, ...}
+
+    # 메타데이터
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 인덱스
+    __table_args__ = (
+        Index('idx_rollup_table_period', 'table_name', 'period_start'),
+    )
+
+
 class BackupHistory(Base):
     """Google Drive 백업 이력"""
     __tablename__ = "backup_history"
@@ -426,6 +492,9 @@ class BackupHistory(Base):
     error_message = Column(String)  # 에러 메시지
     retry_count = Column(Integer, default=0)  # 재시도 횟수
     
+    # 스냅샷 (backup_type='snapshot') 파티션 목록 {table: {date: {file_id, rows, version, ...}}}
+    manifest = Column(JSON)
+    
     # 메타데이터
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
@@ -508,3 +577,86 @@ class QualityScore(Base):
         Index('idx_quality_restaurant', 'restaurant_id'),
         Index('idx_quality_total', 'total_score'),
     )
+
+
+class SchedulerControl(Base):
+    """스케줄러 제어 상태 (단일 행, API에서 pause/resume/restart 요청)"""
+    __tablename__ = "scheduler_control"
+    
+    id = Column(Integer, primary_key=True)  # 항상 1
+    paused = Column(Boolean, default=False)  # 전체 일시정지
+    restart_requested = Column(Boolean, default=False)  # 재시작 요청 (스케줄러가 처리 후 해제)
+    
+    # 실행 중인 스케줄러 인스턴스
+    instance_id = Column(String)  # hostname:pid
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    
+    # 메타데이터
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class SchedulerJobState(Base):
+    """스케줄러 작업별 실행 상태"""
+    __tablename__ = "scheduler_job_states"
+    
+    job_name = Column(String, primary_key=True)
+    cron = Column(String)  # cron 표현식 (UTC)
+    overlap_policy = Column(String)  # skip/queue/parallel
+    paused = Column(Boolean, default=False)  # 작업별 일시정지
+    
+    # 실행 상태
+    running_count = Column(Integer, default=0)
+    last_scheduled_at = Column(DateTime(timezone=True))  # 마지막으로 처리한 예약 시각 (catch-up 기준)
+    next_run_at = Column(DateTime(timezone=True))
+    last_started_at = Column(DateTime(timezone=True))
+    last_finished_at = Column(DateTime(timezone=True))
+    last_status = Column(String)  # success/failed/timeout/skipped/cancelled
+    last_duration_seconds = Column(Float)
+    last_error = Column(Text)
+    
+    # 누적 통계
+    run_count = Column(Integer, default=0)
+    failure_count = Column(Integer, default=0)
+    skip_count = Column(Integer, default=0)
+    
+    # 메타데이터
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class JobLock(Base):
+    """작업 분산 잠금 (lease) - 여러 프로세스/컨테이너의 동일 작업 중복 실행 방지"""
+    __tablename__ = "job_locks"
+    
+    job_name = Column(String, primary_key=True)
+    holder = Column(String)  # hostname:pid:lease (해제 시 NULL)
+    backend = Column(String)  # advisory/table
+    
+    acquired_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    expires_at = Column(DateTime(timezone=True))  # heartbeat 없이 지나면 다른 holder가 획득 가능
+    
+    # 인덱스
+    __table_args__ = (
+        Index('idx_job_lock_expires', 'expires_at'),
+    )
+
+
+class RateLimitBucket(Base):
+    """공유 Rate Limit 토큰 버킷 (여러 워커가 하나의 API 쿼터를 공유)"""
+    __tablename__ = "rate_limit_buckets"
+    
+    key = Column(String, primary_key=True)  # "{limiter name}:{key}"
+    tokens = Column(Float, nullable=False)  # 남은 토큰 (음수 = 예약된 대기열)
+    updated_at = Column(Float, nullable=False)  # epoch seconds (DB 서버 시계)
+
+
+class JobCheckpoint(Base):
+    """장시간 작업 진행 위치 (중단 후 이어서 실행)"""
+    __tablename__ = "job_checkpoints"
+    
+    job_name = Column(String, primary_key=True)
+    cursor = Column(String)  # 마지막으로 처리 완료한 키 (keyset pagination 기준)
+    stats = Column(JSON)  # 진행 중인 실행의 누적 통계
+    started_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
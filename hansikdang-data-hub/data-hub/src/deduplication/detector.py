@@ -1,9 +1,11 @@
+import time
 from typing import List, Dict, Tuple, Optional
 from fuzzywuzzy import fuzz
 from geopy.distance import geodesic
 from loguru import logger
 
 from src.database.models import ProcessedRestaurant
+from src.monitoring.metrics import DEDUP_PAIRS, DEDUP_PAIRS_PER_SECOND
 
 
 class DuplicateDetector:
@@ -25,6 +27,8 @@ class DuplicateDetector:
         
         duplicate_groups = []
         processed_ids = set()
+        pairs = 0
+        started = time.perf_counter()
         
         for i, restaurant in enumerate(restaurants):
             if restaurant.id in processed_ids:
@@ -37,6 +41,7 @@ class DuplicateDetector:
                     continue
                 
                 similarity = self._calculate_similarity(restaurant, candidate)
+                pairs += 1
                 
                 if similarity['is_duplicate']:
                     duplicates.append({
@@ -58,9 +63,21 @@ class DuplicateDetector:
                 })
                 processed_ids.add(restaurant.id)
         
+        elapsed = time.perf_counter() - started
+        DEDUP_PAIRS.inc(pairs)
+        if elapsed > 0:
+            DEDUP_PAIRS_PER_SECOND.set(pairs / elapsed)
+        
         logger.info(f"✅ 중복 탐지 완료: {len(duplicate_groups)}개 그룹 발견")
         return duplicate_groups
     
+    def compare(
+        self,
+        restaurant1: ProcessedRestaurant,
+        restaurant2: ProcessedRestaurant
+    ) -> Dict:
+        return self._calculate_similarity(restaurant1, restaurant2)
+    
     def _calculate_similarity(
         self,
         restaurant1: ProcessedRestaurant,
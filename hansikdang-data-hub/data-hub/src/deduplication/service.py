@@ -1,7 +1,9 @@
 from typing import List, Dict, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from loguru import logger
 
+from src.database.aggregates import count_where, json_array_length
 from src.database.models import (
     ProcessedRestaurant,
     DuplicateGroup,
@@ -119,27 +121,18 @@ class DeduplicationService:
         return query.order_by(MergeHistory.merged_at.desc()).limit(limit).all()
     
     def get_deduplication_stats(self) -> Dict:
-        total_groups = self.db.query(DuplicateGroup).count()
-        merged_groups = self.db.query(DuplicateGroup).filter(
-            DuplicateGroup.status == 'merged'
-        ).count()
-        pending_groups = self.db.query(DuplicateGroup).filter(
-            DuplicateGroup.status == 'detected'
-        ).count()
-        
-        total_merges = self.db.query(MergeHistory).count()
-        auto_merges = self.db.query(MergeHistory).filter(
-            MergeHistory.merge_type == 'auto'
-        ).count()
-        manual_merges = self.db.query(MergeHistory).filter(
-            MergeHistory.merge_type == 'manual'
-        ).count()
-        
-        total_merged_restaurants = 0
-        merge_histories = self.db.query(MergeHistory).all()
-        for history in merge_histories:
-            if history.merged_ids:
-                total_merged_restaurants += len(history.merged_ids)
+        total_groups, merged_groups, pending_groups = self.db.query(
+            func.count(DuplicateGroup.id),
+            count_where(DuplicateGroup.status == 'merged'),
+            count_where(DuplicateGroup.status == 'detected')
+        ).one()
+        
+        total_merges, auto_merges, manual_merges, total_merged_restaurants = self.db.query(
+            func.count(MergeHistory.id),
+            count_where(MergeHistory.merge_type == 'auto'),
+            count_where(MergeHistory.merge_type == 'manual'),
+            func.coalesce(func.sum(json_array_length(MergeHistory.merged_ids)), 0)
+        ).one()
         
         return {
             'duplicate_groups': {
@@ -0,0 +1,257 @@
+"""
+Backup storage targets - 백업 파일 저장 대상
+파일 객체를 청크 단위로 읽어 업로드 (파일 전체를 메모리에 올리지 않음)
+
+- DriveStorage: Google Drive resumable upload (/hansikdang-data/2025-11/07-collection.csv)
+- LocalStorage: 로컬 디렉터리 (개발/테스트용, 임시 파일에 쓴 뒤 원자적으로 교체)
+
+Usage:
+    storage = get_backup_storage()
+    result = storage.upload(fileobj, size, "2025-11/07-collection.csv", "text/csv")
+    storage.download(result['file_id'], out)
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Any, BinaryIO, Dict, Optional
+
+import requests
+from googleapiclient.discovery import build
+from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from google.oauth2.credentials import Credentials
+from loguru import logger
+
+from config import settings
+from ..utils.serialization import loads
+
+
+def spooled_file() -> BinaryIO:
+    """backup_spool_mb까지는 메모리, 넘으면 디스크에 쓰는 임시 파일"""
+    return tempfile.SpooledTemporaryFile(max_size=settings.backup_spool_mb * 1024 * 1024)
+
+
+def file_sha256(fileobj: BinaryIO) -> str:
+    """파일 sha256 (처음부터 읽고 위치를 처음으로 되돌림)"""
+    fileobj.seek(0)
+    digest = hashlib.sha256()
+    while chunk := fileobj.read(1024 * 1024):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+class BackupStorage:
+    """백업 저장 대상 인터페이스"""
+
+    name = "base"
+
+    def upload(self, fileobj: BinaryIO, size: int, relative_path: str, mimetype: str) -> Dict[str, Any]:
+        """
+        파일 업로드 (fileobj는 현재 위치부터 끝까지 읽음)
+
+        Args:
+            fileobj: 업로드할 바이너리 파일 객체
+            size: 파일 크기 (바이트)
+            relative_path: 저장 경로 (예: 2025-11/07-collection.csv)
+            mimetype: MIME 타입
+
+        Returns:
+            file_id, file_name, file_path, file_size_bytes, web_view_link
+        """
+        raise NotImplementedError
+
+    def download(self, file_id: str, fileobj: BinaryIO) -> int:
+        """upload()가 반환한 file_id의 내용을 fileobj에 씀 (반환: 바이트 수)"""
+        raise NotImplementedError
+
+
+class DriveStorage(BackupStorage):
+    """Google Drive 저장 대상 (resumable upload, 청크 단위 전송)"""
+
+    name = "drive"
+
+    def __init__(self, root_folder_name: str = "hansikdang-data", chunk_size: Optional[int] = None):
+        self.root_folder_name = root_folder_name
+        # resumable upload 청크는 256KB의 배수여야 함
+        chunk_size = chunk_size or settings.backup_upload_chunk_mb * 1024 * 1024
+        self.chunk_size = max(256 * 1024, chunk_size - chunk_size % (256 * 1024))
+        self.drive_service = None
+
+    def _get_access_token(self) -> str:
+        """Replit Google Drive 통합에서 access token 가져오기"""
+        hostname = os.getenv('REPLIT_CONNECTORS_HOSTNAME')
+        x_replit_token = os.getenv('REPL_IDENTITY')
+
+        if x_replit_token:
+            x_replit_token = f'repl {x_replit_token}'
+        else:
+            x_replit_token = os.getenv('WEB_REPL_RENEWAL')
+            if x_replit_token:
+                x_replit_token = f'depl {x_replit_token}'
+
+        if not x_replit_token:
+            raise ValueError('X_REPLIT_TOKEN not found for repl/depl')
+
+        url = f'https://{hostname}/api/v2/connection?include_secrets=true&connector_names=google-drive'
+        headers = {
+            'Accept': 'application/json',
+            'X_REPLIT_TOKEN': x_replit_token
+        }
+
+        response = requests.get(url, headers=headers)
+        response.raise_for_status()
+
+        data = loads(response.content)
+        items = data.get('items', [])
+
+        if not items:
+            raise ValueError('Google Drive not connected')
+
+        connection_settings = items[0]
+        access_token = connection_settings.get('settings', {}).get('access_token')
+
+        if not access_token:
+            oauth = connection_settings.get('settings', {}).get('oauth', {})
+            access_token = oauth.get('credentials', {}).get('access_token')
+
+        if not access_token:
+            raise ValueError('Access token not found')
+
+        return access_token
+
+    def _get_drive_service(self):
+        """Google Drive API 서비스 객체 생성"""
+        if self.drive_service:
+            return self.drive_service
+
+        access_token = self._get_access_token()
+
+        credentials = Credentials(token=access_token)
+        self.drive_service = build('drive', 'v3', credentials=credentials)
+
+        return self.drive_service
+
+    def _find_or_create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
+        """폴더 찾기 또는 생성"""
+        service = self._get_drive_service()
+
+        query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        if parent_id:
+            query += f" and '{parent_id}' in parents"
+
+        results = service.files().list(
+            q=query,
+            spaces='drive',
+            fields='files(id, name)'
+        ).execute()
+
+        files = results.get('files', [])
+
+        if files:
+            return files[0]['id']
+
+        file_metadata = {
+            'name': folder_name,
+            'mimeType': 'application/vnd.google-apps.folder'
+        }
+
+        if parent_id:
+            file_metadata['parents'] = [parent_id]
+
+        folder = service.files().create(
+            body=file_metadata,
+            fields='id'
+        ).execute()
+
+        logger.info(f"📁 Created folder: {folder_name} (ID: {folder['id']})")
+
+        return folder['id']
+
+    def upload(self, fileobj: BinaryIO, size: int, relative_path: str, mimetype: str) -> Dict[str, Any]:
+        """루트 폴더 아래 경로대로 폴더를 만들고 청크 단위로 업로드"""
+        service = self._get_drive_service()
+
+        *folders, file_name = relative_path.split('/')
+        folder_id = self._find_or_create_folder(self.root_folder_name)
+        for folder_name in folders:
+            folder_id = self._find_or_create_folder(folder_name, parent_id=folder_id)
+
+        media = MediaIoBaseUpload(fileobj, mimetype=mimetype, chunksize=self.chunk_size, resumable=True)
+        request = service.files().create(
+            body={'name': file_name, 'parents': [folder_id]},
+            media_body=media,
+            fields='id, name, size, webViewLink'
+        )
+
+        file = None
+        while file is None:
+            status, file = request.next_chunk(num_retries=3)
+            if status:
+                logger.debug(f"   Uploading {file_name}: {status.progress() * 100:.0f}%")
+
+        logger.info(f"✅ Uploaded to Google Drive: {file_name} (ID: {file['id']})")
+
+        return {
+            'file_id': file['id'],
+            'file_name': file['name'],
+            'file_path': f"/{self.root_folder_name}/{relative_path}",
+            'file_size_bytes': int(file.get('size', size)),
+            'web_view_link': file.get('webViewLink', '')
+        }
+
+    def download(self, file_id: str, fileobj: BinaryIO) -> int:
+        """청크 단위 다운로드"""
+        service = self._get_drive_service()
+        start = fileobj.tell()
+        downloader = MediaIoBaseDownload(fileobj, service.files().get_media(fileId=file_id), chunksize=self.chunk_size)
+
+        done = False
+        while not done:
+            _, done = downloader.next_chunk(num_retries=3)
+
+        return fileobj.tell() - start
+
+
+class LocalStorage(BackupStorage):
+    """로컬 디렉터리 저장 대상"""
+
+    name = "local"
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.backup_local_dir
+
+    def upload(self, fileobj: BinaryIO, size: int, relative_path: str, mimetype: str) -> Dict[str, Any]:
+        path = os.path.join(self.root, *relative_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(fileobj, f, length=1024 * 1024)
+        os.replace(tmp_path, path)
+
+        logger.info(f"✅ Saved backup: {path}")
+
+        return {
+            'file_id': os.path.abspath(path),
+            'file_name': os.path.basename(path),
+            'file_path': path,
+            'file_size_bytes': os.path.getsize(path),
+            'web_view_link': ''
+        }
+
+    def download(self, file_id: str, fileobj: BinaryIO) -> int:
+        start = fileobj.tell()
+        with open(file_id, 'rb') as f:
+            shutil.copyfileobj(f, fileobj, length=1024 * 1024)
+        return fileobj.tell() - start
+
+
+def get_backup_storage(name: Optional[str] = None) -> BackupStorage:
+    """설정(backup_storage)에 맞는 저장 대상"""
+    name = name or settings.backup_storage
+    if name == "drive":
+        return DriveStorage()
+    if name == "local":
+        return LocalStorage()
+    raise ValueError(f"Unknown backup storage '{name}' (expected 'drive' or 'local')")
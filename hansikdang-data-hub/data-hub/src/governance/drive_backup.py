@@ -1,172 +1,80 @@
 """
 Google Drive Backup Manager - 일일 데이터 백업 시스템
+레스토랑 행을 yield_per로 스트리밍해 CSV를 임시 파일(SpooledTemporaryFile)에 쓰고,
+저장 대상(BackupStorage)에 청크 단위로 업로드 → 테이블 크기와 관계없이 메모리 사용량 일정
 """
-import os
 import uuid
 import csv
-import json
-import requests
-from io import StringIO
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, BinaryIO, Iterator
 from datetime import datetime, timezone, timedelta
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaInMemoryUpload
-from google.oauth2.credentials import Credentials
 
+from config import settings
 from ..database.models import ProcessedRestaurant, QualityMetrics, BackupHistory, MergeHistory
+from .backup_storage import BackupStorage, get_backup_storage, spooled_file
+
+
+CSV_HEADER = [
+    'id', 'name', 'address', 'phone', 'category',
+    'naver_place_id', 'naver_rating', 'naver_reviews',
+    'google_rating', 'google_reviews',
+    'description', 'latitude', 'longitude',
+    'created_at', 'synced_to_hansikdang'
+]
+
+CSV_COLUMNS = [
+    ProcessedRestaurant.id, ProcessedRestaurant.name, ProcessedRestaurant.address,
+    ProcessedRestaurant.phone, ProcessedRestaurant.category,
+    ProcessedRestaurant.naver_place_id, ProcessedRestaurant.naver_rating, ProcessedRestaurant.naver_review_count,
+    ProcessedRestaurant.google_rating, ProcessedRestaurant.google_review_count,
+    ProcessedRestaurant.description, ProcessedRestaurant.latitude, ProcessedRestaurant.longitude,
+    ProcessedRestaurant.created_at, ProcessedRestaurant.synced_to_hansikdang
+]
+
+# 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_FETCH_SIZE = 1000
+
+
+class _LineWriter:
+    """csv.writer가 쓴 한 줄을 그대로 반환"""
+
+    def write(self, line: str) -> str:
+        return line
 
 
 class DriveBackupManager:
     """
     Google Drive 백업 관리자
-    매일 수집된 레스토랑 데이터를 CSV로 변환하여 Google Drive에 저장
+    매일 수집된 레스토랑 데이터를 CSV로 변환하여 Google Drive(또는 설정된 저장 대상)에 저장
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, storage: Optional[BackupStorage] = None):
         self.db = db
-        self.root_folder_name = "hansikdang-data"
-        self.access_token = None
-        self.drive_service = None
+        self._storage = storage
     
-    def _get_access_token(self) -> str:
-        """Replit Google Drive 통합에서 access token 가져오기"""
-        hostname = os.getenv('REPLIT_CONNECTORS_HOSTNAME')
-        x_replit_token = os.getenv('REPL_IDENTITY')
-        
-        if x_replit_token:
-            x_replit_token = f'repl {x_replit_token}'
-        else:
-            x_replit_token = os.getenv('WEB_REPL_RENEWAL')
-            if x_replit_token:
-                x_replit_token = f'depl {x_replit_token}'
-        
-        if not x_replit_token:
-            raise ValueError('X_REPLIT_TOKEN not found for repl/depl')
-        
-        url = f'https://{hostname}/api/v2/connection?include_secrets=true&connector_names=google-drive'
-        headers = {
-            'Accept': 'application/json',
-            'X_REPLIT_TOKEN': x_replit_token
-        }
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        items = data.get('items', [])
-        
-        if not items:
-            raise ValueError('Google Drive not connected')
-        
-        connection_settings = items[0]
-        access_token = connection_settings.get('settings', {}).get('access_token')
-        
-        if not access_token:
-            oauth = connection_settings.get('settings', {}).get('oauth', {})
-            access_token = oauth.get('credentials', {}).get('access_token')
-        
-        if not access_token:
-            raise ValueError('Access token not found')
-        
-        return access_token
+    @property
+    def storage(self) -> BackupStorage:
+        """저장 대상 (백업 실행 시점에 생성, 상태 조회만 할 때는 인증하지 않음)"""
+        if self._storage is None:
+            self._storage = get_backup_storage()
+        return self._storage
     
-    def _get_drive_service(self):
-        """Google Drive API 서비스 객체 생성"""
-        if self.drive_service:
-            return self.drive_service
+    def _iter_csv_lines(self, backup_day: datetime, next_day: datetime, stats: Dict[str, Any]) -> Iterator[bytes]:
+        """헤더 + 레스토랑 행을 CSV 줄(UTF-8)로 하나씩 반환 (서버 측 커서로 조회)"""
+        writer = csv.writer(_LineWriter())
+        yield writer.writerow(CSV_HEADER).encode('utf-8')
         
-        access_token = self._get_access_token()
-        
-        credentials = Credentials(token=access_token)
-        self.drive_service = build('drive', 'v3', credentials=credentials)
-        
-        return self.drive_service
-    
-    def _find_or_create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
-        """폴더 찾기 또는 생성"""
-        service = self._get_drive_service()
-        
-        query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-        if parent_id:
-            query += f" and '{parent_id}' in parents"
-        
-        results = service.files().list(
-            q=query,
-            spaces='drive',
-            fields='files(id, name)'
-        ).execute()
-        
-        files = results.get('files', [])
-        
-        if files:
-            return files[0]['id']
-        
-        file_metadata = {
-            'name': folder_name,
-            'mimeType': 'application/vnd.google-apps.folder'
-        }
-        
-        if parent_id:
-            file_metadata['parents'] = [parent_id]
-        
-        folder = service.files().create(
-            body=file_metadata,
-            fields='id'
-        ).execute()
-        
-        logger.info(f"📁 Created folder: {folder_name} (ID: {folder['id']})")
-        
-        return folder['id']
-    
-    def _prepare_folder_structure(self, backup_date: datetime) -> str:
-        """폴더 구조 준비: /hansikdang-data/2025-11/"""
-        root_folder_id = self._find_or_create_folder(self.root_folder_name)
-        
-        year_month = backup_date.strftime('%Y-%m')
-        month_folder_id = self._find_or_create_folder(year_month, parent_id=root_folder_id)
-        
-        return month_folder_id
-    
-    def _generate_csv_data(self, backup_date: str) -> tuple[str, Dict[str, Any]]:
-        """CSV 데이터 생성 및 통계 계산"""
-        backup_day = datetime.strptime(backup_date, '%Y-%m-%d')
-        next_day = backup_day + timedelta(days=1)
-        
-        restaurants = self.db.query(ProcessedRestaurant).filter(
+        rows = self.db.query(*CSV_COLUMNS).filter(
             ProcessedRestaurant.created_at >= backup_day,
             ProcessedRestaurant.created_at < next_day
-        ).all()
+        ).execution_options(yield_per=EXPORT_FETCH_SIZE)
         
-        total_merged = self.db.query(MergeHistory).filter(
-            MergeHistory.merged_at >= backup_day,
-            MergeHistory.merged_at < next_day
-        ).count()
-        
-        quality_metrics = self.db.query(QualityMetrics).filter(
-            QualityMetrics.measured_at >= backup_day,
-            QualityMetrics.measured_at < next_day
-        ).all()
-        
-        avg_quality = 0
-        if quality_metrics:
-            avg_quality = sum(m.overall_quality_score for m in quality_metrics) / len(quality_metrics)
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        writer.writerow([
-            'id', 'name', 'address', 'phone', 'category',
-            'naver_place_id', 'naver_rating', 'naver_reviews',
-            'google_rating', 'google_reviews',
-            'description', 'latitude', 'longitude',
-            'created_at', 'synced_to_hansikdang'
-        ])
-        
-        for r in restaurants:
-            writer.writerow([
+        for r in rows:
+            stats['total_records'] += 1
+            yield writer.writerow([
                 r.id,
                 r.name,
                 r.address,
@@ -182,51 +90,34 @@ class DriveBackupManager:
                 r.longitude or '',
                 r.created_at.isoformat() if r.created_at else '',
                 r.synced_to_hansikdang or False
-            ])
-        
-        stats = {
-            'total_records': len(restaurants),
-            'new_records': len(restaurants),
-            'duplicate_removed': total_merged,
-            'average_quality_score': round(avg_quality, 2)
-        }
-        
-        return output.getvalue(), stats
+            ]).encode('utf-8')
     
-    def _upload_to_drive(
-        self,
-        csv_content: str,
-        file_name: str,
-        folder_id: str
-    ) -> Dict[str, Any]:
-        """Google Drive에 CSV 파일 업로드"""
-        service = self._get_drive_service()
+    def _write_csv(self, fileobj: BinaryIO, backup_date: str) -> Dict[str, Any]:
+        """CSV를 파일 객체에 스트리밍으로 쓰고 통계 계산"""
+        backup_day = datetime.strptime(backup_date, '%Y-%m-%d')
+        next_day = backup_day + timedelta(days=1)
         
-        file_metadata = {
-            'name': file_name,
-            'parents': [folder_id]
-        }
+        total_merged = self.db.query(MergeHistory).filter(
+            MergeHistory.merged_at >= backup_day,
+            MergeHistory.merged_at < next_day
+        ).count()
         
-        media = MediaInMemoryUpload(
-            csv_content.encode('utf-8'),
-            mimetype='text/csv',
-            resumable=True
-        )
+        avg_quality = self.db.query(func.avg(QualityMetrics.overall_quality_score)).filter(
+            QualityMetrics.measured_at >= backup_day,
+            QualityMetrics.measured_at < next_day
+        ).scalar() or 0
         
-        file = service.files().create(
-            body=file_metadata,
-            media_body=media,
-            fields='id, name, size, webViewLink'
-        ).execute()
+        stats = {'total_records': 0}
+        for line in self._iter_csv_lines(backup_day, next_day, stats):
+            fileobj.write(line)
         
-        logger.info(f"✅ Uploaded to Google Drive: {file_name} (ID: {file['id']})")
+        stats.update({
+            'new_records': stats['total_records'],
+            'duplicate_removed': total_merged,
+            'average_quality_score': round(float(avg_quality), 2)
+        })
         
-        return {
-            'file_id': file['id'],
-            'file_name': file['name'],
-            'file_size_bytes': int(file.get('size', 0)),
-            'web_view_link': file.get('webViewLink', '')
-        }
+        return stats
     
     def backup_daily(
         self,
@@ -272,21 +163,20 @@ class DriveBackupManager:
         
         while retry_count < max_retries:
             try:
-                csv_content, stats = self._generate_csv_data(backup_date)
-                
                 backup_datetime = datetime.strptime(backup_date, '%Y-%m-%d')
-                folder_id = self._prepare_folder_structure(backup_datetime)
-                
-                day = backup_datetime.strftime('%d')
-                file_name = f"{day}-collection.csv"
+                file_name = f"{backup_datetime.strftime('%d')}-collection.csv"
+                relative_path = f"{backup_datetime.strftime('%Y-%m')}/{file_name}"
                 
-                upload_result = self._upload_to_drive(csv_content, file_name, folder_id)
+                with spooled_file() as spool:
+                    stats = self._write_csv(spool, backup_date)
+                    size = spool.tell()
+                    spool.seek(0)
+                    upload_result = self.storage.upload(spool, size, relative_path, 'text/csv')
                 
                 completed_at = datetime.now(timezone.utc)
                 execution_time = int((completed_at - started_at).total_seconds())
                 
-                month = backup_datetime.strftime('%Y-%m')
-                file_path = f"/{self.root_folder_name}/{month}/{file_name}"
+                file_path = upload_result['file_path']
                 
                 backup_history.file_name = file_name
                 backup_history.file_path = file_path
@@ -310,14 +200,16 @@ class DriveBackupManager:
                 return backup_history
                 
             except Exception as e:
+                # 조회 중 DB 오류가 나면 세션을 되돌려야 다음 시도가 PendingRollbackError 없이 진행됨
+                self.db.rollback()
                 retry_count += 1
                 last_error = str(e)
                 logger.error(f"❌ Backup attempt {retry_count} failed: {e}")
                 
                 if retry_count < max_retries:
-                    logger.info(f"   Retrying in 5 seconds...")
-                    import time
-                    time.sleep(5)
+                    delay = settings.retry_delay * retry_count
+                    logger.info(f"   Retrying in {delay} seconds...")
+                    time.sleep(delay)
         
         completed_at = datetime.now(timezone.utc)
         execution_time = int((completed_at - started_at).total_seconds())
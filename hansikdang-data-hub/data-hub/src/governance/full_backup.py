@@ -0,0 +1,589 @@
+"""
+Full Backup Manager - 전체 DB 백업/복원 (재해 복구용)
+
+- DB의 모든 테이블(ORM 외 테이블 포함)을 기본 키 구간 chunk로 나눠 스레드 풀에서 병렬로 내보냄
+- chunk 파일: PostgreSQL COPY text 형식 + gzip, sha256 체크섬과 함께 저장 대상(BackupStorage)에 업로드
+- manifest(BackupHistory.manifest, backup_type='full')에 chunk 구간과 완료 결과를 chunk마다 기록
+  → 실패 후 다시 실행하면 완료되지 않은 chunk부터 이어서 진행
+- PostgreSQL(psycopg2): COPY TO/FROM STDIN으로 내보내기/복원, 새 백업은 exported snapshot으로
+  모든 worker가 같은 시점의 데이터를 읽음 / 그 외 DB는 Python에서 변환해 bulk insert
+- 완료 시 manifest.json도 업로드 (DB가 비어 있는 상태에서 복원할 때 사용)
+
+Usage:
+    result = FullBackupManager().backup()
+    FullBackupManager().restore(manifest_file_id=result['manifest_file_id'])
+"""
+import gzip
+import io
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, JSON, MetaData, Numeric, Table, func, select, text
+from sqlalchemy.schema import CreateTable
+
+from config import settings
+from ..database.connection import db_session, engine
+from ..database.models import BackupHistory
+from ..utils.serialization import dumps, dumps_str, loads
+from .backup_storage import BackupStorage, file_sha256, get_backup_storage, spooled_file
+from .retention import partition_children
+
+
+MANIFEST_VERSION = 1
+CHUNK_FORMAT = "pg-copy-text+gzip"
+CHUNK_MIMETYPE = "application/gzip"
+GZIP_LEVEL = 6
+
+# Python 경로(비 PostgreSQL)에서 한 번에 읽고/삽입하는 행 수
+FETCH_ROWS = 10_000
+
+# COPY text 형식 이스케이프
+_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+_UNESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f", "v": "\v"}
+NULL = "\\N"
+
+
+def _copy_value(value: Any, is_json: bool) -> str:
+    """값 → COPY text 필드"""
+    if value is None:
+        return NULL
+    if is_json or isinstance(value, (dict, list)):
+        return dumps_str(value).translate(_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return "\\\\x" + value.hex()
+    return str(value).translate(_ESCAPES)
+
+
+def _unescape(field: str) -> str:
+    if "\\" not in field:
+        return field
+    out, i = [], 0
+    while i < len(field):
+        if field[i] == "\\" and i + 1 < len(field):
+            out.append(_UNESCAPES.get(field[i + 1], field[i + 1]))
+            i += 2
+        else:
+            out.append(field[i])
+            i += 1
+    return "".join(out)
+
+
+def _converter(column) -> Callable[[str], Any]:
+    """COPY text 필드 → 컬럼 타입 값 (Python bulk insert 경로)"""
+    column_type = column.type
+    if isinstance(column_type, JSON):
+        return loads
+    if isinstance(column_type, Boolean):
+        return lambda value: value.lower() in ("t", "true", "1")
+    if isinstance(column_type, Integer):
+        return int
+    if isinstance(column_type, Float):
+        return float
+    if isinstance(column_type, Numeric):
+        return Decimal
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat
+    if isinstance(column_type, Date):
+        return date.fromisoformat
+    return str
+
+
+def _dependency_levels(tables: List[Table]) -> List[List[Table]]:
+    """FK 의존 순서대로 묶은 테이블 그룹 (같은 그룹은 병렬 복원 가능)"""
+    remaining = {table.name: table for table in tables}
+    levels = []
+    while remaining:
+        level = [
+            table for table in remaining.values()
+            if all(
+                fk.column.table.name == table.name or fk.column.table.name not in remaining
+                for fk in table.foreign_keys
+            )
+        ]
+        level = level or list(remaining.values())  # 순환 참조
+        levels.append(level)
+        for table in level:
+            del remaining[table.name]
+    return levels
+
+
+class _LineCountingWriter:
+    """COPY 출력을 받아 쓰면서 행 수를 셈 (COPY text 형식은 행마다 개행 1개)"""
+
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self.lines = 0
+
+    def write(self, data) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.lines += data.count(b"\n")
+        return self.fileobj.write(data)
+
+
+class FullBackupManager:
+    """전체 DB 병렬 백업/복원"""
+
+    def __init__(
+        self,
+        storage: Optional[BackupStorage] = None,
+        workers: Optional[int] = None,
+        chunk_rows: Optional[int] = None
+    ):
+        """
+        Args:
+            storage: 저장 대상 (기본: settings.backup_storage)
+            workers: 동시에 처리할 chunk 수
+            chunk_rows: chunk당 행 수
+        """
+        self._storage = storage
+        self.workers = workers or settings.full_backup_workers
+        self.chunk_rows = chunk_rows or settings.full_backup_chunk_rows
+        self.dialect = engine.dialect.name
+        self.use_copy = self.dialect == "postgresql" and engine.dialect.driver == "psycopg2"
+
+    @property
+    def storage(self) -> BackupStorage:
+        if self._storage is None:
+            self._storage = get_backup_storage()
+        return self._storage
+
+    @staticmethod
+    def _reflect() -> MetaData:
+        """DB 테이블 (PostgreSQL 파티션은 부모 테이블로 함께 내보내므로 제외)"""
+        with engine.connect() as conn:
+            partitions = partition_children(conn)
+        metadata = MetaData()
+        metadata.reflect(bind=engine, only=lambda name, _: name not in partitions)
+        return metadata
+
+    @staticmethod
+    def _key_column(table: Table):
+        columns = list(table.primary_key.columns)
+        return columns[0] if len(columns) == 1 else None
+
+    # ------------------------------------------------------------------
+    # 백업
+    # ------------------------------------------------------------------
+
+    def _plan(self, conn, table: Table) -> Dict[str, Any]:
+        """기본 키 기준으로 chunk_rows마다 구간 경계를 정함 (키가 없거나 복합 키면 chunk 1개)"""
+        key = self._key_column(table)
+        bounds = []
+        if key is not None:
+            numbered = select(
+                key.label("key"), func.row_number().over(order_by=key).label("rn")
+            ).subquery()
+            bounds = [
+                row[0] for row in conn.execute(
+                    select(numbered.c.key).where((numbered.c.rn - 1) % self.chunk_rows == 0).order_by(numbered.c.key)
+                )
+            ]
+
+        # 첫 chunk는 하한, 마지막 chunk는 상한 없음 (계획 이후 삽입된 행도 포함)
+        edges = [None, *bounds[1:], None]
+        return {
+            "columns": [column.name for column in table.columns],
+            "key": key.name if key is not None else None,
+            "ddl": str(CreateTable(table).compile(dialect=engine.dialect)).strip(),
+            "chunks": [
+                {"index": i, "lower": edges[i], "upper": edges[i + 1]}
+                for i in range(len(edges) - 1)
+            ],
+        }
+
+    @staticmethod
+    def _chunk_query(table: Table, plan: Dict[str, Any], chunk: Dict[str, Any], backup_id: str):
+        query = select(*[table.c[name] for name in plan["columns"]])
+        if table.name == BackupHistory.__tablename__:
+            # 진행 중인 이 백업의 기록은 제외 (복원한 DB에서 이어서 할 백업으로 잡히지 않도록)
+            query = query.where(table.c.id != backup_id)
+        if plan["key"]:
+            key = table.c[plan["key"]]
+            if chunk["lower"] is not None:
+                query = query.where(key >= chunk["lower"])
+            if chunk["upper"] is not None:
+                query = query.where(key < chunk["upper"])
+            query = query.order_by(key)
+        return query
+
+    @contextmanager
+    def _exported_snapshot(self, enabled: bool) -> Iterator[Optional[str]]:
+        """PostgreSQL exported snapshot (이 트랜잭션이 열려 있는 동안 worker가 같은 시점을 읽음)"""
+        if not enabled:
+            yield None
+            return
+
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cursor.execute("SELECT pg_export_snapshot()")
+            yield cursor.fetchone()[0]
+        finally:
+            raw.rollback()
+            raw.close()
+
+    def _copy_out(self, query, writer: _LineCountingWriter, snapshot: Optional[str]) -> None:
+        sql = str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            if snapshot:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", (snapshot,))
+            cursor.copy_expert(f"COPY ({sql}) TO STDOUT", writer)
+        finally:
+            raw.rollback()
+            raw.close()
+
+    @staticmethod
+    def _write_rows(table: Table, plan: Dict[str, Any], query, writer: _LineCountingWriter) -> None:
+        json_flags = [isinstance(table.c[name].type, JSON) for name in plan["columns"]]
+        with engine.connect() as conn:
+            result = conn.execution_options(yield_per=FETCH_ROWS).execute(query)
+            for rows in result.partitions():
+                writer.write("".join(
+                    "\t".join(_copy_value(value, is_json) for value, is_json in zip(row, json_flags)) + "\n"
+                    for row in rows
+                ))
+
+    def _export_chunk(
+        self,
+        table: Table,
+        plan: Dict[str, Any],
+        chunk: Dict[str, Any],
+        backup_id: str,
+        snapshot: Optional[str]
+    ) -> Dict[str, Any]:
+        """chunk 1개 내보내기 → 업로드 (worker 스레드에서 실행)"""
+        query = self._chunk_query(table, plan, chunk, backup_id)
+        with spooled_file() as spool:
+            with gzip.GzipFile(fileobj=spool, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as gz:
+                writer = _LineCountingWriter(gz)
+                if self.use_copy:
+                    self._copy_out(query, writer, snapshot)
+                else:
+                    self._write_rows(table, plan, query, writer)
+
+            size = spool.seek(0, 2)
+            checksum = file_sha256(spool)
+            relative_path = f"full/{backup_id[:8]}/{table.name}/{chunk['index']:05d}.copy.gz"
+            result = self.storage.upload(spool, size, relative_path, CHUNK_MIMETYPE)
+
+        return {
+            "rows": writer.lines,
+            "bytes": size,
+            "sha256": checksum,
+            "file_id": result['file_id'],
+            "path": result['file_path'],
+        }
+
+    @staticmethod
+    def _save(backup_id: str, **values: Any) -> None:
+        with db_session() as db:
+            db.query(BackupHistory).filter(BackupHistory.id == backup_id).update(values)
+
+    def _start(self, metadata: MetaData, resume: bool) -> Dict[str, Any]:
+        """이어서 할 백업을 찾거나 새 백업 계획(manifest) 생성"""
+        started_at = datetime.now(timezone.utc)
+        with db_session() as db:
+            if resume:
+                latest = db.query(BackupHistory).filter(
+                    BackupHistory.backup_type == 'full'
+                ).order_by(BackupHistory.started_at.desc()).first()
+                if latest and latest.status in ('started', 'partial') and latest.manifest:
+                    latest.status = 'started'
+                    latest.retry_count = (latest.retry_count or 0) + 1
+                    return latest.manifest
+
+            backup_id = str(uuid.uuid4())
+            with engine.connect() as conn:
+                tables = {table.name: self._plan(conn, table) for table in metadata.sorted_tables}
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "format": CHUNK_FORMAT,
+                "dialect": self.dialect,
+                "backup_id": backup_id,
+                "created_at": started_at.isoformat(),
+                "tables": tables,
+            }
+            db.add(BackupHistory(
+                id=backup_id,
+                backup_date=started_at.strftime('%Y-%m-%d'),
+                backup_type='full',
+                file_name='manifest.json',
+                file_path=f"full/{backup_id[:8]}/",
+                status='started',
+                started_at=started_at,
+                retry_count=0,
+                manifest=manifest
+            ))
+            return manifest
+
+    def backup(self, resume: bool = True) -> Dict[str, Any]:
+        """
+        전체 백업 (병렬 chunk 내보내기)
+
+        Args:
+            resume: 마지막 전체 백업이 완료되지 않았으면 남은 chunk만 이어서 진행
+
+        Returns:
+            backup_id, status, chunks, rows, bytes, manifest_file_id, elapsed_seconds
+        """
+        started = time.monotonic()
+        metadata = self._reflect()
+        manifest = self._start(metadata, resume)
+        backup_id = manifest["backup_id"]
+
+        pending = [
+            (name, chunk)
+            for name, plan in manifest["tables"].items()
+            for chunk in plan["chunks"]
+            if "sha256" not in chunk and name in metadata.tables
+        ]
+        total_chunks = sum(len(plan["chunks"]) for plan in manifest["tables"].values())
+        resumed = total_chunks - len(pending)
+        logger.info(
+            f"💾 Full backup {backup_id[:8]}: {len(manifest['tables'])} tables, {len(pending)}/{total_chunks} chunks "
+            f"to export{f' (resuming, {resumed} done)' if resumed else ''}, {self.workers} workers"
+        )
+
+        errors: List[str] = []
+        # 이어서 하는 백업은 이전 실행과 같은 시점을 읽을 수 없으므로 snapshot 없이 진행
+        with self._exported_snapshot(self.use_copy and not resumed) as snapshot:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backup") as pool:
+                futures = {
+                    pool.submit(
+                        self._export_chunk, metadata.tables[name], manifest["tables"][name], chunk, backup_id, snapshot
+                    ): (name, chunk)
+                    for name, chunk in pending
+                }
+                for future in as_completed(futures):
+                    name, chunk = futures[future]
+                    try:
+                        chunk.update(future.result())
+                    except Exception as e:
+                        errors.append(f"{name}#{chunk['index']}: {e}")
+                        logger.error(f"❌ Backup chunk {name}#{chunk['index']} failed: {e}")
+                        continue
+                    # chunk마다 진행 상황 저장 (중단되면 여기서부터 재개)
+                    self._save(backup_id, manifest=manifest)
+
+        chunks = [chunk for plan in manifest["tables"].values() for chunk in plan["chunks"]]
+        result = {
+            "backup_id": backup_id,
+            "chunks": len(chunks),
+            "rows": sum(chunk.get("rows", 0) for chunk in chunks),
+            "bytes": sum(chunk.get("bytes", 0) for chunk in chunks),
+            "manifest_file_id": None,
+        }
+
+        if errors:
+            result["status"] = 'partial'
+            self._save(backup_id, status='partial', error_message="; ".join(errors[:20]), manifest=manifest)
+        else:
+            payload = dumps(manifest)
+            uploaded = self.storage.upload(
+                io.BytesIO(payload), len(payload), f"full/{backup_id[:8]}/manifest.json", "application/json"
+            )
+            result["status"] = 'success'
+            result["manifest_file_id"] = uploaded['file_id']
+            completed_at = datetime.now(timezone.utc)
+            self._save(
+                backup_id,
+                status='success',
+                error_message=None,
+                manifest=manifest,
+                file_path=uploaded['file_path'],
+                drive_file_id=uploaded['file_id'],
+                file_size_bytes=result["bytes"],
+                total_records=result["rows"],
+                completed_at=completed_at,
+                execution_time_seconds=int(time.monotonic() - started)
+            )
+
+        result["elapsed_seconds"] = round(time.monotonic() - started, 2)
+        log = logger.info if not errors else logger.warning
+        log(
+            f"{'✅' if not errors else '⚠️'} Full backup {backup_id[:8]} {result['status']}: "
+            f"{result['rows']} rows, {result['bytes'] / 1024 / 1024:.2f} MB in {result['elapsed_seconds']}s"
+            f"{f', {len(errors)} chunks failed (run again to resume)' if errors else ''}"
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # 복원
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self, manifest_file_id: Optional[str]) -> Dict[str, Any]:
+        if manifest_file_id:
+            buffer = io.BytesIO()
+            self.storage.download(manifest_file_id, buffer)
+            return loads(buffer.getvalue())
+
+        with db_session() as db:
+            latest = db.query(BackupHistory).filter(
+                BackupHistory.backup_type == 'full',
+                BackupHistory.status == 'success'
+            ).order_by(BackupHistory.completed_at.desc()).first()
+            if not latest:
+                raise ValueError("No successful full backup recorded; pass the manifest file id")
+            return latest.manifest
+
+    def _copy_in(self, table: Table, columns: List[str], fileobj) -> None:
+        preparer = engine.dialect.identifier_preparer
+        column_list = ", ".join(preparer.quote(name) for name in columns)
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.copy_expert(f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN", fileobj)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+    @staticmethod
+    def _insert_rows(table: Table, columns: List[str], fileobj) -> None:
+        converters = [_converter(table.c[name]) for name in columns]
+        statement = table.insert()
+        batch = []
+        with engine.begin() as conn:
+            for line in io.TextIOWrapper(fileobj, encoding="utf-8", newline="\n"):
+                fields = line[:-1].split("\t")
+                batch.append({
+                    name: None if field == NULL else convert(_unescape(field))
+                    for name, convert, field in zip(columns, converters, fields)
+                })
+                if len(batch) >= FETCH_ROWS:
+                    conn.execute(statement, batch)
+                    batch = []
+            if batch:
+                conn.execute(statement, batch)
+
+    def _load_chunk(self, table: Table, plan: Dict[str, Any], chunk: Dict[str, Any]) -> int:
+        """chunk 1개 다운로드 → 체크섬 확인 → 적재 (worker 스레드에서 실행)"""
+        with spooled_file() as spool:
+            self.storage.download(chunk["file_id"], spool)
+            if file_sha256(spool) != chunk["sha256"]:
+                raise ValueError(f"Checksum mismatch for {chunk['path']}")
+            with gzip.GzipFile(fileobj=spool, mode="rb") as gz:
+                if self.use_copy:
+                    self._copy_in(table, plan["columns"], gz)
+                else:
+                    self._insert_rows(table, plan["columns"], gz)
+        return chunk["rows"]
+
+    def _prepare_tables(self, manifest: Dict[str, Any], names: List[str], truncate: bool) -> List[Table]:
+        """없는 테이블은 백업 시점 DDL로 생성, 데이터가 있는 테이블은 truncate=True일 때만 비움"""
+        metadata = self._reflect()
+        missing = [name for name in names if name not in metadata.tables]
+        if missing:
+            if manifest["dialect"] != self.dialect:
+                raise ValueError(
+                    f"Tables missing on {self.dialect} and the backup DDL is for {manifest['dialect']}: "
+                    f"{', '.join(missing)} (run `init` first)"
+                )
+            with engine.begin() as conn:
+                for name in missing:
+                    conn.execute(text(manifest["tables"][name]["ddl"]))
+                    logger.info(f"🧱 Created table {name} from backup DDL")
+            metadata = self._reflect()
+
+        tables = [metadata.tables[name] for name in names]
+        with engine.begin() as conn:
+            non_empty = [table.name for table in tables if conn.execute(select(func.count()).select_from(table)).scalar()]
+            if non_empty and not truncate:
+                raise ValueError(f"Tables are not empty: {', '.join(non_empty)} (use truncate to replace)")
+            for level in reversed(_dependency_levels(tables)):
+                for table in level:
+                    if table.name in non_empty:
+                        conn.execute(table.delete())
+        return tables
+
+    def _reset_sequences(self, tables: List[Table]) -> None:
+        """COPY로 넣은 정수 키 이후 값부터 시퀀스가 이어지도록 조정"""
+        preparer = engine.dialect.identifier_preparer
+        with engine.begin() as conn:
+            for table in tables:
+                key = self._key_column(table)
+                if key is None or not isinstance(key.type, Integer):
+                    continue
+                conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence(:table, :column), "
+                        f"COALESCE((SELECT MAX({preparer.quote(key.name)}) FROM {preparer.format_table(table)}), 0) + 1, false)"
+                    ),
+                    {"table": table.name, "column": key.name}
+                )
+
+    def restore(
+        self,
+        manifest_file_id: Optional[str] = None,
+        tables: Optional[Iterable[str]] = None,
+        truncate: bool = False
+    ) -> Dict[str, int]:
+        """
+        전체 백업 복원 (FK 의존 순서 그룹별로 chunk 병렬 적재)
+
+        Args:
+            manifest_file_id: 업로드된 manifest.json (None이면 마지막 성공 백업의 manifest)
+            tables: 복원할 테이블 (None이면 전체)
+            truncate: 데이터가 있는 테이블을 비우고 복원 (기본: 비어 있지 않으면 중단)
+
+        Returns:
+            테이블별 복원한 행 수
+        """
+        started = time.monotonic()
+        manifest = self._load_manifest(manifest_file_id)
+        names = list(tables or manifest["tables"])
+        unknown = [name for name in names if name not in manifest["tables"]]
+        if unknown:
+            raise ValueError(f"Tables not in backup: {', '.join(unknown)}")
+        incomplete = [
+            f"{name}#{chunk['index']}" for name in names
+            for chunk in manifest["tables"][name]["chunks"] if "sha256" not in chunk
+        ]
+        if incomplete:
+            raise ValueError(f"Backup is incomplete ({len(incomplete)} chunks missing, e.g. {incomplete[0]})")
+
+        target = self._prepare_tables(manifest, names, truncate)
+        # SQLite 등은 동시 쓰기를 지원하지 않으므로 순차 적재
+        workers = self.workers if self.use_copy else 1
+        restored = {name: 0 for name in names}
+
+        logger.info(f"♻️  Restoring backup {manifest['backup_id'][:8]}: {len(names)} tables, {workers} workers")
+        for level in _dependency_levels(target):
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore") as pool:
+                futures = {
+                    pool.submit(self._load_chunk, table, manifest["tables"][table.name], chunk): table.name
+                    for table in level
+                    for chunk in manifest["tables"][table.name]["chunks"]
+                }
+                for future in as_completed(futures):
+                    restored[futures[future]] += future.result()
+
+        if self.use_copy:
+            self._reset_sequences(target)
+
+        logger.info(
+            f"✅ Restored {sum(restored.values())} rows into {len(names)} tables "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return restored
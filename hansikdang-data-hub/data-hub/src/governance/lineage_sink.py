@@ -0,0 +1,274 @@
+"""
+Lineage sink - 데이터 계보 이벤트 버퍼링 기록
+파이프라인 단계는 이벤트를 메모리 버퍼에 넣기만 하고, 백그라운드 스레드가 모아서 bulk insert
+
+- flush 조건: 버퍼가 lineage_flush_rows 이상 / 마지막 flush 후 lineage_flush_interval 초 경과
+- 버퍼가 찼을 때 (lineage_backpressure)
+  - block (기본): 여유가 생길 때까지 최대 lineage_block_timeout 초 대기 후 버림
+    (이벤트 루프 위에서 호출하면 루프 전체가 멈추므로 대기하지 않고 바로 버림)
+  - sample: 버퍼가 75% 이상이면 성공 이벤트는 lineage_sample_rate개 중 1개만 유지, 가득 차면 버림 (생산 단계는 대기하지 않음)
+- 종료 시 close()가 버퍼를 모두 기록 (start() 이후 프로세스 종료 시에도 atexit로 호출)
+- 기록/버림/대기 횟수는 stats(), 버린 이벤트는 datahub_lineage_dropped 메트릭 + 경고 로그 (DROP_WARN_INTERVAL마다)
+
+Usage:
+    lineage_sink.record(restaurant_id, 'processed', 'gemini', quality_after=score, execution_time_ms=ms)
+"""
+import asyncio
+import atexit
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from config import settings
+from ..database.connection import db_session
+from ..database.models import DataLineage
+from ..monitoring.metrics import registry
+from .lineage_tracker import build_lineage_row
+
+
+POLICIES = ("block", "sample")
+
+# sample 정책에서 표본 추출을 시작하는 버퍼 사용률
+SAMPLE_WATERMARK = 0.75
+
+# flush 실패 시 재시도 간격 (초, 1회 재시도 후 버림)
+RETRY_DELAY = 1.0
+
+# 이벤트를 버렸을 때 경고 로그 최소 간격 (초, 그 사이 버린 수는 합산해 기록)
+DROP_WARN_INTERVAL = 10.0
+
+LINEAGE_DROPPED = registry.counter(
+    "datahub_lineage_dropped", "Lineage events not written (reason = sampled, full, closed or flush_error)",
+    ("reason",)
+)
+
+
+def _on_event_loop() -> bool:
+    """실행 중인 이벤트 루프 스레드에서 호출됐는지 (async 단계에서 직접 record()한 경우)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class LineageSink:
+    """계보 이벤트 버퍼 + 백그라운드 bulk insert"""
+
+    def __init__(
+        self,
+        max_buffer: Optional[int] = None,
+        flush_rows: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        policy: Optional[str] = None,
+        sample_rate: Optional[int] = None,
+        block_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            max_buffer: 버퍼 최대 이벤트 수
+            flush_rows: 한 번에 기록하는 이벤트 수 (이만큼 쌓이면 바로 flush)
+            flush_interval: 최대 flush 간격 (초)
+            policy: 버퍼가 찼을 때 정책 (block | sample)
+            sample_rate: sample 정책에서 유지할 성공 이벤트 비율 (N개 중 1개)
+            block_timeout: block 정책에서 최대 대기 시간 (초)
+        """
+        self.max_buffer = max_buffer or settings.lineage_buffer_size
+        self.flush_rows = flush_rows or settings.lineage_flush_rows
+        self.flush_interval = flush_interval or settings.lineage_flush_interval
+        self.policy = policy or settings.lineage_backpressure
+        if self.policy not in POLICIES:
+            raise ValueError(f"Unknown lineage backpressure policy '{self.policy}' (expected {' or '.join(POLICIES)})")
+        self.sample_rate = max(1, sample_rate or settings.lineage_sample_rate)
+        self.block_timeout = block_timeout if block_timeout is not None else settings.lineage_block_timeout
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._writing = 0
+        self._sample_counter = 0
+        self._atexit_registered = False
+        self._unreported_drops: Dict[str, int] = {}
+        self._last_drop_warning = 0.0
+        self._stats = {
+            "enqueued": 0, "written": 0, "dropped": 0, "sampled_out": 0,
+            "blocked": 0, "blocked_seconds": 0.0, "flushes": 0, "flush_errors": 0
+        }
+
+    # ------------------------------------------------------------------
+    # 생산 단계
+    # ------------------------------------------------------------------
+
+    def record(self, entity_id: str, operation: str, source_system: str, **kwargs: Any) -> bool:
+        """
+        계보 이벤트 추가 (DataLineageTracker.track_operation과 같은 인자)
+
+        Returns:
+            버퍼에 들어갔는지 (비활성/표본 제외/버림이면 False)
+        """
+        if not settings.lineage_enabled:
+            return False
+        return self.put(build_lineage_row(entity_id, operation, source_system, **kwargs))
+
+    def put(self, row: Dict[str, Any]) -> bool:
+        """DataLineage 행(dict) 추가"""
+        with self._cond:
+            if self._closed:
+                self._drop("closed")
+                return False
+            self._ensure_started()
+
+            size = len(self._buffer)
+            if size >= self.max_buffer and self.policy == "block" and not _on_event_loop():
+                started = time.monotonic()
+                self._stats["blocked"] += 1
+                self._cond.notify_all()
+                self._cond.wait_for(
+                    lambda: len(self._buffer) < self.max_buffer or self._closed, timeout=self.block_timeout
+                )
+                self._stats["blocked_seconds"] += time.monotonic() - started
+                size = len(self._buffer)
+
+            if size >= self.max_buffer or self._closed:
+                self._drop("closed" if self._closed else "full")
+                return False
+
+            if (
+                self.policy == "sample"
+                and size >= self.max_buffer * SAMPLE_WATERMARK
+                and row.get("operation_status") == 'success'
+            ):
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_rate:
+                    self._drop("sampled")
+                    return False
+
+            self._buffer.append(row)
+            self._stats["enqueued"] += 1
+            if len(self._buffer) >= self.flush_rows:
+                self._cond.notify_all()
+            return True
+
+    def _drop(self, reason: str, count: int = 1) -> None:
+        """버린 이벤트 집계 + 경고 (self._cond 보유 상태에서 호출)"""
+        self._stats["sampled_out" if reason == "sampled" else "dropped"] += count
+        LINEAGE_DROPPED.inc(count, reason=reason)
+        self._unreported_drops[reason] = self._unreported_drops.get(reason, 0) + count
+
+        now = time.monotonic()
+        if now - self._last_drop_warning >= DROP_WARN_INTERVAL:
+            counts = ", ".join(f"{key}={value}" for key, value in self._unreported_drops.items())
+            logger.warning(
+                f"⚠️  Lineage events dropped ({counts}, policy={self.policy}, buffer={len(self._buffer)}/{self.max_buffer})"
+            )
+            self._unreported_drops = {}
+            self._last_drop_warning = now
+
+    # ------------------------------------------------------------------
+    # 백그라운드 기록
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """백그라운드 스레드 시작 (record()가 처음 호출될 때도 자동 시작)"""
+        with self._cond:
+            self._closed = False
+            self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="lineage-sink", daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+    def _take(self) -> List[Dict[str, Any]]:
+        count = min(len(self._buffer), self.flush_rows)
+        batch = [self._buffer.popleft() for _ in range(count)]
+        self._writing += len(batch)
+        self._cond.notify_all()  # block 정책으로 대기 중인 생산 단계
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._buffer) >= self.flush_rows or self._closed, timeout=self.flush_interval
+                )
+                if not self._buffer:
+                    if self._closed:
+                        return
+                    continue
+                batch = self._take()
+
+            written = self._write(batch)
+            with self._cond:
+                self._writing -= len(batch)
+                self._stats["written"] += written
+                if written < len(batch):
+                    self._drop("flush_error", len(batch) - written)
+                self._stats["flushes"] += 1
+                self._cond.notify_all()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> int:
+        for attempt in (1, 2):
+            try:
+                with db_session() as db:
+                    db.bulk_insert_mappings(DataLineage, batch)
+                return len(batch)
+            except Exception as e:
+                with self._cond:
+                    self._stats["flush_errors"] += 1
+                logger.warning(f"⚠️  Lineage flush failed ({len(batch)} events, attempt {attempt}): {e}")
+                if attempt == 1:
+                    time.sleep(RETRY_DELAY)
+        return 0
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """지금까지 넣은 이벤트가 모두 기록될 때까지 대기"""
+        with self._cond:
+            if self._thread is None:
+                return not self._buffer
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._buffer and not self._writing, timeout=timeout
+            )
+
+    def close(self, timeout: float = 30.0) -> None:
+        """남은 이벤트를 모두 기록하고 스레드 종료"""
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        thread.join(timeout)
+        with self._cond:
+            self._thread = None
+            remaining = len(self._buffer)
+        if remaining:
+            logger.warning(f"⚠️  Lineage sink closed with {remaining} unwritten events")
+        logger.info(f"📊 Lineage sink closed: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """기록/버림/대기 횟수 + 현재 버퍼 크기"""
+        with self._cond:
+            return {
+                **self._stats,
+                "blocked_seconds": round(self._stats["blocked_seconds"], 3),
+                "buffered": len(self._buffer),
+                "policy": self.policy,
+            }
+
+
+lineage_sink = LineageSink()
+
+registry.gauge(
+    "datahub_lineage_buffer_depth", "Lineage events waiting to be written"
+).set_function(lambda: len(lineage_sink._buffer))
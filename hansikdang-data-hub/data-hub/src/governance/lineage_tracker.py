@@ -1,15 +1,70 @@
 """
 Data Lineage Tracker - 데이터 계보 추적 시스템
+
+track_operation()은 이벤트마다 commit합니다.
+파이프라인처럼 이벤트가 많은 경로는 lineage_sink.record()를 사용하세요 (버퍼링 후 bulk insert).
 """
 import uuid
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 from loguru import logger
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from ..database.aggregates import count_where, percentiles
 from ..database.models import DataLineage
 
 
+def _sample_data(data: Optional[Dict], max_fields: int = 5) -> Optional[Dict]:
+    """데이터 샘플링 (저장 공간 절약)"""
+    if not data:
+        return None
+    
+    if isinstance(data, dict):
+        keys = list(data.keys())[:max_fields]
+        return {k: data[k] for k in keys}
+    
+    return data
+
+
+def build_lineage_row(
+    entity_id: str,
+    operation: str,
+    source_system: str,
+    input_data: Optional[Dict] = None,
+    output_data: Optional[Dict] = None,
+    transformation_rules: Optional[Dict] = None,
+    quality_before: Optional[float] = None,
+    quality_after: Optional[float] = None,
+    execution_time_ms: Optional[int] = None,
+    status: str = 'success',
+    executed_by: str = 'system'
+) -> Dict[str, Any]:
+    """DataLineage 행 (executed_at은 기록 시점이 아닌 이벤트 발생 시각)"""
+    quality_delta = None
+    if quality_before is not None and quality_after is not None:
+        quality_delta = quality_after - quality_before
+    
+    return {
+        'id': str(uuid.uuid4()),
+        'entity_id': entity_id,
+        'entity_type': 'restaurant',
+        'operation': operation,
+        'operation_status': status,
+        'source_system': source_system,
+        'source_id': entity_id,
+        'input_data': _sample_data(input_data),
+        'output_data': _sample_data(output_data),
+        'transformation_rules': transformation_rules,
+        'quality_before': quality_before,
+        'quality_after': quality_after,
+        'quality_delta': quality_delta,
+        'executed_at': datetime.now(timezone.utc),
+        'executed_by': executed_by,
+        'execution_time_ms': execution_time_ms,
+    }
+
+
 class DataLineageTracker:
     """
     데이터 변환 이력 추적 시스템
@@ -52,27 +107,17 @@ class DataLineageTracker:
         Returns:
             DataLineage: 계보 레코드
         """
-        quality_delta = None
-        if quality_before is not None and quality_after is not None:
-            quality_delta = quality_after - quality_before
-        
-        lineage = DataLineage(
-            id=str(uuid.uuid4()),
-            entity_id=entity_id,
-            entity_type='restaurant',
-            operation=operation,
-            operation_status=status,
-            source_system=source_system,
-            source_id=entity_id,
-            input_data=self._sample_data(input_data),
-            output_data=self._sample_data(output_data),
+        lineage = DataLineage(**build_lineage_row(
+            entity_id, operation, source_system,
+            input_data=input_data,
+            output_data=output_data,
             transformation_rules=transformation_rules,
             quality_before=quality_before,
             quality_after=quality_after,
-            quality_delta=quality_delta,
-            executed_by=executed_by,
-            execution_time_ms=execution_time_ms
-        )
+            execution_time_ms=execution_time_ms,
+            status=status,
+            executed_by=executed_by
+        ))
         
         self.db.add(lineage)
         self.db.commit()
@@ -83,14 +128,7 @@ class DataLineageTracker:
     
     def _sample_data(self, data: Optional[Dict], max_fields: int = 5) -> Optional[Dict]:
         """데이터 샘플링 (저장 공간 절약)"""
-        if not data:
-            return None
-        
-        if isinstance(data, dict):
-            keys = list(data.keys())[:max_fields]
-            return {k: data[k] for k in keys}
-        
-        return data
+        return _sample_data(data, max_fields)
     
     def get_lineage(
         self,
@@ -116,14 +154,16 @@ class DataLineageTracker:
     def get_operation_stats(
         self,
         operation: Optional[str] = None,
-        hours: int = 24
+        hours: int = 24,
+        with_percentiles: bool = False
     ) -> Dict[str, Any]:
         """
-        작업 통계를 조회합니다.
+        작업 통계를 조회합니다. (DB에서 집계)
         
         Args:
             operation: 작업 유형 필터
             hours: 조회 시간 범위 (시간)
+            with_percentiles: 실행 시간 백분위수(p50/p95/p99) 포함
             
         Returns:
             통계 정보
@@ -132,38 +172,33 @@ class DataLineageTracker:
         
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         
-        query = self.db.query(DataLineage)\
-            .filter(DataLineage.executed_at >= cutoff_time)
-        
+        criteria = [DataLineage.executed_at >= cutoff_time]
         if operation:
-            query = query.filter(DataLineage.operation == operation)
-        
-        records = query.all()
-        
-        total = len(records)
-        success = sum(1 for r in records if r.operation_status == 'success')
-        failed = sum(1 for r in records if r.operation_status == 'failed')
+            criteria.append(DataLineage.operation == operation)
         
-        avg_exec_time = 0
-        if records:
-            exec_times = [r.execution_time_ms for r in records if r.execution_time_ms]
-            if exec_times:
-                avg_exec_time = sum(exec_times) / len(exec_times)
+        total, success, failed, avg_exec_time, avg_quality_delta = self.db.query(
+            func.count(DataLineage.id),
+            count_where(DataLineage.operation_status == 'success'),
+            count_where(DataLineage.operation_status == 'failed'),
+            func.avg(func.nullif(DataLineage.execution_time_ms, 0)),
+            func.avg(DataLineage.quality_delta)
+        ).filter(*criteria).one()
         
-        avg_quality_delta = 0
-        if records:
-            deltas = [r.quality_delta for r in records if r.quality_delta is not None]
-            if deltas:
-                avg_quality_delta = sum(deltas) / len(deltas)
-        
-        return {
+        stats = {
             'total_operations': total,
-            'successful': success,
-            'failed': failed,
+            'successful': int(success),
+            'failed': int(failed),
             'success_rate': round((success / total * 100) if total > 0 else 0, 2),
-            'avg_execution_time_ms': round(avg_exec_time, 2),
-            'avg_quality_improvement': round(avg_quality_delta, 2)
+            'avg_execution_time_ms': round(float(avg_exec_time or 0), 2),
+            'avg_quality_improvement': round(float(avg_quality_delta or 0), 2)
         }
+        
+        if with_percentiles:
+            stats['execution_time_ms_percentiles'] = percentiles(
+                self.db, DataLineage.execution_time_ms, DataLineage.execution_time_ms > 0, *criteria
+            )
+        
+        return stats
     
     def trace_entity_journey(
         self,
@@ -0,0 +1,174 @@
+"""
+Quality Rescorer - 변경된 레스토랑만 품질 점수 재계산
+
+- 품질 입력 필드가 바뀐 행은 ORM 이벤트가 quality_dirty = True로 표시 (src/database/change_tracking.py)
+- rescore(): 표시된 행 + 같은 이름의 행(고유성 점수)만 다시 계산해
+  quality_metrics / quality_scores를 레스토랑당 1행으로 교체하고 표시 해제
+- mark_stale(): 적시성 점수(경과 일수 구간)가 바뀌었을 수 있는 행 표시 (하루 1회면 충분)
+
+Usage:
+    with db_session() as db:
+        QualityRescorer(db).mark_stale()
+        stats = QualityRescorer(db).rescore()
+"""
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ..database.models import ProcessedRestaurant, QualityMetrics, QualityScore
+from .quality_validator import QualityValidator, calculate_quality_score
+
+
+# 한 번에 재계산하는 표시된 행 수 (같은 이름의 행이 더해질 수 있음)
+RESCORE_CHUNK_ROWS = 1000
+
+# 적시성 점수 구간의 마지막 경계 (이보다 오래된 행은 더 이상 바뀌지 않음)
+TIMELINESS_HORIZON_DAYS = 91
+
+
+def _dirty_filter():
+    return ProcessedRestaurant.quality_dirty.isnot(False)
+
+
+class QualityRescorer:
+    """quality_dirty 행만 재계산"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.validator = QualityValidator(db)
+
+    def pending(self) -> int:
+        """재계산 대기 행 수"""
+        return self.db.query(ProcessedRestaurant.id).filter(_dirty_filter()).count()
+
+    def mark_dirty(self, restaurant_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        재계산 대상으로 표시 (ORM 이벤트를 거치지 않은 쓰기, 강제 재계산용)
+
+        Args:
+            restaurant_ids: 대상 ID (None이면 전체)
+        """
+        statement = update(ProcessedRestaurant).values(quality_dirty=True)
+        if restaurant_ids is not None:
+            statement = statement.where(ProcessedRestaurant.id.in_(list(restaurant_ids)))
+        marked = self.db.execute(statement).rowcount
+        self.db.commit()
+        return marked
+
+    def mark_stale(self, now: Optional[datetime] = None) -> int:
+        """
+        적시성 점수가 바뀌었을 수 있는 행 표시
+        (TIMELINESS_HORIZON_DAYS 이내에 생성됐고 마지막 측정이 하루 이상 지난 행)
+        """
+        now = now or datetime.now(timezone.utc)
+        measured_before = self.db.query(QualityMetrics.restaurant_id).filter(
+            QualityMetrics.data_type == 'restaurant',
+            QualityMetrics.measured_at < now - timedelta(days=1)
+        )
+        marked = self.db.execute(
+            update(ProcessedRestaurant)
+            .where(
+                ProcessedRestaurant.quality_dirty.is_(False),
+                ProcessedRestaurant.created_at >= now - timedelta(days=TIMELINESS_HORIZON_DAYS),
+                ProcessedRestaurant.id.in_(measured_before.scalar_subquery())
+            )
+            .values(quality_dirty=True)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+        if marked:
+            logger.info(f"🕒 {marked} restaurants marked for timeliness rescoring")
+        return marked
+
+    def _claim(self, max_rows: int = RESCORE_CHUNK_ROWS) -> List[str]:
+        """다음 표시된 행(최대 max_rows) + 같은 이름의 행 ID를 가져와 표시 해제
+        (해제 후 읽으므로 그 사이 변경된 행은 다시 표시되어 다음 청크/실행에서 처리)"""
+        rows = self.db.query(ProcessedRestaurant.id, ProcessedRestaurant.name).filter(
+            _dirty_filter()
+        ).order_by(ProcessedRestaurant.id).limit(max_rows).all()
+        if not rows:
+            return []
+
+        names = list({name for _, name in rows if name})
+        ids = {restaurant_id for restaurant_id, _ in rows}
+        if names:
+            ids.update(
+                restaurant_id for (restaurant_id,) in
+                self.db.query(ProcessedRestaurant.id).filter(ProcessedRestaurant.name.in_(names))
+            )
+
+        ids = sorted(ids)
+        self.db.execute(
+            update(ProcessedRestaurant)
+            .where(ProcessedRestaurant.id.in_(ids))
+            .values(quality_dirty=False)
+            .execution_options(synchronize_session=False)
+        )
+        return ids
+
+    def _save_quality_scores(self, frame) -> None:
+        """QualityScore (Stage A) 레스토랑당 1행으로 교체"""
+        ids = frame['id'].tolist()
+        self.db.query(QualityScore).filter(
+            QualityScore.restaurant_id.in_(ids)
+        ).delete(synchronize_session=False)
+
+        fields = ('name', 'address', 'phone', 'latitude', 'longitude')
+        records = frame[['id', *fields]].astype(object).where(frame[['id', *fields]].notna(), None)
+        self.db.bulk_insert_mappings(QualityScore, [
+            {'restaurant_id': row[0], **calculate_quality_score(dict(zip(fields, row[1:])))}
+            for row in records.itertuples(index=False, name=None)
+        ])
+
+    def rescore(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        표시된 행 재계산 (청크마다 commit)
+
+        Args:
+            limit: 최대 처리 행 수 (None이면 표시된 행 전체)
+
+        Returns:
+            rescored, chunks, average_score, elapsed_seconds
+        """
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        rescored = chunks = 0
+        score_sum = 0.0
+
+        while limit is None or rescored < limit:
+            # 마지막 청크는 limit까지 남은 만큼만 표시 해제 (나머지는 다음 실행에서 처리)
+            ids = self._claim(RESCORE_CHUNK_ROWS if limit is None else min(RESCORE_CHUNK_ROWS, limit - rescored))
+            if not ids:
+                break
+
+            try:
+                frame = self.validator._load_frame(None, None, ids=ids)
+                name_counts = self.validator._duplicate_name_counts(names=list(set(frame['name'].dropna())))
+                scores = self.validator.score_frame(frame, name_counts, now=now)
+                issues = self.validator._frame_issues(frame)
+
+                self.validator.save_metrics(self.validator.metric_rows(frame, scores, issues))
+                self._save_quality_scores(frame)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()  # 표시 해제도 취소 → 다음 실행에서 다시 시도
+                raise
+
+            rescored += len(frame)
+            chunks += 1
+            score_sum += float(scores['overall'].sum())
+
+        elapsed = time.monotonic() - started
+        stats = {
+            'rescored': rescored,
+            'chunks': chunks,
+            'average_score': round(score_sum / rescored, 2) if rescored else 0.0,
+            'elapsed_seconds': round(elapsed, 2)
+        }
+        if rescored:
+            logger.info(f"✅ Quality rescored: {rescored} restaurants in {elapsed:.1f}s (avg {stats['average_score']})")
+        return stats
@@ -1,13 +1,109 @@
 """
 Quality Validator - 7가지 품질 지표 측정 시스템
+
+- validate_restaurant(): 레스토랑 1개 측정 후 저장
+- validate_batch(): 배치를 한 번에 불러와 pandas로 7개 지표를 열 단위 계산,
+  중복 이름 수는 GROUP BY 한 번으로 미리 구하고 QualityMetrics는 bulk insert (청크마다 commit 1회)
+- quality_metrics는 레스토랑당 현재 값 1행 (다시 측정하면 교체, quality_history_enabled면 이력 테이블에 추가)
+- calculate_quality_score(): 중복 관리 API의 QualityScore (Stage A) 점수
 """
+import re
+import time
 import uuid
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
 from loguru import logger
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from ..database.models import ProcessedRestaurant, QualityMetrics
+from config import settings
+from ..database.models import ProcessedRestaurant, QualityMetrics, QualityMetricsHistory
+
+
+# 일괄 검증 시 한 번에 불러와 계산/저장하는 행 수
+VALIDATION_CHUNK_ROWS = 5000
+
+VALID_CATEGORIES = ['한식', '일식', '중식', '양식', '카페', '주점', '분식', '아시안']
+KOREAN_KEYWORDS = ['한식', '한정식', '국밥', '찌개', '삼겹살', '갈비', '비빔밥']
+
+METRIC_WEIGHTS = {
+    'completeness': 0.20,
+    'accuracy': 0.20,
+    'consistency': 0.15,
+    'timeliness': 0.10,
+    'validity': 0.15,
+    'uniqueness': 0.10,
+    'relevance': 0.10,
+}
+
+
+# 이력 테이블에 복사하는 컬럼
+HISTORY_COLUMNS = (
+    'restaurant_id', 'completeness_score', 'accuracy_score', 'consistency_score', 'timeliness_score',
+    'validity_score', 'uniqueness_score', 'relevance_score', 'overall_quality_score', 'quality_grade',
+    'measured_by'
+)
+
+
+def calculate_quality_score(restaurant: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    데이터 품질 점수 계산
+    
+    Returns:
+        {
+            'completeness_score': float,  # 0-100
+            'phone_valid': bool,
+            'address_complete': bool,
+            'coordinates_valid': bool,
+            'total_score': float  # 0-100
+        }
+    """
+    score = {
+        'completeness_score': 0.0,
+        'phone_valid': False,
+        'address_complete': False,
+        'coordinates_valid': False,
+        'total_score': 0.0
+    }
+    
+    # 필수 필드 체크
+    required_fields = ['name', 'address', 'phone']
+    filled_required = sum(1 for field in required_fields if restaurant.get(field))
+    score['completeness_score'] = (filled_required / len(required_fields)) * 100
+    
+    # 전화번호 유효성 (10자리 이상 숫자)
+    phone = ''.join(filter(str.isdigit, str(restaurant.get('phone', ''))))
+    score['phone_valid'] = len(phone) >= 10
+    
+    # 주소 완성도 (10자 이상)
+    address = str(restaurant.get('address', '')).strip()
+    score['address_complete'] = len(address) >= 10
+    
+    # 좌표 유효성
+    lat = restaurant.get('latitude')
+    lng = restaurant.get('longitude')
+    if lat and lng:
+        try:
+            lat_f = float(lat)
+            lng_f = float(lng)
+            # 한국 좌표 범위: 위도 33-39, 경도 124-132
+            score['coordinates_valid'] = (33 <= lat_f <= 39 and 124 <= lng_f <= 132)
+        except:
+            score['coordinates_valid'] = False
+    
+    # 종합 점수 계산
+    total = 0
+    total += score['completeness_score'] * 0.4  # 40%
+    total += 20 if score['phone_valid'] else 0  # 20%
+    total += 20 if score['address_complete'] else 0  # 20%
+    total += 20 if score['coordinates_valid'] else 0  # 20%
+    
+    score['total_score'] = min(100, total)
+    
+    return score
 
 
 class QualityValidator:
@@ -52,13 +148,13 @@ class QualityValidator:
         relevance = self._measure_relevance(restaurant)
         
         overall_score = (
-            completeness * 0.20 +
-            accuracy * 0.20 +
-            consistency * 0.15 +
-            timeliness * 0.10 +
-            validity * 0.15 +
-            uniqueness * 0.10 +
-            relevance * 0.10
+            completeness * METRIC_WEIGHTS['completeness'] +
+            accuracy * METRIC_WEIGHTS['accuracy'] +
+            consistency * METRIC_WEIGHTS['consistency'] +
+            timeliness * METRIC_WEIGHTS['timeliness'] +
+            validity * METRIC_WEIGHTS['validity'] +
+            uniqueness * METRIC_WEIGHTS['uniqueness'] +
+            relevance * METRIC_WEIGHTS['relevance']
         )
         
         grade = self._calculate_grade(overall_score)
@@ -83,7 +179,9 @@ class QualityValidator:
             measured_by='system'
         )
         
+        self._replace_current([restaurant.id])
         self.db.add(metrics)
+        self._append_history([{column: getattr(metrics, column) for column in HISTORY_COLUMNS}])
         self.db.commit()
         
         logger.info(f"✅ 품질 검증 완료: {restaurant.name} - {grade}등급 ({overall_score:.1f}점)")
@@ -184,8 +282,7 @@ class QualityValidator:
                 score -= 30
         
         if restaurant.category:
-            valid_categories = ['한식', '일식', '중식', '양식', '카페', '주점', '분식', '아시안']
-            if not any(cat in restaurant.category for cat in valid_categories):
+            if not any(cat in restaurant.category for cat in VALID_CATEGORIES):
                 score -= 10
         
         return max(0, score)
@@ -213,8 +310,7 @@ class QualityValidator:
         score = 100.0
         
         if restaurant.category:
-            korean_keywords = ['한식', '한정식', '국밥', '찌개', '삼겹살', '갈비', '비빔밥']
-            if not any(keyword in restaurant.category for keyword in korean_keywords):
+            if not any(keyword in restaurant.category for keyword in KOREAN_KEYWORDS):
                 score -= 30
         
         if not restaurant.description:
@@ -283,42 +379,275 @@ class QualityValidator:
         
         return recommendations
     
+    # ------------------------------------------------------------------
+    # 일괄 검증 (열 단위 계산)
+    # ------------------------------------------------------------------
+    
+    def _load_frame(
+        self,
+        after_id: Optional[str],
+        limit: Optional[int],
+        ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """id 순으로 다음 청크(또는 지정한 id)의 검증 대상 컬럼만 불러오기"""
+        fields = list(dict.fromkeys(
+            ['id', 'name', 'address', 'category', 'description', 'phone', 'created_at',
+             'google_rating', 'naver_rating', 'latitude', 'longitude']
+            + [field for field in self.required_fields + self.recommended_fields if hasattr(ProcessedRestaurant, field)]
+        ))
+        query = self.db.query(*[getattr(ProcessedRestaurant, field) for field in fields])
+        if after_id is not None:
+            query = query.filter(ProcessedRestaurant.id > after_id)
+        if ids is not None:
+            query = query.filter(ProcessedRestaurant.id.in_(ids))
+        rows = query.order_by(ProcessedRestaurant.id).limit(limit).all()
+        return pd.DataFrame([tuple(row) for row in rows], columns=fields)
+    
+    def _duplicate_name_counts(self, names: Optional[List[str]] = None) -> Dict[str, int]:
+        """이름별 레스토랑 수 (2개 이상인 이름만, GROUP BY 1회)"""
+        query = self.db.query(ProcessedRestaurant.name, func.count(ProcessedRestaurant.id))
+        if names is not None:
+            query = query.filter(ProcessedRestaurant.name.in_(names))
+        rows = query.group_by(ProcessedRestaurant.name).having(func.count(ProcessedRestaurant.id) > 1).all()
+        return {name: count for name, count in rows}
+    
+    def _frame_filled(self, frame: pd.DataFrame, field: str) -> pd.Series:
+        """_measure_completeness와 같은 기준으로 값이 채워져 있는지 (모델에 없는 필드는 항상 False)"""
+        if field not in frame:
+            return pd.Series(False, index=frame.index)
+        column = frame[field]
+        if pd.api.types.is_numeric_dtype(column):
+            return column.fillna(0) != 0
+        return column.fillna('').astype(str).str.strip() != ''
+    
+    def score_frame(
+        self,
+        frame: pd.DataFrame,
+        name_counts: Dict[str, int],
+        now: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        7가지 지표를 열 단위로 계산 (validate_restaurant의 _measure_* 와 같은 결과)
+        
+        Args:
+            frame: _load_frame() 결과
+            name_counts: _duplicate_name_counts() 결과
+            now: 적시성 기준 시각
+            
+        Returns:
+            지표별 점수, overall, grade 컬럼
+        """
+        now = now or datetime.now(timezone.utc)
+        text = {
+            field: frame[field].fillna('').astype(str)
+            for field in ('name', 'address', 'category', 'description', 'phone')
+        }
+        number = {
+            field: pd.to_numeric(frame[field], errors='coerce').astype(float)
+            for field in ('google_rating', 'naver_rating', 'latitude', 'longitude')
+        }
+        # 원래 코드의 `if value:` 판정 (None/0/빈 문자열은 False)
+        has = {field: values != '' for field, values in text.items()}
+        has.update({field: values.fillna(0) != 0 for field, values in number.items()})
+        description_len = text['description'].str.len()
+        google_rating = number['google_rating']
+        
+        scores = pd.DataFrame(index=frame.index)
+        
+        fields = self.required_fields + self.recommended_fields
+        filled = sum(self._frame_filled(frame, field).astype(int) for field in fields)
+        scores['completeness'] = np.minimum(100, filled / len(fields) * 100)
+        
+        digits_len = text['phone'].str.replace('-', '', regex=False).str.replace(' ', '', regex=False).str.len()
+        scores['accuracy'] = np.maximum(0, (
+            100.0
+            - 20 * (has['description'] & (description_len < 200))
+            - 30 * (has['google_rating'] & ((google_rating < 0) | (google_rating > 5)))
+            - 10 * (has['phone'] & (digits_len < 9))
+        ))
+        
+        rating_diff = (number['naver_rating'] - google_rating).abs()
+        both_ratings = has['naver_rating'] & has['google_rating']
+        scores['consistency'] = np.maximum(0, (
+            100.0
+            - 30 * (both_ratings & (rating_diff > 1.0))
+            - 15 * (both_ratings & (rating_diff > 0.5) & (rating_diff <= 1.0))
+            - 20 * ~(has['address'] & has['latitude'] & has['longitude'])
+        ))
+        
+        created_at = pd.to_datetime(frame['created_at'], utc=True)
+        age_days = (pd.Timestamp(now) - created_at).dt.days
+        scores['timeliness'] = np.select(
+            [created_at.isna(), age_days <= 1, age_days <= 7, age_days <= 30, age_days <= 90],
+            [50.0, 100.0, 90.0, 70.0, 50.0],
+            default=30.0
+        )
+        
+        latitude, longitude = number['latitude'], number['longitude']
+        valid_category = text['category'].str.contains('|'.join(map(re.escape, VALID_CATEGORIES)), regex=True)
+        scores['validity'] = np.maximum(0, (
+            100.0
+            - 30 * (has['latitude'] & ~latitude.between(33, 43))
+            - 30 * (has['longitude'] & ~longitude.between(124, 132))
+            - 10 * (has['category'] & ~valid_category)
+        ))
+        
+        duplicates = frame['name'].map(name_counts).fillna(1) - 1
+        scores['uniqueness'] = np.select([duplicates == 0, duplicates == 1], [100.0, 70.0], default=40.0)
+        
+        korean_category = text['category'].str.contains('|'.join(map(re.escape, KOREAN_KEYWORDS)), regex=True)
+        scores['relevance'] = np.maximum(0, (
+            100.0
+            - 30 * (has['category'] & ~korean_category)
+            - 20 * ~has['description']
+            - 10 * (has['description'] & (description_len < 200))
+            - 20 * (~has['google_rating'] | (google_rating < 3.5))
+        ))
+        
+        scores['overall'] = sum(scores[metric] * weight for metric, weight in METRIC_WEIGHTS.items())
+        scores['grade'] = np.select(
+            [scores['overall'] >= 90, scores['overall'] >= 80, scores['overall'] >= 70, scores['overall'] >= 60],
+            ['A', 'B', 'C', 'D'],
+            default='F'
+        )
+        return scores
+    
+    def _frame_issues(self, frame: pd.DataFrame) -> List[List[Dict[str, str]]]:
+        """_identify_issues와 같은 이슈 목록 (행별)"""
+        missing = [
+            (field, (~self._frame_filled(frame, field)).tolist()) for field in self.required_fields
+        ]
+        description_len = frame['description'].fillna('').astype(str).str.len()
+        short_description = description_len.between(1, 199).tolist()
+        no_rating = (pd.to_numeric(frame['google_rating'], errors='coerce').fillna(0) == 0).tolist()
+        description_len = description_len.tolist()
+        
+        issues = []
+        for i in range(len(frame)):
+            row_issues = [
+                {'field': field, 'severity': 'critical', 'message': f'필수 필드 누락: {field}'}
+                for field, flags in missing if flags[i]
+            ]
+            if short_description[i]:
+                row_issues.append({
+                    'field': 'description',
+                    'severity': 'warning',
+                    'message': f'설명이 너무 짧습니다 ({description_len[i]}자, 권장: 200자 이상)'
+                })
+            if no_rating[i]:
+                row_issues.append({'field': 'google_rating', 'severity': 'warning', 'message': 'Google 평점 누락'})
+            issues.append(row_issues)
+        return issues
+    
+    def metric_rows(
+        self,
+        frame: pd.DataFrame,
+        scores: pd.DataFrame,
+        issues: List[List[Dict[str, str]]]
+    ) -> List[Dict[str, Any]]:
+        """score_frame() 결과 → QualityMetrics 행"""
+        return [
+            {
+                'id': str(uuid.uuid4()),
+                'restaurant_id': restaurant_id,
+                'data_type': 'restaurant',
+                'completeness_score': float(completeness),
+                'accuracy_score': float(accuracy),
+                'consistency_score': float(consistency),
+                'timeliness_score': float(timeliness),
+                'validity_score': float(validity),
+                'uniqueness_score': float(uniqueness),
+                'relevance_score': float(relevance),
+                'overall_quality_score': float(overall),
+                'quality_grade': grade,
+                'issues': row_issues,
+                'recommendations': self._generate_recommendations(row_issues),
+                'measured_by': 'system'
+            }
+            for restaurant_id, completeness, accuracy, consistency, timeliness, validity, uniqueness,
+                relevance, overall, grade, row_issues in zip(
+                frame['id'], *(scores[column] for column in scores.columns), issues
+            )
+        ]
+    
+    def _replace_current(self, restaurant_ids: List[str]) -> None:
+        """레스토랑의 현재 메트릭 행 삭제 (이전 측정값/중복 행 정리)"""
+        self.db.query(QualityMetrics).filter(
+            QualityMetrics.data_type == 'restaurant',
+            QualityMetrics.restaurant_id.in_(restaurant_ids)
+        ).delete(synchronize_session=False)
+    
+    def _append_history(self, rows: List[Dict[str, Any]]) -> None:
+        if settings.quality_history_enabled and rows:
+            self.db.bulk_insert_mappings(QualityMetricsHistory, [
+                {'id': str(uuid.uuid4()), **{column: row[column] for column in HISTORY_COLUMNS}}
+                for row in rows
+            ])
+    
+    def save_metrics(self, rows: List[Dict[str, Any]]) -> None:
+        """레스토랑별 현재 메트릭 교체 (bulk insert, commit은 호출한 쪽에서)"""
+        if not rows:
+            return
+        self._replace_current([row['restaurant_id'] for row in rows])
+        self.db.bulk_insert_mappings(QualityMetrics, rows)
+        self._append_history(rows)
+    
     def validate_batch(
         self,
-        batch_size: int = 100
+        batch_size: Optional[int] = 100
     ) -> Dict[str, Any]:
         """
-        일괄 품질 검증
+        일괄 품질 검증 (청크 단위로 불러와 열 단위 계산 후 bulk insert)
         
         Args:
-            batch_size: 한 번에 검증할 레스토랑 수
+            batch_size: 검증할 레스토랑 수 (None 또는 0이면 전체)
             
         Returns:
             통계 정보
         """
-        logger.info(f"일괄 품질 검증 시작 (배치 크기: {batch_size})")
+        logger.info(f"일괄 품질 검증 시작 (배치 크기: {batch_size or '전체'})")
+        started = time.monotonic()
         
-        restaurants = self.db.query(ProcessedRestaurant).limit(batch_size).all()
+        name_counts = self._duplicate_name_counts()
+        now = datetime.now(timezone.utc)
         
-        total = len(restaurants)
+        total = 0
         grades = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        avg_score = 0.0
-        
-        for restaurant in restaurants:
-            metrics = self.validate_restaurant(restaurant)
-            grades[metrics.quality_grade] += 1
-            avg_score += metrics.overall_quality_score
+        score_sum = 0.0
+        after_id = None
+        
+        while not batch_size or total < batch_size:
+            limit = min(VALIDATION_CHUNK_ROWS, batch_size - total) if batch_size else VALIDATION_CHUNK_ROWS
+            frame = self._load_frame(after_id, limit)
+            if frame.empty:
+                break
+            
+            scores = self.score_frame(frame, name_counts, now=now)
+            issues = self._frame_issues(frame)
+            
+            self.save_metrics(self.metric_rows(frame, scores, issues))
+            self.db.commit()
+            
+            for grade, count in scores['grade'].value_counts().items():
+                grades[grade] += int(count)
+            score_sum += float(scores['overall'].sum())
+            total += len(frame)
+            after_id = frame['id'].iat[-1]
+            
+            if len(frame) < limit:
+                break
         
-        if total > 0:
-            avg_score /= total
+        avg_score = score_sum / total if total > 0 else 0.0
+        elapsed = time.monotonic() - started
         
         stats = {
             'total_validated': total,
             'average_score': round(avg_score, 2),
             'grade_distribution': grades,
-            'a_grade_percentage': round((grades['A'] / total * 100) if total > 0 else 0, 2)
+            'a_grade_percentage': round((grades['A'] / total * 100) if total > 0 else 0, 2),
+            'elapsed_seconds': round(elapsed, 2)
         }
         
-        logger.info(f"✅ 일괄 품질 검증 완료: {total}개, 평균 {avg_score:.1f}점")
+        logger.info(f"✅ 일괄 품질 검증 완료: {total}개, 평균 {avg_score:.1f}점 ({elapsed:.1f}s)")
         
         return stats
@@ -0,0 +1,418 @@
+"""
+Log Retention - 로그 테이블 월 파티션 + 보존 기간 관리
+
+대상: data_lineage, system_health, quality_metrics_history, scraping_logs, sync_logs
+(quality_metrics는 레스토랑당 현재 점수 1행만 유지하므로 이력 테이블이 대상)
+
+- PostgreSQL: partition_table()로 시간 컬럼 기준 월 range 파티션 테이블로 전환
+  (기본 키는 (id, 시간 컬럼), 범위 밖 행은 {table}_default 파티션)
+  ensure_partitions()가 이번 달부터 log_partition_months_ahead개월 뒤까지 파티션을 미리 생성
+  → 기간 조건이 있는 통계 쿼리는 해당 월 파티션만 읽음
+- 그 외 DB 또는 전환 전 테이블: 일반 테이블 그대로 (시간 컬럼 인덱스 + 월 단위 DELETE)
+- apply_retention(): 보존 기간이 완전히 지난 달을 log_rollups에 요약한 뒤
+  파티션 DROP (파티션 테이블) / 구간 DELETE (일반 테이블)
+
+Usage:
+    manager = RetentionManager()
+    manager.ensure_partitions()
+    results = manager.apply_retention()
+"""
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import Column, MetaData, Table, delete, func, select, text
+from sqlalchemy.schema import CreateTable
+
+from config import settings
+from ..database.connection import engine
+from ..database.models import (
+    DataLineage, LogRollup, QualityMetricsHistory, ScrapingLog, SyncLog, SystemHealth
+)
+
+
+class RetentionPolicy(NamedTuple):
+    """테이블별 보존 설정 + 삭제 전 월별 요약 방법"""
+    model: Any
+    time_column: str
+    retention_setting: str  # settings 속성 이름 (일)
+    dimensions: Tuple[str, ...]  # 요약 group by 컬럼
+    averages: Tuple[str, ...] = ()
+    sums: Tuple[str, ...] = ()
+
+    @property
+    def table(self) -> Table:
+        return self.model.__table__
+
+    @property
+    def retention_days(self) -> int:
+        return getattr(settings, self.retention_setting)
+
+
+RETENTION_POLICIES: Dict[str, RetentionPolicy] = {
+    "data_lineage": RetentionPolicy(
+        DataLineage, "executed_at", "lineage_retention_days",
+        dimensions=("operation", "source_system", "operation_status"),
+        averages=("execution_time_ms", "quality_delta")
+    ),
+    "system_health": RetentionPolicy(
+        SystemHealth, "measured_at", "health_retention_days",
+        dimensions=("component", "component_status"),
+        averages=("response_time_ms", "cpu_usage", "memory_usage", "disk_usage", "error_rate")
+    ),
+    "quality_metrics_history": RetentionPolicy(
+        QualityMetricsHistory, "measured_at", "quality_history_retention_days",
+        dimensions=("quality_grade",),
+        averages=("overall_quality_score",)
+    ),
+    "scraping_logs": RetentionPolicy(
+        ScrapingLog, "started_at", "scraping_log_retention_days",
+        dimensions=("status",),
+        sums=("total_scraped", "success_count", "error_count")
+    ),
+    "sync_logs": RetentionPolicy(
+        SyncLog, "started_at", "sync_log_retention_days",
+        dimensions=("status",),
+        sums=("total_sent", "success_count", "error_count")
+    ),
+}
+
+
+def month_start(value: datetime) -> datetime:
+    """해당 월 1일 00:00 (UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value: datetime) -> datetime:
+    return (value.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def partition_name(table_name: str, month: datetime) -> str:
+    return f"{table_name}_p{month:%Y%m}"
+
+
+def _is_postgres() -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def partition_children(conn) -> Set[str]:
+    """PostgreSQL 파티션(자식 테이블) 이름 (전체 백업 등 테이블 목록에서 제외용)"""
+    if conn.dialect.name != "postgresql":
+        return set()
+    return {
+        row[0] for row in conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relkind = 'p'"
+        ))
+    }
+
+
+class RetentionManager:
+    """로그 테이블 월 파티션 생성/전환 + 보존 기간 적용"""
+
+    def __init__(self, tables: Optional[Iterable[str]] = None):
+        """
+        Args:
+            tables: 대상 테이블 (None이면 RETENTION_POLICIES 전체)
+        """
+        names = list(tables) if tables else list(RETENTION_POLICIES)
+        unknown = [name for name in names if name not in RETENTION_POLICIES]
+        if unknown:
+            raise ValueError(f"Unknown log tables: {', '.join(unknown)} (expected {', '.join(RETENTION_POLICIES)})")
+        self.policies = {name: RETENTION_POLICIES[name] for name in names}
+
+    # ------------------------------------------------------------------
+    # 파티션
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_partitioned(conn, table_name: str) -> bool:
+        if conn.dialect.name != "postgresql":
+            return False
+        return conn.execute(text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :name AND c.relnamespace = to_regnamespace(current_schema())"
+        ), {"name": table_name}).first() is not None
+
+    @staticmethod
+    def _partitions(conn, table_name: str) -> Dict[datetime, str]:
+        """월 시작 → 파티션 이름 (default 파티션 제외)"""
+        rows = conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :name"
+        ), {"name": table_name})
+
+        prefix = f"{table_name}_p"
+        partitions = {}
+        for (name,) in rows:
+            suffix = name[len(prefix):] if name.startswith(prefix) else ""
+            if len(suffix) == 6 and suffix.isdigit():
+                month = datetime(int(suffix[:4]), int(suffix[4:]), 1, tzinfo=timezone.utc)
+                partitions[month] = name
+        return partitions
+
+    @staticmethod
+    def _create_partition(conn, table_name: str, month: datetime) -> None:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, month)} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+        ))
+
+    def _months_ahead(self, now: datetime) -> List[datetime]:
+        months = [month_start(now)]
+        for _ in range(max(settings.log_partition_months_ahead, 0)):
+            months.append(next_month(months[-1]))
+        return months
+
+    def ensure_partitions(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        파티션 테이블에 이번 달 ~ log_partition_months_ahead개월 뒤 파티션 생성
+
+        Returns:
+            테이블별 새로 만든 파티션 수 (일반 테이블은 0)
+        """
+        if not _is_postgres():
+            return {name: 0 for name in self.policies}
+
+        months = self._months_ahead(now or datetime.now(timezone.utc))
+        created = {}
+        for name in self.policies:
+            with engine.begin() as conn:
+                if not self.is_partitioned(conn, name):
+                    created[name] = 0
+                    continue
+                existing = self._partitions(conn, name)
+                created[name] = 0
+                for month in months:
+                    if month in existing:
+                        continue
+                    # default 파티션에 해당 월 행이 있으면 실패 → 다음 달 파티션은 계속 생성
+                    try:
+                        with conn.begin_nested():
+                            self._create_partition(conn, name, month)
+                        created[name] += 1
+                    except Exception as e:
+                        logger.warning(f"⚠️  Failed to create partition {partition_name(name, month)}: {e}")
+            if created[name]:
+                logger.info(f"🧱 Created {created[name]} partitions for {name}")
+        return created
+
+    def _partitioned_table(self, policy: RetentionPolicy) -> Table:
+        """월 range 파티션 부모 테이블 정의 (기본 키에 시간 컬럼 포함)"""
+        metadata = MetaData()
+        columns = []
+        for column in policy.table.columns:
+            is_time = column.name == policy.time_column
+            columns.append(Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key or is_time,
+                nullable=False if (column.primary_key or is_time) else column.nullable,
+                server_default=func.now() if is_time else None
+            ))
+        return Table(
+            policy.table.name, metadata, *columns,
+            postgresql_partition_by=f"RANGE ({policy.time_column})"
+        )
+
+    def partition_table(self, table_name: str, now: Optional[datetime] = None) -> bool:
+        """
+        일반 테이블 → 월 range 파티션 테이블 전환 (PostgreSQL, 한 트랜잭션)
+
+        기존 행은 월 파티션으로 복사 (시간 컬럼이 NULL인 행은 전환 시각으로 채움).
+        복사 동안 테이블이 잠기므로 트래픽이 적은 시간에 실행하세요.
+
+        Returns:
+            전환했는지 (이미 파티션 테이블이면 False)
+        """
+        if not _is_postgres():
+            raise RuntimeError("Table partitioning requires PostgreSQL (other databases keep plain tables)")
+
+        policy = RETENTION_POLICIES[table_name]
+        legacy = f"{table_name}_legacy"
+        time_column = policy.time_column
+        columns = [column.name for column in policy.table.columns]
+
+        with engine.begin() as conn:
+            if self.is_partitioned(conn, table_name):
+                return False
+
+            conn.execute(text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE"))
+            conn.execute(text(f"ALTER TABLE {table_name} RENAME TO {legacy}"))
+            # 새 테이블이 같은 이름을 쓰도록 기존 기본 키/인덱스 제거 (legacy 테이블은 복사 후 삭제)
+            conn.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT IF EXISTS {table_name}_pkey"))
+            for index in policy.table.indexes:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+            conn.execute(CreateTable(self._partitioned_table(policy)))
+
+            oldest = conn.execute(text(f"SELECT min({time_column}) FROM {legacy}")).scalar()
+            now = now or datetime.now(timezone.utc)
+            month = month_start(min(oldest, now) if oldest else now)
+            last = self._months_ahead(now)[-1]
+            partitions = 0
+            while month <= last:
+                self._create_partition(conn, table_name, month)
+                month = next_month(month)
+                partitions += 1
+            conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT"))
+
+            select_list = ", ".join(
+                f"COALESCE({name}, now())" if name == time_column else name for name in columns
+            )
+            copied = conn.execute(text(
+                f"INSERT INTO {table_name} ({', '.join(columns)}) SELECT {select_list} FROM {legacy}"
+            )).rowcount
+            conn.execute(text(f"DROP TABLE {legacy}"))
+
+            # 부모 테이블 인덱스 → 모든 파티션에 생성
+            for index in policy.table.indexes:
+                index.create(bind=conn)
+
+        logger.info(f"🧱 Partitioned {table_name} by month on {time_column}: {copied} rows in {partitions} partitions")
+        return True
+
+    # ------------------------------------------------------------------
+    # 보존 기간
+    # ------------------------------------------------------------------
+
+    def _rollup(self, conn, name: str, policy: RetentionPolicy, start: datetime, end: datetime) -> int:
+        """[start, end) 구간을 dimension별로 요약해 log_rollups에 기록 (같은 월 요약은 교체)"""
+        table = policy.table
+        time_column = table.c[policy.time_column]
+        dimensions = [table.c[column] for column in policy.dimensions]
+        aggregates = [func.count().label("row_count")]
+        aggregates += [func.avg(table.c[column]).label(f"avg_{column}") for column in policy.averages]
+        aggregates += [func.max(table.c[column]).label(f"max_{column}") for column in policy.averages]
+        aggregates += [func.sum(table.c[column]).label(f"sum_{column}") for column in policy.sums]
+
+        rows = conn.execute(
+            select(*dimensions, *aggregates)
+            .where(time_column >= start, time_column < end)
+            .group_by(*dimensions)
+        ).mappings().all()
+
+        conn.execute(delete(LogRollup.__table__).where(
+            LogRollup.table_name == name, LogRollup.period_start == start
+        ))
+        if rows:
+            conn.execute(LogRollup.__table__.insert(), [
+                {
+                    "table_name": name,
+                    "period_start": start,
+                    "dimensions": {column: row[column] for column in policy.dimensions},
+                    "row_count": row["row_count"],
+                    "metrics": {
+                        key: round(float(value), 3)
+                        for key, value in row.items()
+                        if key not in policy.dimensions and key != "row_count" and value is not None
+                    },
+                }
+                for row in rows
+            ])
+        return sum(row["row_count"] for row in rows)
+
+    def _expired_months(self, conn, policy: RetentionPolicy, boundary: datetime) -> List[datetime]:
+        """boundary 이전에 행이 남아 있는 월 (일반 테이블/default 파티션)"""
+        time_column = policy.table.c[policy.time_column]
+        oldest = conn.execute(select(func.min(time_column)).where(time_column < boundary)).scalar()
+        months = []
+        month = month_start(oldest) if oldest else boundary
+        while month < boundary:
+            months.append(month)
+            month = next_month(month)
+        return months
+
+    def apply_retention(self, now: Optional[datetime] = None, dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        보존 기간이 완전히 지난 달을 요약 후 삭제 (월 단위, 요약과 삭제는 같은 트랜잭션)
+
+        Args:
+            now: 기준 시각 (기본: 현재)
+            dry_run: 삭제 대상 월만 계산
+
+        Returns:
+            테이블별 {"boundary", "months", "rows", "dropped_partitions", "mode"}
+        """
+        now = now or datetime.now(timezone.utc)
+        results = {}
+
+        for name, policy in self.policies.items():
+            days = policy.retention_days
+            if days <= 0:
+                continue
+
+            # 보존 기간 시작이 속한 달 이전만 삭제 (부분 월은 다음 달에 통째로 정리)
+            boundary = month_start(now - timedelta(days=days))
+            result = {"boundary": boundary.isoformat(), "months": [], "rows": 0, "dropped_partitions": 0}
+
+            with engine.begin() as conn:
+                partitioned = self.is_partitioned(conn, name)
+                result["mode"] = "partitioned" if partitioned else "plain"
+
+                if partitioned:
+                    for month, partition in sorted(self._partitions(conn, name).items()):
+                        if next_month(month) > boundary:
+                            continue
+                        result["months"].append(month.strftime("%Y-%m"))
+                        if dry_run:
+                            continue
+                        result["rows"] += self._rollup(conn, name, policy, month, next_month(month))
+                        conn.execute(text(f"DROP TABLE {partition}"))
+                        result["dropped_partitions"] += 1
+
+                # 일반 테이블 (파티션 테이블이면 default 파티션에 남은 행)
+                time_column = policy.table.c[policy.time_column]
+                for month in self._expired_months(conn, policy, boundary):
+                    label = month.strftime("%Y-%m")
+                    if label not in result["months"]:
+                        result["months"].append(label)
+                    if dry_run:
+                        continue
+                    end = min(next_month(month), boundary)
+                    self._rollup(conn, name, policy, month, end)
+                    result["rows"] += conn.execute(
+                        delete(policy.table).where(time_column >= month, time_column < end)
+                    ).rowcount
+
+            if result["months"] and not dry_run:
+                logger.info(
+                    f"🧹 {name}: rolled up and removed {result['rows']} rows "
+                    f"({', '.join(result['months'])}, {result['mode']})"
+                )
+            results[name] = result
+
+        return results
+
+    def vacuum(self) -> None:
+        """삭제 후 공간 회수 (PostgreSQL: VACUUM ANALYZE 대상 테이블, SQLite: VACUUM)"""
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if conn.dialect.name == "postgresql":
+                for name in self.policies:
+                    conn.execute(text(f"VACUUM ANALYZE {name}"))
+            elif conn.dialect.name == "sqlite":
+                conn.execute(text("VACUUM"))
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """테이블별 저장 방식, 파티션 수, 행 수, 가장 오래된 행 시각"""
+        status = {}
+        with engine.connect() as conn:
+            for name, policy in self.policies.items():
+                time_column = policy.table.c[policy.time_column]
+                count, oldest = conn.execute(select(func.count(), func.min(time_column))).one()
+                partitioned = self.is_partitioned(conn, name)
+                status[name] = {
+                    "mode": "partitioned" if partitioned else "plain",
+                    "partitions": len(self._partitions(conn, name)) if partitioned else 0,
+                    "rows": count,
+                    "oldest": oldest.isoformat() if oldest else None,
+                    "retention_days": policy.retention_days,
+                }
+        return status
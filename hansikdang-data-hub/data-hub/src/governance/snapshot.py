@@ -0,0 +1,391 @@
+"""
+Snapshot Exporter - 주요 테이블을 날짜 파티션별 Parquet 파일로 내보내기 / 검증 / 복원
+
+- 파티션: 테이블별 날짜 컬럼(created_at, scraped_at, merged_at, measured_at)의 날짜
+  → snapshots/{table}/date=YYYY-MM-DD/part-{snapshot}.parquet (zstd 압축)
+- 증분: 파티션별 fingerprint(행 수, 최종 변경 시각)를 직전 스냅샷 manifest(BackupHistory.manifest)와
+  비교해 바뀐 파티션만 다시 쓰고, 나머지는 이전 파일을 그대로 참조
+  (raw_restaurant_data.status처럼 시각 컬럼 없이 바뀌는 값은 full 스냅샷에서 반영)
+- CSV: 일일 백업과 같은 형식의 processed_restaurants CSV를 Parquet 파티션에서 파생 (선택)
+
+pyarrow가 설치되어 있어야 합니다.
+
+Usage:
+    with db_session() as db:
+        history = SnapshotExporter(db).export()
+        report = SnapshotExporter(db).verify()
+"""
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, BinaryIO, Dict, Iterable, List, NamedTuple, Optional
+
+from loguru import logger
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, func, select
+from sqlalchemy.orm import Session
+
+from ..database.models import BackupHistory, MergeHistory, ProcessedRestaurant, QualityMetrics, RawRestaurantData
+from ..utils.serialization import dumps_str, loads
+from .backup_storage import BackupStorage, file_sha256, get_backup_storage, spooled_file
+from .drive_backup import CSV_COLUMNS, CSV_HEADER
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class SnapshotTable(NamedTuple):
+    """스냅샷 대상 테이블 (파티션 날짜 컬럼, 변경 시각 컬럼)"""
+    model: Any
+    partition_column: Any
+    version_column: Optional[Any] = None
+
+
+SNAPSHOT_TABLES: Dict[str, SnapshotTable] = {
+    "processed_restaurants": SnapshotTable(
+        ProcessedRestaurant, ProcessedRestaurant.created_at, ProcessedRestaurant.updated_at
+    ),
+    "raw_restaurant_data": SnapshotTable(RawRestaurantData, RawRestaurantData.scraped_at),
+    "merge_history": SnapshotTable(MergeHistory, MergeHistory.merged_at),
+    "quality_metrics": SnapshotTable(QualityMetrics, QualityMetrics.measured_at),
+}
+
+# 날짜 컬럼이 NULL인 행의 파티션
+UNDATED = "undated"
+
+# 서버 측 커서 fetch 크기 = Parquet row group 크기
+BATCH_ROWS = 10_000
+PARQUET_COMPRESSION = "zstd"
+PARQUET_MIMETYPE = "application/vnd.apache.parquet"
+
+
+def _arrow_type(column) -> "pa.DataType":
+    """SQLAlchemy 컬럼 타입 → Arrow 타입 (JSON은 문자열로 저장)"""
+    column_type = column.type
+    if isinstance(column_type, JSON):
+        return pa.string()
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC") if column_type.timezone else pa.timestamp("us")
+    return pa.string()
+
+
+class SnapshotExporter:
+    """Parquet 스냅샷 내보내기/검증/복원"""
+
+    def __init__(self, db: Session, storage: Optional[BackupStorage] = None):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Parquet snapshots require the 'pyarrow' package")
+        self.db = db
+        self._storage = storage
+
+    @property
+    def storage(self) -> BackupStorage:
+        if self._storage is None:
+            self._storage = get_backup_storage()
+        return self._storage
+
+    # ------------------------------------------------------------------
+    # manifest / fingerprint
+    # ------------------------------------------------------------------
+
+    def latest_snapshot(self) -> Optional[BackupHistory]:
+        """마지막으로 성공한 스냅샷"""
+        return self.db.query(BackupHistory).filter(
+            BackupHistory.backup_type == 'snapshot',
+            BackupHistory.status == 'success'
+        ).order_by(BackupHistory.completed_at.desc()).first()
+
+    def _manifest(self, snapshot_id: Optional[str]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if snapshot_id:
+            history = self.db.query(BackupHistory).filter(BackupHistory.id == snapshot_id).first()
+            if not history or history.backup_type != 'snapshot':
+                raise ValueError(f"Snapshot not found: {snapshot_id}")
+        else:
+            history = self.latest_snapshot()
+            if not history:
+                raise ValueError("No successful snapshot found")
+        return history.manifest or {}
+
+    def fingerprints(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """현재 DB의 파티션별 (행 수, 최종 변경 시각)"""
+        spec = SNAPSHOT_TABLES[name]
+        day = func.date(spec.partition_column)
+        changed = spec.partition_column
+        if spec.version_column is not None:
+            changed = func.coalesce(spec.version_column, spec.partition_column)
+
+        partitions = {}
+        for partition, rows, version in self.db.query(day, func.count(), func.max(changed)).group_by(day):
+            partitions[str(partition) if partition else UNDATED] = {
+                "rows": rows,
+                "version": version.isoformat() if isinstance(version, datetime) else version,
+            }
+        return partitions
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def _partition_filter(self, spec: SnapshotTable, partition: str):
+        if partition == UNDATED:
+            return spec.partition_column.is_(None)
+        day = datetime.strptime(partition, '%Y-%m-%d')
+        return (spec.partition_column >= day) & (spec.partition_column < day + timedelta(days=1))
+
+    def write_parquet(self, name: str, partition: str, fileobj: BinaryIO) -> int:
+        """파티션 행을 서버 측 커서로 읽어 Parquet로 기록 (반환: 행 수)"""
+        spec = SNAPSHOT_TABLES[name]
+        table = spec.model.__table__
+        columns = list(table.columns)
+        json_columns = {i for i, column in enumerate(columns) if isinstance(column.type, JSON)}
+        schema = pa.schema([pa.field(column.name, _arrow_type(column)) for column in columns])
+
+        result = self.db.execute(
+            select(*columns).where(self._partition_filter(spec, partition))
+            .order_by(*table.primary_key.columns)
+            .execution_options(yield_per=BATCH_ROWS)
+        )
+
+        written = 0
+        with pq.ParquetWriter(fileobj, schema, compression=PARQUET_COMPRESSION) as writer:
+            for rows in result.partitions():
+                arrays = []
+                for i, field in enumerate(schema):
+                    values = [row[i] for row in rows]
+                    if i in json_columns:
+                        values = [dumps_str(value) if value is not None else None for value in values]
+                    arrays.append(pa.array(values, type=field.type))
+                writer.write_batch(pa.record_batch(arrays, schema=schema))
+                written += len(rows)
+        return written
+
+    def _upload(self, fileobj: BinaryIO, relative_path: str, mimetype: str) -> Dict[str, Any]:
+        size = fileobj.seek(0, 2)
+        checksum = file_sha256(fileobj)
+        result = self.storage.upload(fileobj, size, relative_path, mimetype)
+        return {"file_id": result['file_id'], "path": result['file_path'], "bytes": size, "sha256": checksum}
+
+    def _export_partition(self, name: str, partition: str, snapshot_id: str, derive_csv: bool) -> Dict[str, Any]:
+        prefix = f"snapshots/{name}/date={partition}/part-{snapshot_id[:8]}"
+        with spooled_file() as spool:
+            rows = self.write_parquet(name, partition, spool)
+            entry = {**self._upload(spool, f"{prefix}.parquet", PARQUET_MIMETYPE), "exported_rows": rows}
+
+            if derive_csv and name == "processed_restaurants":
+                spool.seek(0)
+                entry["csv"] = self._derive_csv(spool, f"{prefix}.csv")
+
+        return entry
+
+    def _derive_csv(self, parquet_file: BinaryIO, relative_path: str) -> Dict[str, Any]:
+        """Parquet 파티션 → 일일 백업과 같은 컬럼의 CSV"""
+        table = pq.read_table(parquet_file, columns=[column.key for column in CSV_COLUMNS])
+        table = table.rename_columns(CSV_HEADER)
+        with spooled_file() as spool:
+            pa_csv.write_csv(table, spool)
+            return self._upload(spool, relative_path, 'text/csv')
+
+    def export(
+        self,
+        tables: Optional[Iterable[str]] = None,
+        full: bool = False,
+        derive_csv: bool = False
+    ) -> BackupHistory:
+        """
+        스냅샷 실행 (바뀐 파티션만 기록)
+
+        Args:
+            tables: 대상 테이블 (None이면 전체, 나머지 테이블은 직전 manifest 유지)
+            full: fingerprint와 관계없이 모든 파티션 다시 기록
+            derive_csv: processed_restaurants 파티션의 CSV도 함께 저장
+
+        Returns:
+            BackupHistory: 스냅샷 이력 (manifest 포함)
+        """
+        names = list(tables or SNAPSHOT_TABLES)
+        unknown = set(names) - set(SNAPSHOT_TABLES)
+        if unknown:
+            raise ValueError(f"Unknown snapshot tables: {', '.join(sorted(unknown))}")
+
+        latest = self.latest_snapshot()
+        previous = dict(latest.manifest or {}) if latest else {}
+
+        snapshot_id = str(uuid.uuid4())
+        started_at = datetime.now(timezone.utc)
+        history = BackupHistory(
+            id=snapshot_id,
+            backup_date=started_at.strftime('%Y-%m-%d'),
+            backup_type='snapshot',
+            file_name=f"snapshot-{snapshot_id[:8]}",
+            file_path="snapshots/",
+            status='started',
+            started_at=started_at,
+            retry_count=0
+        )
+        self.db.add(history)
+        self.db.commit()
+
+        logger.info(f"📦 Starting {'full' if full else 'incremental'} snapshot {snapshot_id[:8]} ({', '.join(names)})")
+
+        manifest = dict(previous)
+        written_partitions, written_rows, written_bytes = 0, 0, 0
+        try:
+            for name in names:
+                previous_partitions = previous.get(name, {})
+                partitions = {}
+                for partition, fingerprint in sorted(self.fingerprints(name).items()):
+                    old = previous_partitions.get(partition)
+                    if not full and old and old["rows"] == fingerprint["rows"] and old["version"] == fingerprint["version"]:
+                        partitions[partition] = old
+                        continue
+
+                    entry = self._export_partition(name, partition, snapshot_id, derive_csv)
+                    partitions[partition] = {**fingerprint, **entry, "snapshot_id": snapshot_id}
+                    written_partitions += 1
+                    written_rows += entry["exported_rows"]
+                    written_bytes += entry["bytes"]
+
+                manifest[name] = partitions
+                logger.info(f"   {name}: {len(partitions)} partitions")
+
+            completed_at = datetime.now(timezone.utc)
+            history.manifest = manifest
+            history.total_records = sum(p["rows"] for parts in manifest.values() for p in parts.values())
+            history.new_records = written_rows
+            history.file_size_bytes = written_bytes
+            history.status = 'success'
+            history.completed_at = completed_at
+            history.execution_time_seconds = int((completed_at - started_at).total_seconds())
+            self.db.commit()
+
+            logger.info(
+                f"✅ Snapshot {snapshot_id[:8]} completed: {written_partitions} partitions written "
+                f"({written_rows} rows, {written_bytes / 1024 / 1024:.2f} MB), "
+                f"{history.total_records} rows total in {history.execution_time_seconds}s"
+            )
+        except Exception as e:
+            self.db.rollback()
+            history.status = 'failed'
+            history.error_message = str(e)
+            history.completed_at = datetime.now(timezone.utc)
+            self.db.commit()
+            logger.error(f"❌ Snapshot {snapshot_id[:8]} failed: {e}")
+            raise
+
+        return history
+
+    # ------------------------------------------------------------------
+    # 검증 / 복원
+    # ------------------------------------------------------------------
+
+    def _download(self, entry: Dict[str, Any], spool: BinaryIO) -> None:
+        self.storage.download(entry["file_id"], spool)
+        checksum = file_sha256(spool)
+        if checksum != entry["sha256"]:
+            raise ValueError(f"Checksum mismatch for {entry['path']}")
+
+    def verify(self, snapshot_id: Optional[str] = None, check_db: bool = False) -> Dict[str, Any]:
+        """
+        스냅샷 파일 검증 (체크섬, Parquet 행 수)
+
+        Args:
+            snapshot_id: 검증할 스냅샷 (None이면 최신)
+            check_db: 현재 DB fingerprint와 달라진 파티션도 보고 (오류 아님)
+        """
+        manifest = self._manifest(snapshot_id)
+        report = {"partitions": 0, "verified": 0, "rows": 0, "errors": [], "stale": []}
+
+        for name, partitions in manifest.items():
+            current = self.fingerprints(name) if check_db else {}
+            for partition, entry in sorted(partitions.items()):
+                report["partitions"] += 1
+                try:
+                    with spooled_file() as spool:
+                        self._download(entry, spool)
+                        rows = pq.ParquetFile(spool).metadata.num_rows
+                    if rows != entry["exported_rows"]:
+                        raise ValueError(f"row count {rows} != {entry['exported_rows']}")
+                    report["verified"] += 1
+                    report["rows"] += rows
+                except Exception as e:
+                    report["errors"].append(f"{name}/{partition}: {e}")
+
+                if check_db:
+                    fingerprint = current.get(partition)
+                    if fingerprint != {"rows": entry["rows"], "version": entry["version"]}:
+                        report["stale"].append(f"{name}/{partition}")
+
+            if check_db:
+                report["stale"].extend(f"{name}/{p}" for p in sorted(set(current) - set(partitions)))
+
+        return report
+
+    def _insert_statement(self, table, overwrite: bool):
+        dialect = self.db.bind.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise ValueError(f"Snapshot restore is not supported on {dialect}")
+
+        statement = insert(table)
+        keys = [column.name for column in table.primary_key.columns]
+        if overwrite:
+            return statement.on_conflict_do_update(
+                index_elements=keys,
+                set_={column.name: statement.excluded[column.name] for column in table.columns if not column.primary_key}
+            )
+        return statement.on_conflict_do_nothing(index_elements=keys)
+
+    def restore(
+        self,
+        snapshot_id: Optional[str] = None,
+        tables: Optional[Iterable[str]] = None,
+        overwrite: bool = False
+    ) -> Dict[str, int]:
+        """
+        스냅샷을 DB에 복원 (파티션 단위 커밋)
+
+        Args:
+            snapshot_id: 복원할 스냅샷 (None이면 최신)
+            tables: 대상 테이블 (None이면 manifest 전체)
+            overwrite: 이미 있는 행도 스냅샷 값으로 덮어씀 (기본: 없는 행만 삽입)
+
+        Returns:
+            테이블별 처리한 행 수
+        """
+        manifest = self._manifest(snapshot_id)
+        restored: Dict[str, int] = {}
+
+        for name in tables or manifest:
+            table = SNAPSHOT_TABLES[name].model.__table__
+            json_columns = [column.name for column in table.columns if isinstance(column.type, JSON)]
+            statement = self._insert_statement(table, overwrite)
+            restored[name] = 0
+
+            for partition, entry in sorted(manifest.get(name, {}).items()):
+                with spooled_file() as spool:
+                    self._download(entry, spool)
+                    for batch in pq.ParquetFile(spool).iter_batches(batch_size=BATCH_ROWS):
+                        rows: List[Dict[str, Any]] = batch.to_pylist()
+                        for row in rows:
+                            for column in json_columns:
+                                if row[column] is not None:
+                                    row[column] = loads(row[column])
+                        self.db.execute(statement, rows)
+                        restored[name] += len(rows)
+                self.db.commit()
+
+            logger.info(f"♻️  Restored {name}: {restored[name]} rows")
+
+        return restored
@@ -0,0 +1,361 @@
+"""
+Metrics Registry - 프로세스 내 counter / gauge / histogram (Prometheus 노출 형식)
+
+- API: GET /metrics (Accept에 application/openmetrics-text가 있으면 OpenMetrics, 아니면 Prometheus text 0.0.4)
+- 스케줄러(별도 프로세스): start_textfile()이 주기적으로 파일에 기록
+  (node_exporter textfile collector 또는 pushgateway 업로드 스크립트가 읽음)
+- 값은 프로세스별 (여러 워커/레플리카는 수집 쪽에서 합산)
+- label은 라우트 템플릿/연동 이름처럼 종류가 제한된 값만 사용
+
+Usage:
+    REQUESTS = registry.counter("datahub_example_requests", "Example requests", ("client",))
+    REQUESTS.inc(client="naver")
+    with LATENCY.time(client="naver"):
+        ...
+"""
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지연 시간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 건수/바이트 등 크기
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self, name: str) -> List[str]:
+        return [f"# HELP {name} {_escape(self.documentation)}", f"# TYPE {name} {self.type_name}"]
+
+    def render(self, openmetrics: bool) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 값 (노출 시 _total 접미사)"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self, openmetrics: bool) -> List[str]:
+        # OpenMetrics는 TYPE에 접미사 없는 이름, Prometheus text는 샘플 이름과 같아야 함
+        lines = self._header(self.name if openmetrics else f"{self.name}_total")
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}_total{_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """현재 값 (set_function을 지정하면 노출 시점에 계산)"""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """label 없는 gauge의 값을 노출 시점에 계산 (큐 길이 등)"""
+        if self.labelnames:
+            raise ValueError("set_function is only supported for gauges without labels")
+        self._function = function
+
+    def value(self, **labels) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self, openmetrics: bool) -> List[str]:
+        lines = self._header(self.name)
+        if self._function is not None:
+            try:
+                lines.append(f"{self.name} {_format_value(float(self._function()))}")
+            except Exception as e:
+                logger.debug(f"Gauge {self.name} callback failed: {e}")
+            return lines
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """분포 (누적 bucket + _sum + _count)"""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[LabelValues, List[float]] = {}  # bucket별 건수 + [sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """블록 실행 시간 (초) 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def render(self, openmetrics: bool) -> List[str]:
+        lines = self._header(self.name)
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = ("le", _format_value(bound) if bound != math.inf else "+Inf")
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {_format_value(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록 + 노출 형식 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._textfile_thread: Optional[threading.Thread] = None
+        self._textfile_stop = threading.Event()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different type or labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self, openmetrics: bool = True) -> str:
+        """모든 메트릭 (openmetrics=False면 Prometheus text 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render(openmetrics))
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Prometheus text 형식으로 파일에 기록 (임시 파일 후 교체라 읽는 쪽이 중간 상태를 보지 않음)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render(openmetrics=False))
+        os.replace(tmp_path, path)
+
+    def start_textfile(self, path: str, interval: float) -> None:
+        """interval초마다 write_textfile (백그라운드 스레드)"""
+        if self._textfile_thread is not None and self._textfile_thread.is_alive():
+            return
+        self._textfile_stop.clear()
+
+        def run():
+            while not self._textfile_stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except Exception as e:
+                    logger.warning(f"⚠️  Failed to write metrics file {path}: {e}")
+
+        self._textfile_thread = threading.Thread(target=run, name="metrics-textfile", daemon=True)
+        self._textfile_thread.start()
+        logger.info(f"📈 Writing metrics to {path} every {interval:g}s")
+
+    def stop_textfile(self, path: str) -> None:
+        """주기 기록 중지 + 마지막 값 기록"""
+        thread = self._textfile_thread
+        if thread is None:
+            return
+        self._textfile_stop.set()
+        thread.join(5)
+        self._textfile_thread = None
+        try:
+            self.write_textfile(path)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to write metrics file {path}: {e}")
+
+
+registry = MetricsRegistry()
+
+
+# ----------------------------------------------------------------------
+# 공용 메트릭 (계측 위치: 각 모듈)
+# ----------------------------------------------------------------------
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "datahub_http_request_duration_seconds", "API request latency by route template",
+    ("method", "route", "status")
+)
+EXTERNAL_REQUESTS = registry.counter(
+    "datahub_external_requests", "Outbound requests per provider client (status = HTTP code or error)",
+    ("client", "status")
+)
+EXTERNAL_REQUEST_SECONDS = registry.histogram(
+    "datahub_external_request_duration_seconds", "Outbound request latency per provider client (retries included)",
+    ("client",)
+)
+EXTERNAL_RETRIES = registry.counter(
+    "datahub_external_retries", "Outbound request retries per provider client", ("client",)
+)
+GEMINI_REQUESTS = registry.counter(
+    "datahub_gemini_requests", "Gemini generate_content calls", ("operation", "status")
+)
+GEMINI_REQUEST_SECONDS = registry.histogram(
+    "datahub_gemini_request_duration_seconds", "Gemini generate_content latency", ("operation",)
+)
+GEMINI_TOKENS = registry.counter(
+    "datahub_gemini_tokens", "Gemini tokens from usage metadata (kind = prompt or completion)",
+    ("operation", "kind")
+)
+RATE_LIMIT_WAIT_SECONDS = registry.histogram(
+    "datahub_rate_limiter_wait_seconds", "Time spent waiting for a rate limiter token (0 = no wait)",
+    ("limiter",)
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "datahub_db_query_duration_seconds", "Database statement execution time", ("operation",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+DEDUP_PAIRS = registry.counter(
+    "datahub_dedup_pairs_compared", "Restaurant pairs compared by the duplicate detector"
+)
+DEDUP_PAIRS_PER_SECOND = registry.gauge(
+    "datahub_dedup_pairs_per_second", "Pair comparison rate of the last duplicate detection run"
+)
+SYNC_BYTES = registry.counter(
+    "datahub_sync_bytes", "Bytes sent to hansikdang (kind = raw payload or wire after compression)",
+    ("kind",)
+)
+SYNC_BATCH_SIZE = registry.histogram(
+    "datahub_sync_batch_size", "Restaurants per sync request", ("transport",), buckets=SIZE_BUCKETS
+)
+SYNC_RESTAURANTS = registry.counter(
+    "datahub_sync_restaurants", "Restaurants synced to hansikdang by result", ("result",)
+)
+PIPELINE_QUEUE_DEPTH = registry.gauge(
+    "datahub_pipeline_queue_depth", "Items waiting in a streaming pipeline stage inbox", ("pipeline", "stage")
+)
+JOB_SECONDS = registry.histogram(
+    "datahub_job_duration_seconds", "Scheduler job run time", ("job", "status"),
+    buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200, 14400)
+)
@@ -0,0 +1,241 @@
+"""
+Metrics Sampler - 시스템 리소스 백그라운드 샘플링
+
+- 백그라운드 스레드가 metrics_sample_interval초마다 CPU, 메모리, 디스크, 프로세스 RSS,
+  열린 파일 디스크립터 수, 이벤트 루프 지연을 측정해 링 버퍼(metrics_buffer_size개)에 저장
+  → SystemMonitor/대시보드는 latest()로 마지막 샘플을 대기 없이 읽음
+  (cpu_percent(interval=1)처럼 호출자를 멈추지 않음)
+- 이벤트 루프 지연: 루프에 콜백을 예약하고 실제 실행까지 걸린 시간 (start(loop=...)로 연결)
+  샘플 사이 최대값, 아직 실행되지 않은 콜백이 있으면 예약 후 경과 시간도 반영
+- metrics_persist_interval초마다 그 사이 샘플의 평균/최대를 system_health (component='system')에 1행 기록
+
+Usage:
+    metrics_sampler.start(loop=asyncio.get_running_loop())
+    sample = metrics_sampler.latest()
+"""
+import asyncio
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+import psutil
+from loguru import logger
+
+from config import settings
+from ..database.connection import db_session
+from ..database.models import SystemHealth
+
+
+# 이벤트 루프 지연 경고 기준 (밀리초)
+LOOP_LAG_WARN_MS = 500
+
+# 기록 시 평균/최대를 계산하는 필드
+SERIES_FIELDS = ("cpu_usage", "memory_usage", "disk_usage", "process_rss_mb", "open_fds", "loop_lag_ms")
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return round(sum(values) / len(values), 2) if values else None
+
+
+class MetricsSampler:
+    """시스템 리소스 샘플 링 버퍼 + 주기적 다운샘플 기록"""
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        capacity: Optional[int] = None,
+        persist_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            interval: 샘플링 간격 (초)
+            capacity: 링 버퍼 크기 (샘플 수)
+            persist_interval: system_health 기록 간격 (초, 0이면 기록 안 함)
+        """
+        self.interval = interval or settings.metrics_sample_interval
+        self.capacity = capacity or settings.metrics_buffer_size
+        self.persist_interval = (
+            persist_interval if persist_interval is not None else settings.metrics_persist_interval
+        )
+
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lag_ms: Optional[float] = None  # 직전 샘플 이후 최대 지연
+        self._probe_pending: Optional[float] = None  # 실행 대기 중인 콜백의 예약 시각
+        self._process = psutil.Process(os.getpid())
+        self._last_persist = time.monotonic()
+        self._persist_from = 0  # 마지막 기록 이후 샘플의 시작 번호
+        self._sample_count = 0
+
+        psutil.cpu_percent(interval=None)  # 다음 호출부터 직전 호출 이후 사용률 반환
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+
+    def _probe_loop(self) -> None:
+        """루프에 콜백을 예약 (실행되면 예약 후 경과 시간이 지연, 한 번에 1개만 대기)"""
+        loop = self._loop
+        if loop is None or loop.is_closed() or self._probe_pending is not None:
+            return
+
+        scheduled = self._probe_pending = time.monotonic()
+
+        def _measure():
+            lag = round((time.monotonic() - scheduled) * 1000, 2)
+            self._loop_lag_ms = max(self._loop_lag_ms or 0.0, lag)
+            self._probe_pending = None
+
+        try:
+            loop.call_soon_threadsafe(_measure)
+        except RuntimeError:  # 루프 종료
+            self._probe_pending = None
+
+    def _take_loop_lag(self) -> Optional[float]:
+        """직전 샘플 이후 최대 지연 (루프가 아직 멈춰 있으면 대기 중인 콜백의 경과 시간)"""
+        lag, self._loop_lag_ms = self._loop_lag_ms, None
+        pending = self._probe_pending
+        if pending is not None:
+            lag = max(lag or 0.0, round((time.monotonic() - pending) * 1000, 2))
+        return lag
+
+    def _open_fds(self) -> Optional[int]:
+        try:
+            if hasattr(self._process, "num_fds"):
+                return self._process.num_fds()
+            return self._process.num_handles()  # Windows
+        except (psutil.Error, OSError):
+            return None
+
+    def sample(self) -> Dict[str, Any]:
+        """지금 측정 (대기 없음, CPU는 직전 측정 이후 사용률)"""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        try:
+            rss = self._process.memory_info().rss
+        except psutil.Error:
+            rss = 0
+
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "cpu_usage": psutil.cpu_percent(interval=None),
+            "memory_usage": memory.percent,
+            "memory_available_mb": round(memory.available / 1024 / 1024, 2),
+            "disk_usage": disk.percent,
+            "disk_free_gb": round(disk.free / 1024 / 1024 / 1024, 2),
+            "process_rss_mb": round(rss / 1024 / 1024, 2),
+            "open_fds": self._open_fds(),
+            "loop_lag_ms": self._take_loop_lag(),
+        }
+
+    def _record(self) -> Dict[str, Any]:
+        sample = self.sample()
+        with self._lock:
+            self._samples.append(sample)
+            self._sample_count += 1
+        return sample
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def latest(self) -> Dict[str, Any]:
+        """마지막 샘플 (아직 없으면 지금 측정)"""
+        with self._lock:
+            if self._samples:
+                return dict(self._samples[-1])
+        return self._record()
+
+    def series(self, seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """링 버퍼의 샘플 (seconds가 있으면 최근 seconds초)"""
+        with self._lock:
+            samples = list(self._samples)
+        if seconds:
+            count = max(int(seconds / self.interval), 1)
+            samples = samples[-count:]
+        return samples
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스레드
+    # ------------------------------------------------------------------
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """샘플링 스레드 시작 (loop: 지연을 측정할 이벤트 루프)"""
+        if loop is not None:
+            self._loop = loop
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._last_persist = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                sample = self._record()
+                if sample["loop_lag_ms"] is not None and sample["loop_lag_ms"] > LOOP_LAG_WARN_MS:
+                    logger.warning(f"⚠️  Event loop lag {sample['loop_lag_ms']}ms")
+                self._probe_loop()
+
+                if self.persist_interval and time.monotonic() - self._last_persist >= self.persist_interval:
+                    self.persist()
+            except Exception as e:
+                logger.warning(f"⚠️  Metrics sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+    def persist(self) -> Optional[Dict[str, Any]]:
+        """마지막 기록 이후 샘플을 평균/최대로 요약해 system_health에 1행 기록"""
+        with self._lock:
+            new = min(self._sample_count - self._persist_from, len(self._samples))
+            samples = list(self._samples)[-new:] if new else []
+            self._persist_from = self._sample_count
+        self._last_persist = time.monotonic()
+        if not samples:
+            return None
+
+        summary = {"samples": len(samples), "from": samples[0]["timestamp"], "to": samples[-1]["timestamp"]}
+        for field in SERIES_FIELDS:
+            values = [sample[field] for sample in samples if sample[field] is not None]
+            summary[f"avg_{field}"] = _mean(values)
+            summary[f"max_{field}"] = max(values) if values else None
+
+        cpu = summary["avg_cpu_usage"] or 0.0
+        status = 'degraded' if cpu > 90 or (summary["max_loop_lag_ms"] or 0) > LOOP_LAG_WARN_MS else 'healthy'
+        with db_session() as db:
+            db.add(SystemHealth(
+                id=str(uuid.uuid4()),
+                component='system',
+                component_status=status,
+                cpu_usage=summary["avg_cpu_usage"],
+                memory_usage=summary["avg_memory_usage"],
+                disk_usage=summary["avg_disk_usage"],
+                details=summary
+            ))
+        return summary
+
+    def close(self, timeout: float = 5.0) -> None:
+        """샘플링 중지 + 남은 샘플 기록"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        self._thread = None
+        self._loop = None
+        self._probe_pending = None
+        if self.persist_interval:
+            try:
+                self.persist()
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to persist metrics: {e}")
+
+
+metrics_sampler = MetricsSampler()
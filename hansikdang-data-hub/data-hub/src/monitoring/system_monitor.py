@@ -1,14 +1,16 @@
 """
 System Monitor - 실시간 시스템 모니터링
+
+리소스 사용률은 metrics_sampler(백그라운드 샘플링)의 마지막 샘플을 사용합니다.
 """
 import uuid
-import psutil
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone, timedelta
 from loguru import logger
 from sqlalchemy.orm import Session
 
 from ..database.models import SystemHealth, RawRestaurantData, ProcessedRestaurant
+from .metrics_sampler import metrics_sampler
 
 
 class SystemMonitor:
@@ -41,9 +43,8 @@ class SystemMonitor:
         Returns:
             SystemHealth: 건강 상태 레코드
         """
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        sample = metrics_sampler.latest()
+        cpu_usage = sample['cpu_usage']
         
         error_rate = 0.0
         success_rate = 100.0
@@ -63,7 +64,7 @@ class SystemMonitor:
             error_rate=error_rate,
             response_time_ms=response_time_ms,
             cpu_usage=cpu_usage,
-            memory_usage=memory.percent
+            memory_usage=sample['memory_usage']
         )
         
         health = SystemHealth(
@@ -75,16 +76,20 @@ class SystemMonitor:
             error_rate=error_rate,
             success_rate=success_rate,
             cpu_usage=cpu_usage,
-            memory_usage=memory.percent,
-            disk_usage=disk.percent,
+            memory_usage=sample['memory_usage'],
+            disk_usage=sample['disk_usage'],
             total_operations=total_operations,
             successful_operations=successful_operations,
             failed_operations=failed_operations,
             alerts=alerts,
             last_alert_at=datetime.now(timezone.utc) if alerts else None,
             details={
-                'memory_available_mb': round(memory.available / 1024 / 1024, 2),
-                'disk_free_gb': round(disk.free / 1024 / 1024 / 1024, 2)
+                'memory_available_mb': sample['memory_available_mb'],
+                'disk_free_gb': sample['disk_free_gb'],
+                'process_rss_mb': sample['process_rss_mb'],
+                'open_fds': sample['open_fds'],
+                'loop_lag_ms': sample['loop_lag_ms'],
+                'sampled_at': sample['timestamp']
             }
         )
         
@@ -179,14 +184,16 @@ class SystemMonitor:
                     'error_rate': 0
                 }
         
-        cpu_usage = psutil.cpu_percent(interval=0.5)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        sample = metrics_sampler.latest()
         
         overview['system_resources'] = {
-            'cpu_usage': cpu_usage,
-            'memory_usage': memory.percent,
-            'disk_usage': disk.percent
+            'cpu_usage': sample['cpu_usage'],
+            'memory_usage': sample['memory_usage'],
+            'disk_usage': sample['disk_usage'],
+            'process_rss_mb': sample['process_rss_mb'],
+            'open_fds': sample['open_fds'],
+            'loop_lag_ms': sample['loop_lag_ms'],
+            'sampled_at': sample['timestamp']
         }
         
         return overview
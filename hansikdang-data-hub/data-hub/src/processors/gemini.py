@@ -8,10 +8,12 @@ Gemini AI Data Processor
 """
 from typing import Dict, Any, Optional, List
 import json
+import time
 import google.generativeai as genai
 from loguru import logger
 
 from config import settings
+from src.monitoring.metrics import GEMINI_REQUESTS, GEMINI_REQUEST_SECONDS, GEMINI_TOKENS
 from src.processors.popularity_calculator import PopularityCalculator
 
 
@@ -19,12 +21,36 @@ class GeminiProcessor:
     """Gemini AI 데이터 처리"""
     
     def __init__(self):
+        self.logger = logger.bind(processor="gemini")
+        if settings.gemini_fake:
+            # 오프라인 벤치마크/테스트 (src/testing/fake_providers.py)
+            from src.testing.fake_providers import FakeGeminiModel
+            self.model = FakeGeminiModel()
+            return
+        
         if not settings.gemini_api_key:
             raise ValueError("GEMINI_API_KEY not set")
         
         genai.configure(api_key=settings.gemini_api_key)
         self.model = genai.GenerativeModel("gemini-2.0-flash-exp")
-        self.logger = logger.bind(processor="gemini")
+    
+    async def _generate(self, operation: str, prompt: str):
+        """generate_content 호출 + 호출 수/지연/토큰 메트릭"""
+        started = time.perf_counter()
+        try:
+            response = await self.model.generate_content_async(prompt)
+        except Exception:
+            GEMINI_REQUESTS.inc(operation=operation, status="error")
+            raise
+        finally:
+            GEMINI_REQUEST_SECONDS.observe(time.perf_counter() - started, operation=operation)
+        
+        GEMINI_REQUESTS.inc(operation=operation, status="success")
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            GEMINI_TOKENS.inc(getattr(usage, "prompt_token_count", 0) or 0, operation=operation, kind="prompt")
+            GEMINI_TOKENS.inc(getattr(usage, "candidates_token_count", 0) or 0, operation=operation, kind="completion")
+        return response
     
     async def refine_restaurant_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -108,7 +134,7 @@ class GeminiProcessor:
 - JSON만 반환 (설명 없이)
 """
             
-            response = await self.model.generate_content_async(prompt)
+            response = await self._generate("refine", prompt)
             result_text = response.text.strip()
             
             # JSON 파싱
@@ -187,7 +213,7 @@ class GeminiProcessor:
 JSON만 반환하세요.
 """
             
-            response = await self.model.generate_content_async(prompt)
+            response = await self._generate("match", prompt)
             result_text = response.text.strip()
             
             if "```json" in result_text:
@@ -265,7 +291,7 @@ JSON 배열로만 반환:
 ["강남 냉면", "이태원 삼겹살", "명동 한정식", ...]
 """
             
-            response = await self.model.generate_content_async(prompt)
+            response = await self._generate("keywords", prompt)
             result_text = response.text.strip()
             
             if "```json" in result_text:
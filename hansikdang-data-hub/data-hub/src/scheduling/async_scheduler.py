@@ -0,0 +1,316 @@
+"""
+Async-native Scheduler
+하나의 이벤트 루프에서 cron 작업을 실행하는 스케줄러
+
+- cron 표현식 (UTC)
+- 중복 실행 정책: skip(건너뜀) / queue(종료 후 1회 실행) / parallel(동시 실행)
+- 작업별 timeout, 시작 지터(jitter)
+- 프로세스 중단 중 놓친 실행 catch-up (misfire_grace 이내 1회)
+- 상태 DB 저장 → API에서 pause/resume/restart 제어
+- 분산 잠금 (여러 레플리카 중 한 곳에서만 실행)
+"""
+import asyncio
+import inspect
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+from loguru import logger
+
+from src.monitoring.metrics import JOB_SECONDS
+from src.scheduling import state
+from src.scheduling.cron import CronExpression
+
+
+OVERLAP_POLICIES = ('skip', 'queue', 'parallel')
+
+JobFunc = Callable[[], Union[Awaitable[Any], Any]]
+
+
+@dataclass
+class ScheduledJob:
+    """스케줄 작업 정의 + 실행 상태"""
+    name: str
+    func: JobFunc
+    cron: CronExpression
+    overlap: str = 'skip'
+    timeout: Optional[float] = None  # 초
+    jitter: float = 0.0  # 초 (0 ~ jitter 사이 랜덤 지연)
+    catch_up: bool = True
+    misfire_grace: float = 6 * 3600  # 이 시간 이내에 놓친 실행만 catch-up
+    description: str = ''
+
+    scheduled_at: Optional[datetime] = None  # 다음 cron 예약 시각
+    fire_at: Optional[datetime] = None  # 지터 적용된 실제 실행 시각
+    running: Set[asyncio.Task] = field(default_factory=set)
+    queued: List[datetime] = field(default_factory=list)
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.func)
+
+    def schedule_next(self, after: datetime) -> None:
+        self.scheduled_at = self.cron.next_after(after)
+        delay = random.uniform(0, self.jitter) if self.jitter > 0 else 0
+        self.fire_at = self.scheduled_at + timedelta(seconds=delay)
+
+
+class AsyncScheduler:
+    """
+    asyncio 기반 스케줄러
+
+    Usage:
+        scheduler = AsyncScheduler()
+        scheduler.add_job("sync", sync_daily, "0 23 * * *", timeout=3600)
+        result = await scheduler.run()  # 'stopped' | 'restart'
+
+    동기 함수는 asyncio.to_thread로 실행되어 루프를 막지 않습니다.
+    (스레드 작업은 timeout 시 대기만 중단되며 스레드 자체는 끝까지 실행됩니다)
+
+    lock_service가 주어지면 parallel이 아닌 작업은 작업 이름으로 분산 잠금을 잡고 실행하며,
+    다른 레플리카가 실행 중이면 건너뜁니다.
+    """
+
+    def __init__(self, poll_interval: float = 5.0, shutdown_grace: float = 30.0, lock_service=None):
+        self.poll_interval = poll_interval
+        self.lock_service = lock_service
+        self.shutdown_grace = shutdown_grace
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._stop_event: Optional[asyncio.Event] = None
+        self._paused = False
+        self._paused_jobs: Set[str] = set()
+
+    def add_job(
+        self,
+        name: str,
+        func: JobFunc,
+        cron: str,
+        overlap: str = 'skip',
+        timeout: Optional[float] = None,
+        jitter: float = 0.0,
+        catch_up: bool = True,
+        misfire_grace: float = 6 * 3600,
+        description: str = ''
+    ) -> ScheduledJob:
+        """작업 등록"""
+        if name in self.jobs:
+            raise ValueError(f"Job already registered: {name}")
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"Invalid overlap policy '{overlap}' (expected one of {OVERLAP_POLICIES})")
+
+        job = ScheduledJob(
+            name=name,
+            func=func,
+            cron=CronExpression(cron),
+            overlap=overlap,
+            timeout=timeout,
+            jitter=jitter,
+            catch_up=catch_up,
+            misfire_grace=misfire_grace,
+            description=description
+        )
+        self.jobs[name] = job
+        return job
+
+    def stop(self) -> None:
+        """실행 루프 종료 요청 (시그널 핸들러에서 호출)"""
+        if self._stop_event:
+            self._stop_event.set()
+
+    async def run(self) -> str:
+        """
+        스케줄러 실행
+
+        Returns:
+            'restart': API로 재시작 요청됨 / 'stopped': stop() 호출됨
+        """
+        self._stop_event = asyncio.Event()
+        now = datetime.now(timezone.utc)
+
+        last_scheduled = await self._persist(
+            state.register_instance,
+            self.instance_id,
+            [{'name': job.name, 'cron': job.cron.expression, 'overlap': job.overlap} for job in self.jobs.values()]
+        ) or {}
+
+        for job in self.jobs.values():
+            job.schedule_next(now)
+            self._catch_up(job, last_scheduled.get(job.name), now)
+            await self._persist(state.update_job_state, job.name, next_run_at=job.scheduled_at)
+
+        logger.info(f"⏰ Async scheduler started ({self.instance_id}, {len(self.jobs)} jobs)")
+
+        result = 'stopped'
+        try:
+            while not self._stop_event.is_set():
+                control = await self._persist(state.heartbeat, self.instance_id)
+                if control:
+                    if control['restart_requested']:
+                        logger.info("🔁 Restart requested via API")
+                        result = 'restart'
+                        break
+                    self._apply_control(control)
+
+                now = datetime.now(timezone.utc)
+                for job in self.jobs.values():
+                    if job.fire_at <= now:
+                        scheduled_at = job.scheduled_at
+                        job.schedule_next(now)
+                        await self._dispatch(job, scheduled_at)
+
+                next_fire = min((job.fire_at for job in self.jobs.values()), default=None)
+                wait = self.poll_interval
+                if next_fire:
+                    wait = max(0.0, min(wait, (next_fire - datetime.now(timezone.utc)).total_seconds()))
+
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._shutdown()
+
+        if result == 'restart':
+            await self._persist(state.clear_restart)
+
+        logger.info(f"⏹️  Async scheduler {result}")
+        return result
+
+    def _catch_up(self, job: ScheduledJob, last_scheduled_at: Optional[datetime], now: datetime) -> None:
+        """중단 중 놓친 실행이 있으면 즉시 1회 실행 (여러 번 놓쳐도 1회로 병합)"""
+        if not job.catch_up or not last_scheduled_at:
+            return
+
+        missed = job.cron.next_after(last_scheduled_at)
+        if missed > now:
+            return
+
+        # 가장 최근에 놓친 예약 시각
+        latest_missed = missed
+        while True:
+            following = job.cron.next_after(latest_missed)
+            if following > now:
+                break
+            latest_missed = following
+
+        lateness = (now - latest_missed).total_seconds()
+        if lateness > job.misfire_grace:
+            logger.info(f"  ⏭️  {job.name}: missed run at {latest_missed.isoformat()} beyond grace, skipping")
+            return
+
+        logger.info(f"  ↩️  {job.name}: catching up missed run at {latest_missed.isoformat()}")
+        job.fire_at = now
+        job.scheduled_at = latest_missed
+
+    def _apply_control(self, control: Dict[str, Any]) -> None:
+        if control['paused'] != self._paused:
+            logger.info("⏸️  Scheduler paused" if control['paused'] else "▶️  Scheduler resumed")
+        self._paused = control['paused']
+        self._paused_jobs = control['paused_jobs']
+
+    async def _dispatch(self, job: ScheduledJob, scheduled_at: datetime) -> None:
+        """예약 시각 도달 → 일시정지/중복 정책에 따라 실행"""
+        if self._paused or job.name in self._paused_jobs:
+            logger.info(f"  ⏸️  {job.name}: paused, skipping run at {scheduled_at.isoformat()}")
+            await self._persist(state.record_job_skipped, job.name, scheduled_at, job.scheduled_at, 'paused')
+            return
+
+        if job.running:
+            if job.overlap == 'skip':
+                logger.warning(f"  ⏭️  {job.name}: previous run still active, skipping")
+                await self._persist(state.record_job_skipped, job.name, scheduled_at, job.scheduled_at, 'overlap')
+                return
+            if job.overlap == 'queue':
+                # 대기열은 1개만 유지 (밀린 실행은 병합)
+                if not job.queued:
+                    job.queued.append(scheduled_at)
+                    logger.info(f"  ⏳ {job.name}: previous run still active, queued")
+                return
+
+        self._start(job, scheduled_at)
+
+    def _start(self, job: ScheduledJob, scheduled_at: datetime) -> None:
+        task = asyncio.create_task(self._execute(job, scheduled_at), name=f"job:{job.name}")
+        job.running.add(task)
+        task.add_done_callback(lambda t, job=job: self._on_done(job, t))
+
+    def _on_done(self, job: ScheduledJob, task: asyncio.Task) -> None:
+        job.running.discard(task)
+        if job.queued and not job.running and not self._stop_event.is_set():
+            self._start(job, job.queued.pop(0))
+
+    async def _execute(self, job: ScheduledJob, scheduled_at: datetime) -> None:
+        if self.lock_service is None or job.overlap == 'parallel':
+            await self._run_job(job, scheduled_at)
+            return
+
+        from src.scheduling.locks import JobLockBusy
+
+        try:
+            async with self.lock_service.hold(job.name):
+                await self._run_job(job, scheduled_at)
+        except JobLockBusy as e:
+            logger.warning(f"  🔒 {job.name}: {e}, skipping")
+            await self._persist(state.record_job_skipped, job.name, scheduled_at, job.scheduled_at, f"locked by {e.holder}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ {job.name} lock error: {e}")
+
+    async def _run_job(self, job: ScheduledJob, scheduled_at: datetime) -> None:
+        await self._persist(state.record_job_started, job.name, scheduled_at, job.scheduled_at)
+        logger.info(f"▶️  {job.name} started (scheduled {scheduled_at.isoformat()})")
+
+        started = time.monotonic()
+        status, error = 'success', None
+
+        try:
+            coro = job.func() if job.is_async else asyncio.to_thread(job.func)
+            await asyncio.wait_for(coro, timeout=job.timeout)
+        except asyncio.TimeoutError:
+            status, error = 'timeout', f"Timed out after {job.timeout}s"
+            logger.error(f"⏱️  {job.name} timed out after {job.timeout}s")
+        except asyncio.CancelledError:
+            status, error = 'cancelled', 'Cancelled (scheduler shutdown or lock lost)'
+            logger.warning(f"🛑 {job.name} cancelled")
+            raise
+        except Exception as e:
+            status, error = 'failed', str(e)
+            logger.error(f"❌ {job.name} failed: {e}")
+            logger.exception(e)
+        finally:
+            duration = time.monotonic() - started
+            JOB_SECONDS.observe(duration, job=job.name, status=status)
+            await self._persist(state.record_job_finished, job.name, status, duration, error)
+            if status == 'success':
+                logger.info(f"✅ {job.name} finished in {duration:.1f}s")
+
+    async def _shutdown(self) -> None:
+        """실행 중 작업 완료 대기 (grace 초과 시 취소)"""
+        tasks = [task for job in self.jobs.values() for task in job.running]
+        for job in self.jobs.values():
+            job.queued.clear()
+
+        if not tasks:
+            return
+
+        logger.info(f"Waiting up to {self.shutdown_grace:.0f}s for {len(tasks)} running jobs...")
+        done, pending = await asyncio.wait(tasks, timeout=self.shutdown_grace)
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _persist(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """상태 저장 (DB 장애가 스케줄링을 멈추지 않도록 오류는 로그만)"""
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Scheduler state update failed ({func.__name__}): {e}")
+            return None
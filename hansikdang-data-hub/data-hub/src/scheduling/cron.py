@@ -0,0 +1,135 @@
+"""
+Cron expression parser
+표준 5필드 cron 표현식 (분 시 일 월 요일) - UTC 기준
+
+지원 문법: *, 숫자, 범위(1-5), 간격(*/15, 0-30/10), 목록(1,15,30), 요일/월 이름(mon, jan)
+"""
+from datetime import datetime, timedelta
+from typing import FrozenSet, List
+
+
+_MONTH_NAMES = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+_DOW_NAMES = {'sun': 0, 'mon': 1, 'tue': 2, 'wed': 3, 'thu': 4, 'fri': 5, 'sat': 6}
+
+# (최소, 최대, 이름표)
+_FIELDS = [
+    (0, 59, {}),           # minute
+    (0, 23, {}),           # hour
+    (1, 31, {}),           # day of month
+    (1, 12, _MONTH_NAMES), # month
+    (0, 7, _DOW_NAMES),    # day of week (0, 7 = 일요일)
+]
+
+# 존재하지 않는 날짜 조합(예: 2월 30일) 방지용 탐색 한도
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+class CronExpression:
+    """
+    cron 표현식
+
+    Usage:
+        cron = CronExpression("0 18 * * *")
+        cron.next_after(datetime.now(timezone.utc))
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        parts = self.expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: '{expression}'")
+
+        fields = [
+            self._parse_field(part, low, high, names)
+            for part, (low, high, names) in zip(parts, _FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, dows = fields
+
+        # 7 → 0 (일요일) 정규화
+        self.weekdays = frozenset(d % 7 for d in dows)
+
+        # 표준 cron: 일/요일이 모두 제한되면 OR 조건
+        self._day_restricted = parts[2] != '*'
+        self._dow_restricted = parts[4] != '*'
+
+    @staticmethod
+    def _parse_field(part: str, low: int, high: int, names: dict) -> FrozenSet[int]:
+        values: List[int] = []
+
+        for item in part.lower().split(','):
+            step = 1
+            if '/' in item:
+                item, step_str = item.split('/', 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"Invalid cron step: '{part}'")
+
+            if item == '*':
+                start, end = low, high
+            elif '-' in item:
+                start_str, end_str = item.split('-', 1)
+                start = names[start_str] if start_str in names else int(start_str)
+                end = names[end_str] if end_str in names else int(end_str)
+            else:
+                start = names[item] if item in names else int(item)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron value out of range [{low}-{high}]: '{part}'")
+
+            values.extend(range(start, end + 1, step))
+
+        return frozenset(values)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        # Python weekday(): 월=0 → cron: 일=0
+        dow_ok = (dt.weekday() + 1) % 7 in self.weekdays
+
+        if self._day_restricted and self._dow_restricted:
+            return day_ok or dow_ok
+        return day_ok and dow_ok
+
+    def matches(self, dt: datetime) -> bool:
+        """해당 시각(분 단위)이 표현식과 일치하는지"""
+        return (
+            dt.minute in self.minutes and
+            dt.hour in self.hours and
+            dt.month in self.months and
+            self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(초과) 첫 실행 시각 (dt의 tzinfo 유지)"""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                # 다음 달 1일 00:00
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+
+            return candidate
+
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
+
+    def __repr__(self) -> str:
+        return f"CronExpression('{self.expression}')"
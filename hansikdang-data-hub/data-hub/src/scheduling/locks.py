@@ -0,0 +1,335 @@
+"""
+Distributed Job Lock
+작업 이름 단위 lease 잠금 - 스케줄러/API 레플리카가 같은 작업을 동시에 실행하지 않도록 보장
+
+- PostgreSQL: 전용 커넥션의 세션 advisory lock (프로세스가 죽으면 커넥션과 함께 즉시 해제)
+- 그 외 DB: job_locks 테이블 lease (expires_at 이후 다른 holder가 획득)
+
+두 방식 모두 job_locks 행에 holder/heartbeat를 기록하므로 /api/jobs/status에서 조회할 수 있습니다.
+"""
+import asyncio
+import hashlib
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from sqlalchemy import or_, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from config import settings
+from src.database.connection import db_session, engine
+from src.database.models import JobLock
+
+
+class JobLockBusy(Exception):
+    """다른 holder가 잠금을 보유 중"""
+
+    def __init__(self, job_name: str, holder: Optional[str] = None):
+        self.job_name = job_name
+        self.holder = holder
+        super().__init__(f"Job '{job_name}' is already running (holder: {holder or 'unknown'})")
+
+
+@dataclass
+class JobLease:
+    """획득한 잠금"""
+    job_name: str
+    holder: str
+    backend: str
+    acquired_at: datetime
+    connection: Optional[Connection] = None  # advisory lock 보유 커넥션
+    lost: bool = False
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _advisory_key(job_name: str) -> int:
+    """작업 이름 → pg advisory lock 키 (signed bigint)"""
+    digest = hashlib.sha1(f"datahub-job:{job_name}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big', signed=True)
+
+
+def _advisory_lock_ids(key: int) -> Tuple[int, int]:
+    """bigint advisory lock 키 → pg_locks (classid, objid) - 상위/하위 32비트 (oid는 부호 없음)"""
+    unsigned = key & 0xFFFFFFFFFFFFFFFF
+    return unsigned >> 32, unsigned & 0xFFFFFFFF
+
+
+class DistributedLockService:
+    """
+    작업 이름 단위 분산 잠금
+
+    Usage:
+        async with job_locks.hold("sync"):
+            await workflow.sync_to_hansikdang()
+    """
+
+    def __init__(self, ttl_seconds: int = 300, heartbeat_seconds: int = 60):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.backend = 'advisory' if engine.dialect.name == 'postgresql' else 'table'
+
+    # ------------------------------------------------------------------
+    # 동기 API
+    # ------------------------------------------------------------------
+
+    def acquire(self, job_name: str) -> Optional[JobLease]:
+        """잠금 획득 시도 (대기하지 않음). 실패 시 None"""
+        holder = f"{self.instance_id}:{uuid.uuid4().hex[:8]}"
+
+        if self.backend == 'advisory':
+            lease = self._acquire_advisory(job_name, holder)
+        else:
+            lease = self._acquire_table(job_name, holder)
+
+        if lease:
+            logger.debug(f"🔒 Lock acquired: {job_name} ({lease.backend}, {holder})")
+        return lease
+
+    def renew(self, lease: JobLease) -> bool:
+        """heartbeat - lease 연장. 잠금을 잃었으면 False"""
+        now = _now()
+
+        if lease.connection is not None:
+            try:
+                # 커넥션 생존 확인 (끊기면 advisory lock도 해제된 상태)
+                lease.connection.execute(text("SELECT 1"))
+                lease.connection.commit()
+            except Exception as e:
+                logger.error(f"Lock connection lost for {lease.job_name}: {e}")
+                lease.lost = True
+                return False
+
+        with db_session() as db:
+            updated = db.query(JobLock).filter(
+                JobLock.job_name == lease.job_name,
+                JobLock.holder == lease.holder
+            ).update({
+                JobLock.heartbeat_at: now,
+                JobLock.expires_at: now + self.ttl,
+            }, synchronize_session=False)
+
+        if not updated and lease.connection is None:
+            lease.lost = True
+            return False
+        return True
+
+    def release(self, lease: JobLease) -> None:
+        """잠금 해제"""
+        try:
+            with db_session() as db:
+                db.query(JobLock).filter(
+                    JobLock.job_name == lease.job_name,
+                    JobLock.holder == lease.holder
+                ).update({
+                    JobLock.holder: None,
+                    JobLock.expires_at: None,
+                }, synchronize_session=False)
+        finally:
+            if lease.connection is not None:
+                try:
+                    lease.connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": _advisory_key(lease.job_name)}
+                    )
+                finally:
+                    lease.connection.close()
+                    lease.connection = None
+
+        logger.debug(f"🔓 Lock released: {lease.job_name}")
+
+    def get_holder(self, job_name: str) -> Optional[str]:
+        """
+        현재 유효한 holder (없으면 None)
+
+        advisory lock은 보유 프로세스가 죽으면 바로 풀리지만 job_locks 행은 expires_at까지 남으므로,
+        pg_locks에서 실제로 잠겨 있는지 확인합니다.
+        """
+        with db_session() as db:
+            lock = db.query(JobLock).filter(
+                JobLock.job_name == job_name,
+                JobLock.holder.isnot(None),
+                JobLock.expires_at > _now()
+            ).first()
+            if not lock:
+                return None
+            if lock.backend == 'advisory' and self.backend == 'advisory' and not self._advisory_held(db, job_name):
+                logger.debug(f"Stale lock row for {job_name} ({lock.holder}): advisory lock is not held")
+                return None
+            return lock.holder
+
+    def list_locks(self) -> List[Dict[str, Any]]:
+        """잠금 보유 현황 (만료 여부 포함)"""
+        now = _now()
+        with db_session() as db:
+            locks = db.query(JobLock).order_by(JobLock.job_name).all()
+
+            result = []
+            for lock in locks:
+                expires_at = lock.expires_at
+                if expires_at is not None and expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+
+                result.append({
+                    "job_name": lock.job_name,
+                    "holder": lock.holder,
+                    "backend": lock.backend,
+                    "held": bool(lock.holder and expires_at and expires_at > now),
+                    "acquired_at": lock.acquired_at.isoformat() if lock.acquired_at else None,
+                    "heartbeat_at": lock.heartbeat_at.isoformat() if lock.heartbeat_at else None,
+                    "expires_at": expires_at.isoformat() if expires_at else None,
+                })
+            return result
+
+    @staticmethod
+    def _advisory_held(db, job_name: str) -> bool:
+        """advisory lock이 현재 DB의 어떤 세션에든 잡혀 있는지 (잠금을 시도하지 않으므로 획득 경쟁에 영향 없음)"""
+        classid, objid = _advisory_lock_ids(_advisory_key(job_name))
+        return bool(db.execute(text(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_locks "
+            "WHERE locktype = 'advisory' AND granted AND objsubid = 1 "
+            "AND database = (SELECT oid FROM pg_database WHERE datname = current_database()) "
+            "AND classid = CAST(:classid AS oid) AND objid = CAST(:objid AS oid))"
+        ), {"classid": classid, "objid": objid}).scalar())
+
+    def _acquire_advisory(self, job_name: str, holder: str) -> Optional[JobLease]:
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": _advisory_key(job_name)}
+            ).scalar()
+            # 세션 lock은 트랜잭션과 무관하게 유지되므로 열린 트랜잭션만 정리
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+
+        if not acquired:
+            connection.close()
+            return None
+
+        now = _now()
+        try:
+            with db_session() as db:
+                lock = db.query(JobLock).filter(JobLock.job_name == job_name).first()
+                if not lock:
+                    lock = JobLock(job_name=job_name)
+                    db.add(lock)
+                lock.holder = holder
+                lock.backend = 'advisory'
+                lock.acquired_at = now
+                lock.heartbeat_at = now
+                lock.expires_at = now + self.ttl
+        except Exception:
+            connection.close()
+            raise
+
+        return JobLease(job_name, holder, 'advisory', now, connection=connection)
+
+    def _acquire_table(self, job_name: str, holder: str) -> Optional[JobLease]:
+        now = _now()
+        values = {
+            JobLock.holder: holder,
+            JobLock.backend: 'table',
+            JobLock.acquired_at: now,
+            JobLock.heartbeat_at: now,
+            JobLock.expires_at: now + self.ttl,
+        }
+
+        try:
+            with db_session() as db:
+                # 해제되었거나 만료된 잠금만 가져옴 (조건부 UPDATE로 원자적 획득)
+                updated = db.query(JobLock).filter(
+                    JobLock.job_name == job_name,
+                    or_(JobLock.holder.is_(None), JobLock.expires_at < now)
+                ).update(values, synchronize_session=False)
+
+                if not updated:
+                    if db.query(JobLock.job_name).filter(JobLock.job_name == job_name).first():
+                        return None
+                    db.add(JobLock(
+                        job_name=job_name, holder=holder, backend='table',
+                        acquired_at=now, heartbeat_at=now, expires_at=now + self.ttl
+                    ))
+        except IntegrityError:
+            # 동시에 다른 holder가 먼저 INSERT
+            return None
+
+        return JobLease(job_name, holder, 'table', now)
+
+    # ------------------------------------------------------------------
+    # async API
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def hold(self, job_name: str) -> AsyncIterator[JobLease]:
+        """
+        잠금을 보유한 채 블록 실행 (heartbeat 자동 연장)
+
+        Raises:
+            JobLockBusy: 다른 holder가 실행 중
+        """
+        lease = await asyncio.to_thread(self.acquire, job_name)
+        if not lease:
+            holder = await asyncio.to_thread(self.get_holder, job_name)
+            raise JobLockBusy(job_name, holder)
+
+        owner = asyncio.current_task()
+        heartbeat = asyncio.create_task(self._heartbeat(lease, owner))
+        try:
+            yield lease
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await asyncio.to_thread(self.release, lease)
+
+        if lease.lost:
+            logger.warning(f"⚠️  Lock for {job_name} was lost during execution")
+
+    async def _heartbeat(self, lease: JobLease, owner: Optional[asyncio.Task]) -> None:
+        """주기적으로 lease 연장. 잠금을 잃으면 작업 취소 (다른 holder와 중복 실행 방지)"""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                renewed = await asyncio.to_thread(self.renew, lease)
+            except Exception as e:
+                # 일시적인 DB 오류는 TTL 안에서 다음 heartbeat로 재시도
+                logger.error(f"Lock heartbeat failed for {lease.job_name}: {e}")
+                continue
+
+            if not renewed:
+                logger.error(f"❌ Lock lost for {lease.job_name}, cancelling job")
+                if owner:
+                    owner.cancel()
+                return
+
+    async def run_exclusive(self, job_name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        잠금을 잡고 작업 실행 (동기 함수는 스레드에서 실행)
+
+        이미 실행 중이면 건너뛰고 None 반환 (BackgroundTasks용)
+        """
+        try:
+            async with self.hold(job_name):
+                if asyncio.iscoroutinefunction(func):
+                    return await func(*args, **kwargs)
+                return await asyncio.to_thread(func, *args, **kwargs)
+        except JobLockBusy as e:
+            logger.warning(f"⏭️  Skipping {job_name}: {e}")
+            return None
+
+
+job_locks = DistributedLockService(
+    ttl_seconds=settings.job_lock_ttl_seconds,
+    heartbeat_seconds=settings.job_lock_heartbeat_seconds
+)
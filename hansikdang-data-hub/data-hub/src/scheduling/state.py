@@ -0,0 +1,222 @@
+"""
+Scheduler state persistence
+스케줄러 제어 플래그와 작업별 실행 상태를 DB에 저장
+
+스케줄러 프로세스와 API 프로세스가 같은 테이블을 읽고 쓰므로
+/api/jobs/scheduler/pause|resume|restart 요청이 실행 중인 스케줄러에 반영됩니다.
+"""
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from src.database.connection import db_session
+from src.database.models import SchedulerControl, SchedulerJobState
+
+
+CONTROL_ROW_ID = 1
+
+# heartbeat가 이 시간 이상 끊기면 스케줄러가 중지된 것으로 판단
+HEARTBEAT_TIMEOUT_SECONDS = 60
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """timezone 정보가 없는 값(SQLite 등)은 UTC로 간주"""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _get_control(db: Session) -> SchedulerControl:
+    control = db.query(SchedulerControl).filter(SchedulerControl.id == CONTROL_ROW_ID).first()
+    if not control:
+        control = SchedulerControl(id=CONTROL_ROW_ID, paused=False, restart_requested=False)
+        db.add(control)
+        db.flush()
+    return control
+
+
+def _get_job_state(db: Session, job_name: str) -> SchedulerJobState:
+    job_state = db.query(SchedulerJobState).filter(SchedulerJobState.job_name == job_name).first()
+    if not job_state:
+        job_state = SchedulerJobState(
+            job_name=job_name, paused=False, running_count=0,
+            run_count=0, failure_count=0, skip_count=0
+        )
+        db.add(job_state)
+        db.flush()
+    return job_state
+
+
+# ============================================================================
+# API 측 (제어 요청)
+# ============================================================================
+
+def set_paused(paused: bool, job_name: Optional[str] = None) -> Dict[str, Any]:
+    """전체 또는 특정 작업 일시정지/재개"""
+    with db_session() as db:
+        if job_name:
+            job_state = db.query(SchedulerJobState).filter(
+                SchedulerJobState.job_name == job_name
+            ).first()
+            if not job_state:
+                raise ValueError(f"Unknown scheduler job: {job_name}")
+            job_state.paused = paused
+        else:
+            _get_control(db).paused = paused
+
+    return get_scheduler_status()
+
+
+def request_restart() -> Dict[str, Any]:
+    """재시작 요청 (스케줄러가 다음 heartbeat에서 처리)"""
+    with db_session() as db:
+        _get_control(db).restart_requested = True
+
+    return get_scheduler_status()
+
+
+def get_scheduler_status() -> Dict[str, Any]:
+    """스케줄러 제어 상태 + 작업별 상태"""
+    with db_session() as db:
+        control = _get_control(db)
+        jobs = db.query(SchedulerJobState).order_by(SchedulerJobState.next_run_at).all()
+
+        heartbeat_at = _as_utc(control.heartbeat_at)
+        alive = bool(
+            heartbeat_at and
+            _now() - heartbeat_at < timedelta(seconds=HEARTBEAT_TIMEOUT_SECONDS)
+        )
+
+        return {
+            "alive": alive,
+            "paused": bool(control.paused),
+            "restart_requested": bool(control.restart_requested),
+            "instance_id": control.instance_id,
+            "started_at": control.started_at.isoformat() if control.started_at else None,
+            "heartbeat_at": heartbeat_at.isoformat() if heartbeat_at else None,
+            "jobs": [_job_to_dict(job) for job in jobs],
+        }
+
+
+def _job_to_dict(job: SchedulerJobState) -> Dict[str, Any]:
+    return {
+        "job_name": job.job_name,
+        "cron": job.cron,
+        "overlap_policy": job.overlap_policy,
+        "paused": bool(job.paused),
+        "running": (job.running_count or 0) > 0,
+        "next_run_at": job.next_run_at.isoformat() if job.next_run_at else None,
+        "last_started_at": job.last_started_at.isoformat() if job.last_started_at else None,
+        "last_finished_at": job.last_finished_at.isoformat() if job.last_finished_at else None,
+        "last_status": job.last_status,
+        "last_duration_seconds": job.last_duration_seconds,
+        "last_error": job.last_error,
+        "run_count": job.run_count or 0,
+        "failure_count": job.failure_count or 0,
+        "skip_count": job.skip_count or 0,
+    }
+
+
+# ============================================================================
+# 스케줄러 측
+# ============================================================================
+
+def register_instance(instance_id: str, jobs: List[Dict[str, Any]]) -> Dict[str, Optional[datetime]]:
+    """
+    스케줄러 시작 시 인스턴스/작업 등록
+
+    Returns:
+        작업별 last_scheduled_at (missed-run catch-up 기준)
+    """
+    now = _now()
+    last_scheduled: Dict[str, Optional[datetime]] = {}
+
+    with db_session() as db:
+        control = _get_control(db)
+        control.instance_id = instance_id
+        control.started_at = now
+        control.heartbeat_at = now
+        control.restart_requested = False
+
+        for job in jobs:
+            job_state = _get_job_state(db, job['name'])
+            job_state.cron = job['cron']
+            job_state.overlap_policy = job['overlap']
+            # 이전 프로세스가 비정상 종료된 경우 실행 중 표시 초기화
+            job_state.running_count = 0
+            last_scheduled[job['name']] = _as_utc(job_state.last_scheduled_at)
+
+    return last_scheduled
+
+
+def heartbeat(instance_id: str) -> Dict[str, Any]:
+    """heartbeat 기록 후 제어 플래그 반환"""
+    with db_session() as db:
+        control = _get_control(db)
+        control.instance_id = instance_id
+        control.heartbeat_at = _now()
+
+        paused_jobs = {
+            row.job_name for row in db.query(SchedulerJobState.job_name).filter(
+                SchedulerJobState.paused == True
+            ).all()
+        }
+
+        return {
+            "paused": bool(control.paused),
+            "restart_requested": bool(control.restart_requested),
+            "paused_jobs": paused_jobs,
+        }
+
+
+def clear_restart() -> None:
+    """재시작 요청 처리 완료"""
+    with db_session() as db:
+        _get_control(db).restart_requested = False
+
+
+def update_job_state(job_name: str, **fields: Any) -> None:
+    """작업 상태 필드 갱신"""
+    with db_session() as db:
+        job_state = _get_job_state(db, job_name)
+        for key, value in fields.items():
+            setattr(job_state, key, value)
+
+
+def record_job_skipped(job_name: str, scheduled_at: datetime, next_run_at: datetime, reason: str) -> None:
+    """예약 실행을 건너뜀 (실행 중/일시정지)"""
+    with db_session() as db:
+        job_state = _get_job_state(db, job_name)
+        job_state.last_scheduled_at = scheduled_at
+        job_state.next_run_at = next_run_at
+        job_state.last_status = 'skipped'
+        job_state.last_error = reason
+        job_state.skip_count = (job_state.skip_count or 0) + 1
+
+
+def record_job_started(job_name: str, scheduled_at: datetime, next_run_at: datetime) -> None:
+    """작업 시작 기록"""
+    with db_session() as db:
+        job_state = _get_job_state(db, job_name)
+        job_state.last_scheduled_at = scheduled_at
+        job_state.next_run_at = next_run_at
+        job_state.last_started_at = _now()
+        job_state.running_count = (job_state.running_count or 0) + 1
+
+
+def record_job_finished(job_name: str, status: str, duration: float, error: Optional[str] = None) -> None:
+    """작업 종료 기록 (success/failed/timeout/cancelled)"""
+    with db_session() as db:
+        job_state = _get_job_state(db, job_name)
+        job_state.running_count = max((job_state.running_count or 0) - 1, 0)
+        job_state.last_finished_at = _now()
+        job_state.last_status = status
+        job_state.last_duration_seconds = round(duration, 2)
+        job_state.last_error = error
+        job_state.run_count = (job_state.run_count or 0) + 1
+        if status != 'success':
+            job_state.failure_count = (job_state.failure_count or 0) + 1
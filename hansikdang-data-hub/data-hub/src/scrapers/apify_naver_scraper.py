@@ -7,13 +7,12 @@ Apify의 'Naver Map Search Results Scraper'를 활용한 상세 데이터 수집
 - 리뷰, 영업시간, GPS 등 풍부한 데이터
 - 99%+ 성공률 보장
 """
-import httpx
-import asyncio
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from loguru import logger
 
 from config import settings
+from src.scrapers.apify_runner import ApifyActorRunner, ApifyRunError
 
 
 class ApifyNaverScraper:
@@ -21,12 +20,13 @@ class ApifyNaverScraper:
     
     ACTOR_ID = "UCpUxFUNcdKdbBdYg"  # delicious_zebu/naver-map-search-results-scraper
     
-    def __init__(self):
+    def __init__(self, run_timeout: float = 30 * 60):
         if not settings.apify_api_token:
             raise ValueError("APIFY_API_TOKEN not set")
         
         self.api_token = settings.apify_api_token
-        self.base_url = "https://api.apify.com/v2"
+        self.runner = ApifyActorRunner(self.api_token)
+        self.run_timeout = run_timeout
         self.logger = logger.bind(scraper="apify_naver")
     
     async def search_restaurants(
@@ -45,65 +45,47 @@ class ApifyNaverScraper:
             레스토랑 데이터 리스트 (메뉴 포함)
         """
         try:
-            # Apify Actor 실행
-            run_input = {
-                "keywords": keywords,
-                "maxResultsPerKeyword": max_results_per_keyword
-            }
+            # 1. Actor 실행 + 완료 대기 (long-poll)
+            run = await self.start_search(keywords, max_results_per_keyword)
             
-            self.logger.info(f"Starting Apify scrape: {len(keywords)} keywords")
+            # 2. 데이터셋 페이지 단위 다운로드
+            results = [item async for item in self.iter_results(run)]
             
-            # Actor 실행 시작
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                # 1. Actor 실행
-                run_response = await client.post(
-                    f"{self.base_url}/acts/{self.ACTOR_ID}/runs",
-                    params={"token": self.api_token},
-                    json=run_input
-                )
-                run_response.raise_for_status()
-                run_data = run_response.json()
-                run_id = run_data["data"]["id"]
-                
-                self.logger.info(f"Actor run started: {run_id}")
-                
-                # 2. 실행 완료 대기
-                status = "RUNNING"
-                while status in ["RUNNING", "READY"]:
-                    await asyncio.sleep(5)
-                    
-                    status_response = await client.get(
-                        f"{self.base_url}/actor-runs/{run_id}",
-                        params={"token": self.api_token}
-                    )
-                    status_response.raise_for_status()
-                    status_data = status_response.json()
-                    status = status_data["data"]["status"]
-                    
-                    self.logger.debug(f"Run status: {status}")
-                
-                # 3. 결과 확인
-                if status == "SUCCEEDED":
-                    dataset_id = run_data["data"]["defaultDatasetId"]
-                    
-                    # 데이터셋 다운로드
-                    dataset_response = await client.get(
-                        f"{self.base_url}/datasets/{dataset_id}/items",
-                        params={"token": self.api_token}
-                    )
-                    dataset_response.raise_for_status()
-                    results = dataset_response.json()
-                    
-                    self.logger.info(f"✅ Scraped {len(results)} restaurants with menu data")
-                    return results
-                else:
-                    self.logger.error(f"Actor run failed: {status}")
-                    return []
-                
+            self.logger.info(f"✅ Scraped {len(results)} restaurants with menu data")
+            return results
+            
+        except ApifyRunError as e:
+            self.logger.error(f"Actor run failed: {e.status}")
+            return []
         except Exception as e:
             self.logger.error(f"Apify scraping failed: {e}")
             return []
     
+    async def start_search(
+        self,
+        keywords: List[str],
+        max_results_per_keyword: int = 100
+    ) -> Dict[str, Any]:
+        """
+        여러 키워드를 하나의 actor 실행으로 검색하고 완료된 run 객체 반환
+        
+        결과는 iter_results(run)으로 스트리밍합니다. run["usageTotalUsd"]에 실행 비용이 기록됩니다.
+        
+        Raises:
+            ApifyRunError: 실행 실패
+        """
+        run_input = {
+            "keywords": keywords,
+            "maxResultsPerKeyword": max_results_per_keyword
+        }
+        
+        self.logger.info(f"Starting Apify scrape: {len(keywords)} keywords")
+        return await self.runner.call(self.ACTOR_ID, run_input, timeout=self.run_timeout)
+    
+    def iter_results(self, run: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """실행 결과 데이터셋 스트리밍"""
+        return self.runner.iter_items(run["defaultDatasetId"])
+    
     def parse_apify_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apify 데이터를 내부 포맷으로 변환
@@ -0,0 +1,174 @@
+"""
+Async Apify actor runner (REST API)
+이벤트 루프를 막지 않는 Apify actor 실행 / 완료 대기 / 데이터셋 스트리밍
+
+- 완료 대기: waitForFinish long-poll (Apify가 완료 즉시 응답, 고정 sleep 폴링 없음)
+- 데이터셋: offset/limit 페이지 단위 스트리밍 (대량 결과를 한 번에 메모리에 올리지 않음)
+- 대기 중 취소되면 actor 실행도 abort (비용 낭비 방지)
+
+Usage:
+    runner = ApifyActorRunner()
+    run = await runner.call(ACTOR_ID, {"keywords": ["강남 한식"]})
+    async for item in runner.iter_items(run["defaultDatasetId"]):
+        ...
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+from loguru import logger
+
+from config import settings
+from src.utils.http_client import http_clients
+
+
+# Apify는 waitForFinish를 최대 60초까지 허용
+MAX_WAIT_SECONDS = 60
+
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+
+class ApifyRunError(Exception):
+    """actor 실행이 SUCCEEDED 이외의 상태로 종료"""
+
+    def __init__(self, run: Dict[str, Any]):
+        self.run = run
+        self.status = run.get("status")
+        super().__init__(f"Apify run {run.get('id')} finished with status {self.status}")
+
+
+class ApifyActorRunner:
+    """Apify REST API 비동기 실행기 (공유 'apify' HTTP 클라이언트 사용)"""
+
+    def __init__(self, api_token: Optional[str] = None, page_size: int = 1000):
+        """
+        Args:
+            api_token: Apify API 토큰 (기본: settings.apify_api_token)
+            page_size: 데이터셋 페이지당 항목 수
+        """
+        self.api_token = api_token or settings.apify_api_token
+        if not self.api_token:
+            raise ValueError("APIFY_API_TOKEN not set")
+
+        self.page_size = page_size
+        self.logger = logger.bind(scraper="apify_runner")
+
+    @staticmethod
+    def _actor_path(actor_id: str) -> str:
+        # REST 경로에서는 "username/actor-name"을 "username~actor-name"으로 표기
+        return actor_id.replace("/", "~")
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        client = http_clients.get("apify")
+        params = {"token": self.api_token, **kwargs.pop("params", {})}
+        response = await client.request(method, path, params=params, **kwargs)
+        response.raise_for_status()
+        return response.json()["data"]
+
+    async def start(self, actor_id: str, run_input: Dict[str, Any], wait_seconds: int = 0) -> Dict[str, Any]:
+        """actor 실행 시작 (wait_seconds 동안 완료를 기다린 뒤 run 객체 반환)"""
+        run = await self._request(
+            "POST",
+            f"/acts/{self._actor_path(actor_id)}/runs",
+            params={"waitForFinish": min(wait_seconds, MAX_WAIT_SECONDS)},
+            json=run_input
+        )
+        self.logger.info(f"Actor run started: {run['id']} ({actor_id})")
+        return run
+
+    async def wait_for_finish(self, run_id: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        실행 완료까지 long-poll
+
+        Raises:
+            asyncio.TimeoutError: timeout(초) 내에 끝나지 않음
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            wait = MAX_WAIT_SECONDS
+            if deadline:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Apify run {run_id} did not finish within {timeout}s")
+                wait = max(1, min(wait, int(remaining)))
+
+            run = await self._request("GET", f"/actor-runs/{run_id}", params={"waitForFinish": wait})
+            if run["status"] in TERMINAL_STATUSES:
+                return run
+
+            self.logger.debug(f"Run {run_id} status: {run['status']}")
+
+    async def abort(self, run_id: str) -> None:
+        """실행 중단"""
+        await self._request("POST", f"/actor-runs/{run_id}/abort")
+        self.logger.warning(f"Actor run aborted: {run_id}")
+
+    async def call(
+        self,
+        actor_id: str,
+        run_input: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        actor 실행 후 완료까지 대기
+
+        Raises:
+            ApifyRunError: SUCCEEDED 이외의 상태로 종료
+        """
+        started = time.monotonic()
+        run = await self.start(actor_id, run_input, wait_seconds=MAX_WAIT_SECONDS)
+
+        try:
+            if run["status"] not in TERMINAL_STATUSES:
+                remaining = timeout - (time.monotonic() - started) if timeout else None
+                run = await self.wait_for_finish(run["id"], timeout=remaining)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            # 결과를 받지 않을 실행이 계속 과금되지 않도록 중단
+            try:
+                await asyncio.shield(self.abort(run["id"]))
+            except Exception as e:
+                self.logger.error(f"Failed to abort run {run['id']}: {e}")
+            raise
+
+        if run["status"] != "SUCCEEDED":
+            raise ApifyRunError(run)
+
+        self.logger.info(
+            f"Actor run {run['id']} succeeded in {time.monotonic() - started:.1f}s "
+            f"(usage: ${run.get('usageTotalUsd') or 0:.4f})"
+        )
+        return run
+
+    async def iter_items(
+        self,
+        dataset_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """데이터셋 항목을 페이지 단위로 가져오며 하나씩 반환"""
+        client = http_clients.get("apify")
+        offset = 0
+        yielded = 0
+
+        while True:
+            page_limit = self.page_size if limit is None else min(self.page_size, limit - yielded)
+            if page_limit <= 0:
+                return
+
+            params = {"token": self.api_token, "offset": offset, "limit": page_limit, "clean": "true"}
+            if fields:
+                params["fields"] = fields
+
+            response = await client.get(f"/datasets/{dataset_id}/items", params=params)
+            response.raise_for_status()
+            items = response.json()
+
+            for item in items:
+                yield item
+            yielded += len(items)
+            offset += len(items)
+
+            # 마지막 페이지 (X-Apify-Pagination-Total 헤더가 없을 때도 종료 보장)
+            total = response.headers.get("X-Apify-Pagination-Total")
+            if len(items) < page_limit or (total is not None and offset >= int(total)):
+                return
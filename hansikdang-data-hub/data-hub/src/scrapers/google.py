@@ -3,18 +3,16 @@ Google Maps Scraper using Outscraper
 """
 from typing import List, Optional, Dict, Any
 import uuid
-import httpx
 from loguru import logger
 
 from src.scrapers.base import BaseScraper, ScrapedRestaurant
+from src.utils.http_client import http_clients
 from config import settings
 
 
 class GoogleMapsScraper(BaseScraper):
     """구글맵스 스크래퍼 (Outscraper API 사용)"""
     
-    BASE_URL = "https://api.outscraper.com"
-    
     def __init__(self):
         super().__init__(api_key=settings.outscraper_api_key)
         if not self.api_key:
@@ -38,20 +36,19 @@ class GoogleMapsScraper(BaseScraper):
             
             self.logger.info(f"Searching Google Maps: {search_query}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/maps/search-v3",
-                    headers=self.headers,
-                    params={
-                        "query": search_query,
-                        "limit": limit,
-                        "language": "ko",
-                        "region": "KR",
-                    },
-                    timeout=60.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = http_clients.get("outscraper")
+            response = await client.get(
+                "/maps/search-v3",
+                headers=self.headers,
+                params={
+                    "query": search_query,
+                    "limit": limit,
+                    "language": "ko",
+                    "region": "KR",
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
             
             results = []
             for item in data.get("data", []):
@@ -69,15 +66,14 @@ class GoogleMapsScraper(BaseScraper):
     async def get_details(self, source_id: str) -> ScrapedRestaurant:
         """구글 플레이스 상세 정보"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/maps/place-info",
-                    headers=self.headers,
-                    params={"place_id": source_id},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = http_clients.get("outscraper")
+            response = await client.get(
+                "/maps/place-info",
+                headers=self.headers,
+                params={"place_id": source_id},
+            )
+            response.raise_for_status()
+            data = response.json()
             
             if data.get("data"):
                 return self._parse_google_item(data["data"][0])
@@ -9,7 +9,8 @@ from typing import Optional, Dict, List
 from loguru import logger
 
 from config import settings
-from src.utils.rate_limiter import RateLimiter
+from src.utils.rate_limiter import rate_limiters
+from src.utils.http_client import http_clients
 
 
 class GooglePlacesAPI:
@@ -27,9 +28,9 @@ class GooglePlacesAPI:
         if not self.api_key:
             raise ValueError("GOOGLE_PLACES_API_KEY or GEMINI_API_KEY not set")
         
-        self.base_url = "https://maps.googleapis.com/maps/api/place"
-        # Rate Limit: 10 requests/second (안전하게 5 req/s)
-        self.rate_limiter = RateLimiter(max_requests=5, per_seconds=1)
+        self.base_url = settings.google_places_base_url
+        # Rate Limit: 모든 인스턴스가 제공자 쿼터 하나를 공유 (5 req/s)
+        self.rate_limiter = rate_limiters.get("google_places")
         self.logger = logger.bind(scraper="google_places")
     
     async def search_place(
@@ -66,56 +67,55 @@ class GooglePlacesAPI:
             
             self.logger.debug(f"Searching: {name}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/findplacefromtext/json",
-                    params=params,
-                    timeout=10
+            client = http_clients.get("google_places")
+            response = await client.get(
+                "/findplacefromtext/json",
+                params=params
+            )
+            
+            if response.status_code != 200:
+                self.logger.error(
+                    f"HTTP {response.status_code}: {response.text[:200]}"
                 )
-                
-                if response.status_code != 200:
-                    self.logger.error(
-                        f"HTTP {response.status_code}: {response.text[:200]}"
-                    )
-                    return None
-                
-                data = response.json()
-                
-                if data.get("status") != "OK":
-                    self.logger.warning(
-                        f"API status {data.get('status')} for {name}"
-                    )
-                    return None
-                
-                candidates = data.get("candidates", [])
-                if not candidates:
-                    self.logger.warning(f"No candidates for {name}")
-                    return None
-                
-                result = candidates[0]
-                
-                # ✅ 이미지 URL 추출 (최대 10개)
-                image_urls = []
-                if 'photos' in result and len(result['photos']) > 0:
-                    for photo in result['photos'][:10]:
-                        photo_reference = photo.get('photo_reference')
-                        if photo_reference:
-                            image_url = (
-                                f"https://maps.googleapis.com/maps/api/place/photo"
-                                f"?maxwidth=800&photo_reference={photo_reference}&key={self.api_key}"
-                            )
-                            image_urls.append(image_url)
-                
-                result['image_urls'] = image_urls
-                result['image_url'] = image_urls[0] if image_urls else "https://via.placeholder.com/400x300?text=Restaurant"
-                
-                self.logger.info(
-                    f"Found: {result.get('name')} "
-                    f"(rating: {result.get('rating')}, "
-                    f"reviews: {result.get('user_ratings_total')}, "
-                    f"images: {len(image_urls)})"
+                return None
+            
+            data = response.json()
+            
+            if data.get("status") != "OK":
+                self.logger.warning(
+                    f"API status {data.get('status')} for {name}"
                 )
-                return result
+                return None
+            
+            candidates = data.get("candidates", [])
+            if not candidates:
+                self.logger.warning(f"No candidates for {name}")
+                return None
+            
+            result = candidates[0]
+            
+            # ✅ 이미지 URL 추출 (최대 10개)
+            image_urls = []
+            if 'photos' in result and len(result['photos']) > 0:
+                for photo in result['photos'][:10]:
+                    photo_reference = photo.get('photo_reference')
+                    if photo_reference:
+                        image_url = (
+                            f"{self.base_url}/photo"
+                            f"?maxwidth=800&photo_reference={photo_reference}&key={self.api_key}"
+                        )
+                        image_urls.append(image_url)
+            
+            result['image_urls'] = image_urls
+            result['image_url'] = image_urls[0] if image_urls else "https://via.placeholder.com/400x300?text=Restaurant"
+            
+            self.logger.info(
+                f"Found: {result.get('name')} "
+                f"(rating: {result.get('rating')}, "
+                f"reviews: {result.get('user_ratings_total')}, "
+                f"images: {len(image_urls)})"
+            )
+            return result
         
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error for {name}: {e}")
@@ -126,23 +126,28 @@ class GooglePlacesAPI:
     
     async def batch_search(
         self, 
-        restaurants: List[Dict]
+        restaurants: List[Dict],
+        concurrency: int = 8
     ) -> List[Dict]:
         """
-        배치 처리 - 병렬로 처리하되 Rate Limit 준수
+        배치 처리 - 동시 요청 수를 제한해 병렬 처리하고 Rate Limit 준수
         
         Args:
             restaurants: [{"id": str, "name": str, "address": str}, ...]
+            concurrency: 동시에 진행할 최대 요청 수
         
         Returns:
             [{"restaurant_id": str, "google_data": dict}, ...]
         """
-        self.logger.info(f"Batch search: {len(restaurants)} restaurants")
+        self.logger.info(f"Batch search: {len(restaurants)} restaurants (concurrency={concurrency})")
         
-        tasks = [
-            self.search_place(r["name"], r["address"]) 
-            for r in restaurants
-        ]
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def search(restaurant: Dict) -> Optional[Dict]:
+            async with semaphore:
+                return await self.search_place(restaurant["name"], restaurant["address"])
+        
+        tasks = [search(r) for r in restaurants]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         successful = [
@@ -1,28 +1,52 @@
 """
 Naver Place Scraper using Apify
 """
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 import uuid
-from apify_client import ApifyClient
 from loguru import logger
 
 from src.scrapers.base import BaseScraper, ScrapedRestaurant
+from src.scrapers.apify_runner import ApifyActorRunner
 from config import settings
 
 
 class NaverPlaceScraper(BaseScraper):
     """네이버플레이스 스크래퍼 (Apify 사용)"""
     
-    def __init__(self):
+    # Apify Actor ID (네이버 플레이스 스크래퍼)
+    # delicious_zebu/naver-map-search-results-scraper (2025, 99% success rate)
+    ACTOR_ID = "delicious_zebu/naver-map-search-results-scraper"
+    
+    def __init__(self, run_timeout: float = 30 * 60):
         super().__init__(api_key=settings.apify_api_token)
         if not self.api_key:
             raise ValueError("APIFY_API_TOKEN not set")
         
-        self.client = ApifyClient(self.api_key)
+        self.runner = ApifyActorRunner(self.api_key)
+        self.actor_id = self.ACTOR_ID
+        self.run_timeout = run_timeout
+    
+    async def iter_search(
+        self,
+        keyword: str,
+        region: Optional[str] = None,
+        limit: int = 50
+    ) -> AsyncIterator[ScrapedRestaurant]:
+        """네이버 플레이스 검색 결과를 데이터셋 페이지 단위로 스트리밍"""
+        search_query = f"{region} {keyword}" if region else keyword
+        self.logger.info(f"Searching Naver: {search_query}")
+        
+        # Apify Actor 실행 (완료까지 long-poll, 이벤트 루프는 막지 않음)
+        run = await self.runner.call(
+            self.actor_id,
+            {"keywords": [search_query]},
+            timeout=self.run_timeout
+        )
         
-        # Apify Actor ID (네이버 플레이스 스크래퍼)
-        # delicious_zebu/naver-map-search-results-scraper (2025, 99% success rate)
-        self.actor_id = "delicious_zebu/naver-map-search-results-scraper"
+        async for item in self.runner.iter_items(run["defaultDatasetId"], limit=limit):
+            restaurant = self._parse_naver_item(item)
+            if restaurant:
+                yield restaurant
     
     async def search(
         self,
@@ -32,24 +56,7 @@ class NaverPlaceScraper(BaseScraper):
     ) -> List[ScrapedRestaurant]:
         """네이버 플레이스 검색"""
         try:
-            search_query = f"{region} {keyword}" if region else keyword
-            
-            self.logger.info(f"Searching Naver: {search_query}")
-            
-            # Apify Actor 실행
-            run_input = {
-                "keywords": [search_query]
-            }
-            
-            run = self.client.actor(self.actor_id).call(run_input=run_input)
-            
-            # 결과 가져오기
-            results = []
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
-                restaurant = self._parse_naver_item(item)
-                if restaurant:
-                    results.append(restaurant)
-            
+            results = [restaurant async for restaurant in self.iter_search(keyword, region, limit)]
             self.logger.info(f"Found {len(results)} restaurants from Naver")
             return results
             
@@ -68,9 +75,9 @@ class NaverPlaceScraper(BaseScraper):
                 "includeImages": True,
             }
             
-            run = self.client.actor(self.actor_id).call(run_input=run_input)
+            run = await self.runner.call(self.actor_id, run_input, timeout=self.run_timeout)
             
-            for item in self.client.dataset(run["defaultDatasetId"]).iterate_items():
+            async for item in self.runner.iter_items(run["defaultDatasetId"], limit=1):
                 return self._parse_naver_item(item)
             
             raise ValueError(f"No details found for {source_id}")
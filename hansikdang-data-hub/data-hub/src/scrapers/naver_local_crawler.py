@@ -0,0 +1,219 @@
+"""
+Naver Local search crawler
+한 번의 검색(1페이지)만 가져오던 수집을 페이지네이션 + 지역 fan-out으로 확장
+
+- start 오프셋을 따라 페이지를 순회 (결과가 끝나거나 max_start에 도달할 때까지)
+- 지역 쿼리를 하위 지역으로 분할 (static/regions-complete.json)
+  · "서울 한식" → "서울 강남구 한식", "서울 마포구 한식", ...
+  · "강남 한식" → 해당 구의 dongs 목록이 있으면 "역삼동 한식", ... (없으면 원래 쿼리)
+- 하위 쿼리는 동시 실행 수 제한 + rate limiter로 병렬 처리
+- 이미 수집된 source_id만 나오는 페이지를 만나면 해당 하위 쿼리는 조기 종료
+  (known_ids 인덱스로 판단, 인덱스 양성 후보만 DB 확인)
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Set
+from loguru import logger
+import httpx
+
+from src.database.connection import db_session
+from src.utils.known_ids import known_ids
+from src.utils.rate_limiter import RateLimiter
+
+
+REGIONS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "static", "regions-complete.json"
+)
+
+
+def load_regions(path: str = REGIONS_PATH) -> List[Dict[str, Any]]:
+    """지역 목록 로드 ({"full", "city", "district", "keywords", "dongs"(선택)})"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("regions", [])
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load regions from {path}: {e}")
+        return []
+
+
+def expand_query(query: str, regions: List[Dict[str, Any]]) -> List[str]:
+    """
+    검색 쿼리를 하위 지역 쿼리로 분할
+
+    keywords[0]은 시/도 약칭("서울"), 나머지는 구/시 이름("강남", "강남구")입니다.
+    """
+    tokens = query.split()
+
+    for i, token in enumerate(tokens):
+        rest = " ".join(tokens[:i] + tokens[i + 1:])
+
+        # 구/시 단위 매칭 → 동 단위 (dongs) 또는 같은 이름의 여러 구 ("안양" → 만안구, 동안구)
+        districts = [r for r in regions if token in r.get("keywords", [])[1:] or token == r.get("district")]
+        if districts:
+            dongs = [dong for r in districts for dong in r.get("dongs", [])]
+            if dongs:
+                return [f"{dong} {rest}".strip() for dong in dongs]
+            if len(districts) > 1:
+                return [f"{r['district']} {rest}".strip() for r in districts]
+            return [query]
+
+        # 시/도 단위 매칭 → 소속 구/시 전체
+        cities = [r for r in regions if r.get("keywords") and token in (r["keywords"][0], r.get("city"))]
+        if cities:
+            return [query] + [f"{token} {r['district']} {rest}".strip() for r in cities]
+
+    return [query]
+
+
+class NaverLocalCrawler:
+    """
+    네이버 Local 검색 페이지네이션 + 지역 fan-out 수집기
+
+    Usage:
+        crawler = NaverLocalCrawler(NaverMapsScraper())
+        result = await crawler.crawl("서울 한식")
+    """
+
+    def __init__(
+        self,
+        scraper,
+        concurrency: int = 4,
+        display: int = 100,
+        max_start: int = 1000,
+        requests_per_second: float = 10,
+        regions: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Args:
+            scraper: NaverMapsScraper
+            concurrency: 동시에 순회할 하위 쿼리 수
+            display: 페이지 크기
+            max_start: 최대 start 오프셋 (네이버 검색 API 제한)
+            requests_per_second: 네이버 API 호출 속도 제한
+        """
+        self.scraper = scraper
+        self.concurrency = concurrency
+        self.display = display
+        self.max_start = max_start
+        self.regions = regions if regions is not None else load_regions()
+        self.rate_limiter = RateLimiter(max_requests=requests_per_second, per_seconds=1, name="naver_local")
+        self.logger = logger.bind(scraper="naver_local_crawler")
+
+    @staticmethod
+    def collected_ids(source_ids: List[str]) -> Set[str]:
+        """이미 수집된 네이버 source_id (페이지 단위, 인덱스 양성 후보만 DB 조회)"""
+        with db_session() as db:
+            return known_ids.existing_ids(db, "naver", source_ids)
+
+    async def crawl(self, query: str, fan_out: bool = True, max_new: Optional[int] = None) -> Dict[str, Any]:
+        """
+        쿼리 수집
+
+        Args:
+            fan_out: 하위 지역 쿼리로 분할
+            max_new: 신규 장소가 이 수에 도달하면 중단
+
+        Returns:
+            {"places": 신규 장소 목록, "sub_queries", "api_calls", "items_seen", "new_places",
+             "new_per_call", "stopped_early", "elapsed_seconds"}
+        """
+        started = time.monotonic()
+        sub_queries = expand_query(query, self.regions) if fan_out else [query]
+        # 이번 실행에서 이미 본 장소 (하위 쿼리 간 중복)
+        known: Set[str] = set()
+
+        self.logger.info(
+            f"Crawling '{query}': {len(sub_queries)} sub-queries (concurrency={self.concurrency})"
+        )
+
+        stats = {"api_calls": 0, "items_seen": 0, "stopped_early": 0}
+        new_places: List[Dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        done = asyncio.Event()
+
+        async def crawl_sub_query(sub_query: str) -> None:
+            async with semaphore:
+                if not done.is_set():
+                    await self._paginate(sub_query, known, new_places, stats, done, max_new)
+
+        await asyncio.gather(*(crawl_sub_query(sub_query) for sub_query in sub_queries))
+
+        if max_new is not None:
+            new_places = new_places[:max_new]
+
+        result = {
+            "places": new_places,
+            "sub_queries": len(sub_queries),
+            "api_calls": stats["api_calls"],
+            "items_seen": stats["items_seen"],
+            "new_places": len(new_places),
+            "new_per_call": round(len(new_places) / stats["api_calls"], 2) if stats["api_calls"] else 0,
+            "stopped_early": stats["stopped_early"],
+            "elapsed_seconds": round(time.monotonic() - started, 2),
+        }
+        self.logger.info(
+            f"Crawl '{query}' done: {result['new_places']} new / {result['items_seen']} seen "
+            f"in {result['api_calls']} calls ({result['new_per_call']} new/call)"
+        )
+        return result
+
+    async def _paginate(
+        self,
+        sub_query: str,
+        known: Set[str],
+        new_places: List[Dict[str, Any]],
+        stats: Dict[str, int],
+        done: asyncio.Event,
+        max_new: Optional[int]
+    ) -> None:
+        """하위 쿼리 1개를 start 오프셋 순으로 순회"""
+        start = 1
+
+        while start <= self.max_start and not done.is_set():
+            await self.rate_limiter.acquire()
+            try:
+                data = await self.scraper.search_page(sub_query, start=start, display=self.display)
+            except httpx.HTTPStatusError as e:
+                # 허용 범위를 넘는 start는 400으로 응답 → 페이지 끝으로 처리
+                if e.response.status_code == 400 and start > 1:
+                    return
+                self.logger.error(f"  ❌ {sub_query} (start={start}): HTTP {e.response.status_code}")
+                return
+            except Exception as e:
+                self.logger.error(f"  ❌ {sub_query} (start={start}): {e}")
+                return
+            finally:
+                stats["api_calls"] += 1
+
+            items = data.get("items", [])
+            stats["items_seen"] += len(items)
+
+            source_ids = [self.scraper.place_source_id(place)[0] for place in items]
+            collected = await asyncio.to_thread(self.collected_ids, source_ids) if items else set()
+
+            page_new = 0
+            for place, source_id in zip(items, source_ids):
+                if source_id in known or source_id in collected:
+                    continue
+                # 다른 하위 쿼리와 겹치는 장소도 한 번만 수집
+                known.add(source_id)
+                new_places.append(place)
+                page_new += 1
+
+            if max_new is not None and len(new_places) >= max_new:
+                done.set()
+                return
+
+            if items and not page_new:
+                # 이미 알고 있는 장소만 나온 페이지 → 이후 페이지도 수확이 낮으므로 중단
+                stats["stopped_early"] += 1
+                return
+
+            # API가 display를 더 작게 제한할 수 있으므로 실제 반환 수만큼 이동
+            total = int(data.get("total") or 0)
+            start += len(items)
+            if not items or (total and start > total):
+                return
@@ -10,12 +10,13 @@ Phase 1 업그레이드:
 import httpx
 import uuid
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
 from config import settings
 from src.database.connection import db_session
-from src.database.models import RawRestaurantData
+from src.utils.http_client import http_clients
+from src.utils.known_ids import known_ids
 
 
 class NaverMapsScraper:
@@ -27,8 +28,8 @@ class NaverMapsScraper:
         
         self.client_id = settings.naver_client_id
         self.client_secret = settings.naver_client_secret
-        # 네이버 검색 API (Local) 사용
-        self.base_url = "https://openapi.naver.com/v1/search/local.json"
+        # 네이버 검색 API (Local) 사용 - 호스트는 공유 'naver' 클라이언트 설정 (settings.naver_api_base_url)
+        self.search_path = "/v1/search/local.json"
         self.logger = logger.bind(scraper="naver_maps")
     
     def extract_place_id(self, link: str) -> Optional[str]:
@@ -79,6 +80,52 @@ class NaverMapsScraper:
         
         return result
     
+    def place_source_id(self, place: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """
+        중복 판별용 source_id (PlaceID → link → 이름 순)
+        
+        Returns:
+            (source_id, place_id)
+        """
+        title = place.get("title", "").replace("<b>", "").replace("</b>", "")
+        link = place.get("link", "")
+        place_id = self.extract_place_id(link)
+        return (place_id if place_id else link if link else title), place_id
+    
+    async def search_page(
+        self,
+        query: str,
+        start: int = 1,
+        display: int = 100,
+        sort: str = "random"
+    ) -> Dict[str, Any]:
+        """
+        네이버 검색 API (Local) 1페이지 호출
+        
+        Returns:
+            API 응답 ({"total", "start", "display", "items"})
+        """
+        headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret
+        }
+        
+        params = {
+            "query": query,
+            "display": min(display, 100),  # 최대 100개 제한
+            "start": start,
+            "sort": sort
+        }
+        
+        client = http_clients.get("naver")
+        response = await client.get(
+            self.search_path,
+            headers=headers,
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+    
     async def search_restaurants(
         self,
         query: str = "홍대 한식",
@@ -97,34 +144,13 @@ class NaverMapsScraper:
             레스토랑 데이터 리스트
         """
         try:
-            headers = {
-                "X-Naver-Client-Id": self.client_id,
-                "X-Naver-Client-Secret": self.client_secret
-            }
-            
-            params = {
-                "query": query,
-                "display": min(display, 100),  # 최대 100개 제한
-                "start": 1,
-                "sort": "random"
-            }
-            
             self.logger.info(f"Searching: {query} (display={display})")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    headers=headers,
-                    params=params,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                places = data.get("items", [])
-                
-                self.logger.info(f"Found {len(places)} places")
-                return places
+            data = await self.search_page(query, start=1, display=display)
+            places = data.get("items", [])
+            
+            self.logger.info(f"Found {len(places)} places")
+            return places
         
         except httpx.HTTPStatusError as e:
             self.logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
@@ -143,26 +169,22 @@ class NaverMapsScraper:
         Returns:
             저장된 레스토랑 수
         """
-        saved_count = 0
+        rows = []
         
         with db_session() as db:
+            # ✅ 중복 체크 (PlaceID 또는 link 기준) - 인덱스 양성 후보만 DB 조회
+            existing = known_ids.existing_ids(
+                db, "naver", [self.place_source_id(place)[0] for place in places]
+            )
+            
             for place in places:
                 try:
                     # 네이버 Local API 응답에서 title에 HTML 태그 제거
                     title = place.get("title", "").replace("<b>", "").replace("</b>", "")
                     
                     # ✅ PlaceID 추출 (Phase 1)
-                    link = place.get("link", "")
-                    place_id = self.extract_place_id(link)
-                    
-                    # 중복 체크 (PlaceID 또는 link 기준)
-                    source_id = place_id if place_id else link if link else title
-                    existing = db.query(RawRestaurantData).filter(
-                        RawRestaurantData.source == "naver",
-                        RawRestaurantData.source_id == source_id
-                    ).first()
-                    
-                    if existing:
+                    source_id, place_id = self.place_source_id(place)
+                    if source_id in existing:
                         self.logger.debug(f"Skipping duplicate: {title}")
                         continue
                     
@@ -194,23 +216,24 @@ class NaverMapsScraper:
                     }
                     
                     # DB에 저장
-                    raw = RawRestaurantData(
-                        id=str(uuid.uuid4()),
-                        source="naver",
-                        source_id=source_id,
-                        place_id=place_id,  # ✅ PlaceID 컬럼에 저장
-                        raw_data=raw_data,
-                        status="pending"
-                    )
-                    db.add(raw)
-                    saved_count += 1
+                    rows.append({
+                        "id": str(uuid.uuid4()),
+                        "source": "naver",
+                        "source_id": source_id,
+                        "place_id": place_id,  # ✅ PlaceID 컬럼에 저장
+                        "raw_data": raw_data,
+                        "status": "pending",
+                    })
+                    existing.add(source_id)
                     
-                    self.logger.debug(f"Saved: {title} (PlaceID: {place_id})")
+                    self.logger.debug(f"Queued: {title} (PlaceID: {place_id})")
                 
                 except Exception as e:
                     self.logger.error(f"Failed to save place: {e}")
                     continue
             
+            # 인덱스가 놓친 기존 장소는 unique 제약으로 건너뜀
+            saved_count = len(known_ids.insert_new(db, rows))
             db.commit()
         
         self.logger.info(f"Saved {saved_count}/{len(places)} restaurants to database")
@@ -219,22 +242,31 @@ class NaverMapsScraper:
     async def scrape(
         self,
         query: str = "홍대 한식",
-        limit: int = 100
+        limit: int = 100,
+        crawl: bool = False
     ) -> Dict[str, Any]:
         """
         전체 스크래핑 프로세스 실행
         
         Args:
             query: 검색 쿼리
-            limit: 수집할 최대 개수
+            limit: 수집할 최대 개수 (crawl=True면 신규 장소 기준)
+            crawl: 페이지네이션 + 하위 지역 fan-out (NaverLocalCrawler)
         
         Returns:
             스크래핑 결과 통계
         """
-        self.logger.info(f"Starting scrape: {query} (limit={limit})")
+        self.logger.info(f"Starting scrape: {query} (limit={limit}, crawl={crawl})")
         
-        # API 호출
-        places = await self.search_restaurants(query=query, display=limit)
+        crawl_stats = {}
+        if crawl:
+            from src.scrapers.naver_local_crawler import NaverLocalCrawler
+            
+            crawl_stats = await NaverLocalCrawler(self).crawl(query, max_new=limit)
+            places = crawl_stats.pop("places")
+        else:
+            # API 호출
+            places = await self.search_restaurants(query=query, display=limit)
         
         # DB 저장
         saved_count = self.save_to_database(places)
@@ -243,7 +275,8 @@ class NaverMapsScraper:
             "query": query,
             "total_found": len(places),
             "saved_count": saved_count,
-            "duplicate_count": len(places) - saved_count
+            "duplicate_count": len(places) - saved_count,
+            **crawl_stats
         }
         
         self.logger.info(f"Scrape completed: {result}")
@@ -0,0 +1 @@
+"""Offline testing utilities"""
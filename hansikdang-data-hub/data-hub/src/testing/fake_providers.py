@@ -0,0 +1,376 @@
+"""
+Fake provider server
+외부 API(네이버 Local 검색, Google Places, Apify, 한식당 External API)를 흉내 내는 로컬 서버
+
+같은 쿼리에는 항상 같은 결과를 반환하므로(쿼리 해시 기반 생성) 자격 증명 없이
+파이프라인 처리량 벤치마크와 회귀 테스트를 오프라인에서 반복 실행할 수 있습니다.
+
+Usage:
+    python cli.py fake-providers --port 8099 --latency-ms 50
+
+    export NAVER_API_BASE_URL=http://localhost:8099
+    export GOOGLE_PLACES_BASE_URL=http://localhost:8099/maps/api/place
+    export APIFY_BASE_URL=http://localhost:8099/v2
+    export HANSIKDANG_API_URL=http://localhost:8099
+    export GEMINI_FAKE=true   # Gemini는 HTTP 서버 대신 FakeGeminiModel로 응답
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+from src.utils.compression import IDENTITY, SUPPORTED_ENCODINGS, decompressor
+
+
+NAME_PREFIXES = ["진미", "한우", "고향", "옛날", "명가", "솔", "바다", "하늘", "청춘", "할매", "우리", "전통"]
+NAME_SUFFIXES = ["식당", "한식", "갈비", "국밥", "냉면", "찌개", "보쌈", "칼국수", "삼계탕", "불고기"]
+CATEGORIES = ["한식>육류,고기요리", "한식>국밥", "한식>냉면", "한식>찌개,전골", "한식>백반,가정식"]
+DISTRICTS = ["강남구", "마포구", "종로구", "중구", "용산구", "서초구", "송파구", "영등포구"]
+
+# 쿼리별 전체 결과 수 (페이지네이션 종료 재현용)
+RESULTS_PER_QUERY = 60
+
+
+def _rng(*parts: Any) -> random.Random:
+    seed = hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return random.Random(int(seed[:16], 16))
+
+
+def fake_place(query: str, index: int) -> Dict[str, Any]:
+    """쿼리 + 순번 → 결정적인 가짜 장소"""
+    rng = _rng(query, index)
+    # 다른 쿼리에서도 같은 장소가 나오도록 장소 번호는 작은 공간에서 선택 (중복 제거 경로 검증)
+    place_no = rng.randrange(5000)
+    place_rng = _rng("place", place_no)
+    district = place_rng.choice(DISTRICTS)
+
+    return {
+        "place_no": place_no,
+        "name": f"{place_rng.choice(NAME_PREFIXES)}{place_rng.choice(NAME_SUFFIXES)} {place_no}호점",
+        "category": place_rng.choice(CATEGORIES),
+        "district": district,
+        "address": f"서울특별시 {district} 테스트로 {place_no % 300 + 1}",
+        "phone": f"02-{place_rng.randrange(200, 999)}-{place_rng.randrange(1000, 9999)}",
+        "lat": round(37.45 + place_rng.random() * 0.2, 6),
+        "lng": round(126.85 + place_rng.random() * 0.3, 6),
+        "rating": round(3.5 + place_rng.random() * 1.5, 1),
+        "reviews": place_rng.randrange(0, 3000),
+    }
+
+
+def _prompt_fields(prompt: str, label: str) -> List[str]:
+    """프롬프트의 "- 라벨: 값" 줄 값 목록"""
+    return [value.strip() for value in re.findall(rf"^- {label}: (.*)$", prompt, flags=re.MULTILINE)]
+
+
+class FakeGeminiModel:
+    """
+    GenerativeModel 대역 (generate_content_async만 구현)
+
+    GeminiProcessor의 프롬프트(정제/매칭/키워드 생성)를 알아보고 같은 입력에는 항상 같은
+    JSON 응답을 반환합니다. settings.gemini_fake가 켜져 있으면 GeminiProcessor가 사용합니다.
+    """
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.calls: Counter = Counter()
+
+    async def generate_content_async(self, prompt: str) -> SimpleNamespace:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        if "같은 식당인지" in prompt:
+            operation, result = "match", self._match(prompt)
+        elif "검색 키워드" in prompt:
+            operation, result = "keywords", self._keywords(prompt)
+        else:
+            operation, result = "refine", self._refine(prompt)
+
+        self.calls[operation] += 1
+        text = json.dumps(result, ensure_ascii=False)
+        return SimpleNamespace(
+            text=f"```json\n{text}\n```",
+            usage_metadata=SimpleNamespace(prompt_token_count=len(prompt) // 4, candidates_token_count=len(text) // 4),
+        )
+
+    @staticmethod
+    def _refine(prompt: str) -> Dict[str, Any]:
+        name = (_prompt_fields(prompt, "이름") or ["식당"])[0]
+        address = (_prompt_fields(prompt, "주소") or [""])[0]
+        phone = (_prompt_fields(prompt, "전화번호") or [""])[0]
+        district = next((part for part in address.split() if part.endswith("구")), None)
+        rng = _rng("gemini", name, address)
+        cuisine = rng.choice(NAME_SUFFIXES)
+        return {
+            "name": name,
+            "nameEn": f"Restaurant {hashlib.sha1(name.encode('utf-8')).hexdigest()[:6]}",
+            "category": "한식",
+            "cuisine": cuisine,
+            "district": district,
+            "address": address,
+            "description": f"{name}은(는) {district or '서울'}에 있는 {cuisine} 전문점입니다.",
+            "descriptionEn": f"A {cuisine} restaurant in {district or 'Seoul'}.",
+            "priceRange": str(rng.randrange(1, 5)),
+            "imageUrl": "https://via.placeholder.com/400x300?text=Restaurant",
+            "openHours": "11:00-22:00",
+            "phone": phone if phone and phone != "정보 없음" else None,
+        }
+
+    @staticmethod
+    def _match(prompt: str) -> Dict[str, Any]:
+        names = _prompt_fields(prompt, "이름")
+        is_match = len(names) == 2 and names[0] == names[1]
+        return {"is_match": is_match, "confidence": 0.9 if is_match else 0.1, "reason": "fake"}
+
+    @staticmethod
+    def _keywords(prompt: str) -> List[str]:
+        match = re.search(r"서울 (\S+) 지역.*?(\d+)개", prompt)
+        region, count = (match.group(1), int(match.group(2))) if match else ("강남", 10)
+        return [f"{region} {NAME_SUFFIXES[i % len(NAME_SUFFIXES)]} {i // len(NAME_SUFFIXES) + 1}" for i in range(count)]
+
+
+def create_app(
+    latency_ms: float = 0.0,
+    run_seconds: float = 2.0,
+    not_found_ratio: float = 0.1,
+    max_body_bytes: int = 0,
+    reject_ratio: float = 0.0,
+    accept_encodings: Sequence[str] = SUPPORTED_ENCODINGS,
+    ndjson: bool = True
+) -> FastAPI:
+    """
+    Args:
+        latency_ms: 모든 응답에 추가할 지연 (실제 API 응답 시간 재현)
+        run_seconds: Apify actor 실행 소요 시간
+        not_found_ratio: Google Places ZERO_RESULTS 비율
+        max_body_bytes: 한식당 API 요청 본문 한도 (초과 시 413, 0 = 제한 없음)
+        reject_ratio: 한식당 API가 레스토랑을 거부하는 비율 (재시도 경로 검증용)
+        accept_encodings: 한식당 API가 받는 요청 압축 방식 (그 외는 415, 협상 경로 검증용)
+        ndjson: 한식당 API의 NDJSON 스트리밍 업로드 지원 여부
+    """
+    app = FastAPI(title="Fake Providers", description="오프라인 테스트용 외부 API")
+    runs: Dict[str, Dict[str, Any]] = {}
+    datasets: Dict[str, List[Dict[str, Any]]] = {}
+    received_restaurants: List[Dict[str, Any]] = []
+    request_counts: Counter = Counter()
+    transfer_stats: Counter = Counter()
+
+    @app.middleware("http")
+    async def simulate_latency(request: Request, call_next):
+        request_counts[request.url.path.split("/")[1] if request.url.path != "/" else "/"] += 1
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return await call_next(request)
+
+    # ------------------------------------------------------------------
+    # 네이버 검색 API (Local)
+    # ------------------------------------------------------------------
+
+    @app.get("/v1/search/local.json")
+    async def naver_local(query: str, display: int = 5, start: int = 1, sort: str = "random"):
+        display = max(1, min(display, 100))
+        start = max(1, start)
+        items = []
+        for index in range(start - 1, min(start - 1 + display, RESULTS_PER_QUERY)):
+            place = fake_place(query, index)
+            items.append({
+                "title": f"<b>{place['name']}</b>",
+                "link": f"https://pcmap.place.naver.com/restaurant/{1000000 + place['place_no']}",
+                "category": place["category"],
+                "description": "",
+                "telephone": place["phone"],
+                "address": place["address"],
+                "roadAddress": place["address"],
+                # 네이버는 WGS84 좌표 × 10^7 정수 문자열
+                "mapx": str(int(place["lng"] * 10_000_000)),
+                "mapy": str(int(place["lat"] * 10_000_000)),
+            })
+        return {
+            "lastBuildDate": time.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+            "total": RESULTS_PER_QUERY,
+            "start": start,
+            "display": len(items),
+            "items": items,
+        }
+
+    # ------------------------------------------------------------------
+    # Google Places (Find Place)
+    # ------------------------------------------------------------------
+
+    @app.get("/maps/api/place/findplacefromtext/json")
+    async def places_find(input: str, inputtype: str = "textquery", fields: str = "", key: Optional[str] = None):
+        rng = _rng("places", input)
+        if rng.random() < not_found_ratio:
+            return {"candidates": [], "status": "ZERO_RESULTS"}
+
+        return {
+            "candidates": [{
+                "place_id": f"ChIJfake{hashlib.sha1(input.encode('utf-8')).hexdigest()[:20]}",
+                "name": input.split(" ")[0],
+                "rating": round(3.5 + rng.random() * 1.5, 1),
+                "user_ratings_total": rng.randrange(0, 2000),
+                "photos": [{"photo_reference": f"fakephoto{i}"} for i in range(rng.randrange(0, 4))],
+            }],
+            "status": "OK",
+        }
+
+    # ------------------------------------------------------------------
+    # Apify (actor runs / datasets)
+    # ------------------------------------------------------------------
+
+    def _run_view(run_id: str) -> Dict[str, Any]:
+        run = runs[run_id]
+        if run["status"] == "RUNNING" and time.monotonic() >= run["finishes_at"]:
+            run["status"] = "SUCCEEDED"
+        return {
+            "id": run_id,
+            "actId": run["actor"],
+            "status": run["status"],
+            "defaultDatasetId": run["dataset_id"],
+            "usageTotalUsd": round(0.0023 * len(datasets[run["dataset_id"]]) + 0.002, 4),
+            "stats": {"runTimeSecs": run_seconds},
+        }
+
+    async def _wait(run_id: str, wait_for_finish: int) -> Dict[str, Any]:
+        deadline = time.monotonic() + min(wait_for_finish, 60)
+        view = _run_view(run_id)
+        while view["status"] == "RUNNING" and time.monotonic() < deadline:
+            await asyncio.sleep(min(0.05, max(deadline - time.monotonic(), 0)))
+            view = _run_view(run_id)
+        return view
+
+    @app.post("/v2/acts/{actor_id}/runs", status_code=201)
+    async def apify_start(actor_id: str, request: Request, waitForFinish: int = 0):
+        run_input = await request.json()
+        per_keyword = int(run_input.get("maxResultsPerKeyword") or 20)
+
+        items = []
+        for keyword in run_input.get("keywords") or []:
+            for index in range(min(per_keyword, RESULTS_PER_QUERY)):
+                place = fake_place(keyword, index)
+                items.append({
+                    "Name": place["name"],
+                    "Address": place["address"],
+                    "Category": place["category"].split(">")[-1],
+                    "Contact": place["phone"],
+                    "OverallRating": place["rating"],
+                    "ReviewCount": place["reviews"],
+                    "MenuItems": [{"name": f"메뉴 {i + 1}", "price": f"{(i + 1) * 3000}원"} for i in range(3)],
+                    "BusinessHours": "11:00 - 22:00",
+                    "keyword": keyword,
+                })
+
+        run_id = uuid.uuid4().hex[:17]
+        dataset_id = uuid.uuid4().hex[:17]
+        datasets[dataset_id] = items
+        runs[run_id] = {
+            "actor": actor_id,
+            "status": "RUNNING",
+            "dataset_id": dataset_id,
+            "finishes_at": time.monotonic() + run_seconds,
+        }
+        return {"data": await _wait(run_id, waitForFinish)}
+
+    @app.get("/v2/actor-runs/{run_id}")
+    async def apify_run(run_id: str, waitForFinish: int = 0):
+        if run_id not in runs:
+            raise HTTPException(status_code=404, detail="Run not found")
+        return {"data": await _wait(run_id, waitForFinish)}
+
+    @app.post("/v2/actor-runs/{run_id}/abort")
+    async def apify_abort(run_id: str):
+        if run_id not in runs:
+            raise HTTPException(status_code=404, detail="Run not found")
+        runs[run_id]["status"] = "ABORTED"
+        return {"data": _run_view(run_id)}
+
+    @app.get("/v2/datasets/{dataset_id}/items")
+    async def apify_items(dataset_id: str, offset: int = 0, limit: int = 1000, clean: bool = True):
+        if dataset_id not in datasets:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        items = datasets[dataset_id]
+        return JSONResponse(
+            items[offset:offset + limit],
+            headers={"X-Apify-Pagination-Total": str(len(items))}
+        )
+
+    # ------------------------------------------------------------------
+    # 한식당 External API
+    # ------------------------------------------------------------------
+
+    @app.post("/api/external/restaurants")
+    @app.patch("/api/external/restaurants")
+    async def hansikdang_receive(request: Request):
+        if not request.headers.get("X-API-Key"):
+            raise HTTPException(status_code=401, detail="Missing API key")
+
+        encoding = request.headers.get("Content-Encoding", IDENTITY).lower()
+        if encoding != IDENTITY and encoding not in accept_encodings:
+            # RFC 7694: 지원하는 요청 인코딩을 Accept-Encoding으로 알려줌
+            return JSONResponse(
+                {"detail": f"Unsupported Content-Encoding: {encoding}"},
+                status_code=415,
+                headers={"Accept-Encoding": ", ".join(accept_encodings) or IDENTITY}
+            )
+
+        is_ndjson = request.headers.get("Content-Type", "").startswith("application/x-ndjson")
+        if is_ndjson and not ndjson:
+            return JSONResponse({"detail": "Unsupported Content-Type"}, status_code=415)
+
+        # 본문을 받는 대로 압축 해제 (NDJSON은 줄 단위로 파싱)
+        stream = decompressor(encoding)
+        wire_bytes = 0
+        raw = bytearray()
+        restaurants = []
+        async for chunk in request.stream():
+            wire_bytes += len(chunk)
+            if max_body_bytes and wire_bytes > max_body_bytes:
+                raise HTTPException(status_code=413, detail="Payload too large")
+            raw += stream.decompress(chunk)
+            if is_ndjson:
+                *lines, rest = bytes(raw).split(b"\n")
+                restaurants.extend(json.loads(line) for line in lines if line.strip())
+                raw = bytearray(rest)
+
+        transfer_stats["bytes_received"] += wire_bytes
+        transfer_stats["ndjson_requests" if is_ndjson else "json_requests"] += 1
+        if is_ndjson:
+            if raw.strip():
+                restaurants.append(json.loads(bytes(raw)))
+        else:
+            restaurants = json.loads(bytes(raw)).get("restaurants") or []
+
+        results = []
+        for restaurant in restaurants:
+            if random.random() < reject_ratio:
+                results.append({"success": False, "error": "Temporarily unavailable"})
+            else:
+                received_restaurants.append(restaurant)
+                results.append({"success": True})
+
+        succeeded = sum(1 for result in results if result["success"])
+        return {"success": succeeded, "failed": len(results) - succeeded, "results": results}
+
+    # ------------------------------------------------------------------
+    # 테스트 검증용
+    # ------------------------------------------------------------------
+
+    @app.get("/_fake/stats")
+    async def fake_stats():
+        return {
+            "requests": dict(request_counts),
+            "apify_runs": len(runs),
+            "restaurants_received": len(received_restaurants),
+            **transfer_stats,
+        }
+
+    return app
@@ -0,0 +1,96 @@
+"""
+Content-Encoding helpers
+HTTP 요청 본문/파일 압축 (gzip 기본, zstandard 설치 시 zstd)
+
+Usage:
+    body = compress(raw, "gzip")
+
+    stream = compressor("zstd")
+    chunks = [stream.compress(line) for line in lines] + [stream.flush()]
+"""
+import zlib
+from typing import List, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+IDENTITY = "identity"
+
+# 선호 순서 (압축률/속도 모두 zstd가 우수)
+SUPPORTED_ENCODINGS = ("zstd", "gzip") if ZSTD_AVAILABLE else ("gzip",)
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+class _IdentityStream:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def compressor(encoding: str):
+    """스트리밍 압축기 (compress(bytes) → bytes, flush() → bytes)"""
+    if encoding == "gzip":
+        return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31 → gzip 헤더
+    if encoding == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd encoding requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    if encoding == IDENTITY:
+        return _IdentityStream()
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """한 번에 압축"""
+    if encoding == IDENTITY:
+        return data
+    stream = compressor(encoding)
+    return stream.compress(data) + stream.flush()
+
+
+def decompressor(encoding: str):
+    """스트리밍 압축 해제기 (decompress(bytes) → bytes)"""
+    if encoding == "gzip":
+        return zlib.decompressobj(47)  # wbits=47 → gzip/zlib 헤더 자동 감지
+    if encoding == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd encoding requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompressobj()
+    if encoding in (IDENTITY, ""):
+        return _IdentityStream()
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def parse_accept_encoding(header: Optional[str]) -> List[str]:
+    """Accept-Encoding 헤더 → 인코딩 목록 (q=0 제외, 선언 순서 유지)"""
+    encodings = []
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        encodings.append(name.strip().lower())
+    return encodings
+
+
+def preferred_encoding(setting: str) -> str:
+    """설정값(auto | zstd | gzip | none) → 사용할 인코딩"""
+    if setting == "auto":
+        return SUPPORTED_ENCODINGS[0]
+    if setting == "none":
+        return IDENTITY
+    if setting not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported compression '{setting}' (available: auto, none, {', '.join(SUPPORTED_ENCODINGS)})")
+    return setting
@@ -0,0 +1,306 @@
+"""
+Shared HTTP client registry
+외부 연동(Google Places, Naver, Apify, Outscraper, 한식당)별 재사용 httpx.AsyncClient 관리
+
+- 호스트별 커넥션 한도 / keep-alive / timeout
+- HTTP/2 (h2 패키지가 설치된 경우)
+- 429/5xx, 연결 오류 재시도 (Retry-After 준수, 지수 백오프)
+  · 본문을 다시 보낼 수 없는 스트리밍 요청은 extensions={NO_RETRY: True}로 재시도 제외
+- 커넥션 재사용 메트릭 (신규 TCP/TLS 연결 수 vs 요청 수)
+- 응답 기록/재생 (settings.http_replay_mode, src/utils/http_replay.py)
+
+Usage:
+    client = http_clients.get("google_places")
+    response = await client.get("/findplacefromtext/json", params=params)
+
+앱/스케줄러 시작 시 startup(), 종료 시 aclose()를 호출합니다.
+클라이언트는 이벤트 루프별로 생성되므로 asyncio.run()을 여러 번 호출하는 CLI에서도 안전합니다.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from loguru import logger
+import httpx
+
+from config import settings
+from src.monitoring.metrics import EXTERNAL_REQUESTS, EXTERNAL_REQUEST_SECONDS, EXTERNAL_RETRIES
+from src.utils.http_replay import wrap_transport
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# 요청 extension - True면 RetryTransport가 재시도하지 않음 (async generator 본문 등 재전송 불가 요청)
+NO_RETRY = "no_retry"
+
+
+@dataclass
+class ClientConfig:
+    """연동별 클라이언트 설정"""
+    base_url: str = ""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 30.0
+    http2: bool = True
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    # 재시도 정책
+    max_retries: int = 3
+    backoff_base: float = 0.5  # 초, 2^n 배
+    backoff_max: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    # 서버 처리 여부를 알 수 없는 5xx는 멱등 메서드만 재시도 (429/연결 실패는 모든 메서드)
+    idempotent_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+
+@dataclass
+class ClientMetrics:
+    """클라이언트별 요청/커넥션 통계"""
+    requests: int = 0
+    responses: int = 0
+    errors: int = 0
+    retries: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+    http2_responses: int = 0
+    total_latency: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(self.requests - self.new_connections, 0)
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "errors": self.errors,
+            "retries": self.retries,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0,
+            "http2_responses": self.http2_responses,
+            "avg_latency_ms": round(self.total_latency / self.responses * 1000, 1) if self.responses else 0,
+            "status_counts": dict(self.status_counts),
+        }
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """429/5xx/연결 오류 재시도 transport"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, config: ClientConfig, metrics: ClientMetrics, name: str):
+        self._transport = transport
+        self.config = config
+        self.metrics = metrics
+        self.name = name
+        self.logger = logger.bind(http_client=name)
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.config.backoff_max)
+                except ValueError:
+                    pass
+        delay = self.config.backoff_base * (2 ** attempt)
+        return min(delay, self.config.backoff_max) * (0.5 + random.random() / 2)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in self.config.idempotent_methods
+        max_retries = 0 if request.extensions.get(NO_RETRY) else self.config.max_retries
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                # 연결 단계 실패는 요청이 서버에 도달하지 않았으므로 모든 메서드 재시도 가능
+                connect_failure = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                if not connect_failure or attempt >= max_retries:
+                    self.metrics.errors += 1
+                    EXTERNAL_REQUESTS.inc(client=self.name, status="error")
+                    raise
+                delay = self._backoff(attempt)
+                self.logger.warning(f"{request.method} {request.url.host}: {type(e).__name__}, retry in {delay:.1f}s")
+            else:
+                retryable = response.status_code in self.config.retry_statuses and (
+                    idempotent or response.status_code == 429
+                )
+                if not retryable or attempt >= max_retries:
+                    return response
+
+                delay = self._backoff(attempt, response)
+                self.logger.warning(
+                    f"{request.method} {request.url.host}: HTTP {response.status_code}, retry in {delay:.1f}s"
+                )
+                await response.aclose()
+
+            attempt += 1
+            self.metrics.retries += 1
+            EXTERNAL_RETRIES.inc(client=self.name)
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HTTPClientRegistry:
+    """연동 이름 → 공유 AsyncClient"""
+
+    def __init__(self):
+        self._configs: Dict[str, ClientConfig] = {}
+        self._clients: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._metrics: Dict[str, ClientMetrics] = {}
+
+    def register(self, name: str, **config: Any) -> ClientConfig:
+        """연동 설정 등록 (이미 생성된 클라이언트에는 다음 생성부터 적용)"""
+        self._configs[name] = ClientConfig(**config)
+        self._metrics.setdefault(name, ClientMetrics())
+        return self._configs[name]
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """현재 이벤트 루프용 공유 클라이언트 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        key = (name, id(loop))
+
+        entry = self._clients.get(key)
+        if entry and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+
+        # 종료된 루프의 클라이언트 정리 (커넥션은 루프와 함께 이미 사용 불가)
+        for stale_key in [k for k, (l, _) in self._clients.items() if l.is_closed()]:
+            del self._clients[stale_key]
+
+        client = self._create(name)
+        self._clients[key] = (loop, client)
+        return client
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        if name not in self._configs:
+            raise KeyError(f"Unknown HTTP client: {name}")
+
+        config = self._configs[name]
+        metrics = self._metrics[name]
+        http2 = config.http2 and HTTP2_AVAILABLE
+
+        # HTTP_REPLAY_MODE=record/replay 이면 fixture 기록/재생 transport 사용
+        base_transport = wrap_transport(
+            name,
+            httpx.AsyncHTTPTransport(http2=http2, limits=config.limits),
+            settings.http_replay_mode,
+            settings.http_replay_dir
+        )
+        transport = RetryTransport(base_transport, config, metrics, name)
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                metrics.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                metrics.tls_handshakes += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            request.extensions["trace"] = trace
+            request.extensions["started_at"] = time.monotonic()
+            metrics.requests += 1
+
+        async def on_response(response: httpx.Response) -> None:
+            metrics.responses += 1
+            metrics.status_counts[response.status_code] = metrics.status_counts.get(response.status_code, 0) + 1
+            if response.http_version == "HTTP/2":
+                metrics.http2_responses += 1
+            EXTERNAL_REQUESTS.inc(client=name, status=str(response.status_code))
+            started_at = response.request.extensions.get("started_at")
+            if started_at:
+                metrics.total_latency += time.monotonic() - started_at
+                EXTERNAL_REQUEST_SECONDS.observe(time.monotonic() - started_at, client=name)
+
+        logger.debug(f"Creating HTTP client: {name} (http2={http2}, max_connections={config.max_connections})")
+
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            headers=config.headers,
+            timeout=config.timeout,
+            transport=transport,
+            event_hooks={"request": [on_request], "response": [on_response]},
+        )
+
+    async def startup(self) -> None:
+        """등록된 클라이언트를 현재 루프에 미리 생성"""
+        for name in self._configs:
+            self.get(name)
+        logger.info(f"🌐 HTTP clients ready: {', '.join(self._configs)} (http2={'on' if HTTP2_AVAILABLE else 'off'})")
+
+    async def aclose(self) -> None:
+        """현재 루프의 클라이언트 종료"""
+        loop = asyncio.get_running_loop()
+        for key, (client_loop, client) in list(self._clients.items()):
+            if client_loop is loop:
+                await client.aclose()
+                del self._clients[key]
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """연동별 커넥션 재사용 메트릭"""
+        return {name: metrics.to_dict() for name, metrics in self._metrics.items()}
+
+
+http_clients = HTTPClientRegistry()
+
+# Google Places: batch_search에서 다수 요청이 동시에 발생
+http_clients.register(
+    "google_places",
+    base_url=settings.google_places_base_url,
+    max_connections=20,
+    max_keepalive_connections=20,
+    read_timeout=10.0,
+)
+http_clients.register(
+    "naver",
+    base_url=settings.naver_api_base_url,
+    max_connections=10,
+    read_timeout=30.0,
+)
+# Apify: actor 실행 대기/데이터셋 다운로드로 응답이 느림
+http_clients.register(
+    "apify",
+    base_url=settings.apify_base_url,
+    max_connections=10,
+    read_timeout=300.0,
+)
+http_clients.register(
+    "outscraper",
+    base_url=settings.outscraper_base_url,
+    max_connections=5,
+    read_timeout=60.0,
+)
+# 한식당 External API: POST(비멱등)는 429/연결 실패만 재시도
+http_clients.register(
+    "hansikdang",
+    base_url=settings.hansikdang_api_url,
+    max_connections=5,
+    read_timeout=60.0,
+)
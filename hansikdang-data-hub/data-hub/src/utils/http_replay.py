@@ -0,0 +1,203 @@
+"""
+HTTP record/replay transport
+공유 HTTP 클라이언트의 실제 응답을 압축 fixture로 기록하고, 자격 증명/네트워크 없이 그대로 재생
+
+- 기록: {http_replay_dir}/{client}.jsonl.gz (gzip JSONL, 요청당 1줄)
+- 재생: (메서드, 경로, 쿼리, 본문 해시)가 같은 요청에 기록된 응답을 순서대로 반환
+  (같은 요청을 여러 번 기록했다면 기록 순서대로, 소진되면 마지막 응답 반복 → Apify 상태 폴링 재현)
+  · 본문에 실행마다 달라지는 값(UUID 등)이 있으면 본문 해시를 빼고 (메서드, 경로, 쿼리)로 다시 매칭
+  · 남은 시간에 따라 바뀌는 long-poll 파라미터(waitForFinish)는 매칭에서 제외
+- API 키/토큰은 쿼리/헤더에서 제거한 뒤 기록하고 매칭에서도 제외
+
+Usage:
+    HTTP_REPLAY_MODE=record python cli.py scrape-naver   # 실제 API 호출 + 기록
+    HTTP_REPLAY_MODE=replay python cli.py scrape-naver   # fixture로 재생 (오프라인)
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+import httpx
+
+
+# 기록/매칭에서 제외하는 자격 증명
+SECRET_PARAMS = frozenset({"token", "key", "apikey", "api_key", "access_token"})
+SECRET_HEADERS = frozenset({
+    "authorization", "x-api-key", "x-naver-client-id", "x-naver-client-secret", "cookie", "set-cookie"
+})
+
+# 실행 시점에 따라 값이 달라지는 파라미터 (매칭에서 제외)
+VOLATILE_PARAMS = frozenset({"waitforfinish"})
+
+# 저장 시 본문을 디코딩된 상태로 기록하므로 전송 관련 헤더는 제외
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class ReplayMissError(httpx.TransportError):
+    """재생 모드에서 기록되지 않은 요청"""
+
+
+def request_key(request: httpx.Request) -> str:
+    """요청 매칭 키 (자격 증명/가변 파라미터 제외, 쿼리 파라미터 정렬)"""
+    params = sorted(
+        (key, value) for key, value in request.url.params.multi_items()
+        if key.lower() not in SECRET_PARAMS and key.lower() not in VOLATILE_PARAMS
+    )
+    body = request.content or b""
+    body_hash = hashlib.sha1(body).hexdigest()[:16] if body else "-"
+    query = "&".join(f"{key}={value}" for key, value in params)
+    return f"{request.method} {request.url.path}?{query} {body_hash}"
+
+
+def _bodiless_key(key: str) -> str:
+    """본문 해시를 뺀 매칭 키"""
+    return key.rsplit(" ", 1)[0]
+
+
+def _redacted_url(url: httpx.URL) -> str:
+    params = [
+        (key, "REDACTED" if key.lower() in SECRET_PARAMS else value)
+        for key, value in url.params.multi_items()
+    ]
+    return str(url.copy_with(params=params))
+
+
+class ReplayArchive:
+    """gzip JSONL fixture 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """항목 추가 (gzip 멤버 단위로 이어 쓰므로 기록 중단 시에도 앞부분은 유효)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock, gzip.open(self.path, "ab") as f:
+            f.write(line)
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """요청 키 → 기록된 응답 목록 (기록 순서)"""
+        entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        if not os.path.exists(self.path):
+            return entries
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries[entry["key"]].append(entry)
+        return entries
+
+
+def _encode_body(content: bytes) -> Tuple[str, str]:
+    try:
+        return "text", content.decode("utf-8")
+    except UnicodeDecodeError:
+        return "base64", base64.b64encode(content).decode("ascii")
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if entry.get("encoding") == "base64":
+        return base64.b64decode(entry["body"])
+    return entry["body"].encode("utf-8")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 요청을 보내고 응답을 fixture에 기록"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, archive: ReplayArchive):
+        self._transport = transport
+        self.archive = archive
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()  # 스트리밍 본문(NDJSON 업로드 등)도 매칭 키 계산 가능하도록
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+
+        headers = [
+            (key, value) for key, value in response.headers.multi_items()
+            if key.lower() not in DROPPED_RESPONSE_HEADERS and key.lower() not in SECRET_HEADERS
+        ]
+        encoding, body = _encode_body(content)
+
+        self.archive.append({
+            "key": request_key(request),
+            "method": request.method,
+            "url": _redacted_url(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "encoding": encoding,
+            "body": body,
+        })
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            content=content,
+            request=request,
+            extensions={"http_version": response.extensions.get("http_version", b"HTTP/1.1")},
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """기록된 응답으로 재생 (네트워크 사용 안 함)"""
+
+    def __init__(self, archive: ReplayArchive):
+        self.archive = archive
+        self._entries = archive.load()
+        self._by_endpoint: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for key, recorded in self._entries.items():
+            self._by_endpoint[_bodiless_key(key)].extend(recorded)
+        self._cursors: Dict[str, int] = defaultdict(int)
+        logger.info(f"▶️  Replaying {sum(len(v) for v in self._entries.values())} recorded responses from {archive.path}")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        key = request_key(request)
+        recorded = self._entries.get(key)
+        if not recorded and request.content:
+            key = _bodiless_key(key)
+            recorded = self._by_endpoint.get(key)
+        if not recorded:
+            raise ReplayMissError(f"No recorded response for {key} in {self.archive.path}", request=request)
+
+        index = min(self._cursors[key], len(recorded) - 1)
+        self._cursors[key] += 1
+        entry = recorded[index]
+
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=_decode_body(entry),
+            request=request,
+        )
+
+
+def wrap_transport(
+    name: str,
+    transport: httpx.AsyncBaseTransport,
+    mode: Optional[str],
+    directory: str
+) -> httpx.AsyncBaseTransport:
+    """설정된 모드에 따라 transport 교체 (mode가 없으면 그대로 반환)"""
+    if not mode:
+        return transport
+
+    archive = ReplayArchive(os.path.join(directory, f"{name}.jsonl.gz"))
+    if mode == "record":
+        logger.info(f"⏺️  Recording {name} responses to {archive.path}")
+        return RecordingTransport(transport, archive)
+    if mode == "replay":
+        return ReplayTransport(archive)
+
+    raise ValueError(f"Invalid http_replay_mode '{mode}' (expected 'record' or 'replay')")
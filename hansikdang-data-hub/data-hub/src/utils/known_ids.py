@@ -0,0 +1,365 @@
+"""
+Known source ID index
+이미 수집된 (source, source_id)를 64비트 해시 정렬 배열(mmap 파일)로 보관해 DB 조회 없이 중복 여부 판단
+
+- 파일: 32바이트 헤더 + 정렬된 uint64 해시 배열 → mmap 후 이진 탐색 (프로세스 간 공유, 메모리 복사 없음)
+- 신규 삽입은 메모리 delta 집합에 추가하고, flush() 시 파일과 병합해 원자적으로 교체
+- 다른 프로세스가 삽입한 행은 watermark(scraped_at) 이후 행을 주기적으로 DB에서 가져와 반영
+  → "없음" 판정은 그대로 신뢰, "있음" 판정(해시 충돌/삭제된 행 가능)만 DB로 확인
+- catch-up이 놓치는 행(watermark 이전 scraped_at, 5분 넘게 걸린 트랜잭션)은 insert_new()가
+  (source, source_id) unique 제약(uq_raw_source_id)으로 건너뛰므로 중복 삽입되지 않음
+
+Usage:
+    with db_session() as db:
+        existing = known_ids.existing_ids(db, 'naver', source_ids)  # 양성 후보만 DB 조회
+        inserted = known_ids.insert_new(db, rows)  # 중복은 건너뛰고 삽입 + 인덱스 반영
+"""
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from loguru import logger
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config import settings
+from src.database.connection import db_session
+from src.database.models import ProcessedRestaurant, RawRestaurantData
+
+
+MAGIC = b"KIDX"
+VERSION = 1
+# magic, version, count, watermark(epoch), reserved → 8바이트 정렬
+HEADER = struct.Struct("<4sIQdQ")
+
+# DB 시계/커밋 지연을 고려해 watermark 이전 구간도 다시 가져옴
+CATCH_UP_OVERLAP = timedelta(minutes=5)
+
+
+def id_hash(source: str, source_id: str) -> int:
+    """(source, source_id) → 64비트 해시"""
+    digest = hashlib.blake2b(f"{source}\x00{source_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class KnownIdIndex:
+    """수집된 source ID 집합 (정렬 해시 mmap + 메모리 delta)"""
+
+    def __init__(self, path: str, refresh_interval: float = 30.0, flush_threshold: int = 50_000):
+        """
+        Args:
+            path: 인덱스 파일 경로
+            refresh_interval: 다른 프로세스 삽입분을 DB에서 가져오는 주기 (초)
+            flush_threshold: delta가 이 크기를 넘으면 파일로 병합
+        """
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.flush_threshold = flush_threshold
+
+        self._lock = threading.RLock()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._hashes = memoryview(b"").cast("Q")
+        self._delta: Set[int] = set()
+        self._watermark = 0.0
+        self._refreshed_at = 0.0
+        self._loaded = False
+        self._stats = {"lookups": 0, "negatives": 0, "positives": 0, "confirmed": 0}
+
+    # ------------------------------------------------------------------
+    # 로드 / 저장
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """인덱스 파일 로드 (없으면 DB에서 생성) 후 최신 행 반영"""
+        with self._lock:
+            started = time.monotonic()
+            if os.path.exists(self.path):
+                self._map_file()
+            else:
+                self._build_from_db()
+
+            self._loaded = True
+            self.refresh(force=True)
+            logger.info(
+                f"📇 Known ID index loaded: {len(self._hashes) + len(self._delta)} ids "
+                f"in {time.monotonic() - started:.2f}s ({self.path})"
+            )
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def _map_file(self) -> None:
+        self._unmap()
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError(f"Corrupt known ID index: {self.path}")
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, watermark, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION or size != HEADER.size + count * 8:
+            raise ValueError(f"Corrupt known ID index: {self.path}")
+
+        self._hashes = memoryview(self._mmap)[HEADER.size:].cast("Q")
+        self._watermark = watermark
+
+    def _unmap(self) -> None:
+        if self._hashes is not None:
+            self._hashes.release()
+            self._hashes = memoryview(b"").cast("Q")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, hashes: List[int], watermark: float) -> None:
+        """정렬된 해시를 임시 파일에 쓰고 원자적으로 교체"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(hashes), watermark, 0))
+            f.write(struct.pack(f"<{len(hashes)}Q", *hashes))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _build_from_db(self) -> None:
+        """전체 raw_restaurant_data에서 인덱스 생성"""
+        hashes = set()
+        watermark = 0.0
+        with db_session() as db:
+            query = db.query(
+                RawRestaurantData.source, RawRestaurantData.source_id, RawRestaurantData.scraped_at
+            ).yield_per(10_000)
+            for source, source_id, scraped_at in query:
+                hashes.add(id_hash(source, source_id))
+                if scraped_at:
+                    watermark = max(watermark, self._epoch(scraped_at))
+
+        self._write(sorted(hashes), watermark)
+        self._map_file()
+
+    def flush(self) -> None:
+        """delta를 파일에 병합 (다른 프로세스가 먼저 교체했으면 그 내용도 포함)"""
+        with self._lock:
+            if not self._delta:
+                return
+
+            merged = set(self._delta)
+            watermark = self._watermark
+            if os.path.exists(self.path):
+                self._map_file()  # 최신 파일 기준으로 병합
+                merged.update(self._hashes)
+                watermark = max(watermark, self._watermark)
+
+            self._unmap()
+            self._write(sorted(merged), watermark)
+            self._delta.clear()
+            self._map_file()
+            logger.debug(f"Known ID index flushed: {len(self._hashes)} ids")
+
+    def close(self) -> None:
+        """종료 시 delta 저장"""
+        with self._lock:
+            if self._loaded:
+                self.flush()
+            self._unmap()
+            self._loaded = False
+
+    # ------------------------------------------------------------------
+    # DB 동기화
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _epoch(value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    def refresh(self, force: bool = False) -> int:
+        """watermark 이후 삽입된 행을 delta에 반영 (다른 프로세스/경로의 삽입분)"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._refreshed_at < self.refresh_interval:
+                return 0
+            self._refreshed_at = now
+
+            since = datetime.fromtimestamp(self._watermark, timezone.utc) - CATCH_UP_OVERLAP
+            added = 0
+            with db_session() as db:
+                if db.bind.dialect.name == "sqlite":
+                    since = since.replace(tzinfo=None)
+                rows = db.query(
+                    RawRestaurantData.source, RawRestaurantData.source_id, RawRestaurantData.scraped_at
+                ).filter(RawRestaurantData.scraped_at >= since).yield_per(10_000)
+
+                for source, source_id, scraped_at in rows:
+                    value = id_hash(source, source_id)
+                    if not self._contains_hash(value):
+                        self._delta.add(value)
+                        added += 1
+                    if scraped_at:
+                        self._watermark = max(self._watermark, self._epoch(scraped_at))
+
+            return added
+
+    # ------------------------------------------------------------------
+    # 조회 / 추가
+    # ------------------------------------------------------------------
+
+    def _contains_hash(self, value: int) -> bool:
+        if value in self._delta:
+            return True
+        hashes = self._hashes
+        index = bisect.bisect_left(hashes, value)
+        return index < len(hashes) and hashes[index] == value
+
+    def might_contain(self, source: str, source_id: str) -> bool:
+        """False면 확실히 미수집, True면 수집되었을 가능성 (DB 확인 필요)"""
+        return bool(self.split_known(source, [source_id])[1])
+
+    def split_known(self, source: str, source_ids: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Returns:
+            (확실히 새로운 ID, 이미 수집되었을 수 있는 ID)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self.refresh()
+
+            new, maybe_known = [], []
+            for source_id in source_ids:
+                (maybe_known if self._contains_hash(id_hash(source, source_id)) else new).append(source_id)
+
+            self._stats["lookups"] += len(new) + len(maybe_known)
+            self._stats["negatives"] += len(new)
+            self._stats["positives"] += len(maybe_known)
+            return new, maybe_known
+
+    def existing_ids(self, db: Session, source: str, source_ids: Iterable[str]) -> Set[str]:
+        """DB에 실제로 존재하는 source_id (인덱스 양성 후보만 DB 조회)"""
+        _, maybe_known = self.split_known(source, source_ids)
+        if not maybe_known:
+            return set()
+
+        existing = set()
+        for i in range(0, len(maybe_known), 500):
+            existing.update(
+                row.source_id for row in db.query(RawRestaurantData.source_id).filter(
+                    RawRestaurantData.source == source,
+                    RawRestaurantData.source_id.in_(maybe_known[i:i + 500])
+                ).all()
+            )
+
+        with self._lock:
+            self._stats["confirmed"] += len(existing)
+        return existing
+
+    def add_many(self, source: str, source_ids: Iterable[str]) -> None:
+        """삽입한 ID 반영 (delta가 커지면 파일로 병합)"""
+        with self._lock:
+            self._ensure_loaded()
+            for source_id in source_ids:
+                self._delta.add(id_hash(source, source_id))
+
+            if len(self._delta) >= self.flush_threshold:
+                self.flush()
+
+    def insert_new(self, db: Session, rows: List[Dict[str, Any]]) -> Set[str]:
+        """
+        raw_restaurant_data 일괄 삽입 - (source, source_id)가 이미 있는 행은 건너뜀
+
+        삽입된 행은 인덱스에 반영합니다 (커밋은 호출자).
+
+        Returns:
+            실제로 삽입된 행의 id
+        """
+        if not rows:
+            return set()
+
+        # executemany는 모든 행의 키가 같아야 함
+        keys = {key for row in rows for key in row}
+        rows = [{key: row.get(key) for key in keys} for row in rows]
+        table = RawRestaurantData.__table__
+
+        dialect = db.bind.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            # 충돌 대상을 지정하지 않아 unique 인덱스가 아직 없는 DB에서도 오류 없이 삽입
+            statement = insert(table).on_conflict_do_nothing().returning(table.c.id)
+            inserted = {row.id for row in db.execute(statement, rows)}
+        else:
+            inserted = set()
+            for row in rows:
+                try:
+                    with db.begin_nested():
+                        db.execute(table.insert(), [row])
+                    inserted.add(row["id"])
+                except IntegrityError:
+                    continue
+
+        by_source: Dict[str, List[str]] = {}
+        for row in rows:
+            if row["id"] in inserted:
+                by_source.setdefault(row["source"], []).append(row["source_id"])
+        for source, source_ids in by_source.items():
+            self.add_many(source, source_ids)
+        return inserted
+
+    def stats(self) -> Dict[str, int]:
+        """조회 통계 (false_positives = 양성이었지만 DB에 없던 수)"""
+        with self._lock:
+            return {
+                **self._stats,
+                "false_positives": self._stats["positives"] - self._stats["confirmed"],
+                "indexed": len(self._hashes),
+                "delta": len(self._delta),
+            }
+
+
+def dedupe_raw_sources(db: Session) -> int:
+    """
+    (source, source_id)가 중복된 raw_restaurant_data 정리 (uq_raw_source_id 생성 전 1회)
+
+    가장 먼저 수집된 행을 남기고, 나머지를 가리키던 processed_restaurants.mapping_id를
+    남은 행으로 옮긴 뒤 삭제합니다.
+
+    Returns:
+        삭제한 행 수
+    """
+    duplicates = db.query(RawRestaurantData.source, RawRestaurantData.source_id).group_by(
+        RawRestaurantData.source, RawRestaurantData.source_id
+    ).having(func.count() > 1).all()
+
+    removed = 0
+    for source, source_id in duplicates:
+        ids = [row.id for row in db.query(RawRestaurantData.id).filter(
+            RawRestaurantData.source == source,
+            RawRestaurantData.source_id == source_id
+        ).order_by(RawRestaurantData.scraped_at, RawRestaurantData.id)]
+        keep, drop = ids[0], ids[1:]
+
+        db.query(ProcessedRestaurant).filter(ProcessedRestaurant.mapping_id.in_(drop)).update(
+            {"mapping_id": keep}, synchronize_session=False
+        )
+        removed += db.query(RawRestaurantData).filter(RawRestaurantData.id.in_(drop)).delete(
+            synchronize_session=False
+        )
+
+    return removed
+
+
+known_ids = KnownIdIndex(settings.known_ids_path)
@@ -1,45 +1,359 @@
 """
 Rate Limiter - API 요청 속도 제한
+
+Token bucket 방식:
+- 초당 max_requests / per_seconds 개의 토큰이 채워지고, burst 개까지 쌓임
+- acquire()는 토큰을 즉시 예약하고 부족분만큼만 대기 → 호출 순서대로(FIFO) 통과
+- 키별 버킷 (API 키, 호스트, 엔드포인트 단위 제한) - 전체(제공자) 버킷과 함께 차감되므로 키 합계도 전체 쿼터를 넘지 않음
+- 공유 백엔드 (파일 잠금 / PostgreSQL)로 여러 프로세스가 하나의 쿼터를 나눠 사용
 """
 import asyncio
-from collections import deque
-from time import time
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
+from src.monitoring.metrics import RATE_LIMIT_WAIT_SECONDS
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+@dataclass
+class BucketSpec:
+    """버킷 설정"""
+    rate: float  # 초당 토큰
+    capacity: float  # 최대 토큰 (burst)
+
+
+class LocalBackend:
+    """프로세스 내 버킷 (기본)"""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key → (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def reserve_until(self, key: str, tokens: float, spec: BucketSpec) -> float:
+        """토큰 예약 후 통과 가능한 시각(time.monotonic 기준) 반환 (부족분은 빚으로 기록)"""
+        with self._lock:
+            now = time.monotonic()
+            available, updated_at = self._buckets.get(key, (spec.capacity, now))
+            available = min(spec.capacity, available + (now - updated_at) * spec.rate)
+            available -= tokens
+            self._buckets[key] = (available, now)
+
+        # 예약 순서대로 1/rate씩 늦어지는 시각 (대기 시간으로 바꾸는 시점과 무관하게 FIFO 유지)
+        return now + max(0.0, -available / spec.rate)
+
+    def reserve(self, key: str, tokens: float, spec: BucketSpec) -> float:
+        """토큰 예약 후 대기해야 할 시간(초) 반환"""
+        return max(0.0, self.reserve_until(key, tokens, spec) - time.monotonic())
+
+    def refund(self, key: str, tokens: float, spec: BucketSpec) -> None:
+        """대기 중 취소된 예약 반환"""
+        with self._lock:
+            if key in self._buckets:
+                available, updated_at = self._buckets[key]
+                self._buckets[key] = (min(spec.capacity, available + tokens), updated_at)
+
+
+class FileLockBackend:
+    """
+    파일 잠금(fcntl) 기반 공유 버킷 - 같은 호스트의 여러 워커 프로세스용
+
+    버킷 상태를 JSON 파일에 저장하고, 읽기-수정-쓰기 구간을 flock으로 보호합니다.
+    """
+
+    def __init__(self, path: str = "/tmp/datahub_rate_limits.json"):
+        if fcntl is None:
+            raise RuntimeError("FileLockBackend requires fcntl (POSIX)")
+        self.path = path
+        self._thread_lock = threading.Lock()
+
+    def _update(self, key: str, spec: BucketSpec, delta: float) -> float:
+        with self._thread_lock, open(self.path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                state = json.loads(content) if content else {}
+
+                # 프로세스 간 공유이므로 monotonic 대신 wall clock 사용
+                now = time.time()
+                available, updated_at = state.get(key, (spec.capacity, now))
+                available = min(spec.capacity, available + max(0.0, now - updated_at) * spec.rate)
+                available += delta
+                state[key] = (available, now)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        return available
+
+    def reserve(self, key: str, tokens: float, spec: BucketSpec) -> float:
+        available = self._update(key, spec, -tokens)
+        return max(0.0, -available / spec.rate)
+
+    def refund(self, key: str, tokens: float, spec: BucketSpec) -> None:
+        self._update(key, spec, tokens)
+
+
+class PostgresBackend:
+    """
+    PostgreSQL 기반 공유 버킷 - 여러 컨테이너/호스트가 하나의 제공자 쿼터를 공유
+
+    예약은 단일 UPSERT 문으로 원자적으로 처리되며, 시간은 DB 서버 시계를 사용해
+    호스트 간 시계 차이의 영향을 받지 않습니다.
+    """
+
+    _RESERVE_SQL = """
+        INSERT INTO rate_limit_buckets (key, tokens, updated_at)
+        VALUES (:key, :capacity - :delta, extract(epoch from clock_timestamp()))
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = LEAST(
+                :capacity,
+                rate_limit_buckets.tokens
+                    + (extract(epoch from clock_timestamp()) - rate_limit_buckets.updated_at) * :rate
+            ) - :delta,
+            updated_at = extract(epoch from clock_timestamp())
+        RETURNING tokens
+    """
+
+    def __init__(self, engine=None):
+        if engine is None:
+            from src.database.connection import engine
+        if engine.dialect.name != 'postgresql':
+            raise RuntimeError("PostgresBackend requires a PostgreSQL database")
+        self.engine = engine
+
+    def _update(self, key: str, spec: BucketSpec, delta: float) -> float:
+        from sqlalchemy import text
+
+        with self.engine.begin() as connection:
+            return connection.execute(text(self._RESERVE_SQL), {
+                "key": key,
+                "capacity": spec.capacity,
+                "rate": spec.rate,
+                "delta": delta,
+            }).scalar()
+
+    def reserve(self, key: str, tokens: float, spec: BucketSpec) -> float:
+        available = self._update(key, spec, tokens)
+        return max(0.0, -available / spec.rate)
+
+    def refund(self, key: str, tokens: float, spec: BucketSpec) -> None:
+        self._update(key, spec, -tokens)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 class RateLimiter:
     """
-    요청 속도 제한 (1초당 N개)
-    
+    요청 속도 제한 (token bucket)
+
     Usage:
         rate_limiter = RateLimiter(max_requests=10, per_seconds=1)
         await rate_limiter.acquire()  # 요청 전 호출
+
+        # 키별 제한 + burst (키 버킷과 전체 버킷에서 모두 차감)
+        limiter = RateLimiter(max_requests=10, per_seconds=1, key_limits={"places:findplace": (5, 1)})
+        await limiter.acquire(key="places:findplace")
+
+        # 여러 워커가 하나의 쿼터 공유
+        limiter = RateLimiter(8, 60, name="gemini", backend=PostgresBackend())
     """
-    
-    def __init__(self, max_requests: int, per_seconds: int = 1):
+
+    def __init__(
+        self,
+        max_requests: int,
+        per_seconds: float = 1,
+        burst: Optional[int] = None,
+        name: str = "default",
+        backend=None,
+        key_limits: Optional[Dict[str, Tuple[int, float]]] = None
+    ):
         """
         Args:
             max_requests: 최대 요청 수
             per_seconds: 시간 창 (초)
+            burst: 한 번에 허용할 최대 요청 수 (기본: max_requests)
+            name: 공유 백엔드에서 쿼터를 구분하는 이름
+            backend: LocalBackend(기본) / FileLockBackend / PostgresBackend
+            key_limits: 키별 (max_requests, per_seconds) 추가 제한 (전체 제한과 함께 적용)
         """
+        if max_requests <= 0 or per_seconds <= 0:
+            raise ValueError("max_requests and per_seconds must be positive")
+
         self.max_requests = max_requests
         self.per_seconds = per_seconds
-        self.requests = deque()
-        logger.debug(f"RateLimiter initialized: {max_requests} req/{per_seconds}s")
-    
-    async def acquire(self):
-        """요청 토큰 획득 (필요시 대기)"""
-        now = time()
-        
-        # 오래된 요청 제거
-        while self.requests and self.requests[0] < now - self.per_seconds:
-            self.requests.popleft()
-        
-        # 제한 초과 시 대기
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.requests[0] + self.per_seconds - now + 0.01
-            logger.debug(f"Rate limit reached, sleeping {sleep_time:.2f}s")
-            await asyncio.sleep(sleep_time)
-            return await self.acquire()
-        
-        self.requests.append(now)
+        self.name = name
+        self.backend = backend or LocalBackend()
+        self.default_spec = BucketSpec(
+            rate=max_requests / per_seconds,
+            capacity=float(burst if burst is not None else max_requests)
+        )
+        self.key_specs = {
+            key: BucketSpec(rate=limit / seconds, capacity=float(limit))
+            for key, (limit, seconds) in (key_limits or {}).items()
+        }
+        logger.debug(
+            f"RateLimiter initialized: {max_requests} req/{per_seconds}s "
+            f"(burst={self.default_spec.capacity:.0f}, backend={type(self.backend).__name__})"
+        )
+
+    def _buckets(self, key: Optional[str]) -> List[Tuple[str, BucketSpec]]:
+        """차감할 버킷: 전체 버킷 + (key_limits에 있으면) 키 버킷"""
+        buckets = [(f"{self.name}:*", self.default_spec)]
+        if key and key in self.key_specs:
+            buckets.append((f"{self.name}:{key}", self.key_specs[key]))
+        return buckets
+
+    async def _call(self, method, bucket_key: str, tokens: float, spec: BucketSpec):
+        if isinstance(self.backend, LocalBackend):
+            return method(bucket_key, tokens, spec)
+        return await asyncio.to_thread(method, bucket_key, tokens, spec)
+
+    async def _reserve_until(self, bucket_key: str, tokens: float, spec: BucketSpec) -> float:
+        """예약 후 통과 가능한 시각 (time.monotonic 기준)"""
+        if isinstance(self.backend, LocalBackend):
+            return self.backend.reserve_until(bucket_key, tokens, spec)
+        wait = await asyncio.to_thread(self.backend.reserve, bucket_key, tokens, spec)
+        return time.monotonic() + wait
+
+    async def acquire(self, key: Optional[str] = None, tokens: float = 1):
+        """요청 토큰 획득 (필요시 대기) - 모든 버킷에서 예약하고 가장 늦은 통과 시각까지 대기"""
+        buckets = self._buckets(key)
+        for _, spec in buckets:
+            if tokens > spec.capacity:
+                raise ValueError(f"Requested {tokens} tokens exceeds burst capacity {spec.capacity}")
+
+        deadline = 0.0
+        for bucket_key, spec in buckets:
+            deadline = max(deadline, await self._reserve_until(bucket_key, tokens, spec))
+
+        # asyncio 기본 루프의 loop.time()은 time.monotonic()
+        loop = asyncio.get_running_loop()
+        wait = deadline - loop.time()
+        RATE_LIMIT_WAIT_SECONDS.observe(max(wait, 0.0), limiter=self.name)
+        if wait <= 0:
+            return
+
+        logger.debug(f"Rate limit reached ({self.name}:{key or '*'}), sleeping {wait:.2f}s")
+        # asyncio.sleep(wait)은 호출 시점 기준으로 다시 계산하므로 예약 사이 지연(GC 등)이 끼면
+        # 뒤 대기자가 먼저 깨어날 수 있음 → 예약한 시각에 직접 깨움
+        woken = loop.create_future()
+        handle = loop.call_at(deadline, _wake, woken)
+        try:
+            await woken
+        except asyncio.CancelledError:
+            handle.cancel()
+            # 대기 중 취소되면 예약한 토큰을 돌려줘 뒤의 대기자가 손해보지 않도록 함
+            for bucket_key, spec in buckets:
+                await self._call(self.backend.refund, bucket_key, tokens, spec)
+            raise
+
+
+class RateLimiterRegistry:
+    """
+    제공자 이름 → 공유 RateLimiter
+
+    LocalBackend 버킷은 인스턴스마다 따로 있으므로, 같은 제공자를 쓰는 모든 호출자
+    (파이프라인 단계, 보강 엔진 등)가 여기서 같은 인스턴스를 받아 한 쿼터를 나눠 씁니다.
+    """
+
+    def __init__(self):
+        self._configs: Dict[str, Dict] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, **config) -> None:
+        """제공자 제한 등록 (RateLimiter 인자, 이미 생성된 limiter에는 적용되지 않음)"""
+        self._configs[name] = config
+
+    def get(self, name: str) -> RateLimiter:
+        """공유 limiter (없으면 생성)"""
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                if name not in self._configs:
+                    raise KeyError(f"Unknown rate limiter: {name}")
+                limiter = self._limiters[name] = RateLimiter(name=name, **self._configs[name])
+            return limiter
+
+
+rate_limiters = RateLimiterRegistry()
+
+# Google Places: 제공자 제한 10 req/s → 안전하게 5 req/s
+rate_limiters.register("google_places", max_requests=5, per_seconds=1)
+
+
+async def stress_test(
+    waiters: int = 1000,
+    max_requests: int = 100,
+    per_seconds: float = 1.0,
+    burst: int = 10,
+    backend=None
+) -> Dict[str, float]:
+    """
+    동시 대기자 N개로 제한 준수 여부 검증
+
+    모든 시간 창 [t, t+w]에서 통과 수가 burst + rate * w 이하이고,
+    호출 순서대로 통과(FIFO)하는지 확인합니다.
+    """
+    limiter = RateLimiter(max_requests, per_seconds, burst=burst, name=f"stress-{os.getpid()}", backend=backend)
+    rate = max_requests / per_seconds
+    grants = []
+
+    async def waiter(index: int):
+        await limiter.acquire()
+        grants.append((time.monotonic(), index))
+
+    started = time.monotonic()
+    tasks = []
+    for i in range(waiters):
+        tasks.append(asyncio.create_task(waiter(i)))
+        await asyncio.sleep(0)  # 생성 순서 = acquire 호출 순서
+    await asyncio.gather(*tasks)
+    elapsed = time.monotonic() - started
+
+    times = sorted(t for t, _ in grants)
+    # 슬라이딩 윈도우 최대 초과량 (타이머 오차 허용치 포함)
+    tolerance = 0.02
+    worst_excess = 0.0
+    j = 0
+    for i, t in enumerate(times):
+        while times[j] < t - 1.0:
+            j += 1
+        window_count = i - j + 1
+        allowed = burst + rate * (t - times[j]) + rate * tolerance
+        worst_excess = max(worst_excess, window_count - allowed)
+
+    order = [index for _, index in sorted(grants)]
+    fifo_violations = sum(1 for a, b in zip(order, order[1:]) if b < a)
+
+    # 공유 백엔드는 스레드에서 예약하므로 FIFO는 프로세스 내 LocalBackend에서만 보장
+    fifo_ok = fifo_violations == 0 or not isinstance(limiter.backend, LocalBackend)
+
+    expected_min = max(0.0, (waiters - burst) / rate)
+    return {
+        "waiters": waiters,
+        "elapsed_seconds": round(elapsed, 3),
+        "expected_min_seconds": round(expected_min, 3),
+        "observed_rate": round(waiters / elapsed, 1) if elapsed else 0,
+        "limit_rate": rate,
+        "worst_window_excess": round(worst_excess, 2),
+        "fifo_violations": fifo_violations,
+        "passed": worst_excess <= 1 and elapsed >= expected_min * 0.98 and fifo_ok,
+    }
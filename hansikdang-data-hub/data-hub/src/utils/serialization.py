@@ -0,0 +1,82 @@
+"""
+JSON serialization helpers
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 동일한 출력 형식 유지
+
+- dumps(): UTF-8 bytes (공백 없음, 한글 그대로) → HTTP 본문/파일
+- dumps_str(): str → jsonb CAST 파라미터 등
+- FastJSONResponse: FastAPI 응답 클래스 (jsonable_encoder 없이 dict를 바로 반환할 때 사용)
+
+Usage:
+    body = dumps({"restaurants": payloads})
+    return FastJSONResponse({"status": "success", "items": items})
+"""
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Union
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """기본 타입 외 값 변환 (jsonable_encoder와 같은 결과)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    # 표준 json 경로 (orjson은 아래 타입을 직접 처리)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(value: Any) -> bytes:
+        """값 → JSON bytes"""
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """JSON bytes/str → 값"""
+        return orjson.loads(data)
+
+else:
+    def dumps(value: Any) -> bytes:
+        """값 → JSON bytes"""
+        return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """JSON bytes/str → 값"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def dumps_str(value: Any) -> str:
+    """값 → JSON str"""
+    return dumps(value).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """dumps()로 렌더링하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,230 @@
+"""
+Google Places enrichment workflow
+google_place_id가 없는 레스토랑을 Google Places 평점/리뷰수/이미지로 보강
+
+- 동시 요청 수 제한(semaphore) + GooglePlacesAPI rate limiter → 제공자 쿼터 한도까지 병렬 조회
+- id 순 keyset 페이지 단위 처리, 결과는 bulk update로 청크 저장
+- 페이지 완료마다 진행 위치를 job_checkpoints에 기록 → 중단되면 다음 실행에서 이어서 처리
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+from config import settings
+from src.database.connection import db_session
+from src.database.models import JobCheckpoint, ProcessedRestaurant
+from src.workflows.stages import google_place_fields
+
+
+CHECKPOINT_NAME = "google_enrichment"
+STAT_KEYS = ("processed", "enriched", "not_found", "failed")
+
+# (id, name, address, naver_rating, naver_review_count)
+RestaurantRow = Tuple[str, str, Optional[str], Optional[float], Optional[int]]
+
+
+class GooglePlacesWorkflow:
+    """
+    Google Places 보강 엔진
+
+    Usage:
+        workflow = GooglePlacesWorkflow(concurrency=8)
+        stats = await workflow.enrich_restaurants(limit=1000)
+    """
+
+    def __init__(
+        self,
+        google_api=None,
+        concurrency: Optional[int] = None,
+        page_size: int = 200,
+        chunk_size: int = 50
+    ):
+        """
+        Args:
+            google_api: GooglePlacesAPI (기본: 새로 생성)
+            concurrency: 동시 조회 수 (기본: settings.google_enrichment_concurrency)
+            page_size: 한 번에 읽어오는 레스토랑 수 (체크포인트 단위)
+            chunk_size: bulk update 한 번에 저장할 행 수
+        """
+        if google_api is None:
+            from src.scrapers.google_places_api import GooglePlacesAPI
+            google_api = GooglePlacesAPI()
+
+        self.google_api = google_api
+        self.concurrency = concurrency or settings.google_enrichment_concurrency
+        self.page_size = page_size
+        self.chunk_size = chunk_size
+        self.logger = logger.bind(workflow="google_places")
+
+    async def enrich_restaurants(self, limit: Optional[int] = None, resume: bool = True) -> Dict[str, Any]:
+        """
+        보강 실행
+
+        Args:
+            limit: 이번 실행에서 조회할 최대 레스토랑 수 (기본: settings.google_enrichment_limit, 0 = 제한 없음)
+            resume: 이전 실행의 체크포인트부터 이어서 처리
+
+        Returns:
+            {"processed", "enriched", "not_found", "failed", "elapsed_seconds", "lookups_per_second", "completed"}
+        """
+        if limit is None:
+            limit = settings.google_enrichment_limit
+
+        cursor, previous = await asyncio.to_thread(self._load_checkpoint, resume)
+        if cursor:
+            self.logger.info(f"↩️  Resuming Google enrichment after id {cursor} ({previous.get('processed', 0)} done)")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        run = {key: 0 for key in STAT_KEYS}
+        started = time.monotonic()
+        completed = False
+
+        self.logger.info(
+            f"⭐ Google enrichment started (concurrency={self.concurrency}, limit={limit or 'none'})"
+        )
+
+        while not limit or run["processed"] < limit:
+            page_limit = min(self.page_size, limit - run["processed"]) if limit else self.page_size
+            page = await asyncio.to_thread(self._fetch_page, cursor, page_limit)
+
+            if not page:
+                completed = True
+                break
+
+            await self._process_page(page, semaphore, run)
+            cursor = page[-1][0]
+
+            totals = {key: previous.get(key, 0) + run[key] for key in STAT_KEYS}
+            await asyncio.to_thread(self._save_checkpoint, cursor, totals)
+
+            elapsed = time.monotonic() - started
+            self.logger.info(
+                f"  📍 {run['processed']} looked up, {run['enriched']} enriched "
+                f"({run['processed'] / elapsed:.1f}/s)"
+            )
+
+        if completed:
+            # 전체 순회 완료 → 다음 실행은 처음부터 (찾지 못한 레스토랑 재시도)
+            await asyncio.to_thread(self._clear_checkpoint)
+
+        elapsed = time.monotonic() - started
+        result = {
+            **run,
+            "elapsed_seconds": round(elapsed, 2),
+            "lookups_per_second": round(run["processed"] / elapsed, 2) if elapsed else 0,
+            "completed": completed,
+        }
+
+        self.logger.info(
+            f"✅ Google enrichment {'completed' if completed else 'paused at limit'}: "
+            f"{run['enriched']}/{run['processed']} enriched in {elapsed:.1f}s"
+        )
+        return result
+
+    async def _process_page(self, page: List[RestaurantRow], semaphore: asyncio.Semaphore, run: Dict[str, int]) -> None:
+        """페이지 내 레스토랑 병렬 조회, 결과는 청크 단위로 저장"""
+
+        async def lookup(row: RestaurantRow) -> Tuple[RestaurantRow, Optional[Dict[str, Any]], bool]:
+            async with semaphore:
+                try:
+                    place_data = await self.google_api.search_place(name=row[1], address=row[2] or "")
+                    return row, place_data, False
+                except Exception as e:
+                    self.logger.error(f"Failed to enrich {row[1]}: {e}")
+                    return row, None, True
+
+        tasks = [asyncio.create_task(lookup(row)) for row in page]
+        pending_writes: List[Dict[str, Any]] = []
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                row, place_data, failed = await next_done
+                run["processed"] += 1
+
+                if failed:
+                    run["failed"] += 1
+                    continue
+                if not place_data:
+                    run["not_found"] += 1
+                    continue
+
+                restaurant_id, name, _, naver_rating, naver_review_count = row
+                pending_writes.append({
+                    "id": restaurant_id,
+                    **google_place_fields(place_data, naver_rating, naver_review_count)
+                })
+                run["enriched"] += 1
+                self.logger.debug(f"  ✓ Enriched: {name} (Rating: {place_data.get('rating')}/5.0)")
+
+                if len(pending_writes) >= self.chunk_size:
+                    chunk, pending_writes = pending_writes, []
+                    await asyncio.to_thread(self._write_chunk, chunk)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # 취소/오류로 중단되더라도 이미 비용을 지불한 조회 결과는 저장
+            if pending_writes:
+                await asyncio.to_thread(self._write_chunk, pending_writes)
+
+    def _fetch_page(self, cursor: Optional[str], limit: int) -> List[RestaurantRow]:
+        """cursor 이후 미보강 레스토랑 (필요한 컬럼만)"""
+        with db_session() as db:
+            query = db.query(
+                ProcessedRestaurant.id,
+                ProcessedRestaurant.name,
+                ProcessedRestaurant.address,
+                ProcessedRestaurant.naver_rating,
+                ProcessedRestaurant.naver_review_count
+            ).filter(
+                ProcessedRestaurant.google_place_id == None
+            )
+            if cursor:
+                query = query.filter(ProcessedRestaurant.id > cursor)
+
+            return [tuple(row) for row in query.order_by(ProcessedRestaurant.id).limit(limit).all()]
+
+    def _write_chunk(self, mappings: List[Dict[str, Any]]) -> None:
+        # bulk_update_mappings는 ORM 이벤트를 거치지 않으므로 행을 읽어 갱신 (content_hash 변경 추적)
+        with db_session() as db:
+            restaurants = {
+                r.id: r for r in db.query(ProcessedRestaurant).filter(
+                    ProcessedRestaurant.id.in_([mapping["id"] for mapping in mappings])
+                )
+            }
+            for mapping in mappings:
+                restaurant = restaurants.get(mapping["id"])
+                if restaurant is None:
+                    continue
+                for field, value in mapping.items():
+                    if field != "id":
+                        setattr(restaurant, field, value)
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self, resume: bool) -> Tuple[Optional[str], Dict[str, Any]]:
+        with db_session() as db:
+            checkpoint = db.query(JobCheckpoint).filter(JobCheckpoint.job_name == CHECKPOINT_NAME).first()
+            if not checkpoint:
+                return None, {}
+            if not resume:
+                db.delete(checkpoint)
+                return None, {}
+
+            return checkpoint.cursor, dict(checkpoint.stats or {})
+
+    def _save_checkpoint(self, cursor: str, totals: Dict[str, int]) -> None:
+        with db_session() as db:
+            checkpoint = db.query(JobCheckpoint).filter(JobCheckpoint.job_name == CHECKPOINT_NAME).first()
+            if not checkpoint:
+                checkpoint = JobCheckpoint(job_name=CHECKPOINT_NAME, started_at=datetime.now(timezone.utc))
+                db.add(checkpoint)
+            checkpoint.cursor = cursor
+            checkpoint.stats = totals
+
+    def _clear_checkpoint(self) -> None:
+        with db_session() as db:
+            db.query(JobCheckpoint).filter(JobCheckpoint.job_name == CHECKPOINT_NAME).delete()
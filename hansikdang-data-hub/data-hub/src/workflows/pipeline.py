@@ -0,0 +1,317 @@
+"""
+Streaming ETL Pipeline
+수집 → 정제 → 보강 → 중복제거 → 동기화를 이벤트 기반으로 연결
+
+각 단계는 이전 단계의 출력을 bounded asyncio.Queue로 받아 처리합니다.
+큐가 가득 차면 상위 단계가 대기하므로(backpressure) 메모리가 일정하게 유지되고,
+수집된 레스토랑이 몇 분 안에 메인 앱까지 전달됩니다.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from loguru import logger
+
+from src.monitoring.metrics import PIPELINE_QUEUE_DEPTH
+
+
+_END = object()  # 스트림 종료 신호
+
+
+@dataclass
+class StageMetrics:
+    """단계별 처리량/지연시간 통계"""
+    name: str
+    concurrency: int
+    received: int = 0
+    emitted: int = 0
+    dropped: int = 0
+    failed: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    max_queue_depth: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    errors: List[str] = field(default_factory=list)
+
+    def record(self, latency: float) -> None:
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.received - self.failed
+        elapsed = self.elapsed
+        return {
+            'stage': self.name,
+            'concurrency': self.concurrency,
+            'received': self.received,
+            'emitted': self.emitted,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'avg_latency_ms': round(self.total_latency / self.received * 1000, 1) if self.received else 0,
+            'max_latency_ms': round(self.max_latency * 1000, 1),
+            'throughput_per_min': round(completed / elapsed * 60, 2) if elapsed > 0 else 0,
+            'max_queue_depth': self.max_queue_depth,
+            'elapsed_seconds': round(elapsed, 2),
+            'errors': self.errors[-10:],
+        }
+
+
+StageHandler = Callable[[Any], Awaitable[Union[None, Any, List[Any]]]]
+
+
+class PipelineStage:
+    """
+    파이프라인 단계
+
+    Args:
+        name: 단계 이름 (메트릭 키)
+        handler: async handler(item) → None(제외) | item | [items](분기)
+        concurrency: 동시 실행 워커 수
+        queue_size: 입력 큐 크기 (가득 차면 이전 단계가 대기)
+        on_close: 입력이 모두 처리된 뒤 호출 (배치 flush 등)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        concurrency: int = 1,
+        queue_size: int = 100,
+        on_close: Optional[Callable[[], Awaitable[None]]] = None
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.on_close = on_close
+        self.metrics = StageMetrics(name=name, concurrency=self.concurrency)
+
+
+class StreamingPipeline:
+    """
+    bounded 큐로 연결된 단계별 워커 풀
+
+    Usage:
+        pipeline = StreamingPipeline([
+            PipelineStage("scrape", scrape, concurrency=2),
+            PipelineStage("refine", refine, concurrency=2),
+        ])
+        metrics = await pipeline.run(keywords)
+    """
+
+    def __init__(self, stages: List[PipelineStage], name: str = "pipeline"):
+        if not stages:
+            raise ValueError("Pipeline requires at least one stage")
+
+        self.stages = stages
+        self.name = name
+        self.logger = logger.bind(pipeline=name)
+
+    async def run(self, source: Union[Iterable[Any], AsyncIterator[Any]]) -> Dict[str, Any]:
+        """소스 항목을 모든 단계에 흘려보내고 단계별 메트릭 반환"""
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        started = time.monotonic()
+
+        self.logger.info(
+            "Starting pipeline: " + " → ".join(f"{s.name}(x{s.concurrency})" for s in self.stages)
+        )
+
+        stage_tasks = [
+            asyncio.create_task(self._run_stage(
+                stage,
+                queues[i],
+                queues[i + 1] if i + 1 < len(self.stages) else None,
+                self.stages[i + 1].concurrency if i + 1 < len(self.stages) else 0
+            ))
+            for i, stage in enumerate(self.stages)
+        ]
+
+        try:
+            await self._feed(source, queues[0], self.stages[0])
+            await asyncio.gather(*stage_tasks)
+        except BaseException:
+            for task in stage_tasks:
+                task.cancel()
+            await asyncio.gather(*stage_tasks, return_exceptions=True)
+            raise
+
+        elapsed = time.monotonic() - started
+        result = {
+            'pipeline': self.name,
+            'elapsed_seconds': round(elapsed, 2),
+            'stages': [stage.metrics.to_dict() for stage in self.stages],
+        }
+
+        for stage_metrics in result['stages']:
+            self.logger.info(
+                f"  {stage_metrics['stage']}: in={stage_metrics['received']} "
+                f"out={stage_metrics['emitted']} failed={stage_metrics['failed']} "
+                f"avg={stage_metrics['avg_latency_ms']}ms "
+                f"rate={stage_metrics['throughput_per_min']}/min"
+            )
+        self.logger.info(f"✅ Pipeline completed in {elapsed:.1f}s")
+
+        return result
+
+    async def _feed(self, source, queue: asyncio.Queue, stage: PipelineStage) -> None:
+        """소스 항목을 첫 단계 큐에 투입 (큐가 가득 차면 대기)"""
+        if hasattr(source, '__aiter__'):
+            async for item in source:
+                await self._put(queue, item, stage)
+        else:
+            for item in source:
+                await self._put(queue, item, stage)
+
+        for _ in range(stage.concurrency):
+            await queue.put(_END)
+
+    async def _put(self, queue: asyncio.Queue, item: Any, stage: PipelineStage) -> None:
+        await queue.put(item)
+        stage.metrics.max_queue_depth = max(stage.metrics.max_queue_depth, queue.qsize())
+        PIPELINE_QUEUE_DEPTH.set(queue.qsize(), pipeline=self.name, stage=stage.name)
+
+    async def _run_stage(
+        self,
+        stage: PipelineStage,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        downstream_workers: int
+    ) -> None:
+        """워커 풀 실행 → 입력 소진 시 on_close 호출 → 다음 단계에 종료 신호 전달"""
+        stage.metrics.started_at = time.monotonic()
+        downstream = self.stages[self.stages.index(stage) + 1] if outbox is not None else None
+
+        async def worker():
+            while True:
+                item = await inbox.get()
+                PIPELINE_QUEUE_DEPTH.set(inbox.qsize(), pipeline=self.name, stage=stage.name)
+                if item is _END:
+                    return
+
+                stage.metrics.received += 1
+                started = time.monotonic()
+
+                try:
+                    output = await stage.handler(item)
+                except Exception as e:
+                    stage.metrics.failed += 1
+                    stage.metrics.errors.append(f"{item}: {e}")
+                    self.logger.error(f"[{stage.name}] Failed for {item}: {e}")
+                    continue
+                finally:
+                    stage.metrics.record(time.monotonic() - started)
+
+                outputs = output if isinstance(output, list) else [output]
+                for out in outputs:
+                    if out is None:
+                        if outbox is not None:
+                            stage.metrics.dropped += 1
+                        continue
+                    stage.metrics.emitted += 1
+                    if outbox is not None:
+                        await self._put(outbox, out, downstream)
+
+        await asyncio.gather(*(worker() for _ in range(stage.concurrency)))
+
+        if stage.on_close:
+            try:
+                await stage.on_close()
+            except Exception as e:
+                stage.metrics.failed += 1
+                stage.metrics.errors.append(f"on_close: {e}")
+                self.logger.error(f"[{stage.name}] on_close failed: {e}")
+
+        stage.metrics.finished_at = time.monotonic()
+
+        if outbox is not None:
+            for _ in range(downstream_workers):
+                await outbox.put(_END)
+
+
+async def run_daily_pipeline(
+    keywords: List[str],
+    include_backlog: bool = True,
+    target: Optional[int] = None,
+    refine_concurrency: int = 2,
+    score_concurrency: int = 4,
+    queue_size: int = 50
+) -> Dict[str, Any]:
+    """
+    일일 수집 파이프라인 실행
+
+    Args:
+        keywords: 수집 키워드 (스마트 타겟팅 쿼리)
+        include_backlog: 기존 pending raw 데이터도 정제 단계부터 함께 처리 (오래된 순 최대 pipeline_backlog_limit개)
+        target: 신규 저장 수가 이만큼 되면 남은 키워드는 수집하지 않음 (기본: settings.daily_target)
+
+    수집은 키워드를 묶어 actor 1회로 실행하고(BatchScrapeStage), 결과는 키워드(ScrapingTarget)별로 기록합니다.
+    """
+    from config import settings
+    from src.database.connection import db_session
+    from src.database.models import RawRestaurantData
+    from src.processors.gemini import GeminiProcessor
+    from src.scrapers.apify_naver_scraper import ApifyNaverScraper
+    from src.scrapers.google_places_api import GooglePlacesAPI
+    from src.utils.rate_limiter import RateLimiter
+    from src.workflows.sync import SyncWorkflow
+    from src.workflows.stages import (
+        BatchScrapeStage, RefineStage, ScoreStage, DedupStage, SyncStage
+    )
+
+    backlog: List[str] = []
+    if include_backlog:
+        with db_session() as db:
+            backlog = [
+                row.id for row in db.query(RawRestaurantData.id).filter(
+                    RawRestaurantData.status == 'pending'
+                ).order_by(RawRestaurantData.scraped_at).limit(settings.pipeline_backlog_limit).all()
+            ]
+
+    try:
+        google_api = GooglePlacesAPI()
+    except ValueError as e:
+        logger.warning(f"Google enrichment disabled: {e}")
+        google_api = None
+
+    scrape = BatchScrapeStage(ApifyNaverScraper(), target=target if target is not None else settings.daily_target)
+    sync = SyncStage(SyncWorkflow(), batch_size=settings.batch_size)
+
+    async def scrape_or_pass(item: Dict[str, str]):
+        # backlog 항목은 이미 raw 데이터가 있으므로 바로 정제 단계로 전달
+        if item['type'] == 'raw':
+            return item['id']
+        return await scrape(item['keywords'])
+
+    # Gemini 무료 쿼터(분당 10회)를 넘지 않도록 정제 단계 전체에 공통 제한
+    refine = RefineStage(GeminiProcessor(), rate_limiter=RateLimiter(max_requests=8, per_seconds=60))
+
+    pipeline = StreamingPipeline([
+        # 다음 키워드 묶음은 직전 actor 실행이 끝나야 정해지므로 수집 워커는 1개
+        PipelineStage("scrape", scrape_or_pass, concurrency=1, queue_size=queue_size),
+        PipelineStage("refine", refine, concurrency=refine_concurrency, queue_size=queue_size),
+        PipelineStage("score", ScoreStage(google_api), concurrency=score_concurrency, queue_size=queue_size),
+        PipelineStage("dedup", DedupStage(), concurrency=1, queue_size=queue_size),
+        PipelineStage("sync", sync, concurrency=1, queue_size=queue_size, on_close=sync.flush),
+    ], name="daily")
+
+    async def source():
+        for raw_id in backlog:
+            yield {'type': 'raw', 'id': raw_id}
+        # 목표에 도달하면 plan()이 키워드 묶음 생성을 멈춤
+        async for batch in scrape.plan(keywords):
+            yield {'type': 'keywords', 'keywords': batch}
+
+    result = await pipeline.run(source())
+    result['scrape'] = scrape.summary()
+    logger.info(
+        f"💰 Apify: {result['scrape']['runs']} runs for {result['scrape']['keywords_used']} keywords "
+        f"({result['scrape']['runs_avoided']} runs avoided), ${result['scrape']['usage_usd']:.4f}"
+    )
+    return result
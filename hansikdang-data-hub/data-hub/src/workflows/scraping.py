@@ -15,6 +15,7 @@ from src.database.models import (
 from src.scrapers.naver import NaverPlaceScraper
 from src.scrapers.google import GoogleMapsScraper
 from src.processors.gemini import GeminiProcessor
+from src.utils.known_ids import known_ids
 from config import settings
 
 
@@ -66,27 +67,26 @@ class ScrapingWorkflow:
                         limit=50
                     )
                     
-                    # 데이터베이스에 저장
-                    success_count = 0
+                    # 데이터베이스에 저장 (이미 수집된 장소 제외)
+                    existing = known_ids.existing_ids(db, 'naver', [r.source_id for r in naver_results])
+                    rows = []
                     for result in naver_results:
-                        try:
-                            raw_data = RawRestaurantData(
-                                id=str(uuid.uuid4()),
-                                source='naver',
-                                source_id=result.source_id,
-                                source_url=result.source_url,
-                                raw_data=result.raw_data,
-                                status='pending'
-                            )
-                            db.add(raw_data)
-                            success_count += 1
-                            total_scraped += 1
-                            
-                            if total_scraped >= settings.daily_target:
-                                break
-                                
-                        except Exception as e:
-                            self.logger.error(f"Failed to save: {e}")
+                        if result.source_id in existing:
+                            continue
+                        if total_scraped + len(rows) >= settings.daily_target:
+                            break
+                        existing.add(result.source_id)
+                        rows.append({
+                            'id': str(uuid.uuid4()),
+                            'source': 'naver',
+                            'source_id': result.source_id,
+                            'source_url': result.source_url,
+                            'raw_data': result.raw_data,
+                            'status': 'pending',
+                        })
+                    
+                    success_count = len(known_ids.insert_new(db, rows))
+                    total_scraped += success_count
                     
                     # 로그 업데이트
                     log.completed_at = datetime.now()
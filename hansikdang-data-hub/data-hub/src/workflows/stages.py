@@ -0,0 +1,645 @@
+"""
+Pipeline stage implementations
+스케줄러 작업(수집 → 정제 → 보강 → 중복제거 → 동기화)의 레코드 단위 로직
+
+StreamingPipeline의 단계와 보강 워크플로(google_place_fields)가 사용합니다.
+"""
+import asyncio
+import math
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from loguru import logger
+from sqlalchemy import and_, or_
+
+from src.database.connection import db_session
+from src.database.models import RawRestaurantData, ProcessedRestaurant, ScrapingTarget, ScrapingLog
+from src.governance.lineage_sink import lineage_sink
+from src.processors.popularity_calculator import PopularityCalculator
+from src.utils.known_ids import known_ids
+
+
+def load_daily_queries():
+    """DB에서 스마트 타겟팅 쿼리 로드 (없으면 기본 쿼리)"""
+    with db_session() as db:
+        auto_targets = db.query(ScrapingTarget).filter_by(
+            created_by='auto',
+            status='active'
+        ).limit(33).all()
+
+        if auto_targets:
+            search_queries = [t.keyword for t in auto_targets]
+            logger.info(f"  ✓ Using {len(search_queries)} smart-generated queries")
+            return search_queries
+
+    # Fallback: 기본 쿼리 사용
+    search_queries = [
+        "홍대 한식",
+        "강남 한식당",
+        "명동 한식",
+        "여의도 맛집",
+        "이태원 한식",
+        "서울 삼계탕",
+        "서울 불고기",
+        "서울 비빔밥",
+        "서울 갈비",
+        "서울 냉면",
+        "서울 찌개",
+    ]
+    logger.warning(f"  ⚠️  No smart queries found, using {len(search_queries)} default queries")
+    return search_queries
+
+
+async def refine_with_retry(gemini, raw_data: Dict[str, Any], max_retries: int = 3) -> Dict[str, Any]:
+    """Gemini 정제 (429/quota 오류 시 60초 단위 백오프 재시도)"""
+    retry_count = 0
+    refined = None
+
+    while retry_count < max_retries and refined is None:
+        try:
+            refined = await gemini.refine_restaurant_data(raw_data)
+        except Exception as retry_error:
+            error_msg = str(retry_error)
+            if "429" in error_msg or "quota" in error_msg.lower():
+                retry_count += 1
+                if retry_count < max_retries:
+                    wait_time = 60 * retry_count
+                    logger.warning(f"  ⚠️ Rate limit! Retry in {wait_time}s (attempt {retry_count}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                else:
+                    raise
+            else:
+                raise
+
+    if refined is None:
+        raise Exception("Failed to refine data after retries")
+
+    return refined
+
+
+def build_processed_restaurant(
+    raw: RawRestaurantData,
+    refined: Dict[str, Any],
+    quality: Dict[str, Any]
+) -> ProcessedRestaurant:
+    """정제 결과로 ProcessedRestaurant 생성"""
+    raw_data = raw.raw_data or {}
+    location = raw_data.get('geometry', {}).get('location', {})
+
+    return ProcessedRestaurant(
+        id=str(uuid.uuid4()),
+        mapping_id=raw.id,
+        name=refined.get('name', ''),
+        name_en=refined.get('nameEn', ''),
+        category=refined.get('category', '한식'),
+        cuisine=refined.get('cuisine', ''),
+        district=refined.get('district', ''),
+        address=refined.get('address', ''),
+        address_en=refined.get('addressEn', ''),
+        latitude=raw_data.get('lat') or location.get('lat'),
+        longitude=raw_data.get('lng') or location.get('lng'),
+        description=refined.get('description', ''),
+        description_en=refined.get('descriptionEn', ''),
+        price_range=str(refined.get('priceRange', 2)),
+        phone=refined.get('phone', ''),
+        rating=raw_data.get('rating'),
+        review_count=raw_data.get('reviewCount') or raw_data.get('user_ratings_total', 0),
+        image_url=refined.get('imageUrl', 'https://via.placeholder.com/400x300?text=Restaurant'),
+        open_hours=refined.get('openHours'),
+        quality_score=quality.get('quality_score', 0),
+        quality_details=quality.get('quality_details', {}),
+        sync_status='pending'
+    )
+
+
+def google_place_fields(
+    place_data: Dict[str, Any],
+    naver_rating: Optional[float] = None,
+    naver_review_count: Optional[int] = None
+) -> Dict[str, Any]:
+    """Google Places 결과 → ProcessedRestaurant 갱신 필드 (인기지수 포함)"""
+    fields = {
+        'google_place_id': place_data.get('place_id'),
+        'google_rating': place_data.get('rating'),
+        'google_review_count': place_data.get('user_ratings_total', 0),
+    }
+
+    if place_data.get('image_urls'):
+        fields['image_urls'] = place_data.get('image_urls')
+        fields['image_url'] = place_data.get('image_url')
+
+    fields['popularity_score'], fields['popularity_tier'] = PopularityCalculator.calculate_with_tier(
+        naver_rating=naver_rating or 0,
+        naver_review_count=naver_review_count or 0,
+        google_rating=fields['google_rating'] or 0,
+        google_review_count=fields['google_review_count'] or 0
+    )
+    return fields
+
+
+def apply_google_place(restaurant: ProcessedRestaurant, place_data: Dict[str, Any]) -> None:
+    """Google Places 결과를 레스토랑에 반영하고 인기지수 재계산"""
+    fields = google_place_fields(place_data, restaurant.naver_rating, restaurant.naver_review_count)
+    for key, value in fields.items():
+        setattr(restaurant, key, value)
+
+
+def apify_source_id(restaurant_data: Dict[str, Any]) -> str:
+    """Apify 결과의 중복 판별 키 (이름|주소)"""
+    name = restaurant_data.get('name') or restaurant_data.get('Name') or ''
+    address = restaurant_data.get('address') or restaurant_data.get('Address') or ''
+    return f"{name}|{address}"
+
+
+# Actor 버전에 따라 결과에 검색 키워드가 기록되는 필드명이 다름
+APIFY_KEYWORD_FIELDS = ('keyword', 'Keyword', 'searchKeyword', 'SearchKeyword', 'query', 'searchQuery')
+
+
+def apify_item_keyword(restaurant_data: Dict[str, Any]) -> Optional[str]:
+    """결과 항목을 수집한 검색 키워드 (없으면 None)"""
+    for field in APIFY_KEYWORD_FIELDS:
+        value = restaurant_data.get(field)
+        if value:
+            return str(value).strip()
+    return None
+
+
+def ingest_apify_results(results: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    Apify 결과를 raw_restaurant_data에 일괄 저장
+
+    Returns:
+        (원본 항목, 새 RawRestaurantData ID) 목록 (이미 수집된 항목 제외, 입력 순서 유지)
+    """
+    candidates: Dict[str, Dict[str, Any]] = {}
+    for restaurant_data in results:
+        candidates.setdefault(apify_source_id(restaurant_data), restaurant_data)
+
+    if not candidates:
+        return []
+
+    with db_session() as db:
+        # 중복 체크 (인덱스 양성 후보만 IN 쿼리)
+        existing = known_ids.existing_ids(db, 'apify_naver', candidates)
+
+        rows = [
+            {
+                'id': str(uuid.uuid4()),
+                'source': 'apify_naver',
+                'source_id': source_id,
+                'raw_data': restaurant_data,
+                'status': 'pending',
+            }
+            for source_id, restaurant_data in candidates.items()
+            if source_id not in existing
+        ]
+        # 인덱스가 놓친 기존 행은 unique 제약으로 건너뜀
+        inserted = known_ids.insert_new(db, rows)
+
+    rows = [row for row in rows if row['id'] in inserted]
+    for row in rows:
+        lineage_sink.record(row['id'], 'scraped', 'naver', output_data={'source_id': row['source_id']})
+    return [(candidates[row['source_id']], row['id']) for row in rows]
+
+
+class BatchScrapeStage:
+    """
+    수집 단계: 여러 키워드를 하나의 actor 실행으로 수집하고 키워드(ScrapingTarget)별로 분배
+
+    키워드마다 actor를 실행하면 실행마다 cold start/대기 비용이 발생하므로,
+    목표 수집량에 필요한 만큼의 키워드를 묶어 실행합니다.
+    (키워드 수 = 남은 목표 / (키워드당 결과 수 × 직전 실행의 신규 비율), 직전 묶음의 2배 이하)
+
+    plan()이 키워드 묶음을 만들고, 파이프라인 단계로 호출되면(__call__) 묶음 하나를 실행해
+    신규 RawRestaurantData ID 목록을 반환합니다. 다음 묶음의 크기는 직전 실행이 끝난 뒤
+    결정되며, 신규 저장 수가 target에 도달하면 더 만들지 않습니다.
+    target을 넘는 신규 행은 다음 단계로 넘기지 않고 pending으로 남겨 다음 실행의 backlog로 처리합니다.
+
+    Usage:
+        scrape = BatchScrapeStage(apify, target=33)
+        async for keywords in scrape.plan(load_daily_queries()):
+            saved_ids = await scrape(keywords)
+        scrape.summary()
+    """
+
+    def __init__(
+        self,
+        apify,
+        max_results_per_keyword: int = 11,
+        max_keywords_per_run: int = 11,
+        ingest_chunk_size: int = 200,
+        target: Optional[int] = None
+    ):
+        self.apify = apify
+        self.max_results_per_keyword = max_results_per_keyword
+        self.max_keywords_per_run = max_keywords_per_run
+        self.ingest_chunk_size = ingest_chunk_size
+        self.target = target
+        self.saved = 0
+        self.forwarded = 0
+        self.new_ratio = 1.0
+        self._last_batch_size = 0
+        self.batches: List[Dict[str, Any]] = []
+        self._started = time.monotonic()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def reached(self) -> bool:
+        return self.target is not None and self.saved >= self.target
+
+    def _batch_size(self, pending: int) -> int:
+        if self.target is None:
+            return min(self.max_keywords_per_run, pending)
+        remaining = self.target - self.saved
+        expected_per_keyword = max(self.max_results_per_keyword * self.new_ratio, 1.0)
+        size = min(max(math.ceil(remaining / expected_per_keyword), 1), self.max_keywords_per_run, pending)
+        # 신규 비율은 키워드마다 크게 다르므로 한 번의 저조한 실행으로 묶음을 급격히 키우지 않음
+        # (예상보다 신규가 많아도 초과 수집이 직전 묶음 수준으로 제한됨)
+        if self._last_batch_size:
+            size = min(size, self._last_batch_size * 2)
+        return size
+
+    async def plan(self, keywords: List[str]) -> AsyncIterator[List[str]]:
+        """target에 도달할 때까지 다음 실행의 키워드 묶음 (직전 실행이 끝나야 다음 묶음 생성)"""
+        pending = list(dict.fromkeys(keywords))
+        while pending:
+            await self._idle.wait()
+            if self.reached:
+                return
+            size = self._batch_size(len(pending))
+            self._last_batch_size = size
+            batch, pending = pending[:size], pending[size:]
+            self._idle.clear()
+            yield batch
+
+    async def run_batch(self, keywords: List[str]) -> Dict[str, Any]:
+        """actor 1회 실행 → 결과를 청크 단위로 저장하며 키워드별 집계"""
+        started = time.monotonic()
+        run = await self.apify.start_search(keywords, self.max_results_per_keyword)
+
+        per_keyword = {keyword: {'received': 0, 'saved': 0} for keyword in keywords}
+        unattributed = {'received': 0, 'saved': 0}
+        saved_ids: List[str] = []
+        received = 0
+
+        def bucket(item: Dict[str, Any]) -> Dict[str, int]:
+            keyword = apify_item_keyword(item)
+            if keyword in per_keyword:
+                return per_keyword[keyword]
+            if len(keywords) == 1:
+                return per_keyword[keywords[0]]
+            return unattributed
+
+        def flush(chunk: List[Dict[str, Any]]) -> None:
+            for item in chunk:
+                bucket(item)['received'] += 1
+            for item, raw_id in ingest_apify_results(chunk):
+                bucket(item)['saved'] += 1
+                saved_ids.append(raw_id)
+
+        chunk: List[Dict[str, Any]] = []
+        async for item in self.apify.iter_results(run):
+            chunk.append(item)
+            received += 1
+            if len(chunk) >= self.ingest_chunk_size:
+                await asyncio.to_thread(flush, chunk)
+                chunk = []
+
+        if chunk:
+            await asyncio.to_thread(flush, chunk)
+
+        return {
+            'run_id': run.get('id'),
+            'keywords': len(keywords),
+            'received': received,
+            'saved_ids': saved_ids,
+            'per_keyword': per_keyword,
+            'unattributed': unattributed,
+            'usage_usd': run.get('usageTotalUsd') or 0.0,
+            'run_seconds': (run.get('stats') or {}).get('runTimeSecs') or 0.0,
+            'wall_seconds': time.monotonic() - started,
+        }
+
+    async def __call__(self, keywords: List[str]) -> List[str]:
+        """키워드 묶음 1회 실행 → 신규 RawRestaurantData ID 목록 (키워드별 결과는 ScrapingTarget에 기록)"""
+        try:
+            if self.reached:
+                return []
+
+            batch = await self.run_batch(keywords)
+            self.batches.append(batch)
+            saved_ids = batch['saved_ids']
+            if self.target is not None:
+                # 목표를 넘는 행은 pending으로 남김 (정제/점수 비용은 다음 실행 backlog에서)
+                saved_ids = saved_ids[:max(self.target - self.saved, 0)]
+            self.saved += len(batch['saved_ids'])
+            self.forwarded += len(saved_ids)
+            if batch['received']:
+                self.new_ratio = len(batch['saved_ids']) / batch['received']
+
+            await asyncio.to_thread(record_target_results, batch['per_keyword'])
+
+            logger.info(
+                f"  ✓ Run {batch['run_id']}: {len(keywords)} keywords, "
+                f"{batch['received']} received, {len(batch['saved_ids'])} saved, {len(saved_ids)} forwarded "
+                f"(${batch['usage_usd']:.4f}, {batch['wall_seconds']:.1f}s)"
+            )
+            return saved_ids
+        finally:
+            self._idle.set()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        지금까지의 실행 요약
+
+        Returns:
+            {"runs", "keywords_used", "received", "saved", "forwarded", "per_keyword",
+             "usage_usd", "wall_seconds", "runs_avoided", ...}
+        """
+        per_keyword: Dict[str, Dict[str, int]] = {}
+        for batch in self.batches:
+            per_keyword.update(batch['per_keyword'])
+
+        keywords_used = sum(batch['keywords'] for batch in self.batches)
+        usage_usd = sum(batch['usage_usd'] for batch in self.batches)
+        return {
+            'runs': len(self.batches),
+            'keywords_used': keywords_used,
+            # 키워드별 실행 방식 대비 생략된 actor 실행 수 (실행당 cold start + 완료 대기)
+            'runs_avoided': keywords_used - len(self.batches),
+            'received': sum(batch['received'] for batch in self.batches),
+            'saved': self.saved,
+            # 이번 실행에서 정제 단계로 넘긴 수 (나머지는 pending으로 남아 다음 backlog)
+            'forwarded': self.forwarded,
+            'unattributed': sum(batch['unattributed']['received'] for batch in self.batches),
+            'per_keyword': per_keyword,
+            'usage_usd': round(usage_usd, 4),
+            'usd_per_saved': round(usage_usd / self.saved, 5) if self.saved else None,
+            'actor_seconds': round(sum(batch['run_seconds'] for batch in self.batches), 1),
+            'wall_seconds': round(time.monotonic() - self._started, 1),
+        }
+
+
+def record_target_results(per_keyword: Dict[str, Dict[str, int]]) -> None:
+    """키워드별 수집 결과를 ScrapingTarget(last_scraped/total_found)과 ScrapingLog에 기록"""
+    if not per_keyword:
+        return
+
+    now = datetime.now(timezone.utc)
+    with db_session() as db:
+        targets = db.query(ScrapingTarget).filter(
+            ScrapingTarget.keyword.in_(list(per_keyword))
+        ).all()
+
+        for target in targets:
+            counts = per_keyword[target.keyword]
+            target.last_scraped = now
+            target.total_found = (target.total_found or 0) + counts['saved']
+            db.add(ScrapingLog(
+                id=str(uuid.uuid4()),
+                target_id=target.id,
+                started_at=now,
+                completed_at=now,
+                status='completed',
+                total_scraped=counts['received'],
+                success_count=counts['saved'],
+                error_count=0
+            ))
+
+
+class RefineStage:
+    """정제 단계: RawRestaurantData ID → ProcessedRestaurant ID (Gemini)"""
+
+    def __init__(self, gemini, rate_limiter=None):
+        self.gemini = gemini
+        self.rate_limiter = rate_limiter
+
+    async def __call__(self, raw_id: str) -> Optional[str]:
+        # Gemini 호출(수 초) 동안 DB 연결을 잡고 있지 않도록 조회/기록 세션을 분리
+        with db_session() as db:
+            raw = db.query(RawRestaurantData).filter(
+                RawRestaurantData.id == raw_id,
+                RawRestaurantData.status == 'pending'
+            ).first()
+
+            if not raw:
+                return None
+
+            raw.status = 'processing'
+            raw_data = raw.raw_data
+
+        started = time.monotonic()
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+
+            refined = await refine_with_retry(self.gemini, raw_data)
+            quality = await self.gemini.calculate_quality_score(raw_data)
+
+            with db_session() as db:
+                raw = db.query(RawRestaurantData).filter(RawRestaurantData.id == raw_id).one()
+                restaurant = build_processed_restaurant(raw, refined, quality)
+                db.add(restaurant)
+                raw.status = 'processed'
+                restaurant_id = restaurant.id
+                output_data = {'name': restaurant.name, 'category': restaurant.category}
+                quality_score = restaurant.quality_score
+
+        except Exception as e:
+            with db_session() as db:
+                db.query(RawRestaurantData).filter(RawRestaurantData.id == raw_id).update(
+                    {'status': 'failed', 'error_message': str(e)}, synchronize_session=False
+                )
+            lineage_sink.record(
+                raw_id, 'processed', 'gemini',
+                output_data={'error': str(e)[:200]},
+                execution_time_ms=int((time.monotonic() - started) * 1000),
+                status='failed'
+            )
+            raise
+
+        lineage_sink.record(
+            restaurant_id, 'processed', 'gemini',
+            input_data={'raw_id': raw_id},
+            output_data=output_data,
+            quality_after=quality_score,
+            execution_time_ms=int((time.monotonic() - started) * 1000)
+        )
+        return restaurant_id
+
+
+class ScoreStage:
+    """보강 단계: Google Places 평점/이미지 + 인기지수 계산"""
+
+    def __init__(self, google_api=None):
+        self.google_api = google_api
+
+    async def __call__(self, restaurant_id: str) -> Optional[str]:
+        # Google 조회 동안 DB 연결을 잡고 있지 않도록 조회/기록 세션을 분리
+        with db_session() as db:
+            restaurant = db.query(ProcessedRestaurant).filter(
+                ProcessedRestaurant.id == restaurant_id
+            ).first()
+
+            if not restaurant:
+                return None
+
+            name, address = restaurant.name, restaurant.address or ""
+            needs_place = not restaurant.google_place_id
+
+        started = time.monotonic()
+        place_data = None
+        if self.google_api and needs_place:
+            place_data = await self.google_api.search_place(name=name, address=address)
+
+        with db_session() as db:
+            restaurant = db.query(ProcessedRestaurant).filter(
+                ProcessedRestaurant.id == restaurant_id
+            ).first()
+
+            if not restaurant:
+                return None
+
+            if place_data:
+                apply_google_place(restaurant, place_data)
+            else:
+                popularity_score, popularity_tier = PopularityCalculator.calculate_with_tier(
+                    naver_rating=restaurant.naver_rating or 0,
+                    naver_review_count=restaurant.naver_review_count or 0,
+                    google_rating=restaurant.google_rating or 0,
+                    google_review_count=restaurant.google_review_count or 0
+                )
+                restaurant.popularity_score = popularity_score
+                restaurant.popularity_tier = popularity_tier
+
+            output_data = {
+                'google_place_id': restaurant.google_place_id,
+                'popularity_score': restaurant.popularity_score,
+                'popularity_tier': restaurant.popularity_tier
+            }
+
+        lineage_sink.record(
+            restaurant_id, 'enriched', 'google' if place_data else 'system',
+            output_data=output_data,
+            execution_time_ms=int((time.monotonic() - started) * 1000)
+        )
+        return restaurant_id
+
+
+class DedupStage:
+    """
+    중복 제거 단계: 신규 레스토랑을 같은 지역의 기존 레스토랑과 비교
+
+    비교 대상은 같은 지역에서 좌표가 거리 기준 안에 있거나 이름 앞 두 글자가 같은 레스토랑
+    (최대 max_candidates개)으로 제한합니다. 중복 판정에는 이름 유사도 80 이상이 필요하므로
+    지역 전체를 비교하지 않아도 대부분의 중복이 후보에 포함됩니다.
+    중복이면 기존 레스토랑(master)으로 병합하고 스트림에서 제외합니다.
+    """
+
+    def __init__(
+        self,
+        name_threshold: float = 90.0,
+        address_threshold: float = 85.0,
+        distance_threshold_meters: float = 100.0,
+        max_candidates: int = 200
+    ):
+        from src.deduplication.detector import DuplicateDetector
+
+        self.detector = DuplicateDetector(
+            name_threshold=name_threshold,
+            address_threshold=address_threshold,
+            distance_threshold_meters=distance_threshold_meters
+        )
+        self.max_candidates = max_candidates
+
+    def _candidates(self, db, restaurant: ProcessedRestaurant) -> List[ProcessedRestaurant]:
+        """근접 좌표(bounding box) 또는 이름 접두어가 같은 같은 지역 레스토랑"""
+        nearby = []
+
+        name = (restaurant.name or '').strip()
+        if name:
+            nearby.append(ProcessedRestaurant.name.startswith(name[:2], autoescape=True))
+
+        if restaurant.latitude and restaurant.longitude:
+            meters = self.detector.distance_threshold_meters
+            lat_delta = meters / 111_320
+            lng_delta = meters / (111_320 * max(math.cos(math.radians(restaurant.latitude)), 0.01))
+            nearby.append(and_(
+                ProcessedRestaurant.latitude.between(restaurant.latitude - lat_delta, restaurant.latitude + lat_delta),
+                ProcessedRestaurant.longitude.between(restaurant.longitude - lng_delta, restaurant.longitude + lng_delta)
+            ))
+
+        if not nearby:
+            return []
+
+        return db.query(ProcessedRestaurant).filter(
+            ProcessedRestaurant.id != restaurant.id,
+            ProcessedRestaurant.district == restaurant.district,
+            or_(*nearby)
+        ).limit(self.max_candidates).all()
+
+    async def __call__(self, restaurant_id: str) -> Optional[str]:
+        from src.deduplication.merger import MergeManager
+
+        with db_session() as db:
+            restaurant = db.query(ProcessedRestaurant).filter(
+                ProcessedRestaurant.id == restaurant_id
+            ).first()
+
+            if not restaurant:
+                return None
+
+            for candidate in self._candidates(db, restaurant):
+                similarity = self.detector.compare(candidate, restaurant)
+                if not similarity['is_duplicate']:
+                    continue
+
+                group = {
+                    'master': {
+                        'id': candidate.id,
+                        'name': candidate.name,
+                        'address': candidate.address
+                    },
+                    'duplicates': [{
+                        'id': restaurant.id,
+                        'name': restaurant.name,
+                        'similarity': similarity
+                    }],
+                    'total_duplicates': 1
+                }
+
+                if MergeManager(db).merge_duplicates(group, merge_type='auto', merged_by='pipeline'):
+                    logger.info(f"  🔀 Merged into existing: {restaurant.name} → {candidate.id}")
+                    lineage_sink.record(
+                        restaurant_id, 'merged', 'system',
+                        output_data={'master_id': candidate.id},
+                        transformation_rules={'detection_method': similarity['detection_method']},
+                        executed_by='pipeline'
+                    )
+                    return None
+                break
+
+            return restaurant.id
+
+
+class SyncStage:
+    """동기화 단계: 레스토랑 ID를 모아 배치 단위로 한식당에 전송"""
+
+    def __init__(self, sync_workflow, batch_size: int):
+        self.sync_workflow = sync_workflow
+        self.batch_size = batch_size
+        self.buffer: List[str] = []
+
+    async def __call__(self, restaurant_id: str) -> None:
+        self.buffer.append(restaurant_id)
+        if len(self.buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.buffer:
+            return
+
+        batch, self.buffer = self.buffer, []
+        await self.sync_workflow.sync_to_hansikdang(restaurant_ids=batch)
@@ -1,131 +1,803 @@
 """
 Sync workflow to 한식당
 정제된 데이터를 한식당 External API로 전송
+
+- 동기화 대상(pending + 품질 기준)을 id 순 keyset 페이지로 끝까지 전송 (1회 실행 = 전체 동기화)
+- delta 모드: 동기화 이후 전송 필드가 바뀐 행(content_hash != last_synced_hash)만 재전송
+  · hansikdang_patch_supported면 바뀐 필드만 PATCH로 전송
+- 배치는 행 수가 아닌 payload 바이트 기준으로 구성 (413 방지), 여러 배치를 동시에 전송 (in-flight 창)
+- 응답의 레스토랑별 결과를 반영 (성공 → synced, 최종 실패 → failed)
+  · failed 행은 sync_retry_at 이후 다음 실행에서 재전송 (최대 sync_retry_attempts회, 대기 시간 2배씩 증가)
+  · 결과를 레스토랑별로 알 수 없는 응답(개수만 반환)은 배치를 반으로 나눠 재전송해 실패 항목을 특정
+- 요청 본문 압축 (zstd/gzip, 415 응답의 Accept-Encoding으로 협상)
+- NDJSON 스트리밍 모드 (sync_transport="ndjson"): DB 페이지를 읽는 대로 행 단위 직렬화/압축해 chunked 전송
+  · 서버가 지원하지 않으면 JSON 배치로 자동 전환
+- 일시적 오류(네트워크, 429, 5xx)와 실패 항목은 지수 backoff로 재시도
+- 실행당 SyncLog 1개 (전송/성공/실패 수 정확히 기록)
 """
 import asyncio
-import httpx
+import random
+import time
 import uuid
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, AsyncIterator, NamedTuple, Optional, Tuple
 from loguru import logger
+import httpx
+from sqlalchemy import and_, func, or_
 
 from src.database.connection import db_session
+from src.database.change_tracking import KEY_FIELDS, hansikdang_payload, payload_hash, field_hashes
 from src.database.models import ProcessedRestaurant, SyncLog
+from src.governance.lineage_sink import lineage_sink
+from src.monitoring.metrics import SYNC_BATCH_SIZE, SYNC_BYTES, SYNC_RESTAURANTS
 from config import settings
+from src.utils.compression import (
+    IDENTITY, SUPPORTED_ENCODINGS, compress, compressor, parse_accept_encoding, preferred_encoding
+)
+from src.utils.http_client import NO_RETRY, http_clients
+from src.utils.serialization import dumps, loads
+
+
+class SyncItem(NamedTuple):
+    """전송 단위 (직렬화된 payload 항목 + 성공 시 기록할 해시)"""
+    id: str
+    body: bytes
+    content_hash: str
+    field_hashes: Dict[str, str]
+    patch: bool = False
+    attempts: int = 0  # 이전 실행들에서 연속으로 실패한 수
+
+
+class _BatchPacker:
+    """payload 바이트/행 수 한도로 배치 구성 (PATCH와 전체 전송은 별도 배치)"""
+
+    def __init__(self, max_bytes: int, max_rows: int):
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self._batches: Dict[bool, List[SyncItem]] = {False: [], True: []}
+        self._sizes: Dict[bool, int] = {False: 0, True: 0}
+
+    def add(self, item: SyncItem) -> Optional[List[SyncItem]]:
+        """항목 추가 (한도에 도달해 닫힌 배치가 있으면 반환)"""
+        closed = None
+        batch = self._batches[item.patch]
+        item_size = len(item.body) + 1
+        if batch and (self._sizes[item.patch] + item_size > self.max_bytes or len(batch) >= self.max_rows):
+            closed = batch
+            self._batches[item.patch], self._sizes[item.patch] = [], 0
+
+        self._batches[item.patch].append(item)
+        self._sizes[item.patch] += item_size
+        return closed
+
+    def drain(self) -> List[List[SyncItem]]:
+        """남은 배치"""
+        batches = [batch for batch in self._batches.values() if batch]
+        self._batches = {False: [], True: []}
+        self._sizes = {False: 0, True: 0}
+        return batches
+
+    def pack(self, items: List[SyncItem]) -> List[List[SyncItem]]:
+        batches = [batch for batch in map(self.add, items) if batch]
+        return batches + self.drain()
+
+
+async def _prepend(first: SyncItem, items: AsyncIterator[SyncItem]) -> AsyncIterator[SyncItem]:
+    yield first
+    async for item in items:
+        yield item
+
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# SyncLog.error_details에 남길 실패 사례 수
+MAX_LOGGED_ERRORS = 50
 
 
 class SyncWorkflow:
-    """한식당 동기화 워크플로우"""
-    
-    def __init__(self):
+    """
+    한식당 동기화 엔진
+
+    Usage:
+        workflow = SyncWorkflow(max_in_flight=4)
+        result = await workflow.sync_to_hansikdang()
+        changes = await workflow.sync_to_hansikdang(delta=True)
+    """
+
+    # api_url → 협상된 {"encoding", "transport"} (프로세스 내 공유)
+    _negotiated: Dict[str, Dict[str, str]] = {}
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_batch_rows: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        page_size: int = 500
+    ):
+        """
+        Args:
+            max_in_flight: 동시에 전송 중인 배치 수 (기본: settings.sync_max_in_flight)
+            max_batch_bytes: 배치 payload 최대 바이트 (기본: settings.sync_max_batch_bytes)
+            max_batch_rows: 배치 최대 레스토랑 수 (기본: settings.sync_max_batch_rows)
+            max_attempts: 레스토랑/배치당 최대 전송 시도 수 (기본: settings.max_retries)
+            page_size: DB에서 한 번에 읽는 레스토랑 수
+        """
         self.api_url = settings.hansikdang_api_url
         self.api_key = settings.data_collection_api_key
-        self.batch_size = settings.batch_size
+        self.max_in_flight = max_in_flight or settings.sync_max_in_flight
+        self.max_batch_bytes = max_batch_bytes or settings.sync_max_batch_bytes
+        self.max_batch_rows = max_batch_rows or settings.sync_max_batch_rows
+        self.max_attempts = max_attempts or settings.max_retries
+        self.page_size = page_size
+        self.stream_rows = settings.sync_stream_rows
         self.logger = logger.bind(workflow="sync")
-    
-    async def sync_to_hansikdang(self):
-        """한식당으로 데이터 동기화"""
-        self.logger.info("Starting sync to 한식당")
-        
-        with db_session() as db:
-            # 동기화 대기 중인 레스토랑 (품질 점수 70 이상)
-            restaurants = db.query(ProcessedRestaurant).filter(
-                ProcessedRestaurant.sync_status == 'pending',
-                ProcessedRestaurant.quality_score >= settings.quality_threshold
-            ).limit(self.batch_size).all()
-            
-            if not restaurants:
-                self.logger.info("No restaurants to sync")
-                return
-            
-            # 동기화 로그 생성
-            log_id = str(uuid.uuid4())
-            log = SyncLog(
-                id=log_id,
-                status='running',
-                total_sent=len(restaurants)
+
+        # 압축 방식/전송 방식 (서버 응답으로 협상된 값이 있으면 우선)
+        negotiated = self._negotiated.get(self.api_url, {})
+        self.encoding = negotiated.get("encoding") or preferred_encoding(settings.sync_compression)
+        self.transport = negotiated.get("transport") or settings.sync_transport
+        if self.transport not in ("batch", "ndjson"):
+            raise ValueError(f"Invalid sync_transport '{self.transport}' (expected 'batch' or 'ndjson')")
+
+    async def sync_to_hansikdang(
+        self,
+        restaurant_ids: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        delta: bool = False
+    ) -> Dict[str, Any]:
+        """
+        한식당으로 데이터 동기화 (대상이 없어질 때까지)
+
+        Args:
+            restaurant_ids: 지정 시 해당 레스토랑만 동기화 (파이프라인 sync 단계)
+            limit: 이번 실행에서 전송할 최대 레스토랑 수
+            delta: 미동기화 행 대신 동기화 이후 변경된 행만 전송
+
+        Returns:
+            {"total_sent", "synced", "failed", "patched", "requests", "retries", "splits", "batches",
+             "raw_bytes", "bytes_sent", "bytes_per_restaurant", "compression_ratio", "encoding", "transport",
+             "elapsed_seconds", "restaurants_per_second"}
+        """
+        mode = "delta" if delta else "full"
+        self.logger.info(f"Starting sync to 한식당 ({mode}, transport={self.transport}, encoding={self.encoding})")
+        started = time.monotonic()
+
+        first_page = await asyncio.to_thread(
+            self._fetch_page, None, restaurant_ids, self._page_limit(0, limit), delta
+        )
+        if not first_page:
+            self.logger.info("No restaurants to sync")
+            return {"total_sent": 0, "synced": 0, "failed": 0}
+
+        log_id = await asyncio.to_thread(self._create_log)
+        stats = {
+            "total_sent": 0, "synced": 0, "failed": 0, "patched": 0,
+            "requests": 0, "retries": 0, "splits": 0, "batches": 0, "raw_bytes": 0, "bytes_sent": 0
+        }
+        errors: List[Dict[str, Any]] = []
+        status = 'failed'
+
+        async def record(synced: List[SyncItem], failed: List[Tuple[SyncItem, str]]) -> None:
+            await asyncio.to_thread(self._record_results, synced, failed, delta)
+            stats["synced"] += len(synced)
+            stats["failed"] += len(failed)
+            stats["patched"] += sum(1 for item in synced if item.patch)
+            stats["total_sent"] += len(synced) + len(failed)
+            SYNC_RESTAURANTS.inc(len(synced), result="synced")
+            SYNC_RESTAURANTS.inc(len(failed), result="failed")
+            errors.extend(
+                {"id": item.id, "error": error}
+                for item, error in failed[:max(MAX_LOGGED_ERRORS - len(errors), 0)]
             )
-            db.add(log)
-            db.commit()
-            
-            try:
-                # 한식당 External API로 전송
-                restaurant_list = [
-                    self._format_for_hansikdang(r)
-                    for r in restaurants
-                ]
-                
-                payload = {"restaurants": restaurant_list}
-                
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{self.api_url}/api/external/restaurants",
-                        json=payload,
-                        headers={
-                            "X-API-Key": self.api_key,
-                            "Content-Type": "application/json"
-                        },
-                        timeout=60.0
+
+        items = self._iter_items(first_page, restaurant_ids, limit, delta)
+        try:
+            if self.transport == "ndjson":
+                await self._run_streams(items, stats, record)
+            else:
+                await self._run_batches(items, stats, record)
+            status = 'completed'
+        except asyncio.CancelledError:
+            status = 'cancelled'
+            raise
+        except Exception as e:
+            self.logger.error(f"Sync failed: {e}")
+            errors.append({"error": str(e)})
+        finally:
+            await items.aclose()
+            elapsed = time.monotonic() - started
+            stats["elapsed_seconds"] = round(elapsed, 2)
+            stats["restaurants_per_second"] = round(stats["synced"] / elapsed, 2) if elapsed else 0
+            stats["bytes_per_restaurant"] = round(stats["bytes_sent"] / stats["synced"]) if stats["synced"] else None
+            stats["compression_ratio"] = (
+                round(stats["raw_bytes"] / stats["bytes_sent"], 2) if stats["bytes_sent"] else None
+            )
+            stats["encoding"] = self.encoding
+            stats["transport"] = self.transport
+            SYNC_BYTES.inc(stats["raw_bytes"], kind="raw")
+            SYNC_BYTES.inc(stats["bytes_sent"], kind="wire")
+            await asyncio.shield(asyncio.to_thread(self._finish_log, log_id, status, mode, stats, errors))
+
+        self.logger.info(
+            f"Synced {stats['synced']}/{stats['total_sent']} restaurants ({mode}, {stats['patched']} patched, "
+            f"{stats['failed']} failed, {stats['requests']} requests, {stats['retries']} retries) "
+            f"in {stats['elapsed_seconds']}s, {stats['bytes_per_restaurant']} bytes/restaurant on wire "
+            f"({self.transport}, {self.encoding})"
+        )
+        return stats
+
+    def _page_limit(self, sent: int, limit: Optional[int]) -> int:
+        return min(self.page_size, limit - sent) if limit else self.page_size
+
+    async def _iter_items(
+        self,
+        page: List[SyncItem],
+        restaurant_ids: Optional[List[str]],
+        limit: Optional[int],
+        delta: bool
+    ) -> AsyncIterator[SyncItem]:
+        """전송 항목을 하나씩 반환 (현재 페이지를 보내는 동안 다음 페이지를 미리 조회)"""
+        fetched = 0
+        next_page = None
+        try:
+            while page:
+                fetched += len(page)
+                remaining = self._page_limit(fetched, limit)
+                if remaining:
+                    next_page = asyncio.ensure_future(
+                        asyncio.to_thread(self._fetch_page, page[-1].id, restaurant_ids, remaining, delta)
                     )
-                    
-                    if response.status_code != 200:
-                        self.logger.error(f"Sync failed with status {response.status_code}: {response.text}")
-                    
-                    response.raise_for_status()
-                    result = response.json()
-                
-                # 성공한 레스토랑 업데이트
-                success_count = result.get("success", 0)  # 메인 앱 응답 형식: {"success": N, "failed": M}
-                
+
+                for item in page:
+                    yield item
+
+                page = await next_page if next_page else []
+                next_page = None
+        finally:
+            if next_page:
+                next_page.cancel()
+
+    def _packer(self) -> "_BatchPacker":
+        return _BatchPacker(self.max_batch_bytes, self.max_batch_rows)
+
+    async def _run_batches(self, items: AsyncIterator[SyncItem], stats: Dict[str, Any], record) -> None:
+        """JSON 배치 전송 (배치 구성 → in-flight 창 크기의 큐 → 전송 worker)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_in_flight)
+
+        async def produce() -> None:
+            packer = self._packer()
+            async for item in items:
+                batch = packer.add(item)
+                if batch:
+                    await queue.put(batch)
+            for batch in packer.drain():
+                await queue.put(batch)
+
+            for _ in range(self.max_in_flight):
+                await queue.put(None)
+
+        async def send_batches() -> None:
+            while (batch := await queue.get()) is not None:
+                stats["batches"] += 1
+                await record(*await self._deliver(batch, stats))
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(send_batches()) for _ in range(self.max_in_flight)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_streams(self, items: AsyncIterator[SyncItem], stats: Dict[str, Any], record) -> None:
+        """
+        NDJSON 스트리밍 전송 (요청당 최대 stream_rows 행, 행마다 직렬화 → 압축 → 전송)
+
+        서버가 NDJSON을 지원하지 않으면(404/405/415) 남은 항목은 JSON 배치로 전송합니다.
+        """
+        item = await anext(items, None)
+        while item is not None:
+            if self.transport != "ndjson":
+                await self._run_batches(_prepend(item, items), stats, record)
+                return
+
+            # 본문을 읽기 전에 실패해도(연결 오류, 업로드 전 404/405/415) 첫 항목이 재전송되도록 미리 기록
+            sent: List[SyncItem] = [item]
+
+            async def body() -> AsyncIterator[bytes]:
+                stream = compressor(self.encoding)
+                current = sent[0]
+                while True:
+                    line = current.body + b"\n"
+                    stats["raw_bytes"] += len(line)
+                    chunk = stream.compress(line)
+                    if chunk:
+                        stats["bytes_sent"] += len(chunk)
+                        yield chunk
+                    if len(sent) >= self.stream_rows:
+                        break
+                    current = await anext(items, None)
+                    if current is None:
+                        break
+                    sent.append(current)
+
+                tail = stream.flush()
+                stats["bytes_sent"] += len(tail)
+                SYNC_BATCH_SIZE.observe(len(sent), transport="ndjson")
+                yield tail
+
+            stats["batches"] += 1
+            synced: List[SyncItem] = []
+            retry: List[SyncItem] = []
+            retry_attempt = 2
+            try:
+                result = await self._post_stream(body(), stats)
+            except httpx.HTTPStatusError as e:
+                code = e.response.status_code
+                if code == 415 and self._downgrade_encoding(e.response):
+                    retry, retry_attempt = sent, 1
+                elif code in (404, 405, 415):
+                    self.logger.warning(f"NDJSON upload not supported (HTTP {code}), falling back to JSON batches")
+                    self.transport = "batch"
+                    self._remember(transport="batch")
+                    retry, retry_attempt = sent, 1
+                else:
+                    self.logger.warning(f"NDJSON stream of {len(sent)} restaurants failed: HTTP {code}")
+                    retry = sent
+            except httpx.TransportError as e:
+                self.logger.warning(f"NDJSON stream of {len(sent)} restaurants failed: {type(e).__name__}: {e}")
+                retry = sent
+            except httpx.StreamConsumed:
+                # 본문을 다시 읽으려 한 경우 (재시도하는 transport 등) → 이 묶음만 JSON 배치로 전송
+                self.logger.warning(f"NDJSON stream of {len(sent)} restaurants was consumed, resending as JSON batches")
+                retry, retry_attempt = sent, 1
+            else:
+                outcomes = self._item_results(result, len(sent))
+                if outcomes is None:
+                    retry = sent
+                else:
+                    for sent_item, error in zip(sent, outcomes):
+                        (synced if error is None else retry).append(sent_item)
+
+            if synced:
+                await record(synced, [])
+            if retry:
+                # 스트림 본문은 다시 읽을 수 없으므로 실패분은 JSON 배치로 재전송 (backoff/분할 포함)
+                if retry_attempt > 1:
+                    await asyncio.sleep(self._backoff(1))
+                    stats["retries"] += 1
+                for batch in self._packer().pack(retry):
+                    await record(*await self._deliver(batch, stats, attempt=retry_attempt))
+
+            item = await anext(items, None)
+
+    def _backoff(self, attempt: int) -> float:
+        return settings.retry_delay * 2 ** (attempt - 1) * (0.5 + random.random())
+
+    def _remember(self, **negotiated: str) -> None:
+        """협상 결과를 프로세스 내 이후 실행에도 적용"""
+        self._negotiated.setdefault(self.api_url, {}).update(negotiated)
+
+    def _downgrade_encoding(self, response: httpx.Response) -> bool:
+        """
+        415 응답의 Accept-Encoding에 맞춰 요청 압축 방식 변경
+
+        Returns:
+            변경했으면 True (같은 요청을 다시 보내면 됨), 인코딩 문제가 아니면 False
+        """
+        if self.encoding == IDENTITY:
+            return False
+
+        offered = parse_accept_encoding(response.headers.get("Accept-Encoding"))
+        if self.encoding in offered:
+            return False
+
+        candidates = [encoding for encoding in SUPPORTED_ENCODINGS if encoding in offered]
+        encoding = candidates[0] if candidates else IDENTITY
+        self.logger.warning(f"Server rejected {self.encoding} request body, switching to {encoding}")
+        self.encoding = encoding
+        self._remember(encoding=encoding)
+        return True
+
+    # ------------------------------------------------------------------
+    # 전송
+    # ------------------------------------------------------------------
+
+    async def _deliver(
+        self,
+        batch: List[SyncItem],
+        stats: Dict[str, Any],
+        attempt: int = 1
+    ) -> Tuple[List[SyncItem], List[Tuple[SyncItem, str]]]:
+        """
+        배치 전송 (재시도/분할 포함)
+
+        Returns:
+            (성공한 항목, (실패한 항목, 오류) 목록)
+        """
+        synced: List[SyncItem] = []
+        failed: List[Tuple[SyncItem, str]] = []
+        pending = batch
+
+        while pending:
+            retry: List[Tuple[SyncItem, str]] = []
+            try:
+                result = await self._post(pending, stats)
+            except httpx.HTTPStatusError as e:
+                code = e.response.status_code
+                if code == 413 and len(pending) > 1:
+                    # 한도를 넘는 배치 → 반으로 나눠 재전송
+                    stats["splits"] += 1
+                    for half in (pending[:len(pending) // 2], pending[len(pending) // 2:]):
+                        half_synced, half_failed = await self._deliver(half, stats, attempt)
+                        synced.extend(half_synced)
+                        failed.extend(half_failed)
+                    return synced, failed
+
+                error = f"HTTP {code}: {e.response.text[:200]}"
+                if code in RETRYABLE_STATUS:
+                    retry = [(item, error) for item in pending]
+                else:
+                    failed.extend((item, error) for item in pending)
+            except httpx.TransportError as e:
+                retry = [(item, f"{type(e).__name__}: {e}") for item in pending]
+            else:
+                outcomes = self._item_results(result, len(pending))
+                if outcomes is None:
+                    # 개수만 반환된 부분 실패 → 반으로 나눠 실패 항목 특정
+                    stats["splits"] += 1
+                    for half in (pending[:len(pending) // 2], pending[len(pending) // 2:]):
+                        half_synced, half_failed = await self._deliver(half, stats, attempt)
+                        synced.extend(half_synced)
+                        failed.extend(half_failed)
+                    return synced, failed
+
+                for item, error in zip(pending, outcomes):
+                    if error is None:
+                        synced.append(item)
+                    else:
+                        retry.append((item, error))
+
+            if not retry:
+                break
+            if attempt >= self.max_attempts:
+                failed.extend(retry)
+                break
+
+            delay = self._backoff(attempt)
+            self.logger.warning(
+                f"Retrying {len(retry)} restaurants in {delay:.1f}s (attempt {attempt + 1}/{self.max_attempts}): "
+                f"{retry[0][1]}"
+            )
+            await asyncio.sleep(delay)
+            stats["retries"] += 1
+            attempt += 1
+            pending = [item for item, _ in retry]
+
+        return synced, failed
+
+    async def _post(self, batch: List[SyncItem], stats: Dict[str, Any]) -> Dict[str, Any]:
+        """직렬화된 항목을 그대로 이어 붙여 압축 전송 (재직렬화 없음, PATCH 배치는 PATCH로)"""
+        raw = b'{"restaurants":[' + b",".join(item.body for item in batch) + b"]}"
+        method = "PATCH" if batch[0].patch else "POST"
+        client = http_clients.get("hansikdang")
+        SYNC_BATCH_SIZE.observe(len(batch), transport="batch")
+
+        while True:
+            headers = {
+                "X-API-Key": self.api_key,
+                "Content-Type": "application/json"
+            }
+            body = raw
+            if self.encoding != IDENTITY:
+                body = await asyncio.to_thread(compress, raw, self.encoding)
+                headers["Content-Encoding"] = self.encoding
+
+            stats["requests"] += 1
+            stats["raw_bytes"] += len(raw)
+            stats["bytes_sent"] += len(body)
+            response = await client.request(
+                method,
+                f"{self.api_url}/api/external/restaurants",
+                content=body,
+                headers=headers
+            )
+
+            if response.status_code == 415 and self._downgrade_encoding(response):
+                continue
+            break
+
+        if response.status_code != 200:
+            self.logger.error(
+                f"Sync {method} batch ({len(batch)} restaurants) failed with status {response.status_code}"
+            )
+
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def _post_stream(self, body: AsyncIterator[bytes], stats: Dict[str, Any]) -> Dict[str, Any]:
+        """NDJSON 스트림 업로드 (chunked, 응답: 행 순서대로 {"results": [...]})"""
+        headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": NDJSON_CONTENT_TYPE
+        }
+        if self.encoding != IDENTITY:
+            headers["Content-Encoding"] = self.encoding
+
+        client = http_clients.get("hansikdang")
+        stats["requests"] += 1
+        # 본문(async generator)은 한 번만 읽을 수 있으므로 transport 재시도 없이 전송
+        response = await client.post(
+            f"{self.api_url}/api/external/restaurants",
+            content=body,
+            headers=headers,
+            extensions={NO_RETRY: True}
+        )
+
+        if response.status_code != 200:
+            self.logger.error(f"Sync NDJSON stream failed with status {response.status_code}")
+
+        response.raise_for_status()
+        return loads(response.content)
+
+    @staticmethod
+    def _item_results(result: Dict[str, Any], count: int) -> Optional[List[Optional[str]]]:
+        """
+        응답에서 레스토랑별 결과 추출 (전송 순서, 성공이면 None / 실패면 오류 메시지)
+
+        지원 형식:
+            {"results": [{"success": true}, {"success": false, "error": "..."}]}
+            {"success": N, "failed": M, "errors": [{"index": 1, "error": "..."}]}
+            {"success": N, "failed": 0}
+
+        Returns:
+            레스토랑별로 특정할 수 없으면 None
+        """
+        results = result.get("results")
+        if isinstance(results, list) and len(results) == count:
+            outcomes = []
+            for entry in results:
+                if isinstance(entry, dict):
+                    ok = entry.get("success")
+                    if ok is None:
+                        ok = str(entry.get("status", "")).lower() in ("success", "ok", "created", "updated")
+                    error = entry.get("error") or entry.get("message")
+                else:
+                    ok, error = bool(entry), None
+                outcomes.append(None if ok else str(error or "rejected"))
+            return outcomes
+
+        errors = result.get("errors")
+        if isinstance(errors, list) and errors and all(isinstance(e, dict) and "index" in e for e in errors):
+            outcomes: List[Optional[str]] = [None] * count
+            for entry in errors:
+                index = int(entry["index"])
+                if 0 <= index < count:
+                    outcomes[index] = str(entry.get("error") or entry.get("message") or "rejected")
+            return outcomes
+
+        failed = result.get("failed")
+        success = result.get("success")
+        if failed == 0 or success == count:
+            return [None] * count
+        if count == 1:
+            return ["rejected"]
+        return None
+
+    # ------------------------------------------------------------------
+    # DB
+    # ------------------------------------------------------------------
+
+    def _fetch_page(
+        self,
+        cursor: Optional[str],
+        restaurant_ids: Optional[List[str]],
+        limit: int,
+        delta: bool = False
+    ) -> List[SyncItem]:
+        """cursor 이후 동기화 대상 (payload로 직렬화해 반환)"""
+        with db_session() as db:
+            query = db.query(ProcessedRestaurant)
+            if delta:
+                # idx_processed_sync_dirty (부분 인덱스) 사용
+                query = query.filter(
+                    ProcessedRestaurant.sync_status == 'synced',
+                    ProcessedRestaurant.content_hash.is_distinct_from(ProcessedRestaurant.last_synced_hash)
+                )
+            else:
+                # 재시도 시각이 지난 failed 행도 포함 (시도 횟수 한도 내)
+                query = query.filter(
+                    or_(
+                        ProcessedRestaurant.sync_status == 'pending',
+                        and_(
+                            ProcessedRestaurant.sync_status == 'failed',
+                            func.coalesce(ProcessedRestaurant.sync_attempts, 0) < settings.sync_retry_attempts,
+                            or_(
+                                ProcessedRestaurant.sync_retry_at == None,
+                                ProcessedRestaurant.sync_retry_at <= datetime.now()
+                            )
+                        )
+                    ),
+                    ProcessedRestaurant.quality_score >= settings.quality_threshold
+                )
+            if restaurant_ids is not None:
+                query = query.filter(ProcessedRestaurant.id.in_(restaurant_ids))
+            if cursor:
+                query = query.filter(ProcessedRestaurant.id > cursor)
+
+            # 행을 읽는 대로 직렬화 (ORM 객체를 페이지 전체만큼 쌓아두지 않음)
+            allow_patch = delta and settings.hansikdang_patch_supported and self.transport != "ndjson"
+            return [
+                self._sync_item(r, allow_patch)
+                for r in query.order_by(ProcessedRestaurant.id).limit(limit).yield_per(100)
+            ]
+
+    @staticmethod
+    def _sync_item(restaurant: ProcessedRestaurant, allow_patch: bool = False) -> SyncItem:
+        """전송 항목 생성 (PATCH 가능하면 바뀐 필드 + 식별 필드만, NDJSON 스트림은 전체 레코드)"""
+        payload = hansikdang_payload(restaurant)
+        hashes = field_hashes(payload)
+        body = payload
+        patch = False
+
+        previous = restaurant.synced_field_hashes
+        if allow_patch and previous:
+            changed = [field for field, value in hashes.items() if previous.get(field) != value]
+            # 식별 필드가 바뀌었으면 PATCH 대상을 찾을 수 없으므로 전체 전송
+            if changed and not any(field in KEY_FIELDS for field in changed):
+                body = {field: payload[field] for field in (*KEY_FIELDS, *changed)}
+                patch = True
+
+        return SyncItem(
+            id=restaurant.id,
+            body=dumps(body),
+            content_hash=payload_hash(payload),
+            field_hashes=hashes,
+            patch=patch,
+            attempts=restaurant.sync_attempts or 0,
+        )
+
+    def _record_results(
+        self,
+        synced: List[SyncItem],
+        failed: List[Tuple[SyncItem, str]],
+        delta: bool = False
+    ) -> None:
+        now = datetime.now()
+        mappings = [
+            {
+                "id": item.id,
+                "sync_status": 'synced',
+                "synced_to_hansikdang": True,
+                "synced_at": now,
+                "last_synced_hash": item.content_hash,
+                "synced_field_hashes": item.field_hashes,
+                "sync_attempts": 0,
+                "sync_retry_at": None,
+            }
+            for item in synced
+        ]
+        # delta 전송 실패는 synced 상태 유지 (이전 값은 전송된 상태, 다음 delta 실행에서 재시도)
+        failed_mappings = [] if delta else [
+            {
+                "id": item.id,
+                "sync_status": 'failed',
+                "sync_attempts": item.attempts + 1,
+                "sync_retry_at": now + timedelta(minutes=settings.sync_retry_delay_minutes * 2 ** item.attempts),
+            }
+            for item, _ in failed
+        ]
+
+        with db_session() as db:
+            if mappings:
+                db.bulk_update_mappings(ProcessedRestaurant, mappings)
+                # 해시가 아직 없던 행(변경 추적 이전 데이터)은 전송한 값을 현재 값으로 기록
+                # (그 사이 수정된 행은 content_hash가 이미 있으므로 덮어쓰지 않음)
+                db.query(ProcessedRestaurant).filter(
+                    ProcessedRestaurant.id.in_([item.id for item in synced]),
+                    ProcessedRestaurant.content_hash == None
+                ).update(
+                    {ProcessedRestaurant.content_hash: ProcessedRestaurant.last_synced_hash},
+                    synchronize_session=False
+                )
+            if failed_mappings:
+                db.bulk_update_mappings(ProcessedRestaurant, failed_mappings)
+
+        for item in synced:
+            lineage_sink.record(
+                item.id, 'synced', 'hansikdang',
+                output_data={'content_hash': item.content_hash},
+                transformation_rules={'mode': 'patch' if item.patch else 'full'}
+            )
+        for item, error in failed:
+            lineage_sink.record(
+                item.id, 'synced', 'hansikdang',
+                output_data={'error': error[:200]},
+                transformation_rules={'mode': 'patch' if item.patch else 'full'},
+                status='failed'
+            )
+
+    def baseline_synced_hashes(self, page_size: int = 1000) -> int:
+        """
+        변경 추적 도입 이전에 동기화된 행의 해시 기준선 기록
+
+        현재 값이 마지막으로 전송한 값과 같다고 보고 last_synced_hash를 채웁니다
+        (이후 수정분만 delta sync 대상이 됨).
+
+        Returns:
+            갱신한 행 수
+        """
+        updated = 0
+        cursor = None
+        while True:
+            with db_session() as db:
+                query = db.query(ProcessedRestaurant).filter(
+                    ProcessedRestaurant.sync_status == 'synced',
+                    ProcessedRestaurant.last_synced_hash == None
+                )
+                if cursor:
+                    query = query.filter(ProcessedRestaurant.id > cursor)
+
+                restaurants = query.order_by(ProcessedRestaurant.id).limit(page_size).all()
+                if not restaurants:
+                    break
+
+                mappings = []
                 for restaurant in restaurants:
-                    restaurant.sync_status = 'synced'
-                    restaurant.synced_to_hansikdang = True
-                    restaurant.synced_at = datetime.now()
-                
-                # 로그 업데이트
-                log.completed_at = datetime.now()
-                log.status = 'completed'
-                log.success_count = success_count
-                log.error_count = len(restaurants) - success_count
-                
-                db.commit()
-                
-                self.logger.info(f"Synced {success_count}/{len(restaurants)} restaurants")
-                
-            except Exception as e:
-                self.logger.error(f"Sync failed: {e}")
-                log.status = 'failed'
-                log.error_details = {"error": str(e)}
-                db.commit()
-    
+                    payload = hansikdang_payload(restaurant)
+                    content_hash = payload_hash(payload)
+                    mappings.append({
+                        "id": restaurant.id,
+                        "content_hash": content_hash,
+                        "last_synced_hash": content_hash,
+                        "synced_field_hashes": field_hashes(payload),
+                    })
+                db.bulk_update_mappings(ProcessedRestaurant, mappings)
+                updated += len(mappings)
+                cursor = restaurants[-1].id
+
+        self.logger.info(f"Recorded sync baseline hashes for {updated} restaurants")
+        return updated
+
+    def _create_log(self) -> str:
+        log_id = str(uuid.uuid4())
+        with db_session() as db:
+            db.add(SyncLog(id=log_id, status='running'))
+        return log_id
+
+    def _finish_log(
+        self,
+        log_id: str,
+        status: str,
+        mode: str,
+        stats: Dict[str, Any],
+        errors: List[Dict[str, Any]]
+    ) -> None:
+        with db_session() as db:
+            log = db.query(SyncLog).filter(SyncLog.id == log_id).first()
+            log.completed_at = datetime.now()
+            log.status = status
+            log.total_sent = stats["total_sent"]
+            log.success_count = stats["synced"]
+            log.error_count = stats["failed"]
+            log.error_details = {
+                "mode": mode,
+                "errors": errors,
+                **{
+                    key: stats.get(key)
+                    for key in (
+                        "patched", "requests", "retries", "splits", "batches", "raw_bytes", "bytes_sent",
+                        "bytes_per_restaurant", "compression_ratio", "encoding", "transport", "elapsed_seconds"
+                    )
+                }
+            }
+
     def _format_for_hansikdang(self, restaurant: ProcessedRestaurant) -> Dict[str, Any]:
         """한식당 External API 형식으로 변환"""
-        # priceRange 숫자 변환 (문자열 → 숫자)
-        price_range_map = {
-            "저렴": 1,
-            "보통": 2,
-            "비쌈": 3,
-            "매우비쌈": 4,
-            "1": 1, "2": 2, "3": 3, "4": 4
-        }
-        price_range_value = price_range_map.get(str(restaurant.price_range), 2)
-        
-        return {
-            "name": restaurant.name,
-            "nameEn": restaurant.name_en,
-            "category": restaurant.category,
-            "cuisine": restaurant.cuisine,
-            "district": restaurant.district,
-            "address": restaurant.address,
-            "description": restaurant.description,
-            "descriptionEn": restaurant.description_en,
-            "priceRange": price_range_value,
-            "imageUrl": restaurant.image_url or "https://via.placeholder.com/400x300?text=Restaurant",
-            "openHours": restaurant.open_hours or "정보 없음",
-            "phone": restaurant.phone,
-            "latitude": restaurant.latitude,
-            "longitude": restaurant.longitude,
-        }
+        return hansikdang_payload(restaurant)
 
 
 async def main():
@@ -0,0 +1,49 @@
+"""
+pytest 공통 설정
+
+설정(config.settings)은 import 시점에 환경 변수를 읽으므로 모듈 import 전에
+테스트용 SQLite DB / 인덱스 파일 경로를 지정합니다.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+_TMP_DIR = tempfile.mkdtemp(prefix="datahub-test-")
+os.environ["DATA_HUB_DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/datahub.db"
+os.environ["KNOWN_IDS_PATH"] = f"{_TMP_DIR}/known_ids.idx"
+os.environ["LINEAGE_ENABLED"] = "false"
+os.environ["METRICS_TEXTFILE_PATH"] = ""
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def create_tables():
+    """필요한 모델 테이블만 생성하고 테스트가 끝나면 삭제 (create_all은 SQLite에서 인덱스 이름이 겹침)"""
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.schema import CreateTable
+
+    from src.database.connection import engine
+
+    created = []
+
+    def create(*models):
+        for model in models:
+            table = model.__table__
+            with engine.begin() as conn:
+                conn.execute(CreateTable(table, if_not_exists=True))
+            for index in table.indexes:
+                try:
+                    index.create(engine, checkfirst=True)
+                except OperationalError:
+                    # 다른 테이블의 인덱스와 이름이 같음 (quality_metrics / quality_scores)
+                    pass
+            created.append(table)
+
+    yield create
+
+    for table in reversed(created):
+        table.drop(engine, checkfirst=True)
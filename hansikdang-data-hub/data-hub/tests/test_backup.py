@@ -0,0 +1,151 @@
+"""백업 - 일일 CSV 내보내기 왕복, DB 오류 후 재시도, Parquet 스냅샷 / 전체 백업 복원"""
+import csv
+import io
+import uuid
+from datetime import datetime
+
+import pytest
+
+from config import settings
+from src.database.connection import db_session
+from src.database.models import BackupHistory, MergeHistory, ProcessedRestaurant, QualityMetrics, RawRestaurantData
+from src.governance.backup_storage import LocalStorage
+from src.governance.drive_backup import CSV_HEADER, DriveBackupManager
+from src.governance.full_backup import FullBackupManager
+from src.governance.snapshot import SNAPSHOT_TABLES, SnapshotExporter
+
+BACKUP_DATE = "2026-10-01"
+
+
+@pytest.fixture
+def restaurants(create_tables):
+    create_tables(ProcessedRestaurant, MergeHistory, QualityMetrics, BackupHistory)
+    rows = [
+        {
+            'id': str(uuid.uuid4()), 'name': f"백업 식당 {i}", 'address': f"서울 중구 {i}",
+            'description': "줄바꿈\n\"따옴표\", 쉼표" if i == 0 else None,
+            'naver_rating': 4.5, 'latitude': 37.5 + i / 100, 'created_at': datetime(2026, 10, 1, 9 + i),
+        }
+        for i in range(3)
+    ]
+    with db_session() as db:
+        db.add_all(ProcessedRestaurant(**row) for row in rows)
+        # 다른 날짜 행은 내보내지 않음
+        db.add(ProcessedRestaurant(id=str(uuid.uuid4()), name="다음날 식당", created_at=datetime(2026, 10, 2, 9)))
+    return rows
+
+
+def stored_restaurants():
+    columns = ('id', 'name', 'address', 'description', 'naver_rating', 'latitude', 'created_at', 'content_hash')
+    with db_session() as db:
+        return sorted(db.query(*[getattr(ProcessedRestaurant, column) for column in columns]).all())
+
+
+def read_backup(storage, history):
+    buffer = io.BytesIO()
+    storage.download(history.drive_file_id, buffer)
+    return list(csv.reader(io.StringIO(buffer.getvalue().decode("utf-8"))))
+
+
+def test_daily_backup_csv_round_trip(tmp_path, restaurants):
+    storage = LocalStorage(str(tmp_path))
+    with db_session() as db:
+        history = DriveBackupManager(db, storage).backup_daily(BACKUP_DATE)
+        assert (history.status, history.total_records, history.retry_count) == ('success', 3, 0)
+        assert history.file_path == str(tmp_path / "2026-10" / "01-collection.csv")
+
+        header, *rows = read_backup(storage, history)
+
+    assert header == CSV_HEADER
+    exported = {row[0]: dict(zip(CSV_HEADER, row)) for row in rows}
+    assert set(exported) == {restaurant['id'] for restaurant in restaurants}
+    for restaurant in restaurants:
+        row = exported[restaurant['id']]
+        assert (row['name'], row['address']) == (restaurant['name'], restaurant['address'])
+        assert row['description'] == (restaurant['description'] or '')
+        assert float(row['naver_rating']) == restaurant['naver_rating']
+        assert float(row['latitude']) == restaurant['latitude']
+        assert datetime.fromisoformat(row['created_at']) == restaurant['created_at']
+
+
+def test_daily_backup_retries_after_failed_flush(monkeypatch, tmp_path, restaurants):
+    monkeypatch.setattr(settings, "retry_delay", 0)
+    original = DriveBackupManager._iter_csv_lines
+    failures = []
+
+    def fail_once(self, *args):
+        lines = original(self, *args)
+        yield next(lines)
+        if not failures:
+            # 내보내는 도중 DB 오류 → 세션은 롤백 전까지 모든 쿼리를 거부
+            failures.append(True)
+            self.db.add(ProcessedRestaurant(id=restaurants[0]['id'], name="중복 키"))
+            self.db.flush()
+        yield from lines
+
+    monkeypatch.setattr(DriveBackupManager, "_iter_csv_lines", fail_once)
+
+    storage = LocalStorage(str(tmp_path))
+    with db_session() as db:
+        history = DriveBackupManager(db, storage).backup_daily(BACKUP_DATE, max_retries=2)
+        assert (history.status, history.total_records, history.retry_count) == ('success', 3, 1)
+        assert len(read_backup(storage, history)) == 4
+    assert failures == [True]
+
+
+def test_snapshot_export_verify_restore_round_trip(tmp_path, create_tables, restaurants):
+    create_tables(RawRestaurantData)
+    storage = LocalStorage(str(tmp_path))
+    before = stored_restaurants()
+
+    with db_session() as db:
+        exporter = SnapshotExporter(db, storage)
+        first = exporter.export(derive_csv=True)
+        assert (first.status, first.total_records, first.new_records) == ('success', 4, 4)
+        partitions = first.manifest["processed_restaurants"]
+        assert sorted(partitions) == ["2026-10-01", "2026-10-02"]
+        with open(partitions["2026-10-01"]["csv"]["file_id"], newline="", encoding="utf-8") as f:
+            header, *rows = csv.reader(f)
+        assert header == CSV_HEADER and len(rows) == 3
+
+        report = exporter.verify(check_db=True)
+        assert (report["verified"], report["rows"], report["errors"], report["stale"]) == (2, 4, [], [])
+
+        # 바뀐 파티션이 없으면 이전 파일을 그대로 참조
+        second = exporter.export()
+        assert (second.status, second.new_records) == ('success', 0)
+        assert second.manifest["processed_restaurants"] == partitions
+
+    with db_session() as db:
+        db.query(ProcessedRestaurant).delete()
+
+    with db_session() as db:
+        restored = SnapshotExporter(db, storage).restore()
+    assert restored == {name: 4 if name == "processed_restaurants" else 0 for name in SNAPSHOT_TABLES}
+    assert stored_restaurants() == before
+
+
+def test_full_backup_restore_round_trip(tmp_path, restaurants):
+    storage = LocalStorage(str(tmp_path))
+    before = stored_restaurants()
+
+    # chunk 2개 이상 + 병렬 worker
+    result = FullBackupManager(storage, workers=2, chunk_rows=3).backup(resume=False)
+    assert result["status"] == 'success'
+    with db_session() as db:
+        history = db.query(BackupHistory).filter(BackupHistory.id == result["backup_id"]).one()
+        assert (history.status, history.total_records) == ('success', result["rows"])
+        plan = history.manifest["tables"]["processed_restaurants"]
+    assert len(plan["chunks"]) == 2
+    assert sum(chunk["rows"] for chunk in plan["chunks"]) == 4
+
+    with db_session() as db:
+        db.query(ProcessedRestaurant).delete()
+
+    # 비어 있지 않은 테이블은 truncate 없이 복원하지 않음
+    with pytest.raises(ValueError, match="not empty"):
+        FullBackupManager(storage).restore(result["manifest_file_id"], tables=["backup_history"])
+
+    restored = FullBackupManager(storage).restore(result["manifest_file_id"], tables=["processed_restaurants"])
+    assert restored == {"processed_restaurants": 4}
+    assert stored_restaurants() == before
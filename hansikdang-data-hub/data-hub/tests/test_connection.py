@@ -0,0 +1,33 @@
+"""DB 쿼리 시간 메트릭"""
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.database import connection
+
+
+class Recorder:
+    def __init__(self):
+        self.observed = []
+
+    def observe(self, value, **labels):
+        self.observed.append((labels["operation"], value))
+
+
+def test_failed_statement_leaves_no_timer_state(monkeypatch):
+    recorder = Recorder()
+    monkeypatch.setattr(connection, "DB_QUERY_SECONDS", recorder)
+
+    with connection.engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        time.sleep(0.2)
+        conn.execute(text("SELECT 1"))
+        # 실패한 문장의 시작 시각이 연결에 남지 않음 (장기 연결에서 누적되지 않음)
+        leftover = conn.connection.info.get("query_started")
+
+    assert not leftover
+    assert [operation for operation, _ in recorder.observed] == ["select"]
+    assert recorder.observed[0][1] < 0.1
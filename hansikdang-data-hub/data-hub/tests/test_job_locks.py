@@ -0,0 +1,69 @@
+"""API 작업 실행과 스케줄러 파이프라인의 잠금 공유, 죽은 advisory lock holder 무시"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.api.jobs_routes import _ensure_not_running, router
+from src.database.connection import db_session
+from src.database.models import JobLock
+from src.scheduling import locks
+from src.scheduling.locks import job_locks
+
+
+@pytest.fixture
+def client(create_tables):
+    create_tables(JobLock)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("endpoint", [
+    "/api/jobs/scraping/run",
+    "/api/jobs/gemini/run",
+    "/api/jobs/deduplication/run",
+    "/api/jobs/pipeline/run",
+])
+def test_rejected_while_pipeline_lock_held(client, endpoint):
+    lease = job_locks.acquire("pipeline")
+    assert lease is not None
+    try:
+        response = client.post(endpoint)
+    finally:
+        job_locks.release(lease)
+
+    assert response.status_code == 409
+    assert "pipeline" in response.json()["detail"]
+
+
+def test_advisory_lock_ids_split_key_like_pg_locks():
+    for job_name in ("pipeline", "sync", "smart_targeting"):
+        key = locks._advisory_key(job_name)
+        classid, objid = locks._advisory_lock_ids(key)
+        assert 0 <= classid < 2 ** 32 and 0 <= objid < 2 ** 32
+        assert int.from_bytes((classid << 32 | objid).to_bytes(8, 'big'), 'big', signed=True) == key
+
+
+@pytest.mark.parametrize("held", [True, False])
+def test_advisory_holder_is_confirmed_in_pg_locks(monkeypatch, create_tables, held):
+    create_tables(JobLock)
+    # 보유 프로세스가 죽어 advisory lock은 풀렸지만 job_locks 행은 expires_at까지 남은 상태
+    monkeypatch.setattr(job_locks, "backend", "advisory")
+    monkeypatch.setattr(locks.DistributedLockService, "_advisory_held", staticmethod(lambda db, job_name: held))
+    with db_session() as db:
+        db.add(JobLock(
+            job_name="pipeline", holder="crashed-host:1:abcd", backend="advisory",
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5)
+        ))
+
+    assert job_locks.get_holder("pipeline") == ("crashed-host:1:abcd" if held else None)
+    if held:
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(_ensure_not_running("pipeline"))
+        assert excinfo.value.status_code == 409
+    else:
+        # 남은 행 때문에 expires_at까지 409를 반환하지 않음
+        asyncio.run(_ensure_not_running("pipeline"))
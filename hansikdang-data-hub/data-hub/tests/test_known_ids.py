@@ -0,0 +1,63 @@
+"""Known source ID index - unique 제약 기반 중복 삽입 방지"""
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from src.database.connection import db_session
+from src.database.models import ProcessedRestaurant, RawRestaurantData
+from src.utils.known_ids import KnownIdIndex, dedupe_raw_sources
+
+
+def raw_row(source_id):
+    return {
+        'id': str(uuid.uuid4()),
+        'source': 'naver',
+        'source_id': source_id,
+        'raw_data': {'name': source_id},
+        'status': 'pending',
+    }
+
+
+def test_insert_new_skips_rows_missed_by_catch_up(tmp_path, create_tables):
+    create_tables(RawRestaurantData)
+    index = KnownIdIndex(str(tmp_path / "known_ids.idx"))
+
+    # watermark 이전 scraped_at으로 다른 프로세스가 삽입한 행 (catch-up 대상 아님)
+    with db_session() as db:
+        db.add(RawRestaurantData(
+            id=str(uuid.uuid4()), source='naver', source_id='place-1', raw_data={},
+            status='pending', scraped_at=datetime.now() - timedelta(days=1)
+        ))
+
+    rows = [raw_row('place-1'), raw_row('place-2')]
+    with db_session() as db:
+        inserted = index.insert_new(db, rows)
+
+    assert inserted == {rows[1]['id']}
+    with db_session() as db:
+        assert db.query(RawRestaurantData).filter(RawRestaurantData.source_id == 'place-1').count() == 1
+    assert index.might_contain('naver', 'place-2')
+
+
+def test_dedupe_raw_sources_keeps_earliest_row(create_tables):
+    create_tables(RawRestaurantData, ProcessedRestaurant)
+    keep_id, drop_id = str(uuid.uuid4()), str(uuid.uuid4())
+    now = datetime.now()
+
+    with db_session() as db:
+        # unique 인덱스 도입 전 DB 재현
+        db.execute(text("DROP INDEX uq_raw_source_id"))
+        db.add_all([
+            RawRestaurantData(id=keep_id, source='naver', source_id='dup', raw_data={}, scraped_at=now),
+            RawRestaurantData(id=drop_id, source='naver', source_id='dup', raw_data={},
+                              scraped_at=now + timedelta(minutes=1)),
+            ProcessedRestaurant(id=str(uuid.uuid4()), name='dup', mapping_id=drop_id),
+        ])
+
+    with db_session() as db:
+        assert dedupe_raw_sources(db) == 1
+
+    with db_session() as db:
+        assert [row.id for row in db.query(RawRestaurantData.id)] == [keep_id]
+        assert db.query(ProcessedRestaurant.mapping_id).scalar() == keep_id
@@ -0,0 +1,84 @@
+"""Lineage sink - 버린 이벤트 집계/경고, 이벤트 루프에서 대기하지 않음"""
+import asyncio
+import time
+
+import pytest
+from loguru import logger
+
+from src.database.connection import db_session
+from src.database.models import DataLineage
+from src.governance import lineage_sink as sink_module
+from src.governance.lineage_sink import LINEAGE_DROPPED, LineageSink
+from src.governance.lineage_tracker import build_lineage_row
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    handler = logger.add(lambda message: messages.append(message.record["message"]), level="WARNING")
+    yield messages
+    logger.remove(handler)
+
+
+def events(count):
+    return [build_lineage_row(f"restaurant-{i}", 'processed', 'gemini') for i in range(count)]
+
+
+def test_block_is_default_policy():
+    assert LineageSink().policy == "block"
+
+
+def test_sampled_and_full_drops_are_counted_and_logged(monkeypatch, create_tables, warnings):
+    create_tables(DataLineage)
+    monkeypatch.setattr(sink_module, "DROP_WARN_INTERVAL", 0)
+    sampled_before = LINEAGE_DROPPED.value(reason="sampled")
+    full_before = LINEAGE_DROPPED.value(reason="full")
+
+    # flush 조건(100행/60초)에 닿지 않아 버퍼가 그대로 쌓임
+    sink = LineageSink(max_buffer=4, flush_rows=100, flush_interval=60, policy="sample", sample_rate=2)
+    accepted = [sink.put(row) for row in events(10)]
+    stats = sink.stats()
+    sink.close()
+
+    assert sum(accepted) == 4
+    assert stats["sampled_out"] + stats["dropped"] == 6
+    assert LINEAGE_DROPPED.value(reason="sampled") - sampled_before == stats["sampled_out"]
+    assert LINEAGE_DROPPED.value(reason="full") - full_before == stats["dropped"]
+    assert any("Lineage events dropped" in message for message in warnings)
+    with db_session() as db:
+        assert db.query(DataLineage).count() == 4
+
+
+def test_drop_warnings_are_throttled(create_tables, warnings):
+    create_tables(DataLineage)
+    sink = LineageSink(max_buffer=1, flush_rows=100, flush_interval=60, policy="block", block_timeout=0.01)
+    for row in events(5):
+        sink.put(row)
+    sink.close()
+
+    dropped = [message for message in warnings if "Lineage events dropped" in message]
+    assert len(dropped) == 1
+    assert "full=1" in dropped[0]
+    assert sink.stats()["dropped"] == 4
+
+
+def test_block_policy_never_waits_on_event_loop(create_tables):
+    create_tables(DataLineage)
+    sink = LineageSink(max_buffer=1, flush_rows=100, flush_interval=60, policy="block", block_timeout=5)
+    rows = events(3)
+
+    async def stage():
+        started = time.monotonic()
+        accepted = [sink.put(row) for row in rows[:2]]
+        return accepted, time.monotonic() - started
+
+    accepted, elapsed = asyncio.run(stage())
+    assert accepted == [True, False]
+    assert elapsed < 1
+    assert sink.stats()["blocked"] == 0
+
+    # 루프 밖(to_thread로 호출한 동기 코드)에서는 최대 block_timeout까지 대기
+    sink.block_timeout = 0.05
+    assert sink.put(rows[2]) is False
+    assert sink.stats()["blocked"] == 1
+    sink.close()
@@ -0,0 +1,129 @@
+"""fake provider 서버 / HTTP 기록·재생으로 파이프라인 + 동기화 오프라인 실행"""
+import asyncio
+import socket
+import threading
+import time
+from dataclasses import replace
+
+import httpx
+import pytest
+import uvicorn
+
+from config import settings
+from src.database.connection import db_session
+from src.database.models import (
+    DuplicateGroup, ProcessedRestaurant, RawRestaurantData, ScrapingLog, ScrapingTarget, SyncLog
+)
+from src.testing.fake_providers import create_app
+from src.utils.http_client import http_clients
+from src.workflows.pipeline import run_daily_pipeline
+from src.workflows.sync import SyncWorkflow
+
+KEYWORDS = ["강남 냉면", "마포 국밥", "종로 갈비"]
+
+
+class FakeProviderServer:
+    """create_app()을 별도 스레드의 uvicorn으로 실행"""
+
+    def __init__(self, **options):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+        config = uvicorn.Config(create_app(**options), host="127.0.0.1", port=self.port, log_level="warning")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("fake provider server did not start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.thread.join(10)
+
+    def stats(self):
+        return httpx.get(f"{self.url}/_fake/stats").json()
+
+
+def point_clients_at(monkeypatch, url):
+    """공유 HTTP 클라이언트/설정을 fake provider 주소로 변경 (asyncio.run마다 새 클라이언트 생성)"""
+    monkeypatch.setattr(settings, "apify_base_url", f"{url}/v2")
+    monkeypatch.setattr(settings, "google_places_base_url", f"{url}/maps/api/place")
+    monkeypatch.setattr(settings, "hansikdang_api_url", url)
+    for name, base_url in (("apify", f"{url}/v2"), ("google_places", f"{url}/maps/api/place"), ("hansikdang", url)):
+        config = replace(http_clients._configs[name], base_url=base_url, max_retries=0)
+        monkeypatch.setitem(http_clients._configs, name, config)
+
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path, create_tables):
+    create_tables(RawRestaurantData, ProcessedRestaurant, ScrapingTarget, ScrapingLog, SyncLog, DuplicateGroup)
+    monkeypatch.setattr(settings, "gemini_fake", True)
+    monkeypatch.setattr(settings, "apify_api_token", "fake-token")
+    monkeypatch.setattr(settings, "data_collection_api_key", "fake-key")
+    monkeypatch.setattr(settings, "sync_compression", "none")
+    # Apify 원본 항목은 품질 점수 입력 필드(좌표/메뉴 요약 등)가 없어 0점 → 전부 동기화 대상으로
+    monkeypatch.setattr(settings, "quality_threshold", 0)
+    monkeypatch.setattr(settings, "http_replay_dir", str(tmp_path / "http"))
+    monkeypatch.setattr(SyncWorkflow, "_negotiated", {})
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "fake-places-key")
+
+    with db_session() as db:
+        for i, keyword in enumerate(KEYWORDS):
+            db.add(ScrapingTarget(id=f"target-{i}", keyword=keyword, status='active', created_by='auto'))
+    return monkeypatch
+
+
+def run_pipeline():
+    return asyncio.run(run_daily_pipeline(KEYWORDS, include_backlog=False, target=6))
+
+
+def clear_collected():
+    with db_session() as db:
+        for model in (ProcessedRestaurant, RawRestaurantData, ScrapingLog, SyncLog, DuplicateGroup):
+            db.query(model).delete()
+
+
+def synced_count():
+    with db_session() as db:
+        return db.query(ProcessedRestaurant).filter(ProcessedRestaurant.sync_status == 'synced').count()
+
+
+def test_pipeline_and_sync_against_fake_providers(offline):
+    with FakeProviderServer(run_seconds=0.1) as server:
+        point_clients_at(offline, server.url)
+        result = run_pipeline()
+        stats = server.stats()
+
+    assert result['scrape']['runs'] == 1
+    assert result['scrape']['forwarded'] == 6
+    assert stats['apify_runs'] == 1
+    assert stats['requests']['maps'] >= 1  # Google Places 보강
+    assert stats['restaurants_received'] == synced_count() > 0
+
+    with db_session() as db:
+        restaurants = db.query(ProcessedRestaurant).all()
+        assert len(restaurants) == 6
+        assert all(restaurant.description and restaurant.google_place_id for restaurant in restaurants)
+
+
+def test_recorded_pipeline_replays_without_server(offline):
+    with FakeProviderServer(run_seconds=0.1) as server:
+        point_clients_at(offline, server.url)
+        offline.setattr(settings, "http_replay_mode", "record")
+        recorded = run_pipeline()
+    recorded_synced = synced_count()
+    clear_collected()
+
+    # 서버 종료 후 같은 실행을 기록된 응답으로 재생
+    offline.setattr(settings, "http_replay_mode", "replay")
+    replayed = run_pipeline()
+
+    assert replayed['scrape']['saved'] == recorded['scrape']['saved']
+    assert synced_count() == recorded_synced > 0
@@ -0,0 +1,120 @@
+"""일일 파이프라인 - 키워드 묶음 수집"""
+import asyncio
+
+import pytest
+
+from src.database.connection import db_session
+from src.database.models import ProcessedRestaurant, RawRestaurantData, ScrapingLog, ScrapingTarget
+from src.workflows.pipeline import run_daily_pipeline
+
+
+class FakeApify:
+    """키워드마다 max_results개를 반환하는 actor (start_search 1회 = actor 실행 1회)"""
+
+    def __init__(self):
+        self.runs = []
+
+    async def start_search(self, keywords, max_results_per_keyword):
+        self.runs.append(list(keywords))
+        return {
+            'id': f"run-{len(self.runs)}",
+            'usageTotalUsd': 0.01,
+            'items': [
+                {'name': f"{keyword} 식당 {i}", 'address': f"서울 {keyword} {i}", 'keyword': keyword}
+                for keyword in keywords for i in range(max_results_per_keyword)
+            ],
+        }
+
+    async def iter_results(self, run):
+        for item in run['items']:
+            yield item
+
+
+class FakeGemini:
+    async def refine_restaurant_data(self, raw_data):
+        return {'name': raw_data['name'], 'address': raw_data['address'], 'district': '마포구'}
+
+    async def calculate_quality_score(self, raw_data):
+        return {'quality_score': 50}
+
+
+class FakeSync:
+    def __init__(self):
+        self.synced = []
+
+    async def sync_to_hansikdang(self, restaurant_ids=None, **kwargs):
+        self.synced.extend(restaurant_ids)
+
+
+class NoLimit:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def acquire(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def fakes(monkeypatch, create_tables):
+    create_tables(RawRestaurantData, ProcessedRestaurant, ScrapingTarget, ScrapingLog)
+
+    apify, sync = FakeApify(), FakeSync()
+    monkeypatch.setattr("src.scrapers.apify_naver_scraper.ApifyNaverScraper", lambda: apify)
+    monkeypatch.setattr("src.processors.gemini.GeminiProcessor", FakeGemini)
+    monkeypatch.setattr("src.workflows.sync.SyncWorkflow", lambda: sync)
+    monkeypatch.setattr("src.utils.rate_limiter.RateLimiter", NoLimit)
+    monkeypatch.delenv("GOOGLE_PLACES_API_KEY", raising=False)
+    monkeypatch.setattr("config.settings.gemini_api_key", None)
+    return apify, sync
+
+
+def test_one_actor_run_per_keyword_batch(fakes):
+    apify, sync = fakes
+    keywords = [f"지역{i} 한식" for i in range(6)]
+    with db_session() as db:
+        for i, keyword in enumerate(keywords):
+            db.add(ScrapingTarget(id=f"target-{i}", keyword=keyword, status='active', created_by='auto'))
+
+    # 키워드당 11개 → 목표 30개는 키워드 3개를 묶은 실행 1회로 채워짐
+    result = asyncio.run(run_daily_pipeline(keywords, include_backlog=False, target=30))
+
+    assert apify.runs == [keywords[:3]]
+    assert result['scrape']['runs'] == 1
+    assert result['scrape']['saved'] == 33
+    # 목표를 넘는 3개는 정제/동기화하지 않고 pending으로 남김
+    assert result['scrape']['forwarded'] == 30
+    assert len(sync.synced) == 30
+
+    with db_session() as db:
+        targets = {target.keyword: target for target in db.query(ScrapingTarget)}
+        for keyword in keywords[:3]:
+            assert targets[keyword].total_found == 11
+            assert targets[keyword].last_scraped is not None
+        for keyword in keywords[3:]:
+            assert not targets[keyword].total_found
+            assert targets[keyword].last_scraped is None
+        assert db.query(ScrapingLog).count() == 3
+
+
+def test_batches_sized_from_previous_run(fakes):
+    apify, _ = fakes
+    keywords = [f"지역{i} 한식" for i in range(6)]
+    with db_session() as db:
+        # 첫 키워드 결과는 이미 수집됨 → 신규 비율이 낮아져 다음 묶음이 커짐
+        for i in range(11):
+            db.add(RawRestaurantData(
+                id=f"old-{i}", source='apify_naver', source_id=f"{keywords[0]} 식당 {i}|서울 {keywords[0]} {i}",
+                raw_data={}, status='processed'
+            ))
+
+    result = asyncio.run(run_daily_pipeline(keywords, include_backlog=False, target=11))
+
+    # 1회차: 키워드 1개, 신규 0개 → 2회차: 신규 비율이 낮아도 직전 묶음의 2배까지만
+    assert apify.runs == [keywords[:1], keywords[1:3]]
+    assert result['scrape']['runs'] == 2
+    assert result['scrape']['saved'] <= 11 + 11
+    assert result['scrape']['forwarded'] == 11
+
+    with db_session() as db:
+        pending = db.query(RawRestaurantData).filter(RawRestaurantData.status == 'pending').count()
+    assert pending == result['scrape']['saved'] - 11
@@ -0,0 +1,28 @@
+"""품질 재계산 - limit 준수"""
+import uuid
+
+from src.database.connection import db_session
+from src.database.models import ProcessedRestaurant, QualityMetrics, QualityMetricsHistory, QualityScore
+from src.governance import quality_rescoring
+from src.governance.quality_rescoring import QualityRescorer
+
+
+def test_rescore_limit_touches_exactly_limit_rows(monkeypatch, create_tables):
+    create_tables(ProcessedRestaurant, QualityMetrics, QualityMetricsHistory, QualityScore)
+    # limit이 청크 크기의 배수가 아닌 경우
+    monkeypatch.setattr(quality_rescoring, "RESCORE_CHUNK_ROWS", 30)
+
+    with db_session() as db:
+        db.add_all([
+            ProcessedRestaurant(id=str(uuid.uuid4()), name=f"식당 {i}", address=f"서울 {i}", quality_dirty=True)
+            for i in range(250)
+        ])
+
+    with db_session() as db:
+        stats = QualityRescorer(db).rescore(limit=100)
+
+    assert stats['rescored'] == 100
+    assert stats['chunks'] == 4
+    with db_session() as db:
+        assert db.query(QualityScore).count() == 100
+        assert QualityRescorer(db).pending() == 150
@@ -0,0 +1,90 @@
+"""RateLimiter 키 버킷 + 전체 버킷"""
+import asyncio
+import time
+
+from src.utils.rate_limiter import RateLimiter
+
+
+def _worst_excess(times, rate, burst, tolerance=0.02):
+    """모든 시간 창 [t0, t]에서 허용량(burst + rate × 창 길이) 대비 최대 초과 수"""
+    times = sorted(times)
+    worst = 0.0
+    for i, t in enumerate(times):
+        for j in range(i + 1):
+            allowed = burst + rate * (t - times[j] + tolerance)
+            worst = max(worst, (i - j + 1) - allowed)
+    return worst
+
+
+def _run(limiter, keys, per_key):
+    grants = []
+
+    async def waiter(key):
+        await limiter.acquire(key=key)
+        grants.append(time.monotonic())
+
+    async def main():
+        await asyncio.gather(*(waiter(key) for key in keys for _ in range(per_key)))
+
+    asyncio.run(main())
+    return grants
+
+
+def test_keys_together_never_exceed_global_rate():
+    keys = [f"key-{i}" for i in range(4)]
+    # 키마다 전체와 같은 쿼터를 줘도 합계는 전체 쿼터를 넘지 않아야 함
+    limiter = RateLimiter(
+        max_requests=50, per_seconds=1, burst=5, name="test-global",
+        key_limits={key: (50, 1) for key in keys}
+    )
+
+    grants = _run(limiter, keys, per_key=15)
+
+    assert len(grants) == 60
+    assert _worst_excess(grants, rate=50, burst=5) <= 1
+
+
+def test_key_limit_applies_on_top_of_global():
+    limiter = RateLimiter(
+        max_requests=100, per_seconds=1, burst=10, name="test-key",
+        key_limits={"slow": (20, 1)}
+    )
+
+    grants = _run(limiter, ["slow"], per_key=30)
+
+    assert _worst_excess(grants, rate=20, burst=20) <= 1
+
+
+def test_google_places_instances_share_limiter(monkeypatch):
+    from src.scrapers.google_places_api import GooglePlacesAPI
+
+    monkeypatch.setenv("GOOGLE_PLACES_API_KEY", "test")
+
+    assert GooglePlacesAPI().rate_limiter is GooglePlacesAPI().rate_limiter
+
+
+def test_limit_and_fifo_hold_with_1000_concurrent_waiters():
+    limiter = RateLimiter(max_requests=500, per_seconds=1, burst=50, name="test-stress")
+    grants = []
+
+    async def waiter(index):
+        await limiter.acquire()
+        grants.append((time.monotonic(), index))
+
+    async def main():
+        tasks = []
+        for i in range(1000):
+            tasks.append(asyncio.create_task(waiter(i)))
+            await asyncio.sleep(0)  # 생성 순서 = acquire 호출 순서
+        await asyncio.gather(*tasks)
+
+    started = time.monotonic()
+    asyncio.run(main())
+    elapsed = time.monotonic() - started
+
+    assert len(grants) == 1000
+    assert _worst_excess([t for t, _ in grants], rate=500, burst=50) <= 1
+    # burst 이후 950개는 초당 500개로만 통과
+    assert elapsed >= (1000 - 50) / 500 * 0.98
+    # 호출 순서대로 통과 (FIFO)
+    assert [index for _, index in sorted(grants)] == list(range(1000))
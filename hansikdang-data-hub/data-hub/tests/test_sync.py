@@ -0,0 +1,325 @@
+"""한식당 동기화 - failed 행 재전송, delta sync, 413 분할/415 압축 변경, NDJSON 스트림 재시도"""
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from config import settings
+from src.database.change_tracking import hansikdang_payload, payload_hash
+from src.database.connection import db_session
+from src.database.models import ProcessedRestaurant, SyncLog
+from src.utils.http_client import NO_RETRY, ClientConfig, ClientMetrics, RetryTransport
+from src.workflows import sync as sync_module
+from src.workflows.sync import SyncWorkflow
+
+
+class FakeHansikdang:
+    """요청마다 정해진 성공 여부(또는 HTTP 상태 코드)로 레스토랑별 결과를 반환"""
+
+    def __init__(self, outcomes, accept_encoding="identity"):
+        self.outcomes = list(outcomes)
+        self.accept_encoding = accept_encoding
+        self.received = []
+        self.requests = []
+        self.headers = []
+
+    async def request(self, method, url, content=None, headers=None):
+        self.headers.append(headers)
+        ok = self.outcomes.pop(0)
+        if not isinstance(ok, bool):
+            # 본문을 해석하기 전에 거절 (413 한도 초과, 415 미지원 인코딩)
+            return httpx.Response(
+                ok, headers={"Accept-Encoding": self.accept_encoding}, request=httpx.Request(method, url)
+            )
+
+        restaurants = json.loads(content)["restaurants"]
+        self.received.append([restaurant["name"] for restaurant in restaurants])
+        self.requests.append((method, restaurants))
+        results = [{"success": ok, "error": None if ok else "temporarily rejected"} for _ in restaurants]
+        return httpx.Response(200, json={"results": results}, request=httpx.Request(method, url))
+
+
+@pytest.fixture
+def restaurant(monkeypatch, create_tables):
+    create_tables(ProcessedRestaurant, SyncLog)
+    monkeypatch.setattr(settings, "sync_compression", "none")
+    monkeypatch.setattr(SyncWorkflow, "_negotiated", {})
+
+    restaurant_id = str(uuid.uuid4())
+    with db_session() as db:
+        db.add(ProcessedRestaurant(id=restaurant_id, name="재시도 식당", quality_score=80))
+    return restaurant_id
+
+
+def sync_state(restaurant_id):
+    with db_session() as db:
+        row = db.query(ProcessedRestaurant).filter(ProcessedRestaurant.id == restaurant_id).one()
+        return row.sync_status, row.sync_attempts, row.sync_retry_at
+
+
+def update_restaurant(restaurant_id, **values):
+    """ORM 경유 수정 (change tracking 리스너 적용)"""
+    with db_session() as db:
+        row = db.query(ProcessedRestaurant).filter(ProcessedRestaurant.id == restaurant_id).one()
+        for key, value in values.items():
+            setattr(row, key, value)
+
+
+def sync_hashes(restaurant_id):
+    with db_session() as db:
+        row = db.query(ProcessedRestaurant).filter(ProcessedRestaurant.id == restaurant_id).one()
+        return row.content_hash, row.last_synced_hash
+
+
+def test_failed_restaurant_is_resent_on_next_run(monkeypatch, restaurant):
+    monkeypatch.setattr(settings, "sync_retry_delay_minutes", 0)
+    server = FakeHansikdang([False, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    first = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    assert first["failed"] == 1
+    status, attempts, _ = sync_state(restaurant)
+    assert (status, attempts) == ('failed', 1)
+
+    second = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    assert second["synced"] == 1
+    status, attempts, retry_at = sync_state(restaurant)
+    assert (status, attempts, retry_at) == ('synced', 0, None)
+    assert server.received == [["재시도 식당"], ["재시도 식당"]]
+
+
+def test_failed_restaurant_waits_for_retry_time_and_attempt_limit(monkeypatch, restaurant):
+    server = FakeHansikdang([False])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    _, _, retry_at = sync_state(restaurant)
+    assert retry_at > datetime.now() + timedelta(minutes=settings.sync_retry_delay_minutes - 1)
+
+    # 재시도 시각 전에는 대상이 아님
+    assert asyncio.run(SyncWorkflow().sync_to_hansikdang())["total_sent"] == 0
+
+    # 시도 한도에 도달한 행도 대상이 아님
+    with db_session() as db:
+        db.query(ProcessedRestaurant).update({
+            "sync_retry_at": datetime.now() - timedelta(minutes=1),
+            "sync_attempts": settings.sync_retry_attempts,
+        })
+    assert asyncio.run(SyncWorkflow().sync_to_hansikdang())["total_sent"] == 0
+    assert len(server.received) == 1
+
+
+def test_content_hash_follows_payload_fields(restaurant):
+    with db_session() as db:
+        row = db.query(ProcessedRestaurant).filter(ProcessedRestaurant.id == restaurant).one()
+        # insert 시 컬럼 기본값까지 채운 뒤 해시 계산
+        assert row.content_hash == payload_hash(hansikdang_payload(row))
+        inserted = row.content_hash
+
+    # 전송 필드가 아닌 값만 바뀌면 해시 그대로
+    update_restaurant(restaurant, quality_score=90)
+    assert sync_hashes(restaurant)[0] == inserted
+
+    update_restaurant(restaurant, description="새 설명")
+    with db_session() as db:
+        row = db.query(ProcessedRestaurant).filter(ProcessedRestaurant.id == restaurant).one()
+        assert row.content_hash != inserted
+        assert row.content_hash == payload_hash(hansikdang_payload(row))
+
+
+def test_delta_sync_sends_only_changed_rows(monkeypatch, restaurant):
+    other = str(uuid.uuid4())
+    with db_session() as db:
+        db.add(ProcessedRestaurant(id=other, name="그대로 식당", quality_score=80))
+    server = FakeHansikdang([True, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    assert asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())["synced"] == 2
+    content_hash, last_synced_hash = sync_hashes(restaurant)
+    assert content_hash == last_synced_hash
+
+    # 동기화 이후 바뀐 행이 없으면 전송 없음
+    assert asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))["total_sent"] == 0
+
+    update_restaurant(restaurant, description="새 설명")
+    result = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))
+    assert (result["synced"], result["patched"]) == (1, 0)
+    method, restaurants = server.requests[-1]
+    # PATCH 미지원 서버 → 전체 레코드 POST
+    assert method == "POST"
+    assert restaurants == [{**restaurants[0], "name": "재시도 식당", "description": "새 설명"}]
+    assert len(restaurants[0]) == len(hansikdang_payload(ProcessedRestaurant()))
+
+    content_hash, last_synced_hash = sync_hashes(restaurant)
+    assert content_hash == last_synced_hash
+    assert asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))["total_sent"] == 0
+
+
+def test_delta_sync_patches_changed_fields(monkeypatch, restaurant):
+    monkeypatch.setattr(settings, "hansikdang_patch_supported", True)
+    update_restaurant(restaurant, address="서울 종로구 1")
+    server = FakeHansikdang([True, True, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+    asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+
+    update_restaurant(restaurant, description="새 설명", phone="02-123-4567")
+    result = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))
+    assert result["patched"] == 1
+    # 식별 필드 + 바뀐 필드만
+    assert server.requests[-1] == ("PATCH", [{
+        "name": "재시도 식당", "address": "서울 종로구 1", "description": "새 설명", "phone": "02-123-4567",
+    }])
+
+    # 식별 필드가 바뀌면 PATCH 대상을 찾을 수 없으므로 전체 레코드 POST
+    update_restaurant(restaurant, name="새 이름 식당")
+    result = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))
+    assert (result["synced"], result["patched"]) == (1, 0)
+    method, restaurants = server.requests[-1]
+    assert method == "POST"
+    assert restaurants[0]["name"] == "새 이름 식당"
+    assert restaurants[0]["description"] == "새 설명"
+
+
+def test_delta_failure_stays_synced_and_dirty(monkeypatch, restaurant):
+    server = FakeHansikdang([True, False, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+    asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    _, synced_hash = sync_hashes(restaurant)
+
+    update_restaurant(restaurant, description="새 설명")
+    assert asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))["failed"] == 1
+    # 이전 값은 전송된 상태이므로 failed로 바꾸지 않고 다음 delta 실행에서 재시도
+    assert sync_state(restaurant) == ('synced', 0, None)
+    assert sync_hashes(restaurant)[1] == synced_hash
+
+    assert asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang(delta=True))["synced"] == 1
+    content_hash, last_synced_hash = sync_hashes(restaurant)
+    assert content_hash == last_synced_hash != synced_hash
+    assert len(server.requests) == 3
+
+
+def test_baseline_synced_hashes_fills_rows_synced_before_tracking(restaurant):
+    with db_session() as db:
+        # 변경 추적 도입 이전에 동기화된 행 (ORM 이벤트를 거치지 않은 쓰기)
+        db.query(ProcessedRestaurant).update({
+            "sync_status": 'synced', "content_hash": None, "last_synced_hash": None,
+        }, synchronize_session=False)
+
+    workflow = SyncWorkflow()
+    assert workflow.baseline_synced_hashes(page_size=1) == 1
+    content_hash, last_synced_hash = sync_hashes(restaurant)
+    assert content_hash is not None and content_hash == last_synced_hash
+    with db_session() as db:
+        assert db.query(ProcessedRestaurant.synced_field_hashes).scalar()["description"]
+
+    # 기준선 이후 수정분만 delta 대상
+    assert workflow.baseline_synced_hashes() == 0
+    assert workflow._fetch_page(None, None, 10, delta=True) == []
+    update_restaurant(restaurant, description="새 설명")
+    assert [item.id for item in workflow._fetch_page(None, None, 10, delta=True)] == [restaurant]
+
+
+def test_oversized_batch_is_split_in_halves(monkeypatch, restaurant):
+    with db_session() as db:
+        db.add(ProcessedRestaurant(id=str(uuid.uuid4()), name="분할 식당", quality_score=80))
+    server = FakeHansikdang([413, True, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    result = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    assert (result["synced"], result["splits"], result["retries"]) == (2, 1, 0)
+    assert sorted(server.received) == [["분할 식당"], ["재시도 식당"]]
+    assert sync_state(restaurant)[0] == 'synced'
+
+
+def test_unsupported_encoding_downgrades_to_accepted_one(monkeypatch, restaurant):
+    monkeypatch.setattr(settings, "sync_compression", "gzip")
+    server = FakeHansikdang([415, True, True])
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    result = asyncio.run(SyncWorkflow(max_attempts=1).sync_to_hansikdang())
+    assert (result["synced"], result["encoding"]) == (1, "identity")
+    assert server.headers[0]["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in server.headers[1]
+    assert server.received == [["재시도 식당"]]
+
+    # 협상 결과는 이후 실행에도 적용
+    assert SyncWorkflow().encoding == "identity"
+
+
+class UnreadStreamServer(FakeHansikdang):
+    """NDJSON 업로드 본문을 읽기 전에 실패하는 서버 (JSON 배치는 정상 처리)"""
+
+    def __init__(self, outcomes, failure):
+        super().__init__(outcomes)
+        self.failure = failure
+
+    async def post(self, url, content=None, headers=None, extensions=None):
+        if isinstance(self.failure, Exception):
+            raise self.failure
+        return httpx.Response(self.failure, request=httpx.Request("POST", url))
+
+
+@pytest.mark.parametrize("failure", [httpx.ConnectError("connection refused"), 404, 415])
+def test_stream_failing_before_body_is_read_resends_first_item(monkeypatch, restaurant, failure):
+    monkeypatch.setattr(settings, "sync_transport", "ndjson")
+    monkeypatch.setattr(settings, "retry_delay", 0)
+    server = UnreadStreamServer([True], failure)
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    result = asyncio.run(SyncWorkflow(max_attempts=2).sync_to_hansikdang())
+    assert result["synced"] == 1
+    assert server.received == [["재시도 식당"]]
+    assert sync_state(restaurant)[0] == 'synced'
+
+
+class RateLimitedServer(httpx.AsyncBaseTransport):
+    """본문을 실제 전송처럼 스트림에서 읽고 429 반환"""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def handle_async_request(self, request):
+        self.bodies.append(b"".join([chunk async for chunk in request.stream]))
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+
+def test_stream_upload_is_not_retried_by_transport():
+    server = RateLimitedServer()
+
+    async def body():
+        yield b'{"name": "a"}\n'
+
+    async def upload(**extensions):
+        transport = RetryTransport(server, ClientConfig(max_retries=3), ClientMetrics(), "hansikdang")
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.post("http://hansikdang.test/", content=body(), extensions=extensions)
+
+    # 재시도하면 이미 읽은 본문을 다시 읽어야 함
+    with pytest.raises(httpx.StreamConsumed):
+        asyncio.run(upload())
+
+    server.bodies.clear()
+    response = asyncio.run(upload(**{NO_RETRY: True}))
+    assert response.status_code == 429
+    assert server.bodies == [b'{"name": "a"}\n']
+
+
+def test_consumed_stream_falls_back_to_json_batch(monkeypatch, restaurant):
+    monkeypatch.setattr(settings, "sync_transport", "ndjson")
+    server = FakeHansikdang([True])
+
+    async def post(url, content=None, headers=None, extensions=None):
+        async for _ in content:
+            pass
+        raise httpx.StreamConsumed()
+
+    server.post = post
+    monkeypatch.setattr(sync_module.http_clients, "get", lambda name: server)
+
+    result = asyncio.run(SyncWorkflow().sync_to_hansikdang())
+    assert result["synced"] == 1
+    assert server.received == [["재시도 식당"]]
+    assert sync_state(restaurant)[0] == 'synced'